@@ -7,6 +7,10 @@ import json
 import traceback
 import logging
 import ssl
+import asyncio
+import copy
+import functools
+import inspect
 from threading import Thread
 import time
 
@@ -33,7 +37,7 @@ sys.path.append(current_dir)
 
 try:
     # Import FastMCP library
-    from mcp.server.fastmcp import FastMCP
+    from mcp.server.fastmcp import FastMCP, Context
     logger.info("FastMCP successfully imported")
 except ImportError as e:
     logger.error(f"Failed to import FastMCP: {str(e)}")
@@ -72,6 +76,50 @@ except ImportError as e:
         print(f"Error: Could not find HwpTableTools module", file=sys.stderr)
         sys.exit(1)
 
+# Try to import utility modules
+try:
+    from src.utils.watchdog import ComWatchdog
+    from src.utils.session_journal import SessionJournal
+    from src.utils.result_cache import LRUResultCache, ToolResultCache
+    from src.utils.batch_checkpoint import operations_digest, encode_continuation_token, decode_continuation_token
+    from src.utils.progress import ProgressTracker, OperationCancelled, use_tracker, report_progress, check_cancelled, cancel_requested
+    from src.utils.edit_generation import EditGenerationTracker
+    from src.utils.text_pager import select_pages, slice_text
+    from src.utils.find_session import FindSessionStore
+    from src.utils.form_profiles import FormProfileStore
+    from src.utils.series import generate_series
+    from src.utils.table_compute import compute_table
+    from src.utils.tabular_stream import DEFAULT_CHUNK_ROWS, TABULAR_EXTENSIONS, is_tabular_text, looks_like_path, read_chunks
+    from src.utils.payload_loader import load_operations, load_table_chunks, load_text, peek_chunks
+    from src.utils.cell_map import parse_cell_reference
+    from src.utils.cursor_context import index_to_cell
+    from src.utils.hwpx import replace_in_hwpx
+    logger.info("Utility modules imported successfully")
+except ImportError as e:
+    logger.error(f"Failed to import utility modules: {str(e)}")
+    try:
+        from utils.watchdog import ComWatchdog
+        from utils.session_journal import SessionJournal
+        from utils.result_cache import LRUResultCache, ToolResultCache
+        from utils.batch_checkpoint import operations_digest, encode_continuation_token, decode_continuation_token
+        from utils.progress import ProgressTracker, OperationCancelled, use_tracker, report_progress, check_cancelled, cancel_requested
+        from utils.edit_generation import EditGenerationTracker
+        from utils.text_pager import select_pages, slice_text
+        from utils.find_session import FindSessionStore
+        from utils.form_profiles import FormProfileStore
+        from utils.series import generate_series
+        from utils.table_compute import compute_table
+        from utils.tabular_stream import DEFAULT_CHUNK_ROWS, TABULAR_EXTENSIONS, is_tabular_text, looks_like_path, read_chunks
+        from utils.payload_loader import load_operations, load_table_chunks, load_text, peek_chunks
+        from utils.cell_map import parse_cell_reference
+        from utils.cursor_context import index_to_cell
+        from utils.hwpx import replace_in_hwpx
+        logger.info("Utility modules imported from alternate path")
+    except ImportError as e2:
+        logger.error(f"Could not find utility modules in any path: {str(e2)}")
+        print("Error: Could not find utility modules", file=sys.stderr)
+        sys.exit(1)
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "hwp-mcp",
@@ -83,10 +131,236 @@ mcp = FastMCP(
 hwp_controller = None
 # Global HWP table tools instance
 hwp_table_tools = None
+# Global session journal - 재연결 시 열린 문서와 커서 위치 복원
+session_journal = SessionJournal()
+# 다음 연결 시 세션 복원이 필요한지 여부
+session_restore_pending = False
+# 문서별 편집 세대 - 컨트롤러를 새로 만들어도 유지해 캐시 키가 겹치지 않도록 함
+edit_generations = EditGenerationTracker()
+# hwp_find_next가 이어서 찾을 수 있도록 보관하는 찾기 세션
+find_sessions = FindSessionStore()
+# 양식 지문별로 찾은 셀 위치를 보관하는 프로필 저장소 (HWP_MCP_PROFILE_DIR로 위치 지정)
+form_profiles = FormProfileStore()
+
+def _load_deadlines():
+    """HWP_MCP_DEADLINES 환경 변수(JSON, 예: '{"AllReplace": 300}')에서 동작별 제한 시간을 읽습니다."""
+    raw = os.environ.get("HWP_MCP_DEADLINES")
+    if not raw:
+        return {}
+    try:
+        return {str(action): float(seconds) for action, seconds in json.loads(raw).items()}
+    except Exception as e:
+        logger.warning(f"HWP_MCP_DEADLINES 파싱 실패 (기본값 사용): {e}")
+        return {}
+
+def _init_com_thread():
+    """COM 작업 스레드를 STA로 초기화합니다."""
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except Exception as e:
+        logger.debug(f"CoInitialize: {e}")
+
+def _recover_hwp_instance(diagnostics):
+    """제한 시간을 넘긴 COM 호출 이후 HWP 인스턴스를 복구합니다. (MCP 서버는 재시작하지 않음)"""
+    global hwp_controller, hwp_table_tools, session_restore_pending
+    logger.warning(f"Recovering HWP instance after '{diagnostics['action']}' timed out")
+
+    # 호출을 막고 있는 대화상자를 닫아 걸린 호출이 풀리도록 함
+    closed = HwpController.close_modal_dialogs()
+    if closed:
+        logger.info(f"Closed {closed} modal dialog(s)")
+
+    # 기존 컨트롤러는 버려진 작업 스레드에 묶여 있으므로 다음 호출 때 새로 연결
+    hwp_controller = None
+    hwp_table_tools = None
+    session_restore_pending = True
+
+# Global COM watchdog - 모든 HWP 호출을 동작별 제한 시간으로 감시
+com_watchdog = ComWatchdog(
+    deadlines=_load_deadlines(),
+    on_timeout=_recover_hwp_instance,
+    initializer=_init_com_thread
+)
+
+def com_guarded(action: str = "default"):
+    """
+    도구 실행을 COM 작업 스레드에서 action의 제한 시간으로 감시하는 데코레이터.
+    도구는 비동기로 등록되므로 실행 중에도 이벤트 루프가 진행 상황 알림과 취소 요청을 처리합니다.
+    다른 도구 안에서 호출할 때는 `도구.__wrapped__(...)`로 감시 없이 직접 호출합니다.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            tracker = ProgressTracker(report=_progress_sender(kwargs.get("ctx"), loop))
+
+            @functools.wraps(fn)
+            def run():
+                with use_tracker(tracker):
+                    result = fn(*args, **kwargs)
+                _update_session_journal()
+                return result
+
+            try:
+                return await loop.run_in_executor(None, functools.partial(com_watchdog.call, action, run))
+            except asyncio.CancelledError:
+                # MCP 취소 요청 - 작업 스레드가 다음 COM 호출 전에 멈추도록 플래그 설정
+                tracker.cancel()
+                logger.info(f"{fn.__name__} cancelled by client")
+                raise
+        return wrapper
+    return decorator
+
+def _progress_sender(ctx, loop):
+    """작업 스레드에서 MCP 진행 상황 알림을 보내는 콜백을 만듭니다."""
+    if ctx is None:
+        return None
+
+    def send(done, total, message):
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(done, total), loop)
+    return send
+
+# 멱등성 키로 완료된 변경 도구 결과 캐시 - (도구, 키, 문서) 단위로 (인자 해시, 결과)를 보관
+idempotency_cache = LRUResultCache(maxsize=256)
+
+# 인자 해시에서 제외하는 인자 (멱등성 키 자체와 자동 주입되는 MCP 컨텍스트)
+IDEMPOTENCY_EXCLUDED_ARGS = ("idempotency_key", "ctx")
+
+def _is_error_result(result) -> bool:
+    """도구 결과가 오류 또는 취소인지 여부 (재시도 시 다시 실행되도록 캐시하지 않음)"""
+    if isinstance(result, str):
+        return result.startswith(("Error", "Cancelled"))
+    if isinstance(result, dict):
+        return result.get("status") in ("error", "cancelled") or "error" in result or bool(result.get("cancelled"))
+    return False
+
+def _is_partial_result(result) -> bool:
+    """도구 결과가 이어서 실행해야 하는 부분 결과인지 여부 (이어하기 호출이 다시 실행되도록 캐시하지 않음)"""
+    return isinstance(result, dict) and result.get("status") == "partial"
+
+def _bound_arguments(signature: inspect.Signature, args, kwargs) -> dict:
+    """호출 인자를 이름별로 모읍니다. (기본값 포함, 멱등성 키와 컨텍스트 제외)"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return {name: value for name, value in bound.arguments.items() if name not in IDEMPOTENCY_EXCLUDED_ARGS}
+
+def _arguments_digest(signature: inspect.Signature, args, kwargs) -> str:
+    """호출 인자(기본값 포함, 멱등성 키와 컨텍스트 제외)의 해시"""
+    return operations_digest(_bound_arguments(signature, args, kwargs))
+
+def _idempotency_conflict(fn, key: str):
+    """같은 멱등성 키가 다른 인자로 다시 쓰였을 때의 오류 결과 (도구의 반환 형식에 맞춤)"""
+    message = (f"idempotency_key '{key}' was already used with different arguments for {fn.__name__}. "
+               "Use a new key for a different request.")
+    if inspect.signature(fn).return_annotation in (dict, "dict"):
+        return {"status": "error", "message": message}
+    return f"Error: {message}"
+
+def idempotent(fn=None, *, document=None):
+    """
+    idempotency_key 인자를 받는 변경 도구용 데코레이터.
+    같은 키, 같은 인자, 같은 문서로 다시 호출되면 COM 작업을 다시 실행하지 않고 저장된 결과를 반환합니다.
+    같은 키가 다른 인자로 다시 오면 실행하지 않고 오류를 반환합니다.
+
+    Args:
+        document: 호출 인자(dict)로 대상 문서 키를 정하는 함수. None을 반환하거나 없으면 활성 HWP 문서를 씁니다.
+            HWP를 거치지 않고 파일을 직접 바꾸는 호출이 HWP를 실행하지 않게 할 때 사용합니다.
+    """
+    if fn is None:
+        return functools.partial(idempotent, document=document)
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = kwargs.get("idempotency_key")
+        if not key:
+            return fn(*args, **kwargs)
+
+        digest = _arguments_digest(signature, args, kwargs)
+        target = document(_bound_arguments(signature, args, kwargs)) if document else None
+        if target is None:
+            hwp = get_hwp_controller()
+            document_key = hwp.get_document_key() if hwp else ""
+        else:
+            document_key = target
+        found, entry = idempotency_cache.get((fn.__name__, key, document_key))
+        if found:
+            cached_digest, result = entry
+            if cached_digest != digest:
+                logger.warning(f"Idempotency key reused with different arguments: {fn.__name__} ({key})")
+                return _idempotency_conflict(fn, key)
+            logger.info(f"Idempotency key hit: {fn.__name__} ({key}), returning cached result")
+            return result
+
+        result = fn(*args, **kwargs)
+        if not _is_error_result(result) and not _is_partial_result(result):
+            idempotency_cache.put((fn.__name__, key, document_key), (digest, result))
+            if target is None:
+                # 새 문서를 만드는 도구는 재시도 시 활성 문서가 바뀌어 있으므로 실행 후 문서로도 저장
+                hwp = get_hwp_controller()
+                after = hwp.get_document_key() if hwp else ""
+                if after != document_key:
+                    idempotency_cache.put((fn.__name__, key, after), (digest, result))
+        return result
+    return wrapper
+
+# 읽기 전용 도구 결과 캐시 - (도구, 인자, 문서 편집 세대, 변경 카운터) 단위로 보관
+tool_cache = ToolResultCache(maxsize=128)
+
+def read_only(cursor_sensitive: bool = False):
+    """
+    문서를 바꾸지 않는 도구용 데코레이터.
+    같은 인자, 같은 문서, 같은 편집 세대로 다시 호출되면 HWP를 거치지 않고 저장된 결과를 반환합니다.
+
+    Args:
+        cursor_sensitive: 결과가 커서 위치에 따라 달라지는 도구이면 True (커서 위치도 키에 포함)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            hwp = get_hwp_controller()
+            if not hwp:
+                return fn(*args, **kwargs)
+
+            arguments = repr((args, sorted((k, v) for k, v in kwargs.items() if k != "ctx")))
+            position = repr(hwp._get_current_position()) if cursor_sensitive else None
+            key = (fn.__name__, arguments, hwp.get_edit_generation(), tool_cache.change_counter, position)
+
+            found, result = tool_cache.lookup(key)
+            if found:
+                logger.debug(f"Tool cache hit: {fn.__name__}")
+                return copy.deepcopy(result)
+
+            result = fn(*args, **kwargs)
+            if not _is_error_result(result):
+                tool_cache.put(key, copy.deepcopy(result))
+            return result
+        return wrapper
+    return decorator
+
+def mutating(fn):
+    """문서를 바꾸는 도구용 데코레이터. 실행이 끝나면 (실패해도) 읽기 전용 도구 캐시를 무효화합니다."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            tool_cache.invalidate()
+    return wrapper
+
+def _update_session_journal():
+    """커서 위치를 기록하고, 주기가 되면 문서 목록 갱신 및 자동 저장을 수행합니다."""
+    if hwp_controller is None or not hwp_controller.is_hwp_running:
+        return
+    try:
+        hwp_controller.capture_session(session_journal, full=session_journal.checkpoint_due())
+    except Exception as e:
+        logger.debug(f"세션 저널 기록 실패 (무시): {e}")
 
 def get_hwp_controller():
     """Get or create HwpController instance. Auto-reconnects if connection is lost."""
-    global hwp_controller, hwp_table_tools
+    global hwp_controller, hwp_table_tools, session_restore_pending
 
     # 연결 상태 확인 및 재연결
     if hwp_controller is not None:
@@ -97,11 +371,12 @@ def get_hwp_controller():
             logger.warning(f"HWP connection lost ({e}), attempting to reconnect...")
             hwp_controller = None
             hwp_table_tools = None
+            session_restore_pending = True
 
     if hwp_controller is None:
         logger.info("Creating HwpController instance...")
         try:
-            hwp_controller = HwpController()
+            hwp_controller = HwpController(edit_generations, form_profiles)
             if not hwp_controller.connect(visible=True):
                 logger.error("Failed to connect to HWP program")
                 return None
@@ -110,6 +385,17 @@ def get_hwp_controller():
             hwp_table_tools = HwpTableTools(hwp_controller)
 
             logger.info("Successfully connected to HWP program")
+
+            # 연결이 끊어졌던 경우 세션(열린 문서, 현재 탭, 커서 위치) 복원
+            if session_restore_pending:
+                session_restore_pending = False
+                # 끊긴 동안의 변경은 알 수 없으므로 이전 세대를 모두 무효화
+                edit_generations.forget()
+                success, message = hwp_controller.restore_session(session_journal)
+                if success:
+                    logger.info(message)
+                else:
+                    logger.warning(message)
         except Exception as e:
             logger.error(f"Error creating HwpController: {str(e)}", exc_info=True)
             return None
@@ -125,7 +411,10 @@ def get_hwp_table_tools():
     return hwp_table_tools
 
 @mcp.tool()
-def hwp_create() -> str:
+@com_guarded()
+@idempotent
+@mutating
+def hwp_create(idempotency_key: str = None) -> str:
     """Create a new HWP document."""
     try:
         hwp = get_hwp_controller()
@@ -142,6 +431,8 @@ def hwp_create() -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@read_only()
 def hwp_list_tabs() -> str:
     """
     현재 HWP 창에서 열려있는 탭(문서) 목록을 반환합니다.
@@ -172,6 +463,7 @@ def hwp_list_tabs() -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
 def hwp_switch_tab(index: int) -> str:
     """
     현재 HWP 창에서 특정 탭으로 전환합니다.
@@ -198,6 +490,7 @@ def hwp_switch_tab(index: int) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
 def hwp_list_windows() -> str:
     """
     실행 중인 모든 HWP 창을 찾습니다.
@@ -229,6 +522,8 @@ def hwp_list_windows() -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_switch_window(hwnd: int) -> str:
     """
     다른 HWP 창으로 전환합니다.
@@ -255,6 +550,8 @@ def hwp_switch_window(hwnd: int) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_close_window(hwnd: int) -> str:
     """
     HWP 창을 닫습니다 (저장 안 함).
@@ -281,6 +578,8 @@ def hwp_close_window(hwnd: int) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded("FileOpen")
+@mutating
 def hwp_open(path: str) -> str:
     """Open an existing HWP document."""
     try:
@@ -301,6 +600,8 @@ def hwp_open(path: str) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded("FileSaveAs_S")
+@mutating
 def hwp_save(path: str = None) -> str:
     """Save the current HWP document."""
     try:
@@ -326,7 +627,10 @@ def hwp_save(path: str = None) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_insert_text(text: str, preserve_linebreaks: bool = True) -> str:
+@com_guarded()
+@idempotent
+@mutating
+def hwp_insert_text(text: str, preserve_linebreaks: bool = True, idempotency_key: str = None) -> str:
     """Insert text at the current cursor position."""
     try:
         if not text:
@@ -336,15 +640,8 @@ def hwp_insert_text(text: str, preserve_linebreaks: bool = True) -> str:
         if not hwp:
             return "Error: Failed to connect to HWP program"
 
-        # 현재 커서가 표 안에 있는지 확인
-        is_in_table = False
-        try:
-            hwp.hwp.Run("TableCellBlock")
-            hwp.hwp.Run("Cancel")
-            is_in_table = True
-        except Exception as e:
-            logger.debug(f"표 셀 확인 실패 (무시): {e}")
-            is_in_table = False
+        # 현재 커서가 표 안에 있는지 확인 (선택 상태를 건드리지 않음)
+        is_in_table = hwp.get_cursor_context()["in_table"]
 
         # 줄바꿈 문자 처리
         if preserve_linebreaks and ('\n' in text or '\\n' in text):
@@ -385,6 +682,8 @@ def hwp_insert_text(text: str, preserve_linebreaks: bool = True) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_set_font(
     name: str = None, 
     size: int = None, 
@@ -418,7 +717,10 @@ def hwp_set_font(
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_insert_table(rows: int, cols: int) -> str:
+@com_guarded()
+@idempotent
+@mutating
+def hwp_insert_table(rows: int, cols: int, idempotency_key: str = None) -> str:
     """Insert a table at the current cursor position."""
     try:
         # HwpTableTools 인스턴스 가져오기
@@ -432,7 +734,10 @@ def hwp_insert_table(rows: int, cols: int) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_insert_paragraph() -> str:
+@com_guarded()
+@idempotent
+@mutating
+def hwp_insert_paragraph(idempotency_key: str = None) -> str:
     """Insert a new paragraph."""
     try:
         hwp = get_hwp_controller()
@@ -449,12 +754,48 @@ def hwp_insert_paragraph() -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_get_text() -> str:
-    """Get the text content of the current document."""
+@com_guarded()
+@read_only()
+def hwp_get_text(
+    offset: int = None,
+    limit: int = None,
+    unit: str = "chars",
+    page_from: int = None,
+    page_to: int = None
+):
+    """
+    Get the text content of the current document.
+
+    인자 없이 호출하면 전체 텍스트(str)를 반환합니다. offset/limit이나 쪽 범위를 지정하면
+    해당 구간만 잘라 다음 구간 위치와 함께 dict로 반환합니다.
+
+    Args:
+        offset: 시작 위치 (unit 단위, 0부터)
+        limit: 최대 길이 (unit 단위)
+        unit: "chars" (문자) 또는 "paragraphs" (문단)
+        page_from: 시작 쪽 (1부터, 포함)
+        page_to: 끝 쪽 (포함)
+
+    Returns:
+        str | dict: 전체 텍스트, 또는 {"text", "unit", "offset", "returned", "total", "next_offset",
+            "page_from", "page_to"} (next_offset이 None이면 마지막 구간)
+    """
     try:
         hwp = get_hwp_controller()
         if not hwp:
             return "Error: Failed to connect to HWP program"
+
+        if any(arg is not None for arg in (offset, limit, page_from, page_to)):
+            paragraphs = hwp.get_paragraphs()
+            if page_from is not None or page_to is not None:
+                paragraphs = select_pages(paragraphs, hwp.get_paragraph_pages(), page_from, page_to)
+            try:
+                result = slice_text(paragraphs, offset or 0, limit, unit, hwp.text_model.separator)
+            except ValueError as e:
+                return f"Error: {str(e)}"
+            result["page_from"] = page_from
+            result["page_to"] = page_to
+            return result
         
         text = hwp.get_text()
         if text is not None:
@@ -467,6 +808,8 @@ def hwp_get_text() -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_close_document(save: bool = False, suppress_dialog: bool = True) -> str:
     """
     현재 문서를 닫습니다.
@@ -493,6 +836,8 @@ def hwp_close_document(save: bool = False, suppress_dialog: bool = True) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_close_all_documents(save: bool = False, suppress_dialog: bool = True) -> str:
     """
     모든 문서를 닫습니다.
@@ -519,6 +864,8 @@ def hwp_close_all_documents(save: bool = False, suppress_dialog: bool = True) ->
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_undo(count: int = 1) -> str:
     """
     실행 취소(Undo)를 수행합니다.
@@ -545,6 +892,8 @@ def hwp_undo(count: int = 1) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@mutating
 def hwp_redo(count: int = 1) -> str:
     """
     다시 실행(Redo)을 수행합니다.
@@ -571,6 +920,7 @@ def hwp_redo(count: int = 1) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
 def hwp_find_text(text: str) -> str:
     """
     문서에서 텍스트를 찾습니다.
@@ -599,7 +949,130 @@ def hwp_find_text(text: str) -> str:
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_replace_text(find: str, replace: str, replace_all: bool = True) -> str:
+@com_guarded()
+@read_only()
+def hwp_find_all(text: str, regex: bool = False, max_hits: int = 500) -> dict:
+    """
+    문서에서 text가 나오는 모든 위치를 한 번에 찾습니다.
+    결과는 다음 변경 작업 전까지 캐시되며, 커서는 움직이지 않습니다.
+
+    Args:
+        text: 찾을 텍스트
+        regex: 정규식 검색 여부
+        max_hits: 최대 적중 수 (기본값: 500)
+
+    Returns:
+        dict: {"query", "count", "truncated", "hits": [{"pos", "end", "page", "cell", "table_index", "snippet"}, ...]}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"error": "HWP 프로그램에 연결할 수 없습니다."}
+
+        success, hits = hwp.find_all(text, regex, max_hits)
+        if not success:
+            return {"error": "찾기에 실패했습니다."}
+        return {"query": text, "count": len(hits), "truncated": len(hits) >= max_hits, "hits": hits}
+    except Exception as e:
+        logger.error(f"Error finding all: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+@mcp.tool()
+@com_guarded()
+@read_only()
+def hwp_find_many(labels: list, ignore_case: bool = False, max_hits_per_label: int = 100) -> dict:
+    """
+    여러 레이블(검색어)의 위치를 한 번에 찾습니다.
+    문서 텍스트를 한 번 읽어 모든 레이블을 동시에 검색하므로, 레이블마다 HWP 찾기를 반복하지 않습니다.
+    문서에 없는 레이블은 not_found에 담깁니다.
+
+    Args:
+        labels: 찾을 레이블 목록 (리스트 또는 JSON 문자열)
+        ignore_case: 영문 대소문자 구분 안 함
+        max_hits_per_label: 레이블별 최대 적중 수 (기본값: 100)
+
+    Returns:
+        dict: {"found": {레이블: [{"pos", "table_index", "cell_index", "snippet"}, ...]}, "not_found": [...]}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"error": "HWP 프로그램에 연결할 수 없습니다."}
+
+        if isinstance(labels, str):
+            try:
+                labels = json.loads(labels)
+            except json.JSONDecodeError:
+                labels = [label.strip() for label in labels.split(",")]
+        if not isinstance(labels, list) or not labels:
+            return {"error": "labels must be a non-empty list"}
+
+        success, result = hwp.find_many([str(label) for label in labels], ignore_case, max_hits_per_label)
+        return result
+    except Exception as e:
+        logger.error(f"Error finding labels: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+@mcp.tool()
+@com_guarded()
+def hwp_find_next(text: str = None, regex: bool = False, session_id: str = None) -> dict:
+    """
+    다음 적중 위치로 이동해 선택합니다.
+    처음 호출하면 찾기 세션을 만들어 session_id를 반환하고, 이후 session_id로 호출하면
+    문서 처음부터 다시 찾지 않고 마지막 적중 다음부터 이어서 찾습니다.
+    중간에 문서가 바뀌면 마지막 적중 위치 이후를 다시 검색합니다.
+
+    Args:
+        text: 찾을 텍스트 (새 세션을 시작할 때 필요)
+        regex: 정규식 검색 여부
+        session_id: 이전 호출이 반환한 세션 ID
+
+    Returns:
+        dict: {"status": "found" | "done", "session_id", "hit", "remaining"}
+            (적중 위치를 선택하지 못하면 "status": "error"와 "message", 세션은 다음 적중으로 이어짐)
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        if session_id:
+            session = find_sessions.get(session_id)
+            if session is None:
+                return {"status": "error", "message": f"Find session '{session_id}' not found or expired"}
+            # 세션 이후 문서가 바뀌었으면 마지막 적중 다음부터 다시 검색
+            if session.synced_key != hwp.get_edit_generation():
+                start = session.last_hit["end"] if session.last_hit else None
+                success, hits = hwp.find_all(session.query, session.regex, start_pos=start)
+                if not success:
+                    return {"status": "error", "message": "찾기에 실패했습니다."}
+                session.rebase(hits, hwp.get_edit_generation())
+        else:
+            if not text:
+                return {"status": "error", "message": "text or session_id is required"}
+            success, hits = hwp.find_all(text, regex)
+            if not success:
+                return {"status": "error", "message": "찾기에 실패했습니다."}
+            session = find_sessions.create(text, regex, hits, hwp.get_edit_generation())
+
+        hit = session.advance()
+        if hit is None:
+            find_sessions.close(session.session_id)
+            return {"status": "done", "session_id": session.session_id, "message": "더 이상 찾을 내용이 없습니다."}
+
+        if not hwp.select_range(hit["pos"], hit["end"]):
+            return {"status": "error", "session_id": session.session_id, "hit": hit, "remaining": session.remaining,
+                    "message": "찾은 위치를 선택하지 못했습니다. (다음 찾기는 이어서 할 수 있습니다)"}
+        return {"status": "found", "session_id": session.session_id, "hit": hit, "remaining": session.remaining}
+    except Exception as e:
+        logger.error(f"Error finding next: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+@com_guarded("AllReplace")
+@idempotent
+@mutating
+def hwp_replace_text(find: str, replace: str, replace_all: bool = True, idempotency_key: str = None) -> str:
     """
     문서에서 텍스트를 찾아 바꿉니다.
 
@@ -607,6 +1080,7 @@ def hwp_replace_text(find: str, replace: str, replace_all: bool = True) -> str:
         find: 찾을 텍스트
         replace: 바꿀 텍스트
         replace_all: 모두 바꾸기 여부 (기본값: True)
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
 
     Returns:
         str: 결과 메시지
@@ -628,6 +1102,139 @@ def hwp_replace_text(find: str, replace: str, replace_all: bool = True) -> str:
         logger.error(f"Error replacing text: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
+def _hwpx_document(arguments: dict):
+    """hwp_replace_many가 HWPX 파일을 직접 바꾸는 호출이면 그 파일을 멱등성 문서 키로 씁니다. (HWP를 실행하지 않음)"""
+    path = arguments.get("path")
+    return f"file:{os.path.normcase(os.path.abspath(path))}" if path else None
+
+@mcp.tool()
+@com_guarded("replace_many")
+@idempotent(document=_hwpx_document)
+@mutating
+def hwp_replace_many(mapping: dict, path: str = None, output_path: str = None, idempotency_key: str = None, ctx: Context = None) -> dict:
+    """
+    여러 항목을 한 번에 찾아 바꿉니다.
+
+    - path가 없으면 현재 열린 문서에서 바꿉니다. 문서 텍스트를 미리 검사해 없는 항목은 건너뛰고,
+      겹치는 항목("성명란"/"성명")이나 서로 맞바꾸는 항목(A→B, B→A)도 한 번에 바꾼 것과 같은 결과가 되도록 순서를 정합니다.
+    - path에 HWPX 파일을 주면 HWP를 거치지 않고 XML 본문을 한 번만 읽어 모든 항목을 바꿉니다.
+      (HWP에서 열려 있는 파일이면 먼저 닫으세요. 서식이 달라 여러 조각으로 나뉜 텍스트는 바뀌지 않습니다.)
+      HWP를 실행하지 않으며, counts는 파일에서 실제로 바꾼 횟수입니다.
+
+    Args:
+        mapping: {찾을 문자열: 바꿀 문자열} (딕셔너리 또는 JSON 문자열)
+        path: 직접 바꿀 HWPX 파일 경로 (선택)
+        output_path: HWPX 결과 저장 경로 (없으면 원본을 바꿈)
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
+
+    Returns:
+        dict: {"status", "mode": "document" | "hwpx", "counts": 항목별 바꾼 횟수, "skipped": 없는 항목}
+    """
+    try:
+        if isinstance(mapping, str):
+            mapping = json.loads(mapping)
+        if not isinstance(mapping, dict) or not mapping:
+            return {"status": "error", "message": "mapping must be a non-empty object"}
+
+        if path:
+            if not path.lower().endswith(".hwpx"):
+                return {"status": "error", "message": "Only HWPX files can be edited directly; open .hwp files and omit path"}
+            counts = replace_in_hwpx(path, mapping, output_path)
+            return {
+                "status": "success",
+                "mode": "hwpx",
+                "path": os.path.abspath(output_path or path),
+                "counts": {key: count for key, count in counts.items() if count},
+                "skipped": [key for key, count in counts.items() if not count],
+            }
+
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        success, result = hwp.replace_many(mapping)
+        if not success:
+            return {"status": "error", "message": result.get("error", "replace failed"), **result}
+        logger.info(f"Replaced {sum(result['counts'].values())} occurrences in {result['steps']} steps")
+        return {"status": "success", "mode": "document", **result}
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Replacement cancelled; replacements already applied were kept"}
+    except Exception as e:
+        logger.error(f"Error replacing many: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+def hwp_watchdog_status() -> dict:
+    """
+    COM 호출 워치독 상태를 반환합니다.
+
+    Returns:
+        dict: 동작별 제한 시간, 진행 중인 호출, 최근 제한 시간 초과 기록
+    """
+    try:
+        return com_watchdog.status()
+    except Exception as e:
+        logger.error(f"Error getting watchdog status: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+@mcp.tool()
+@com_guarded("export_text")
+def hwp_export_text(path: str, encoding: str = "utf-8", chunk_size: int = 65536) -> str:
+    """
+    현재 문서의 텍스트를 파일로 내보냅니다.
+    문서를 조각 단위로 읽어 바로 파일에 쓰므로, 큰 문서도 전체 텍스트를 한 번에 만들지 않습니다.
+
+    Args:
+        path: 저장할 텍스트 파일 경로
+        encoding: 파일 인코딩 (기본값: utf-8)
+        chunk_size: 한 번에 읽어 쓸 대략적인 문자 수
+
+    Returns:
+        str: 결과 메시지
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return "Error: Failed to connect to HWP program"
+
+        abs_path = os.path.abspath(path)
+        written = 0
+        with open(abs_path, "w", encoding=encoding, newline="") as f:
+            for chunk in hwp.iter_text(chunk_size):
+                check_cancelled()
+                f.write(chunk)
+                written += len(chunk)
+                report_progress(written, None, "characters exported")
+
+        logger.info(f"Exported {written} characters to {abs_path}")
+        return f"Text exported: {abs_path} ({written} characters)"
+    except OperationCancelled:
+        return f"Cancelled: 텍스트 내보내기가 취소되었습니다. ({path}에 일부만 저장됨)"
+    except Exception as e:
+        logger.error(f"Error exporting text: {str(e)}", exc_info=True)
+        return f"Error: {str(e)}"
+
+@mcp.tool()
+def hwp_cache_stats(reset: bool = False) -> dict:
+    """
+    읽기 전용 도구 결과 캐시의 적중/실패 통계를 반환합니다.
+
+    Args:
+        reset: True이면 통계를 반환한 뒤 0으로 초기화
+
+    Returns:
+        dict: hits, misses, hit_rate, invalidations, change_counter, size
+    """
+    try:
+        stats = tool_cache.stats()
+        if reset:
+            tool_cache.reset_stats()
+        return stats
+    except Exception as e:
+        logger.error(f"Error getting cache stats: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
 @mcp.tool()
 def hwp_ping_pong(message: str = "핑") -> str:
     """
@@ -662,21 +1269,70 @@ def hwp_ping_pong(message: str = "핑") -> str:
         logger.error(f"핑퐁 테스트 함수 오류: {str(e)}", exc_info=True)
         return f"테스트 오류 발생: {str(e)}"
 
+def _tabular_chunks(data, chunk_rows: int):
+    """
+    data가 CSV/TSV 텍스트나 파일 경로이면 행 청크 이터레이터를, 아니면 None을 반환합니다.
+
+    Raises:
+        FileNotFoundError: CSV/TSV 확장자의 경로처럼 보이지만 파일이 없는 경우
+    """
+    if not isinstance(data, str):
+        return None
+    if looks_like_path(data):
+        return read_chunks(data, chunk_rows)
+    stripped = data.strip().strip('"')
+    if "\n" not in stripped and os.path.splitext(stripped)[1].lower() in TABULAR_EXTENSIONS:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {stripped}")
+    if is_tabular_text(data):
+        return read_chunks(data, chunk_rows)
+    return None
+
+
+def _stream_result_message(result: dict) -> str:
+    """stream_table_rows 결과를 결과 메시지 뒷부분으로 만듭니다."""
+    message = f"{result['rows']}행, {result['chunks']}개 청크"
+    if result.get("appended_rows"):
+        message += f", {result['appended_rows']}행 추가"
+    if result.get("per_cell"):
+        message += f", 셀마다 입력한 청크 {result['per_cell']}개"
+    if result.get("clipped"):
+        message += f", 표 너비를 넘어 버린 값 {result['clipped']}개"
+    return message
+
+
 @mcp.tool()
-def hwp_create_table_with_data(rows: int, cols: int, data = None, has_header: bool = False) -> str:
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_create_table_with_data(rows: int, cols: int, data = None, has_header: bool = False, chunk_rows: int = DEFAULT_CHUNK_ROWS, data_path: str = None, idempotency_key: str = None, ctx: Context = None) -> str:
     """
     pywin32를 사용하여 현재 커서 위치에 표를 생성하고 데이터를 채웁니다.
+
+    data가 CSV/TSV 텍스트(여러 줄 또는 탭 구분)나 .csv/.tsv 파일 경로이면 chunk_rows행씩 읽어
+    표를 청크마다 늘리며 한 번에 붙여넣습니다. 전체 데이터를 메모리에 올리지 않으므로
+    수만 행짜리 내보내기 파일도 채울 수 있습니다. (표는 데이터가 rows보다 길면 늘어나고, 짧으면 rows행으로 맞춤)
+    큰 데이터는 data 대신 data_path로 파일을 가리키면 MCP 메시지에 담지 않고 서버가 직접 읽습니다.
+    붙여넣는 동안 클립보드를 잠시 쓰고 끝나면 이전 내용을 복원합니다. (비트맵 등 GDI 핸들 형식은 복원되지 않음)
     
     Args:
         rows: 표의 행 수
         cols: 표의 열 수
-        data: 표에 채울 데이터 (JSON 문자열 또는 파이썬 리스트)
+        data: 표에 채울 데이터 (JSON 문자열, 파이썬 리스트, CSV/TSV 텍스트 또는 파일 경로)
         has_header: 첫 번째 행을 헤더로 처리할지 여부
+        chunk_rows: CSV/TSV를 한 번에 읽고 붙여넣을 행 수 (기본값: 200)
+        data_path: 표 데이터 파일 경로 (JSON 2차원 배열, CSV/TSV, Markdown 표, pyarrow가 있으면 Parquet/Arrow).
+            지정하면 data는 무시합니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (행 단위 진행 상황 알림에 사용, 자동 주입)
         
     Returns:
         str: 결과 메시지
     """
     try:
+        # 파일 참조는 표를 만들기 전에 확인 (없는 파일이면 표를 만들지 않음)
+        chunks = load_table_chunks(data_path, chunk_rows) if data_path else _tabular_chunks(data, chunk_rows)
+        first, chunks = peek_chunks(chunks) if chunks is not None else (None, None)
+
         # HwpTableTools 인스턴스 가져오기
         table_tools = get_hwp_table_tools()
         if not table_tools:
@@ -684,14 +1340,22 @@ def hwp_create_table_with_data(rows: int, cols: int, data = None, has_header: bo
         
         # 현재 커서가 표 안에 있는지 확인
         hwp = get_hwp_controller()
-        is_in_table = False
-        try:
-            hwp.hwp.Run("TableCellBlock")
-            hwp.hwp.Run("Cancel")
-            is_in_table = True
-        except Exception as e:
-            logger.debug(f"표 셀 확인 실패 (무시): {e}")
-            is_in_table = False
+        is_in_table = hwp.get_cursor_context()["in_table"]
+
+        # CSV/TSV와 파일 참조는 청크 단위로 읽어 표를 늘려 가며 채움
+        if chunks is not None:
+            if not is_in_table:
+                initial_rows = max(1, min(rows, len(first))) if first else rows
+                if not table_tools.insert_table(initial_rows, cols):
+                    return "Error: Failed to create table"
+            if first is None:
+                return f"표 생성 완료 ({rows}x{cols}), 입력할 데이터 행이 없습니다."
+            success, result = hwp.stream_table_rows(
+                chunks, has_header=has_header, min_rows=0 if is_in_table else rows
+            )
+            if not success:
+                return f"표는 생성되었으나 데이터 입력에 실패했습니다: {result.get('error')}"
+            return f"표 생성 및 데이터 입력 완료 ({_stream_result_message(result)})"
 
         # 표 안에 있지 않은 경우에만 새 표 생성
         if not is_in_table:
@@ -756,12 +1420,18 @@ def hwp_create_table_with_data(rows: int, cols: int, data = None, has_header: bo
                 return "표는 생성되었으나 데이터 입력에 실패했습니다."
         
         return f"표 생성 완료 ({rows}x{cols})"
+    except OperationCancelled:
+        logger.info("표 데이터 입력 취소됨")
+        return "Cancelled: 표 데이터 입력이 취소되었습니다. 이미 입력된 행은 유지됩니다."
     except Exception as e:
         logger.error(f"표 생성 중 오류: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
 @mcp.tool()
-def hwp_create_complete_document(document_spec: dict) -> dict:
+@com_guarded("create_document")
+@idempotent
+@mutating
+def hwp_create_complete_document(document_spec: dict, idempotency_key: str = None) -> dict:
     """
     전체 문서를 한 번의 호출로 작성합니다. 문서 구조, 내용 및 서식을 JSON으로 정의하여 전달합니다.
     
@@ -788,6 +1458,7 @@ def hwp_create_complete_document(document_spec: dict) -> dict:
                 },
                 "save": true                    # 저장 여부 (선택 사항)
             }
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
     
     Returns:
         dict: 문서 생성 결과
@@ -995,7 +1666,10 @@ def _create_letter(hwp, params, document_spec):
         return {"status": "error", "message": f"Error: {str(e)}"}
 
 @mcp.tool()
-def hwp_create_document_from_text(content: str, title: str = None, format_content: bool = True, save_filename: str = None, preserve_linebreaks: bool = True) -> dict:
+@com_guarded("create_document")
+@idempotent
+@mutating
+def hwp_create_document_from_text(content: str = None, title: str = None, format_content: bool = True, save_filename: str = None, preserve_linebreaks: bool = True, content_path: str = None, idempotency_key: str = None, ctx: Context = None) -> dict:
     """
     단일 문자열로 된 텍스트 내용으로 문서를 생성합니다.
     
@@ -1005,11 +1679,19 @@ def hwp_create_document_from_text(content: str, title: str = None, format_conten
         format_content (bool): 내용 자동 포맷팅 여부 (줄바꿈, 문단 구분 등)
         save_filename (str, optional): 저장할 파일 이름. 제공되지 않으면 저장하지 않음.
         preserve_linebreaks (bool): 줄바꿈 유지 여부. True이면 원본 텍스트의 모든 줄바꿈 유지.
+        content_path (str, optional): 문서 내용 파일 경로 (.md/.txt, UTF-8 또는 CP949).
+            긴 내용을 MCP 메시지에 담지 않고 서버가 직접 읽습니다. 지정하면 content는 무시합니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입). 취소 요청 시 블록 단위로 멈춥니다.
         
     Returns:
         dict: 문서 생성 결과
     """
     try:
+        # 파일 참조는 새 문서를 만들기 전에 읽음 (없는 파일이면 문서를 만들지 않음)
+        if content_path:
+            content = load_text(content_path)
+
         hwp = get_hwp_controller()
         if not hwp:
             return {"status": "error", "message": "Failed to connect to HWP program"}
@@ -1060,8 +1742,9 @@ def hwp_create_document_from_text(content: str, title: str = None, format_conten
         
         # 내용 자동 포맷팅
         if format_content:
-            # 블록 단위로 처리
-            for block in blocks:
+            # 블록 단위로 처리 (블록 사이에서 취소 확인)
+            for block_index, block in enumerate(blocks):
+                check_cancelled()
                 # 블록 내 첫 번째 줄로 블록 유형 판단
                 first_line = block[0].strip() if block else ""
                 
@@ -1117,14 +1800,17 @@ def hwp_create_document_from_text(content: str, title: str = None, format_conten
                 
                 # 블록 사이에 추가 줄바꿈
                 hwp.insert_paragraph()
+                report_progress(block_index + 1, len(blocks), "blocks inserted")
         
         # 자동 포맷팅 없이 그대로 삽입 (줄바꿈 보존)
         else:
             hwp.set_font(None, 11, False, False)
-            for line in lines:
+            for line_index, line in enumerate(lines):
+                check_cancelled()
                 if line.strip():  # 내용이 있는 줄
                     hwp.insert_text(line)
                 hwp.insert_paragraph()  # 빈 줄이든 내용이 있는 줄이든 항상 줄바꿈
+                report_progress(line_index + 1, len(lines), "lines inserted")
         
         # 문서 저장
         result = {"status": "success", "message": "Document created from text successfully"}
@@ -1137,270 +1823,392 @@ def hwp_create_document_from_text(content: str, title: str = None, format_conten
         
         return result
     
+    except OperationCancelled:
+        logger.info("Document creation from text cancelled")
+        return {"status": "cancelled", "message": "Document creation cancelled; content inserted so far was kept"}
     except Exception as e:
         logger.error(f"Error creating document from text: {str(e)}", exc_info=True)
         return {"status": "error", "message": f"Error: {str(e)}"}
 
+def _run_batch_operation(hwp, operation: str, params: dict) -> dict:
+    """일괄 작업의 작업 하나를 실행하고 결과 딕셔너리를 반환합니다."""
+    global hwp_controller
+
+    result = {"operation": operation, "status": "success", "message": ""}
+    
+    try:
+        if operation == "create":
+            if hwp.create_new_document():
+                result["message"] = "New document created successfully"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to create new document"
+        
+        elif operation == "open":
+            path = params.get("path", "")
+            if not path:
+                result["status"] = "error"
+                result["message"] = "File path is required"
+            elif hwp.open_document(path):
+                result["message"] = f"Document opened: {path}"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to open document"
+        
+        elif operation == "save":
+            path = params.get("path", None)
+            if path and hwp.save_document(path):
+                result["message"] = f"Document saved to: {path}"
+            elif not path:
+                temp_path = os.path.join(os.getcwd(), "temp_document.hwp")
+                if hwp.save_document(temp_path):
+                    result["message"] = f"Document saved to: {temp_path}"
+                    result["path"] = temp_path
+                else:
+                    result["status"] = "error"
+                    result["message"] = "Failed to save document"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to save document"
+        
+        elif operation == "insert_text":
+            text = params.get("text", "")
+            preserve_linebreaks = params.get("preserve_linebreaks", True)
+            
+            if not text:
+                result["status"] = "error"
+                result["message"] = "Text is required"
+            elif preserve_linebreaks and ('\n' in text or '\\n' in text):
+                # 줄바꿈 보존 처리 개선
+                # 이스케이프된 줄바꿈 문자(\n)와 실제 줄바꿈 문자 모두 처리
+                # 먼저 이스케이프된 줄바꿈 문자를 실제 줄바꿈으로 변환
+                processed_text = text.replace('\\n', '\n')
+                lines = processed_text.split('\n')
+                
+                success = True
+                for i, line in enumerate(lines):
+                    if not hwp.insert_text(line):
+                        success = False
+                        break
+                    # 마지막 줄이 아니면 줄바꿈 삽입
+                    if i < len(lines) - 1:
+                        hwp.insert_paragraph()
+                
+                if success:
+                    result["message"] = "Text with line breaks inserted successfully"
+                else:
+                    result["status"] = "error"
+                    result["message"] = "Failed to insert text with line breaks"
+            elif hwp.insert_text(text):
+                result["message"] = "Text inserted successfully"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to insert text"
+        
+        elif operation == "set_font":
+            name = params.get("name", None)
+            size = params.get("size", None)
+            bold = params.get("bold", False)
+            italic = params.get("italic", False)
+            underline = params.get("underline", False)
+            select_previous_text = params.get("select_previous_text", False)
+            
+            if hwp.set_font_style(font_name=name, font_size=size, bold=bold, italic=italic, underline=underline, select_previous_text=select_previous_text):
+                result["message"] = "Font set successfully"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to set font"
+        
+        elif operation == "insert_paragraph":
+            count = params.get("count", 1)  # 여러 줄 삽입 가능
+            success = True
+            for _ in range(count):
+                if not hwp.insert_paragraph():
+                    success = False
+                    break
+            
+            if success:
+                result["message"] = f"{count} paragraph(s) inserted successfully"
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to insert paragraph"
+        
+        elif operation == "insert_table":
+            rows = params.get("rows", 0)
+            cols = params.get("cols", 0)
+            data = params.get("data", [])
+            data_path = params.get("data_path")
+            has_header = params.get("has_header", False)
+            
+            table_tools = get_hwp_table_tools()
+            if not table_tools:
+                result["status"] = "error"
+                result["message"] = "Failed to get table tools instance"
+            elif rows <= 0 or cols <= 0:
+                result["status"] = "error"
+                result["message"] = "Valid rows and cols are required"
+            elif data_path:
+                # 파일 참조는 청크 단위로 읽어 채움 (이미 COM 작업 스레드 안이므로 감시 없이 직접 호출)
+                resp = hwp_create_table_with_data.__wrapped__(
+                    rows=rows, cols=cols, has_header=has_header, data_path=data_path
+                )
+                result["message"] = resp
+                if not resp.startswith("표 생성"):
+                    result["status"] = "error"
+            else:
+                # 데이터가 있으면 테이블 생성 후 데이터 채우기
+                if data:
+                    resp = table_tools.create_table_with_data(rows, cols, json.dumps(data) if isinstance(data, list) else data, has_header)
+                    result["message"] = resp
+                    if resp.startswith("Error"):
+                        result["status"] = "error"
+                else:
+                    resp = table_tools.insert_table(rows, cols)
+                    result["message"] = resp
+                    if resp.startswith("Error"):
+                        result["status"] = "error"
+        
+        elif operation == "set_table_cell_text":
+            row = params.get("row", 0)
+            col = params.get("col", 0)
+            text = params.get("text", "")
+            
+            table_tools = get_hwp_table_tools()
+            if not table_tools:
+                result["status"] = "error"
+                result["message"] = "Failed to get table tools instance"
+            elif row <= 0 or col <= 0:
+                result["status"] = "error"
+                result["message"] = "Valid row and col are required"
+            else:
+                resp = table_tools.set_cell_text(row, col, text, params.get("table_index"))
+                result["message"] = resp
+                if resp.startswith("Error"):
+                    result["status"] = "error"
+        
+        elif operation == "merge_table_cells":
+            start_row = params.get("start_row", 0)
+            start_col = params.get("start_col", 0)
+            end_row = params.get("end_row", 0)
+            end_col = params.get("end_col", 0)
+            
+            table_tools = get_hwp_table_tools()
+            if not table_tools:
+                result["status"] = "error"
+                result["message"] = "Failed to get table tools instance"
+            elif start_row <= 0 or start_col <= 0 or end_row <= 0 or end_col <= 0:
+                result["status"] = "error"
+                result["message"] = "Valid cell coordinates are required"
+            else:
+                resp = table_tools.merge_cells(start_row, start_col, end_row, end_col, params.get("table_index"))
+                result["message"] = resp
+                if resp.startswith("Error"):
+                    result["status"] = "error"
+        
+        elif operation == "get_text":
+            text = hwp.get_text()
+            if text is not None:
+                result["message"] = "Text retrieved successfully"
+                result["text"] = text
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to retrieve text"
+        
+        elif operation == "close":
+            save = params.get("save", True)
+            if hwp.disconnect():
+                result["message"] = "Document closed successfully"
+                # 전역 변수 초기화
+                hwp_controller = None
+            else:
+                result["status"] = "error"
+                result["message"] = "Failed to close document"
+        
+        # 새로 추가: 문서 한 번에 생성
+        elif operation == "create_document_from_text":
+            content = params.get("content", "")
+            content_path = params.get("content_path")
+            title = params.get("title", None)
+            format_content = params.get("format_content", True)
+            save_filename = params.get("save_filename", None)
+            preserve_linebreaks = params.get("preserve_linebreaks", True)
+            
+            if not content and not content_path:
+                result["status"] = "error"
+                result["message"] = "Document content is required"
+            else:
+                # 내부적으로 기존 함수 호출 (이미 COM 작업 스레드 안이므로 감시 없이 직접 호출)
+                doc_result = hwp_create_document_from_text.__wrapped__(
+                    content=content,
+                    content_path=content_path,
+                    title=title,
+                    format_content=format_content,
+                    save_filename=save_filename,
+                    preserve_linebreaks=preserve_linebreaks
+                )
+                
+                result["status"] = doc_result.get("status", "error")
+                result["message"] = doc_result.get("message", "Unknown error")
+                if "saved_path" in doc_result:
+                    result["saved_path"] = doc_result["saved_path"]
+        
+        else:
+            result["status"] = "error"
+            result["message"] = f"Unknown operation: {operation}"
+    
+    except Exception as e:
+        result["status"] = "error"
+        result["message"] = f"Error in operation '{operation}': {str(e)}"
+
+    return result
+
 @mcp.tool()
-def hwp_batch_operations(operations: list) -> dict:
+@com_guarded("batch")
+@idempotent
+@mutating
+def hwp_batch_operations(
+    operations: list = None,
+    time_limit: float = None,
+    continuation_token: str = None,
+    stop_on_error: bool = False,
+    operations_path: str = None,
+    idempotency_key: str = None,
+    ctx: Context = None
+) -> dict:
     """
     여러 HWP 작업을 한 번의 호출로 일괄 처리합니다.
-    
+
+    time_limit을 지정하면 제한 시간까지만 실행하고 부분 결과와 이어하기 토큰을 반환합니다.
+    같은 operations와 continuation_token으로 다시 호출하면 다음 작업부터 이어서 실행합니다.
+
     Args:
         operations (list): 실행할 작업 목록. 각 작업은 다음 형식의 딕셔너리입니다:
             {
                 "operation": "작업명", # 예: "create", "set_font", "insert_text" 등
                 "params": {파라미터 딕셔너리}  # 해당 작업에 필요한 파라미터
             }
-    
+        time_limit (float, optional): 이번 호출에서 작업을 실행할 최대 시간(초)
+        continuation_token (str, optional): 이전 호출이 반환한 이어하기 토큰
+        stop_on_error (bool): 작업이 실패하면 멈추고 실패한 작업을 가리키는 토큰을 반환할지 여부
+        operations_path (str, optional): 작업 목록 JSON 파일 경로 (배열 또는 {"operations": [...]}).
+            긴 목록을 MCP 메시지에 담지 않고 서버가 직접 읽습니다. 이어하기 때도 같은 파일을 지정하세요.
+            작업의 params에도 "data_path"(insert_table), "content_path"(create_document_from_text)를 쓸 수 있습니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (작업 단위 진행 상황 알림에 사용, 자동 주입)
+
     Returns:
         dict: 각 작업의 실행 결과
+            - status: "success" (모두 완료) 또는 "partial" (중단 또는 취소됨)
+            - results: 이번 호출에서 실행한 작업 결과 (index 포함)
+            - next_operation, continuation_token: 중단된 경우 다음 작업 인덱스와 이어하기 토큰
+            - cancelled: 클라이언트 취소로 중단된 경우 True
     """
     try:
+        if operations_path:
+            operations = load_operations(operations_path)
+        if not operations:
+            return {"status": "error", "message": "operations or operations_path is required"}
+
         hwp = get_hwp_controller()
         if not hwp:
             return {"status": "error", "message": "Failed to connect to HWP program"}
-        
-        results = []
-        
-        for op in operations:
-            operation = op.get("operation", "")
-            params = op.get("params", {})
-            
-            result = {"operation": operation, "status": "success", "message": ""}
-            
+
+        digest = operations_digest(operations)
+        start_index = 0
+
+        # 이어하기: 토큰 검증 후 문서 체크포인트(문서, 커서 위치) 확인
+        if continuation_token:
             try:
-                if operation == "create":
-                    if hwp.create_new_document():
-                        result["message"] = "New document created successfully"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to create new document"
-                
-                elif operation == "open":
-                    path = params.get("path", "")
-                    if not path:
-                        result["status"] = "error"
-                        result["message"] = "File path is required"
-                    elif hwp.open_document(path):
-                        result["message"] = f"Document opened: {path}"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to open document"
-                
-                elif operation == "save":
-                    path = params.get("path", None)
-                    if path and hwp.save_document(path):
-                        result["message"] = f"Document saved to: {path}"
-                    elif not path:
-                        temp_path = os.path.join(os.getcwd(), "temp_document.hwp")
-                        if hwp.save_document(temp_path):
-                            result["message"] = f"Document saved to: {temp_path}"
-                            result["path"] = temp_path
-                        else:
-                            result["status"] = "error"
-                            result["message"] = "Failed to save document"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to save document"
-                
-                elif operation == "insert_text":
-                    text = params.get("text", "")
-                    preserve_linebreaks = params.get("preserve_linebreaks", True)
-                    
-                    if not text:
-                        result["status"] = "error"
-                        result["message"] = "Text is required"
-                    elif preserve_linebreaks and ('\n' in text or '\\n' in text):
-                        # 줄바꿈 보존 처리 개선
-                        # 이스케이프된 줄바꿈 문자(\n)와 실제 줄바꿈 문자 모두 처리
-                        # 먼저 이스케이프된 줄바꿈 문자를 실제 줄바꿈으로 변환
-                        processed_text = text.replace('\\n', '\n')
-                        lines = processed_text.split('\n')
-                        
-                        success = True
-                        for i, line in enumerate(lines):
-                            if not hwp.insert_text(line):
-                                success = False
-                                break
-                            # 마지막 줄이 아니면 줄바꿈 삽입
-                            if i < len(lines) - 1:
-                                hwp.insert_paragraph()
-                        
-                        if success:
-                            result["message"] = "Text with line breaks inserted successfully"
-                        else:
-                            result["status"] = "error"
-                            result["message"] = "Failed to insert text with line breaks"
-                    elif hwp.insert_text(text):
-                        result["message"] = "Text inserted successfully"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to insert text"
-                
-                elif operation == "set_font":
-                    name = params.get("name", None)
-                    size = params.get("size", None)
-                    bold = params.get("bold", False)
-                    italic = params.get("italic", False)
-                    underline = params.get("underline", False)
-                    select_previous_text = params.get("select_previous_text", False)
-                    
-                    if hwp.set_font_style(font_name=name, font_size=size, bold=bold, italic=italic, underline=underline, select_previous_text=select_previous_text):
-                        result["message"] = "Font set successfully"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to set font"
-                
-                elif operation == "insert_paragraph":
-                    count = params.get("count", 1)  # 여러 줄 삽입 가능
-                    success = True
-                    for _ in range(count):
-                        if not hwp.insert_paragraph():
-                            success = False
-                            break
-                    
-                    if success:
-                        result["message"] = f"{count} paragraph(s) inserted successfully"
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to insert paragraph"
-                
-                elif operation == "insert_table":
-                    rows = params.get("rows", 0)
-                    cols = params.get("cols", 0)
-                    data = params.get("data", [])
-                    has_header = params.get("has_header", False)
-                    
-                    table_tools = get_hwp_table_tools()
-                    if not table_tools:
-                        result["status"] = "error"
-                        result["message"] = "Failed to get table tools instance"
-                    elif rows <= 0 or cols <= 0:
-                        result["status"] = "error"
-                        result["message"] = "Valid rows and cols are required"
-                    else:
-                        # 데이터가 있으면 테이블 생성 후 데이터 채우기
-                        if data:
-                            resp = table_tools.create_table_with_data(rows, cols, json.dumps(data) if isinstance(data, list) else data, has_header)
-                            result["message"] = resp
-                            if resp.startswith("Error"):
-                                result["status"] = "error"
-                        else:
-                            resp = table_tools.insert_table(rows, cols)
-                            result["message"] = resp
-                            if resp.startswith("Error"):
-                                result["status"] = "error"
-                
-                elif operation == "set_table_cell_text":
-                    row = params.get("row", 0)
-                    col = params.get("col", 0)
-                    text = params.get("text", "")
-                    
-                    table_tools = get_hwp_table_tools()
-                    if not table_tools:
-                        result["status"] = "error"
-                        result["message"] = "Failed to get table tools instance"
-                    elif row <= 0 or col <= 0:
-                        result["status"] = "error"
-                        result["message"] = "Valid row and col are required"
-                    else:
-                        resp = table_tools.set_cell_text(row, col, text)
-                        result["message"] = resp
-                        if resp.startswith("Error"):
-                            result["status"] = "error"
-                
-                elif operation == "merge_table_cells":
-                    start_row = params.get("start_row", 0)
-                    start_col = params.get("start_col", 0)
-                    end_row = params.get("end_row", 0)
-                    end_col = params.get("end_col", 0)
-                    
-                    table_tools = get_hwp_table_tools()
-                    if not table_tools:
-                        result["status"] = "error"
-                        result["message"] = "Failed to get table tools instance"
-                    elif start_row <= 0 or start_col <= 0 or end_row <= 0 or end_col <= 0:
-                        result["status"] = "error"
-                        result["message"] = "Valid cell coordinates are required"
-                    else:
-                        resp = table_tools.merge_cells(start_row, start_col, end_row, end_col)
-                        result["message"] = resp
-                        if resp.startswith("Error"):
-                            result["status"] = "error"
-                
-                elif operation == "get_text":
-                    text = hwp.get_text()
-                    if text is not None:
-                        result["message"] = "Text retrieved successfully"
-                        result["text"] = text
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to retrieve text"
-                
-                elif operation == "close":
-                    save = params.get("save", True)
-                    if hwp.disconnect():
-                        result["message"] = "Document closed successfully"
-                        # 전역 변수 초기화
-                        global hwp_controller
-                        hwp_controller = None
-                    else:
-                        result["status"] = "error"
-                        result["message"] = "Failed to close document"
-                
-                # 새로 추가: 문서 한 번에 생성
-                elif operation == "create_document_from_text":
-                    content = params.get("content", "")
-                    title = params.get("title", None)
-                    format_content = params.get("format_content", True)
-                    save_filename = params.get("save_filename", None)
-                    preserve_linebreaks = params.get("preserve_linebreaks", True)
-                    
-                    if not content:
-                        result["status"] = "error"
-                        result["message"] = "Document content is required"
-                    else:
-                        # 내부적으로 기존 함수 호출
-                        doc_result = hwp_create_document_from_text(
-                            content=content,
-                            title=title,
-                            format_content=format_content,
-                            save_filename=save_filename,
-                            preserve_linebreaks=preserve_linebreaks
-                        )
-                        
-                        result["status"] = doc_result.get("status", "error")
-                        result["message"] = doc_result.get("message", "Unknown error")
-                        if "saved_path" in doc_result:
-                            result["saved_path"] = doc_result["saved_path"]
-                
-                else:
-                    result["status"] = "error"
-                    result["message"] = f"Unknown operation: {operation}"
-            
-            except Exception as e:
-                result["status"] = "error"
-                result["message"] = f"Error in operation '{operation}': {str(e)}"
-            
+                checkpoint = decode_continuation_token(continuation_token, operations)
+            except ValueError as e:
+                return {"status": "error", "message": str(e)}
+
+            if checkpoint.get("document") and checkpoint["document"] != hwp.get_document_key():
+                return {
+                    "status": "error",
+                    "message": "Active document differs from the checkpoint. Switch back to the original document and retry."
+                }
+            if checkpoint.get("pos"):
+                hwp._set_position(checkpoint["pos"])
+            start_index = checkpoint["next"]
+            logger.info(f"Resuming batch at operation {start_index}/{len(operations)}")
+
+        started = time.monotonic()
+        results = []
+        next_index = len(operations)
+        cancelled = False
+
+        for index in range(start_index, len(operations)):
+            # 취소 요청은 작업 경계에서 받아들여 이어하기 토큰으로 돌려줌
+            if cancel_requested():
+                next_index = index
+                cancelled = True
+                break
+
+            # 제한 시간이 지나면 (최소 한 개는 실행한 뒤) 중단
+            if time_limit is not None and results and time.monotonic() - started >= time_limit:
+                next_index = index
+                break
+
+            op = operations[index]
+            result = _run_batch_operation(hwp, op.get("operation", ""), op.get("params", {}))
+            result["index"] = index
             results.append(result)
-        
-        return {"status": "success", "results": results}
-    
+
+            report_progress(index + 1, len(operations), op.get("operation", ""))
+
+            if stop_on_error and result["status"] == "error":
+                next_index = index
+                break
+
+        if next_index >= len(operations):
+            return {"status": "success", "results": results}
+
+        if cancelled:
+            logger.info(f"Batch cancelled before operation {next_index}/{len(operations)}")
+
+        return {
+            "status": "partial",
+            "cancelled": cancelled,
+            "results": results,
+            "completed": next_index,
+            "total": len(operations),
+            "next_operation": next_index,
+            "continuation_token": encode_continuation_token(
+                next_index,
+                len(operations),
+                digest,
+                hwp.get_document_key() if hwp else "",
+                hwp._get_current_position() if hwp else None
+            )
+        }
+
     except Exception as e:
         logger.error(f"Error in batch operations: {str(e)}", exc_info=True)
         return {"status": "error", "message": f"Error: {str(e)}"}
 
 @mcp.tool()
-def hwp_fill_table_with_data(data, start_row: int = 1, start_col: int = 1, has_header: bool = False) -> str:
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_fill_table_with_data(data = None, start_row: int = 1, start_col: int = 1, has_header: bool = False, table_index: int = None, chunk_rows: int = DEFAULT_CHUNK_ROWS, data_path: str = None, idempotency_key: str = None, ctx: Context = None) -> str:
     """
     이미 존재하는 표에 데이터를 채웁니다.
+    data가 CSV/TSV 텍스트(여러 줄 또는 탭 구분)나 .csv/.tsv 파일 경로이면 chunk_rows행씩 읽어
+    한 번에 붙여넣고, 표보다 긴 데이터는 표 끝에 행을 추가하며 채웁니다.
+    붙여넣는 동안 클립보드를 잠시 쓰고 끝나면 이전 내용을 복원합니다. (비트맵 등 GDI 핸들 형식은 복원되지 않음)
     
     Args:
-        data: 표에 채울 데이터 (JSON 문자열 또는 2차원 리스트)
+        data: 표에 채울 데이터 (JSON 문자열, 2차원 리스트, CSV/TSV 텍스트 또는 파일 경로)
         start_row: 시작 행 번호 (1부터 시작)
         start_col: 시작 열 번호 (1부터 시작)
         has_header: 첫 번째 행을 헤더로 처리할지 여부
+        table_index: 채울 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 지정하지 않으면 현재 커서 위치의 표
+        chunk_rows: CSV/TSV를 한 번에 읽고 붙여넣을 행 수 (기본값: 200)
+        data_path: 표 데이터 파일 경로 (JSON 2차원 배열, CSV/TSV, Markdown 표, pyarrow가 있으면 Parquet/Arrow).
+            큰 데이터를 MCP 메시지에 담지 않고 서버가 직접 읽습니다. 지정하면 data는 무시합니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (행 단위 진행 상황 알림에 사용, 자동 주입)
         
     Returns:
         str: 결과 메시지
@@ -1412,6 +2220,18 @@ def hwp_fill_table_with_data(data, start_row: int = 1, start_col: int = 1, has_h
         
         # 데이터 형식 로깅
         logger.info(f"Received data type: {type(data)}, data: {str(data)[:100]}...")
+
+        # CSV/TSV와 파일 참조는 청크 단위로 읽어 채움
+        chunks = load_table_chunks(data_path, chunk_rows) if data_path else _tabular_chunks(data, chunk_rows)
+        if chunks is not None:
+            success, result = get_hwp_controller().stream_table_rows(
+                chunks, table_index=table_index, start_row=start_row, start_col=start_col, has_header=has_header
+            )
+            if not success:
+                return f"Error: {result.get('error')}"
+            return f"표 데이터 입력 완료 ({_stream_result_message(result)})"
+        if data is None:
+            return "Error: data 또는 data_path가 필요합니다."
         
         # 데이터 처리
         processed_data = []
@@ -1486,16 +2306,71 @@ def hwp_fill_table_with_data(data, start_row: int = 1, start_col: int = 1, has_h
         
         logger.info(f"Final processed data has {len(final_data)} rows")
         
+        # 지정한 표로 이동
+        if table_index is not None:
+            moved, message = get_hwp_controller().goto_table(table_index)
+            if not moved:
+                return f"Error: {message}"
+
         # 표에 데이터 채우기
         result = table_tools.fill_table_with_data(final_data, start_row, start_col, has_header)
         logger.info(f"Table filling result: {result}")
         return result
         
+    except OperationCancelled:
+        logger.info("표 데이터 입력 취소됨")
+        return "Cancelled: 표 데이터 입력이 취소되었습니다. 이미 입력된 행은 유지됩니다."
     except Exception as e:
         logger.error(f"표 데이터 입력 중 오류: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
 @mcp.tool()
+@com_guarded()
+@read_only()
+def hwp_list_controls(control_type: str = None) -> dict:
+    """
+    문서의 컨트롤(표, 그림, 필드 등) 목록을 반환합니다.
+    표 도구의 table_index 인자에 여기서 얻은 표 번호를 사용하세요.
+
+    Args:
+        control_type: 종류 필터 ("table", "picture", "field", "shape", "equation" 등). 없으면 전체
+
+    Returns:
+        dict: {"summary": 종류별 개수, "controls": [{"index", "type", "ctrl_id", "anchor",
+            표의 경우 "table_index", "rows", "cols", "first_cell", "first_cell_text"}, ...]}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"error": "HWP 프로그램에 연결할 수 없습니다."}
+
+        index = hwp.get_control_index()
+        return {"summary": index.summary(), "controls": index.by_type(control_type)}
+    except Exception as e:
+        logger.error(f"컨트롤 목록 조회 오류: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+@mcp.tool()
+@com_guarded()
+@read_only(cursor_sensitive=True)
+def hwp_cursor_context() -> dict:
+    """
+    현재 커서 위치 정보를 반환합니다. 선택 상태를 바꾸지 않습니다.
+
+    Returns:
+        dict: {"pos", "in_table", "cell" (예: "B3"), "row", "col", "table_index"}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"error": "HWP 프로그램에 연결할 수 없습니다."}
+        return hwp.get_cursor_context(resolve_table=True)
+    except Exception as e:
+        logger.error(f"커서 위치 조회 오류: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+@mcp.tool()
+@com_guarded()
 def hwp_navigate(direction: str) -> str:
     """
     표에서 지정된 방향으로 이동하고 현재 셀의 내용을 반환합니다.
@@ -1525,6 +2400,31 @@ def hwp_navigate(direction: str) -> str:
 
 
 @mcp.tool()
+@com_guarded()
+def hwp_measure_cell_read(samples: int = 5) -> dict:
+    """
+    현재 셀을 블록 내보내기(saveblock)와 클립보드 방식으로 읽는 평균 시간을 비교합니다.
+    커서가 표 안에 있어야 하며, 측정 중에는 클립보드 내용이 바뀝니다.
+
+    Args:
+        samples: 방식별 반복 횟수 (기본값: 5)
+
+    Returns:
+        dict: {"samples", "saveblock_ms", "clipboard_ms", "speedup", "same_text"}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"error": "HWP 프로그램에 연결할 수 없습니다."}
+        _, result = hwp.measure_cell_read_latency(samples)
+        return result
+    except Exception as e:
+        logger.error(f"셀 읽기 시간 측정 오류: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+
+@mcp.tool()
+@com_guarded()
 def hwp_find_and_show_cell(text: str) -> str:
     """
     텍스트를 찾고 해당 셀의 내용을 반환합니다.
@@ -1554,7 +2454,9 @@ def hwp_find_and_show_cell(text: str) -> str:
 
 
 @mcp.tool()
-def hwp_table_view(depth: int = 1) -> dict:
+@com_guarded()
+@read_only(cursor_sensitive=True)
+def hwp_table_view(depth: int = 1, table_index: int = None) -> dict:
     """
     현재 위치 기준으로 주변 셀들의 내용을 가져옵니다.
     표 구조를 파악할 때 유용합니다.
@@ -1578,6 +2480,7 @@ def hwp_table_view(depth: int = 1) -> dict:
 
     Args:
         depth: 탐색 깊이 (기본값: 1, 최대 권장: 3)
+        table_index: 볼 표 번호 (문서 순서, 0부터). 지정하면 그 표의 첫 번째 셀 기준으로 봅니다.
 
     Returns:
         dict: 셀 내용 딕셔너리
@@ -1595,6 +2498,11 @@ def hwp_table_view(depth: int = 1) -> dict:
         # depth 제한
         depth = min(max(depth, 1), 5)
 
+        if table_index is not None:
+            moved, message = hwp.goto_table(table_index)
+            if not moved:
+                return {"error": message}
+
         success, result = hwp.get_table_view(depth)
 
         if success:
@@ -1609,17 +2517,22 @@ def hwp_table_view(depth: int = 1) -> dict:
 
 
 @mcp.tool()
+@com_guarded("table_fill")
 def hwp_fill_cells(
     path_value_map: dict,
-    mode: str = "replace"
+    mode: str = "replace",
+    use_profile: bool = True,
+    dry_run: bool = False,
+    idempotency_key: str = None
 ) -> str:
     """
     표에서 경로를 따라 셀에 값을 입력합니다. 단일/배치 자동 인식.
 
-    **⚠️ 중요: 반드시 표 구조를 먼저 파악하세요!**
-    1. hwp_find_and_show_cell("레이블")로 시작점 찾기
-    2. hwp_table_view(depth=2)로 주변 셀 구조 확인
-    3. 구조를 이해한 후 hwp_fill_cells 호출
+    **⚠️ 중요: 입력할 셀을 먼저 확인하세요!**
+    1. hwp_fill_cells(..., dry_run=True)로 경로마다 대상 셀(주소)과 현재 내용 확인
+       (문서를 바꾸지 않으며, 실제 입력과 같은 순서로 양식 프로필과 병합 셀을 반영한 표 격자에서
+       경로를 해석하므로 결과가 실제 입력과 같음)
+    2. 대상이 맞으면 dry_run 없이 다시 호출
 
     **방향 키워드:** <left>, <right>, <up>, <down>
     - 텍스트 찾기 후 방향 이동을 조합하여 정확한 셀 탐색
@@ -1647,6 +2560,10 @@ def hwp_fill_cells(
 
     # 기존 내용 앞에 추가 (예: "원" → "1000원")
     hwp_fill_cells({"금액 > <right>": "1000"}, mode="prepend")
+
+    # 입력하지 않고 대상 셀만 확인
+    hwp_fill_cells({"합계 > <down> > <down>": "100"}, dry_run=True)
+    # → ✓ 합계 > <down> > <down> → 표 0 C4 현재: '' → 입력: '100'
     ```
 
     **경로 형식:**
@@ -1663,10 +2580,57 @@ def hwp_fill_cells(
             - "replace": 기존 내용 삭제 후 입력 (기본값)
             - "prepend": 기존 내용 앞에 추가 (예: "명" → "3명")
             - "append": 기존 내용 뒤에 추가
+        use_profile: 양식 프로필 사용 여부 (기본값: True). 같은 양식을 반복해서 채울 때
+            이전에 찾은 셀 위치로 바로 이동하고, 맞지 않는 셀만 다시 찾습니다.
+        dry_run: True면 입력하지 않고 경로마다 대상 셀과 현재 내용만 보고 (기본값: False).
+            문서를 바꾸지 않으므로 멱등성 키에 결과를 저장하지 않고 읽기 캐시도 비우지 않습니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
 
     Returns:
         str: 처리 결과 메시지
     """
+    if dry_run:
+        return _preview_fill_cells(path_value_map, use_profile)
+    return _fill_cells(path_value_map, mode, use_profile, idempotency_key=idempotency_key)
+
+def _preview_fill_cells(path_value_map: dict, use_profile: bool = True) -> str:
+    """hwp_fill_cells(dry_run=True): 경로마다 대상 셀과 현재 내용을 보고합니다."""
+    try:
+        if not path_value_map:
+            return "Error: path_value_map이 필요합니다."
+
+        hwp = get_hwp_controller()
+        if not hwp:
+            return "Error: HWP 프로그램에 연결할 수 없습니다."
+
+        success, preview = hwp.preview_paths(path_value_map, "right", use_profile=use_profile)
+        if not success:
+            return f"Error: {preview.get('error')}"
+        lines = []
+        found = 0
+        for item in preview["previews"]:
+            if not item["ok"]:
+                lines.append(f"✗ {item['path']}: {item['error']}")
+                continue
+            found += 1
+            line = (f"✓ {item['path']} → 표 {item['table_index']} {item['cell']} "
+                    f"현재: '{item['current']}' → 입력: '{item['value']}'")
+            if item["source"] == "profile":
+                line += " (양식 프로필)"
+            if "duplicate_of" in item:
+                line += f" (⚠ '{item['duplicate_of']}'와 같은 셀)"
+            lines.append(line)
+        summary = f"\n[미리보기] 총 {found}개 셀 확인, {len(lines) - found}개 실패 (문서는 바뀌지 않았습니다)"
+        return "\n".join(lines) + summary
+
+    except Exception as e:
+        logger.error(f"셀 미리보기 중 오류: {str(e)}", exc_info=True)
+        return f"Error: {str(e)}"
+
+@idempotent
+@mutating
+def _fill_cells(path_value_map: dict, mode: str = "replace", use_profile: bool = True, idempotency_key: str = None) -> str:
+    """hwp_fill_cells의 입력 경로 (멱등성 키와 읽기 캐시 무효화 적용)"""
     try:
         if not path_value_map:
             return "Error: path_value_map이 필요합니다."
@@ -1676,7 +2640,7 @@ def hwp_fill_cells(
             return "Error: HWP 프로그램에 연결할 수 없습니다."
 
         # 배치 처리 (direction은 경로에서 결정되므로 "right"를 기본값으로)
-        results = hwp.fill_cells_by_path_batch(path_value_map, "right", mode)
+        results = hwp.fill_cells_by_path_batch(path_value_map, "right", mode, use_profile=use_profile)
 
         # 결과 정리
         success_count = 0
@@ -1703,7 +2667,10 @@ def hwp_fill_cells(
 
 
 @mcp.tool()
-def hwp_fill_column_numbers(start: int = 1, end: int = 10, column: int = 1, from_first_cell: bool = True) -> str:
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_fill_column_numbers(start: int = 1, end: int = 10, column: int = 1, from_first_cell: bool = True, table_index: int = None, idempotency_key: str = None, ctx: Context = None) -> str:
     """
     표의 특정 열에 시작 숫자부터 끝 숫자까지 세로로 채웁니다.
     
@@ -1712,6 +2679,9 @@ def hwp_fill_column_numbers(start: int = 1, end: int = 10, column: int = 1, from
         end: 끝 숫자 (기본값: 10)
         column: 숫자를 채울 열 번호 (1부터 시작, 기본값: 1)
         from_first_cell: 정확히 표의 첫 번째 셀부터 시작할지 여부 (기본값: True)
+        table_index: 채울 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 지정하지 않으면 현재 커서 위치의 표
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
     
     Returns:
         str: 결과 메시지
@@ -1722,40 +2692,488 @@ def hwp_fill_column_numbers(start: int = 1, end: int = 10, column: int = 1, from
         if not hwp:
             return "Error: Failed to connect to HWP program"
         
-        # 표 선택 (현재 커서 위치에 표가 있어야 함)
+        # 표 선택 (table_index가 없으면 현재 커서 위치에 표가 있어야 함)
         logger.info(f"테이블 열에 숫자 채우기: 열 {column}, {start}부터 {end}까지")
         
-        # 표의 첫 번째 셀로 이동 (문서의 표 맨 앞)
-        hwp.hwp.Run("TableColBegin")
+        first_row = 0 if from_first_cell else 1
+        if table_index is not None:
+            # 색인된 표의 셀로 바로 이동 (방문한 셀 위치는 캐시되어 다음 호출에서는 SetPos 한 번)
+            success, message = hwp.goto_cell(table_index, first_row, column - 1)
+            if not success:
+                return f"Error: {message}"
+        else:
+            # 표의 첫 번째 셀로 이동 (문서의 표 맨 앞)
+            hwp.hwp.Run("TableColBegin")
         
-        # from_first_cell이 False인 경우에만 아래로 이동
-        if not from_first_cell:
-            hwp.hwp.Run("TableLowerCell")
+            # from_first_cell이 False인 경우에만 아래로 이동
+            if not from_first_cell:
+                hwp.hwp.Run("TableLowerCell")
         
-        # 지정된 열로 이동
-        for _ in range(column - 1):
-            hwp.hwp.Run("TableRightCell")
+            # 지정된 열로 이동
+            for _ in range(column - 1):
+                hwp.hwp.Run("TableRightCell")
         
+        # 셀 내용을 직접 지우므로 편집 세대를 먼저 올려 텍스트 모델이 다시 읽히도록 함 (표 구조는 그대로)
+        hwp.mark_document_changed(structural=False)
+
         # 각 행에 숫자 채우기
         for num in range(start, end + 1):
+            check_cancelled()
+            if table_index is not None and num > start:
+                success, message = hwp.goto_cell(table_index, first_row + num - start, column - 1)
+                if not success:
+                    return f"Error: {message}"
             # 셀 선택 및 내용 지우기
             hwp.hwp.Run("Select")
             hwp.hwp.Run("Delete")
             
             # 셀에 숫자 입력
             hwp.insert_text(str(num))
+            report_progress(num - start + 1, end - start + 1, "cells filled")
             
-            # 다음 행으로 이동 (마지막 행이 아닌 경우)
-            if num < end:
+            # 다음 행으로 이동 (마지막 행이 아닌 경우, 색인된 표는 goto_cell로 이동)
+            if num < end and table_index is None:
                 hwp.hwp.Run("TableLowerCell")
         
         logger.info(f"테이블 열({column})에 숫자 {start}~{end} 입력 완료")
         return f"테이블 열({column})에 숫자 {start}~{end} 입력 완료"
         
+    except OperationCancelled:
+        logger.info("테이블 숫자 채우기 취소됨")
+        return f"Cancelled: 테이블 열({column}) 숫자 채우기가 취소되었습니다."
     except Exception as e:
         logger.error(f"테이블 숫자 채우기 오류: {str(e)}", exc_info=True)
         return f"Error: {str(e)}"
 
+@mcp.tool()
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_fill_series(
+    axis: str = "column",
+    index: int = 1,
+    generator: str = "number",
+    start = 1,
+    step = 1,
+    count: int = 10,
+    format: str = None,
+    values: list = None,
+    offset: int = 1,
+    table_index: int = None,
+    idempotency_key: str = None,
+    ctx: Context = None
+) -> dict:
+    """
+    표의 한 열 또는 한 행에 연속 값을 채웁니다. 값 목록을 한 번에 만들어 셀 블록에 한 번에 붙여넣으므로
+    행이 많아도 빠르며, 붙여넣기 결과가 맞지 않으면 셀마다 입력합니다.
+    붙여넣는 동안 클립보드를 잠시 쓰고 끝나면 이전 내용을 복원합니다. (비트맵 등 GDI 핸들 형식은 복원되지 않음)
+
+    **사용 예시:**
+    ```
+    hwp_fill_series(axis="column", index=1, generator="number", start=1, count=100)          # 1~100
+    hwp_fill_series(axis="column", index=2, generator="date", start="2024-01-31", step="1m", count=12)
+    hwp_fill_series(axis="row", index=1, generator="ganada", count=5, offset=2)              # 가~마
+    hwp_fill_series(axis="column", index=3, generator="list", values=["월", "화", "수"], count=9)
+    hwp_fill_series(axis="column", index=4, generator="template", format="제{n}조", count=20)
+    ```
+
+    Args:
+        axis: "column"(열을 위에서 아래로) 또는 "row"(행을 왼쪽에서 오른쪽으로)
+        index: 채울 열(axis="column") 또는 행(axis="row") 번호 (1부터)
+        generator: "number", "date", "ganada", "korean_ordinal", "circled", "list", "template"
+        start: 시작 값 (숫자, 날짜 "YYYY-MM-DD", 순서 표시는 몇 번째부터인지)
+        step: 증가 폭 (날짜는 정수=일, "1w", "1m", "1y")
+        count: 채울 셀 수
+        format: 형식 (숫자: "03d", ",", "{}번" / 날짜: "%Y.%m.%d" / template: "{n}"을 포함한 문자열)
+        values: generator="list"에서 반복할 값 목록
+        offset: 첫 값을 넣을 행(axis="column") 또는 열(axis="row") 번호 (1부터, 머리행을 건너뛰려면 2)
+        table_index: 채울 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
+
+    Returns:
+        dict: {"status", "written", "method": "paste" | "per_cell", "first", "last"}
+    """
+    try:
+        if isinstance(values, str):
+            values = json.loads(values)
+        series = generate_series(generator, start, step, count, format, values)
+
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        success, result = hwp.fill_series(series, axis, index, offset, table_index)
+        if not success:
+            return {"status": "error", "message": result.get("error"), "written": result.get("written", 0)}
+        logger.info(f"Filled {result['written']} cells by {result['method']}")
+        return {
+            "status": "success",
+            **result,
+            "first": series[0] if series else None,
+            "last": series[-1] if series else None,
+        }
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Series fill cancelled; cells already written were kept"}
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"연속 값 채우기 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+@com_guarded("table_fill")
+def hwp_table_compute(
+    operation: str,
+    column: int = None,
+    table_index: int = None,
+    descending: bool = False,
+    op: str = "==",
+    value = None,
+    func: str = "sum",
+    key_column: int = None,
+    value_column: int = None,
+    columns: list = None,
+    label: str = "합계",
+    label_column: int = 1,
+    header_rows: int = 1,
+    decimals: int = None,
+    write: bool = None,
+    idempotency_key: str = None,
+    ctx: Context = None
+) -> dict:
+    """
+    표를 한 번에 읽어 정렬, 필터, 집계, 그룹별 집계, 합계 행 추가를 Python에서 계산하고,
+    표를 바꾸는 연산은 값이 달라진 셀만 다시 씁니다. "1,234원", "₩5,000", "(1,200)", "△300",
+    "12.5%", "3만" 같은 한국식 숫자 표기를 읽고 결과는 같은 열의 표기로 씁니다.
+
+    **사용 예시:**
+    ```
+    hwp_table_compute("sort", column=3, descending=True)                  # 3열 기준 내림차순 정렬
+    hwp_table_compute("filter", column=2, op=">=", value="1,000원")        # 조건에 맞는 행 확인 (표는 바꾸지 않음)
+    hwp_table_compute("filter", column=2, op=">=", value="1,000원", write=True)  # 맞는 행만 위로 모으고 나머지 행은 비움
+    hwp_table_compute("aggregate", column=3, func="avg")                  # 3열 평균 (표는 바꾸지 않음)
+    hwp_table_compute("group_by", key_column=1, value_column=3)           # 1열 값별 3열 합계 (표는 바꾸지 않음)
+    hwp_table_compute("totals", columns=[3, 4])                           # 합계 행 추가 (이미 있으면 갱신)
+    ```
+
+    Args:
+        operation: "sort", "filter", "aggregate", "group_by", "totals"
+        column: 기준 열 (1부터, sort/filter/aggregate)
+        table_index: 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+        descending: 내림차순 정렬 여부 (sort)
+        op: 필터 조건 "==", "!=", ">", ">=", "<", "<=", "contains", "startswith", "endswith", "empty", "not_empty"
+        value: 필터 비교 값
+        func: 집계 방식 "sum", "avg", "min", "max", "count"
+        key_column: 묶을 기준 열 (1부터, group_by)
+        value_column: 집계할 열 (1부터, group_by, 없으면 그룹별 행 수)
+        columns: 합계를 낼 열 목록 (1부터, totals, 없으면 숫자 열 전부)
+        label: 합계 행 레이블 (totals)
+        label_column: 레이블을 넣을 열 (1부터, totals)
+        header_rows: 계산에서 뺄 머리글 행 수
+        decimals: 결과 소수 자릿수 (없으면 열의 자릿수)
+        write: False면 표를 바꾸지 않고 계산 결과만 반환 (기본값: filter는 False, 나머지는 True).
+            filter를 write=True로 쓰면 조건에 맞지 않는 행의 내용이 지워지므로(행은 남고 비워짐)
+            결과 matrix를 먼저 확인한 뒤 쓰세요.
+            표를 바꾸지 않는 호출(aggregate, group_by, write=False)은 멱등성 키에 결과를 저장하지 않고
+            읽기 캐시도 비우지 않습니다.
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
+
+    Returns:
+        dict: {"status", "operation", "result", "written", "unchanged", "appended_rows", "source"}
+    """
+    try:
+        operation = (operation or "").lower()
+        if isinstance(columns, str):
+            columns = json.loads(columns)
+
+        def zero_based(number):
+            return None if number is None else int(number) - 1
+
+        options = {
+            "column": zero_based(column),
+            "descending": descending,
+            "op": op,
+            "value": value,
+            "func": func,
+            "key_column": zero_based(key_column),
+            "value_column": zero_based(value_column),
+            "columns": None if columns is None else [zero_based(c) for c in columns],
+            "label": label,
+            "label_column": zero_based(label_column),
+            "header_rows": header_rows,
+            "decimals": decimals,
+        }
+        if operation in ("sort", "filter", "aggregate") and column is None:
+            return {"status": "error", "message": f"'{operation}' requires column"}
+        if operation == "group_by" and key_column is None:
+            return {"status": "error", "message": "'group_by' requires key_column"}
+        if write is None:
+            # filter는 맞지 않는 행을 지우므로 명시적으로 요청할 때만 씀
+            write = operation != "filter"
+
+        if not write or operation not in ("sort", "filter", "totals"):
+            return _preview_table_compute(operation, table_index, options)
+        return _write_table_compute(operation, table_index, options, idempotency_key=idempotency_key)
+    except (KeyError, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"표 계산 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+def _compute_on_table(hwp, operation: str, table_index: int, options: dict):
+    """표를 한 번에 읽어 계산합니다. (스냅샷, 계산 결과, 응답 dict) 또는 읽기 실패 시 (None, None, 오류 dict)"""
+    success, snapshot = hwp.snapshot_table(table_index)
+    if not success:
+        return None, None, {"status": "error", "message": snapshot.get("error")}
+    computed = compute_table(snapshot["grid"].to_matrix(), operation, **options)
+    response = {
+        "status": "success",
+        "operation": operation,
+        "table_index": snapshot["table_index"],
+        "source": snapshot["source"],
+        "result": computed["result"],
+    }
+    return snapshot, computed, response
+
+def _preview_table_compute(operation: str, table_index: int, options: dict) -> dict:
+    """hwp_table_compute에서 표를 바꾸지 않는 경로: 계산 결과(와 쓸 경우의 matrix)만 반환합니다."""
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        _, computed, response = _compute_on_table(hwp, operation, table_index, options)
+        if computed is not None and computed["matrix"] is not None:
+            response["matrix"] = computed["matrix"]
+        return response
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Table compute cancelled"}
+    except (KeyError, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"표 계산 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@idempotent
+@mutating
+def _write_table_compute(operation: str, table_index: int, options: dict, idempotency_key: str = None) -> dict:
+    """hwp_table_compute의 다시 쓰기 경로 (멱등성 키와 읽기 캐시 무효화 적용)"""
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        snapshot, computed, response = _compute_on_table(hwp, operation, table_index, options)
+        if snapshot is None:
+            return response
+
+        success, written = hwp.write_table_matrix(snapshot["table_index"], computed["matrix"], snapshot["grid"])
+        if not success:
+            return {"status": "error", "message": written.get("error"), "written": written.get("written", 0)}
+        logger.info(f"Table {operation}: wrote {written['written']} cells, {written['unchanged']} unchanged")
+        response.update(written)
+        return response
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Table compute cancelled; cells already written were kept"}
+    except (KeyError, ValueError) as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"표 계산 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_update_table(
+    data: list,
+    table_index: int = None,
+    start_row: int = 1,
+    start_col: int = 1,
+    idempotency_key: str = None,
+    ctx: Context = None
+) -> dict:
+    """
+    표의 현재 내용을 한 번 읽어 새 데이터와 셀 단위로 비교하고, 값이 다른 셀만 씁니다.
+    같은 보고서를 몇 값만 바꿔 다시 채울 때 hwp_fill_table_with_data보다 훨씬 적게 씁니다.
+    데이터가 표보다 길면 표 끝에 행을 추가합니다.
+
+    **사용 예시:**
+    ```
+    hwp_update_table([["월", "판매량"], ["1월", "120"], ["2월", "155"]])   # 바뀐 "155"만 씀
+    hwp_update_table([["130", None, "140"]], start_row=3, start_col=2)      # None인 셀은 그대로 둠
+    ```
+
+    Args:
+        data: 새 값 (행 목록, JSON 문자열도 가능). None인 값은 건너뜀
+        table_index: 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+        start_row: data[0][0]이 들어갈 행 번호 (1부터)
+        start_col: data[0][0]이 들어갈 열 번호 (1부터)
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
+
+    Returns:
+        dict: {"status", "written", "skipped"(값이 같아 건너뛴 셀 수), "appended_rows",
+               "out_of_range", "merged", "moves"(예상 셀 이동 횟수), "source"}
+    """
+    try:
+        if isinstance(data, str):
+            data = json.loads(data)
+        if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
+            return {"status": "error", "message": "data must be a list of rows"}
+        if start_row < 1 or start_col < 1:
+            return {"status": "error", "message": "start_row and start_col must be >= 1"}
+
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        success, snapshot = hwp.snapshot_table(table_index)
+        if not success:
+            return {"status": "error", "message": snapshot.get("error")}
+        success, result = hwp.write_table_matrix(
+            snapshot["table_index"], data, snapshot["grid"], start_row - 1, start_col - 1
+        )
+        if not success:
+            return {"status": "error", "message": result.get("error"), "written": result.get("written", 0)}
+
+        result["skipped"] = result.pop("unchanged")
+        logger.info(f"Updated table {snapshot['table_index']}: {result['written']} written, {result['skipped']} skipped")
+        return {"status": "success", "table_index": snapshot["table_index"], "source": snapshot["source"], **result}
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Table update cancelled; cells already written were kept"}
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"표 갱신 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+@com_guarded()
+@read_only(cursor_sensitive=True)
+def hwp_get_cell_text(cell, table_index: int = None) -> dict:
+    """
+    표의 셀 하나를 주소로 바로 읽습니다. 커서 위치와 관계없이 어느 셀이든 같은 비용으로 읽으며,
+    병합된 셀 안의 위치는 그 셀을 읽습니다.
+
+    **사용 예시:**
+    ```
+    hwp_get_cell_text("B3", table_index=0)
+    hwp_get_cell_text([3, 2], table_index=0)   # 3행 2열 (1부터)
+    ```
+
+    Args:
+        cell: "B3" 같은 셀 주소 또는 [행, 열] (1부터)
+        table_index: 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+
+    Returns:
+        dict: {"status", "cell", "row", "col", "text"}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+        row, col = parse_cell_reference(cell)
+        text = hwp.get_table_cell_text(row + 1, col + 1, table_index)
+        return {"status": "success", "cell": index_to_cell(row, col), "row": row + 1, "col": col + 1, "text": text}
+    except (ValueError, RuntimeError) as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"셀 읽기 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+
+@mcp.tool()
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_set_cell_text(cell, text: str, table_index: int = None, idempotency_key: str = None) -> dict:
+    """
+    표의 셀 하나에 주소로 바로 텍스트를 입력합니다. (기존 내용은 지움)
+
+    **사용 예시:**
+    ```
+    hwp_set_cell_text("C5", "1,250원", table_index=0)
+    hwp_set_cell_text([5, 3], "1,250원")      # 커서가 있는 표의 5행 3열
+    ```
+
+    Args:
+        cell: "B3" 같은 셀 주소 또는 [행, 열] (1부터)
+        text: 입력할 텍스트
+        table_index: 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+
+    Returns:
+        dict: {"status", "cell"}
+    """
+    try:
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+        row, col = parse_cell_reference(cell)
+        if not hwp.fill_table_cell(row + 1, col + 1, text, table_index):
+            return {"status": "error", "message": f"Failed to set text of cell {index_to_cell(row, col)}"}
+        return {"status": "success", "cell": index_to_cell(row, col)}
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"셀 입력 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
+@mcp.tool()
+@com_guarded("table_fill")
+@idempotent
+@mutating
+def hwp_merge_cells_batch(ranges: list, table_index: int = None, idempotency_key: str = None, ctx: Context = None) -> dict:
+    """
+    표의 여러 범위를 한 번에 병합합니다. 모든 범위를 먼저 검사해(표 밖, 서로 겹침, 기존 병합 셀을
+    일부만 포함) 하나라도 잘못되면 아무것도 병합하지 않으며, 병합 후 표를 다시 읽어 결과를 확인합니다.
+
+    **사용 예시:**
+    ```
+    hwp_merge_cells_batch(["A1:D1", "A2:A4", "B5:D6"], table_index=0)
+    hwp_merge_cells_batch([[1, 1, 1, 4], {"start": "A2", "end": "A4"}])
+    ```
+
+    Args:
+        ranges: 병합 범위 목록 ("A1:B3", [시작 행, 시작 열, 끝 행, 끝 열] (1부터), {"start": "A1", "end": "B3"})
+        table_index: 표 번호 (문서 순서, 0부터, hwp_list_controls 참고). 없으면 커서가 있는 표
+        idempotency_key: 재시도 시 중복 실행을 막는 멱등성 키 (같은 키로 다시 호출하면 저장된 결과를 반환)
+        ctx: MCP 컨텍스트 (진행 상황 알림에 사용, 자동 주입)
+
+    Returns:
+        dict: {"status", "merged", "skipped"(한 칸이거나 이미 병합된 범위), "errors"(잘못된 범위),
+               "mismatched"(병합 결과가 다른 범위)}
+    """
+    try:
+        if isinstance(ranges, str):
+            ranges = json.loads(ranges)
+        if not isinstance(ranges, list):
+            return {"status": "error", "message": "ranges must be a list"}
+
+        hwp = get_hwp_controller()
+        if not hwp:
+            return {"status": "error", "message": "Failed to connect to HWP program"}
+
+        success, result = hwp.merge_cells_batch(ranges, table_index)
+        if "error" in result:
+            return {"status": "error", "message": result.pop("error"), **result}
+        if result.get("errors"):
+            return {"status": "error", "message": "Invalid ranges; nothing was merged", **result}
+        if not success:
+            return {"status": "error", "message": "Merged layout does not match the requested ranges", **result}
+        logger.info(f"Merged {len(result['merged'])} ranges in table {result['table_index']}")
+        return {"status": "success", **result}
+    except OperationCancelled:
+        return {"status": "cancelled", "message": "Merge cancelled; ranges already merged were kept"}
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        logger.error(f"셀 병합 오류: {str(e)}", exc_info=True)
+        return {"status": "error", "message": str(e)}
+
 if __name__ == "__main__":
     logger.info("Starting HWP MCP stdio server")
     try:
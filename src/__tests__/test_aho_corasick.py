@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the Aho-Corasick multi-pattern matcher
+"""
+
+import random
+
+from src.utils.aho_corasick import AhoCorasick
+
+
+def test_overlapping_patterns_are_all_reported():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert sorted(automaton.finditer("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_korean_labels_and_missing_labels():
+    """Labels that do not occur are simply absent from the result."""
+    automaton = AhoCorasick(["성명", "생년월일", "주소", "전화번호", "성명"])
+    found = automaton.search("성명: 홍길동\t생년월일: 2000.01.01\t성명(한자)")
+    assert found == {"성명": [0, 25], "생년월일": [8]}
+    assert automaton.patterns == ["성명", "생년월일", "주소", "전화번호"]
+
+
+def test_ignore_case():
+    automaton = AhoCorasick(["Email"], ignore_case=True)
+    assert list(automaton.finditer("EMAIL / email")) == [(0, "Email"), (8, "Email")]
+
+
+def test_matches_naive_search():
+    """Results agree with a brute-force scan on random text."""
+    rng = random.Random(7)
+    alphabet = "가나다ab"
+    patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(20)]
+    text = "".join(rng.choice(alphabet) for _ in range(500))
+
+    expected = sorted(
+        (i, p) for p in set(patterns) for i in range(len(text)) if text.startswith(p, i)
+    )
+    assert sorted(AhoCorasick(patterns).finditer(text)) == expected
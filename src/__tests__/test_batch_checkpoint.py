@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for batch continuation tokens
+"""
+
+import pytest
+from src.utils.batch_checkpoint import (
+    operations_digest,
+    encode_continuation_token,
+    decode_continuation_token,
+)
+
+OPERATIONS = [
+    {"operation": "insert_text", "params": {"text": "제목"}},
+    {"operation": "insert_paragraph"},
+    {"operation": "save", "params": {"path": "out.hwp"}},
+]
+
+
+def test_token_round_trip():
+    """A token names the next operation and the document checkpoint."""
+    token = encode_continuation_token(2, 3, operations_digest(OPERATIONS), "id:7", (0, 4, 1))
+    checkpoint = decode_continuation_token(token, OPERATIONS)
+
+    assert checkpoint["next"] == 2
+    assert checkpoint["total"] == 3
+    assert checkpoint["document"] == "id:7"
+    assert checkpoint["pos"] == [0, 4, 1]
+
+
+def test_token_rejects_other_operations():
+    """Resuming with a different operations list is refused."""
+    token = encode_continuation_token(1, 3, operations_digest(OPERATIONS))
+    changed = OPERATIONS[:2] + [{"operation": "save", "params": {"path": "other.hwp"}}]
+
+    with pytest.raises(ValueError) as e:
+        decode_continuation_token(token, changed)
+    assert "does not match" in str(e.value)
+
+
+def test_corrupted_token():
+    """Garbage tokens raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_continuation_token("not-a-token", OPERATIONS)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the table cell address map
+"""
+
+import pytest
+
+from src.utils.cell_map import CellAddressMap, parse_cell_reference, table_cell_lists
+from src.utils.table_grid import TableGrid
+
+
+MERGED_HTML = (
+    "<table>"
+    "<tr><td rowspan='2'>구분</td><td colspan='2'>금액</td></tr>"
+    "<tr><td>상반기</td><td>하반기</td></tr>"
+    "<tr><td>A</td><td>1</td><td>2</td></tr>"
+    "</table>"
+)
+
+
+@pytest.mark.parametrize("reference, col, expected", [
+    ("A1", None, (0, 0)),
+    ("(c12)", None, (11, 2)),
+    ("3,2", None, (2, 1)),
+    ([3, 2], None, (2, 1)),
+    (3, 2, (2, 1)),
+])
+def test_parse_cell_reference(reference, col, expected):
+    assert parse_cell_reference(reference, col) == expected
+
+
+@pytest.mark.parametrize("reference, col", [("A0", None), ("0,1", None), ([1], None), (2, None), ("표", None)])
+def test_parse_cell_reference_rejects_bad_input(reference, col):
+    with pytest.raises(ValueError):
+        parse_cell_reference(reference, col)
+
+
+def test_map_resolves_merged_positions_to_anchor_list():
+    grid = TableGrid.from_html(MERGED_HTML)
+    cell_map = CellAddressMap(grid, [10, 11, 12, 13, 14, 15, 16])
+    assert len(cell_map) == 7
+    assert cell_map.resolve(0, 0) == (0, 0, 10)
+    assert cell_map.resolve(1, 0) == (0, 0, 10)
+    assert cell_map.resolve(0, 2) == (0, 1, 11)
+    assert cell_map.resolve(2, 2) == (2, 2, 16)
+    assert cell_map.resolve(3, 0) is None
+    assert cell_map.cell_of(13) == (1, 2)
+    assert cell_map.span(1, 0) == (2, 1)
+    assert cell_map.address(2, 2) == "C3"
+
+
+def test_map_requires_matching_cell_count():
+    grid = TableGrid.from_texts(["a", "b", "c", "d"], 2)
+    with pytest.raises(ValueError):
+        CellAddressMap(grid, [1, 2, 3])
+
+
+def test_table_cell_lists_keeps_reading_order():
+    cell_indexes = [
+        (0, None, None),
+        (5, 0, 0), (5, 0, 0),          # two paragraphs in the first cell
+        (6, 0, 1),
+        (9, 1, 0),                     # nested table inside cell 2
+        (7, 0, 2),
+        (8, 0, 3),
+        (0, None, None),
+    ]
+    assert table_cell_lists(cell_indexes, 0) == [5, 6, 7, 8]
+    assert table_cell_lists(cell_indexes, 1) == [9]
+    assert table_cell_lists(cell_indexes, 2) == []
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the document control index
+"""
+
+import pytest
+
+from src.utils.control_index import ControlIndex, assign_tables, control_type
+
+
+def test_control_type_mapping():
+    assert control_type("tbl") == "table"
+    assert control_type("gso", "그림입니다.") == "picture"
+    assert control_type("gso", "사각형입니다.") == "shape"
+    assert control_type("%clk") == "field"
+    assert control_type("zzzz") == "other"
+
+
+def test_tables_are_numbered_in_document_order():
+    """table_index counts tables only, skipping other controls."""
+    index = ControlIndex()
+    index.load([
+        {"ctrl_id": "secd", "anchor": [0, 0, 0]},
+        {"ctrl_id": "tbl", "anchor": [0, 2, 0], "rows": 3, "cols": 2, "first_cell": [4, 0, 0]},
+        {"ctrl_id": "gso", "description": "그림", "anchor": [0, 5, 0]},
+        {"ctrl_id": "tbl", "anchor": [0, 9, 0], "rows": 5, "cols": 5, "first_cell": [20, 0, 0]},
+    ], synced_key=("id:1", 3, 0))
+
+    tables = index.tables()
+    assert [t["table_index"] for t in tables] == [0, 1]
+    assert index.table(1)["first_cell"] == [20, 0, 0]
+    assert index.summary() == {"section": 1, "table": 2, "picture": 1}
+    assert [e["index"] for e in index.by_type("picture")] == [2]
+
+
+def test_missing_table_raises_index_error():
+    index = ControlIndex()
+    index.load([{"ctrl_id": "tbl"}])
+    with pytest.raises(IndexError):
+        index.table(1)
+
+    index.invalidate()
+    assert index.entries == [] and index.synced_key is None
+
+
+def test_assign_tables_follows_scan_order():
+    """Cell paragraphs map to their table until the scan returns to the anchor list."""
+    tables = [
+        {"table_index": 0, "anchor": [0, 1, 0], "first_cell": [3, 0, 0]},
+        {"table_index": 1, "anchor": [4, 0, 0], "first_cell": [9, 0, 0]},
+    ]
+    keys = [(0, 0), (0, 1), (3, 0), (4, 0), (9, 0), (10, 0), (4, 1), (5, 0), (0, 2)]
+    assert assign_tables(keys, tables) == [
+        (None, None), (None, None),
+        (0, 0), (0, 1),   # outer table: cells 3 and 4
+        (1, 0), (1, 1),   # nested table inside cell 4
+        (0, 1), (0, 2),   # back in the outer table
+        (None, None),
+    ]
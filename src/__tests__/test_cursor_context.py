@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the cursor context helpers
+"""
+
+import pytest
+
+from src.utils.cursor_context import (
+    CursorContextCache, build_context, cell_to_index, index_to_cell, parse_cell_address,
+)
+
+
+def test_cell_address_round_trip():
+    assert parse_cell_address("(b12)") == "B12"
+    assert parse_cell_address("") is None
+    assert parse_cell_address("A0") is None
+    assert cell_to_index("A1") == (0, 0)
+    assert cell_to_index("AA3") == (2, 26)
+    for row, col in [(0, 0), (4, 25), (9, 26), (1, 701), (0, 702)]:
+        assert cell_to_index(index_to_cell(row, col)) == (row, col)
+    with pytest.raises(ValueError):
+        cell_to_index("본문")
+
+
+def test_build_context_requires_cell_outside_body():
+    assert build_context([3, 0, 0], "(C2)", table_index=1) == {
+        "pos": [3, 0, 0], "in_table": True, "cell": "C2", "row": 1, "col": 2, "table_index": 1,
+    }
+    # body text and non-table lists (e.g. header) are not in a table
+    assert not build_context([0, 5, 2], "(A1)")["in_table"]
+    assert build_context([7, 0, 0], "")["table_index"] is None
+
+
+def test_cache_reuses_until_key_changes():
+    cache = CursorContextCache()
+    key = (("id:1", 2, 0), (3, 0, 0))
+    cache.store(key, build_context(key[1], "A1"))
+    assert cache.get(key)["cell"] == "A1"
+    assert cache.get((("id:1", 2, 0), (3, 0, 1))) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.invalidate()
+    assert cache.get(key) is None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for per-document edit-generation tracking
+"""
+
+from src.utils.edit_generation import EditGenerationTracker
+
+
+def test_bump_is_per_document():
+    """Edits to one document do not change another document's generation."""
+    tracker = EditGenerationTracker()
+    assert tracker.generation("id:1") == 0
+
+    assert tracker.bump("id:1") == 1
+    assert tracker.bump("id:1") == 2
+    assert tracker.generation("id:1") == 2
+    assert tracker.generation("id:2") == 0
+
+
+def test_modified_flag_transition_bumps_once():
+    """An unsaved -> modified transition we did not cause invalidates the document."""
+    tracker = EditGenerationTracker()
+    # First observation only records the flag
+    assert not tracker.observe_modified("id:1", False)
+    assert tracker.generation("id:1") == 0
+
+    assert tracker.observe_modified("id:1", True)
+    assert tracker.generation("id:1") == 1
+    # Still modified: no new information
+    assert not tracker.observe_modified("id:1", True)
+    # Saving clears the flag but does not change content
+    assert not tracker.observe_modified("id:1", False)
+    assert tracker.generation("id:1") == 1
+
+
+def test_own_edit_does_not_count_twice():
+    """Our bump already covers the clean -> modified transition it causes."""
+    tracker = EditGenerationTracker()
+    tracker.observe_modified("id:1", False)
+    tracker.bump("id:1")
+    assert not tracker.observe_modified("id:1", True)
+    assert tracker.generation("id:1") == 1
+
+
+def test_forget_never_reuses_cache_keys():
+    """A reopened document starting again at generation 0 gets a new key."""
+    tracker = EditGenerationTracker()
+    before = tracker.key("index:0")
+
+    tracker.forget("index:0")
+    after = tracker.key("index:0")
+    assert after[1] == 0
+    assert after != before
+
+    tracker.bump("id:7")
+    tracker.forget()
+    assert tracker.snapshot() == {}
+
+
+def test_structure_generation_ignores_text_only_edits():
+    """Cell-value edits keep cached cell positions valid; structural edits do not."""
+    tracker = EditGenerationTracker()
+    tracker.bump("id:1", structural=False)
+    assert tracker.generation("id:1") == 1
+    assert tracker.structure_key("id:1") == ("id:1", 0, 0)
+
+    tracker.bump("id:1")
+    assert tracker.structure_key("id:1") == ("id:1", 1, 0)
+
+    tracker.observe_modified("id:1", False)
+    tracker.observe_modified("id:1", True)
+    assert tracker.structure_key("id:1")[1] == 2
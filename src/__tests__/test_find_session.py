@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for find sessions and hit snippets
+"""
+
+from src.utils.find_session import FindSessionStore, make_snippet
+
+
+def test_snippet_marks_truncated_sides():
+    text = "가" * 50 + "찾는말" + "나" * 50
+    snippet = make_snippet(text, 50, 3, width=5)
+    assert snippet == "…가가가가가찾는말나나나나나…"
+    assert make_snippet("짧은 찾는말", 3, 3) == "짧은 찾는말"
+    assert make_snippet("", 0, 3) == ""
+
+
+def test_session_continues_from_last_hit():
+    """Each find-next returns the following hit instead of restarting."""
+    store = FindSessionStore()
+    hits = [{"pos": [0, i, 0], "end": [0, i, 2]} for i in range(3)]
+    session = store.create("성명", False, hits, synced_key=("id:1", 0, 0))
+
+    assert store.get(session.session_id) is session
+    assert session.advance()["pos"] == [0, 0, 0]
+    assert session.advance()["pos"] == [0, 1, 0]
+    assert session.remaining == 1
+    assert session.last_hit["end"] == [0, 1, 2]
+
+    # After an edit the rest of the document is searched again from the last hit
+    session.rebase([{"pos": [0, 3, 0], "end": [0, 3, 2]}], synced_key=("id:1", 1, 0))
+    assert session.advance()["pos"] == [0, 3, 0]
+    assert session.advance() is None
+
+
+def test_store_is_bounded():
+    store = FindSessionStore(maxsize=2)
+    first = store.create("a", False, [])
+    store.create("b", False, [])
+    store.create("c", False, [])
+    assert len(store) == 2
+    assert store.get(first.session_id) is None
+    assert not store.close(first.session_id)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for persistent form profiles
+"""
+
+from src.utils.form_profiles import FormProfileStore, fingerprint_tables, profile_key, verify_entry
+
+TABLES = [
+    {"table_index": 0, "rows": 3, "cols": 2, "first_cell_text": "성 명"},
+    {"table_index": 1, "rows": 2, "cols": 4, "first_cell_text": "구분"},
+]
+
+
+def test_fingerprint_tracks_structure_not_values():
+    base = fingerprint_tables(TABLES, {0: 6, 1: 8})
+    # whitespace in the label does not matter
+    respaced = [dict(TABLES[0], first_cell_text="성명"), TABLES[1]]
+    assert fingerprint_tables(respaced, {0: 6, 1: 8}) == base
+    # a merge changes the cell count and therefore the fingerprint
+    assert fingerprint_tables(TABLES, {0: 5, 1: 8}) != base
+    assert fingerprint_tables([], {}) is None
+
+
+def test_verify_entry_checks_label_cell():
+    entry = {"pos": [7, 0, 0], "label": "성명", "label_list": 6}
+    assert verify_entry(entry, {6: "성명", 7: ""})
+    assert not verify_entry(entry, {6: "주소", 7: ""})
+    assert not verify_entry(entry, {6: "성명"})          # target cell gone
+    assert not verify_entry({"pos": [7, 0, 0]}, {7: ""})  # malformed entry
+
+
+def test_store_round_trip(tmp_path):
+    store = FormProfileStore(str(tmp_path))
+    fingerprint = fingerprint_tables(TABLES, {0: 6, 1: 8})
+    key = profile_key(["성명"], "RIGHT")
+    assert key == "성명|right"
+    assert store.load(fingerprint) == {}
+
+    assert store.update(fingerprint, {key: {"pos": [7, 0, 0], "label": "성명", "label_list": 6}})
+    reloaded = FormProfileStore(str(tmp_path)).load(fingerprint)
+    assert reloaded[key]["pos"] == [7, 0, 0]
+
+
+def test_store_uses_environment_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWP_MCP_PROFILE_DIR", str(tmp_path))
+    assert FormProfileStore().profile_dir == str(tmp_path)
@@ -108,4 +108,78 @@ class TestHwpController:
         # Verify results
         mock_hwp.InsertText.assert_called_once_with("Hello, World!")
         assert result["status"] == "success"
-        assert "Text inserted successfully" in result["message"] 
\ No newline at end of file
+        assert "Text inserted successfully" in result["message"] 
+
+class FakeTableHwp:
+    """Minimal HWP stand-in for one table: cells are list IDs, the caret is a (row, col) pair."""
+
+    def __init__(self, rows, cols):
+        self.cols = cols
+        self.next_id = 1
+        self.table = [self._new_row() for _ in range(rows)]
+        self.caret = (0, 0)
+        self.HAction = MagicMock()
+        self.HAction.Run.side_effect = self.run
+        self.XHwpDocuments = MagicMock()
+        self.XHwpDocuments.Active_XHwpDocument.DocumentID = 1
+
+    def _new_row(self):
+        row = list(range(self.next_id, self.next_id + self.cols))
+        self.next_id += self.cols
+        return row
+
+    def run(self, action):
+        row, col = self.caret
+        if action == "TableColEnd":
+            self.caret = (len(self.table) - 1, col)
+        elif action == "TableAppendRow":
+            # HWP inserts the new row below the caret's row
+            self.table.insert(row + 1, self._new_row())
+        return True
+
+    def GetPos(self):
+        row, col = self.caret
+        return (self.table[row][col], 0, 0)
+
+    def SetPos(self, list_id, para, pos):
+        for r, cells in enumerate(self.table):
+            if list_id in cells:
+                self.caret = (r, cells.index(list_id))
+                return True
+        return False
+
+
+class TestAppendTableRows:
+    """Rows added for longer data must land at the end of the table."""
+
+    def make_controller(self, hwp):
+        controller = HwpController()
+        controller.hwp = hwp
+        controller.is_hwp_running = True
+        return controller
+
+    def test_rows_are_appended_below_the_last_row(self):
+        hwp = FakeTableHwp(rows=4, cols=2)
+        original = [list(row) for row in hwp.table]
+        controller = self.make_controller(hwp)
+        stats = {"appended_rows": 0}
+
+        controller._append_table_rows(2, stats)
+
+        assert hwp.table[:4] == original
+        assert len(hwp.table) == 6
+        assert stats["appended_rows"] == 2
+        # the caret goes back to the cell it started in
+        assert hwp.caret == (0, 0)
+
+
+    def test_append_from_a_middle_row_keeps_rows_below_in_place(self):
+        hwp = FakeTableHwp(rows=5, cols=3)
+        original = [list(row) for row in hwp.table]
+        controller = self.make_controller(hwp)
+        hwp.caret = (2, 1)
+
+        controller._append_table_rows(3)
+
+        assert hwp.table[:5] == original
+        assert hwp.caret == (2, 1)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for direct HWPX text replacement
+"""
+
+import zipfile
+
+import pytest
+
+from src.utils.hwpx import replace_in_hwpx
+
+SECTION = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hs:sec xmlns:hs="s" xmlns:hp="p">'
+    '<hp:p><hp:run><hp:t>성명: {이름}</hp:t></hp:run></hp:p>'
+    '<hp:p><hp:run><hp:t>{회사} &amp; {이름}<hp:tab/>끝</hp:t></hp:run></hp:p>'
+    '</hs:sec>'
+)
+
+
+def make_hwpx(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(zipfile.ZipInfo("mimetype"), "application/hwp+zip")
+        zf.writestr("Contents/section0.xml", SECTION, compress_type=zipfile.ZIP_DEFLATED)
+
+
+def test_replace_in_hwpx_rewrites_sections(tmp_path):
+    source = tmp_path / "form.hwpx"
+    output = tmp_path / "out.hwpx"
+    make_hwpx(source)
+
+    counts = replace_in_hwpx(str(source), {"{이름}": "홍길동", "{회사}": "A<B>", "{없음}": "x"}, str(output))
+
+    assert counts == {"{이름}": 2, "{회사}": 1, "{없음}": 0}
+    with zipfile.ZipFile(output) as zf:
+        xml = zf.read("Contents/section0.xml").decode("utf-8")
+        assert zf.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+    assert "<hp:t>성명: 홍길동</hp:t>" in xml
+    assert "A&lt;B&gt; &amp; 홍길동<hp:tab/>끝" in xml
+    # source is left untouched when output_path is given
+    with zipfile.ZipFile(source) as zf:
+        assert "{이름}" in zf.read("Contents/section0.xml").decode("utf-8")
+
+
+def test_replace_in_hwpx_rejects_non_zip(tmp_path):
+    path = tmp_path / "plain.hwpx"
+    path.write_text("not a zip")
+    with pytest.raises(ValueError):
+        replace_in_hwpx(str(path), {"a": "b"})
+
+
+def test_replace_in_hwpx_counts_only_applied_changes(tmp_path):
+    source = tmp_path / "form.hwpx"
+    make_hwpx(source)
+
+    counts = replace_in_hwpx(str(source), {"{이름}": "{이름}", "{회사}": "B"})
+
+    assert counts == {"{이름}": 0, "{회사}": 1}
+    with zipfile.ZipFile(source) as zf:
+        xml = zf.read("Contents/section0.xml").decode("utf-8")
+    assert "<hp:t>성명: {이름}</hp:t>" in xml
+    assert "B &amp; {이름}" in xml
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the batched merge planner
+"""
+
+import pytest
+
+from src.utils.merge_planner import (
+    merge_grid, parse_range, plan_merges, range_address, selection_moves, verify_merges,
+)
+from src.utils.table_grid import TableGrid
+
+
+def grid_4x4():
+    return TableGrid.from_texts([str(i) for i in range(16)], 4)
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("A1:B3", (0, 0, 2, 1)),
+    ("b3:a1", (0, 0, 2, 1)),
+    ([1, 1, 3, 2], (0, 0, 2, 1)),
+    ({"start": "A1", "end": [3, 2]}, (0, 0, 2, 1)),
+])
+def test_parse_range_normalizes_corners(spec, expected):
+    assert parse_range(spec) == expected
+    assert range_address(expected) == "A1:B3"
+
+
+@pytest.mark.parametrize("spec", ["A1", "A1:B", [1, 2, 3], {"start": "A1"}, 5])
+def test_parse_range_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_range(spec)
+
+
+def test_plan_orders_from_bottom_right_and_skips_noops():
+    plan = plan_merges(grid_4x4(), ["A1:B2", "C3:D4", "A4:B4", [1, 3, 2, 3], "A1:A1"])
+    assert plan["errors"] == []
+    assert [step["address"] for step in plan["steps"]] == ["A4:B4", "C3:D4", "C1:C2", "A1:B2"]
+    assert plan["skipped"] == [{"address": "A1:A1", "reason": "single cell"}]
+    assert verify_merges(plan["grid"], [step["range"] for step in plan["steps"]]) == []
+    assert plan["grid"].text(0, 0) == "0\n1\n4\n5"
+
+
+def test_plan_rejects_overlaps_out_of_range_and_partial_merges():
+    errors = plan_merges(grid_4x4(), ["A1:B2", "B2:C3", "A1:E1"])["errors"]
+    assert {"range": "A1:E1", "error": "outside the 4x4 table"} in errors
+    assert {"range": "A1:B2", "error": "overlaps B2:C3"} in errors
+
+    merged = merge_grid(grid_4x4(), (0, 0, 1, 1))
+    plan = plan_merges(merged, ["A1:A3", "A1:B2"])
+    assert plan["errors"] == [{"range": "A1:A3", "error": "cuts through merged cell A1:B2"}]
+    assert plan["skipped"] == [{"address": "A1:B2", "reason": "already merged"}]
+
+
+def test_selection_moves_skip_over_merged_cells():
+    merged = merge_grid(grid_4x4(), (0, 0, 1, 1))
+    assert selection_moves(grid_4x4(), (0, 0, 2, 2)) == (2, 2)
+    assert selection_moves(merged, (0, 0, 2, 2)) == (1, 2)
+    assert selection_moves(merged, (0, 0, 1, 2)) == (1, 1)
+
+
+def test_verify_reports_unmerged_ranges():
+    grid = merge_grid(grid_4x4(), (0, 0, 0, 1))
+    assert verify_merges(grid, [(0, 0, 0, 1), (1, 0, 2, 0)]) == ["A2:A3"]
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for resolving fill paths against the text model and table grid
+"""
+
+import pytest
+
+from src.utils.cell_map import CellAddressMap
+from src.utils.path_model import direction_keyword, parse_path, resolve_path
+from src.utils.table_grid import TableGrid
+
+
+# 표 0: 대표자(두 행 병합) | 성명 | (빈 셀)
+#                          | 연락처 | 010
+#       합계 | 100 | 200
+GRID = TableGrid([
+    {"row": 0, "col": 0, "rowspan": 2, "colspan": 1, "text": "대표자"},
+    {"row": 0, "col": 1, "rowspan": 1, "colspan": 1, "text": "성명"},
+    {"row": 0, "col": 2, "rowspan": 1, "colspan": 1, "text": ""},
+    {"row": 1, "col": 1, "rowspan": 1, "colspan": 1, "text": "연락처"},
+    {"row": 1, "col": 2, "rowspan": 1, "colspan": 1, "text": "010"},
+    {"row": 2, "col": 0, "rowspan": 1, "colspan": 1, "text": "합계"},
+    {"row": 2, "col": 1, "rowspan": 1, "colspan": 1, "text": "100"},
+    {"row": 2, "col": 2, "rowspan": 1, "colspan": 1, "text": "200"},
+], 3, 3)
+CELL_MAP = CellAddressMap(GRID, [11, 12, 13, 14, 15, 16, 17, 18])
+PARAGRAPHS = [((0, 0), "신청서 (대표자 기재)")] + [
+    ((list_id, 0), cell["text"]) for list_id, cell in zip(range(11, 19), GRID.cells)
+]
+
+
+def resolve(path, direction="right"):
+    return resolve_path(
+        parse_path(path), direction, PARAGRAPHS,
+        lambda list_id: 0 if 11 <= list_id <= 18 else None,
+        lambda table_index: CELL_MAP,
+    )
+
+
+def test_parse_path_and_direction_keyword():
+    assert parse_path("대표자 > <down>") == ["대표자", "<down>"]
+    assert parse_path("대표자/성명") == ["대표자", "성명"]
+    assert parse_path("합계") == ["합계"]
+    assert direction_keyword("<DOWN>") == "down"
+    assert direction_keyword("<back>") == ""
+    assert direction_keyword("대표자") is None
+
+
+def test_label_outside_table_is_skipped_by_next_label():
+    # 본문의 '대표자'를 먼저 찾지만, 다음 레이블은 그 뒤에서 찾으므로 표의 '성명' 오른쪽 셀
+    result = resolve("대표자 > 성명")
+    assert result["ok"]
+    assert (result["table_index"], result["row"], result["col"], result["list_id"]) == (0, 0, 2, 13)
+    assert result["labels"][0]["table_index"] is None
+    assert result["label_pos"] == (12, 0, 0)
+
+
+def test_moves_keep_row_inside_merged_cell():
+    # 연락처(B2)에서 왼쪽은 병합된 대표자 셀, 그 셀에서 오른쪽은 같은 행(2행)의 연락처
+    result = resolve("연락처 > <left> > <right> > <right>")
+    assert (result["row"], result["col"]) == (1, 2)
+    result = resolve("성명 > <left> > <down>")
+    assert (result["row"], result["col"]) == (2, 0)
+
+
+def test_final_direction_applies_only_after_label():
+    assert (resolve("합계", "up")["row"], resolve("합계", "up")["col"]) == (0, 0)
+    assert resolve("합계 > <right>", "up")["col"] == 1
+
+
+def test_label_search_restarts_in_cell_after_move():
+    result = resolve("성명 > <down> > 010", "down")
+    assert (result["row"], result["col"]) == (2, 2)
+
+
+@pytest.mark.parametrize("path, message, depth", [
+    ("없음", "첫 번째 레이블", 0),
+    ("합계 > 성명", "이후에 '성명'", 1),
+    ("합계 > <down>", "이동할 셀이 없습니다", 1),
+    ("합계 > <back>", "잘못된 방향", 1),
+    ("신청서", "표 밖에서는", 1),
+])
+def test_failures_report_depth(path, message, depth):
+    result = resolve(path)
+    assert not result["ok"]
+    assert message in result["error"]
+    assert result["depth"] == depth
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for file-referenced payloads
+"""
+
+import json
+
+import pytest
+
+from src.utils.payload_loader import (
+    load_json, load_operations, load_table_chunks, load_text, markdown_table_rows, payload_format, peek_chunks,
+)
+
+
+def test_load_text_and_json_use_detected_encoding(tmp_path):
+    doc = tmp_path / "report.md"
+    doc.write_bytes("# 보고서\r\n\r\n본문".encode("cp949"))
+    assert load_text(str(doc)) == "# 보고서\n\n본문"
+
+    data = tmp_path / "data.json"
+    data.write_text(json.dumps([["가", 1]], ensure_ascii=False), encoding="utf-8-sig")
+    assert load_json(str(data)) == [["가", 1]]
+
+    empty = tmp_path / "empty.txt"
+    empty.write_text("", encoding="utf-8")
+    assert load_text(str(empty)) == ""
+
+
+def test_missing_file_and_unknown_format(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_text(str(tmp_path / "missing.md"))
+    with pytest.raises(ValueError):
+        payload_format("data.xlsx")
+    assert payload_format("data.dat", "CSV") == "csv"
+
+
+def test_load_operations_accepts_list_or_wrapper(tmp_path):
+    ops = [{"operation": "insert_text", "params": {"text": "a"}}]
+    listed = tmp_path / "ops.json"
+    listed.write_text(json.dumps(ops), encoding="utf-8")
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(json.dumps({"operations": ops}), encoding="utf-8")
+    assert load_operations(str(listed)) == ops
+    assert load_operations(str(wrapped)) == ops
+
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"op": 1}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_operations(str(bad))
+
+
+def test_markdown_table_rows():
+    text = "설명\n\n| 월 | 판매량 |\n|:---|---:|\n| 1월 | 120 |\n"
+    assert list(markdown_table_rows(text)) == [["월", "판매량"], ["1월", "120"]]
+
+
+def test_load_table_chunks_from_each_format(tmp_path):
+    rows = [["월", "판매량"]] + [[f"{i}월", str(i * 10)] for i in range(1, 6)]
+
+    as_json = tmp_path / "t.json"
+    as_json.write_text(json.dumps([["월", "판매량"], ["1월", 10, None], "합계"], ensure_ascii=False), encoding="utf-8")
+    assert list(load_table_chunks(str(as_json), 2)) == [[["월", "판매량"], ["1월", "10", ""]], [["합계"]]]
+
+    as_csv = tmp_path / "t.csv"
+    as_csv.write_text("\n".join(",".join(row) for row in rows), encoding="utf-8")
+    assert [len(chunk) for chunk in load_table_chunks(str(as_csv), 4)] == [4, 2]
+
+    as_dat = tmp_path / "t.dat"
+    as_dat.write_text("\n".join("\t".join(row) for row in rows), encoding="utf-8")
+    assert next(load_table_chunks(str(as_dat), 10, "tsv")) == rows
+
+    not_table = tmp_path / "obj.json"
+    not_table.write_text('{"rows": []}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_table_chunks(str(not_table))
+
+
+def test_arrow_formats_when_pyarrow_is_installed(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    table = pa.table({"월": ["1월", "2월", "3월"], "판매량": [10, None, 30]})
+    path = tmp_path / "t.parquet"
+    pq.write_table(table, str(path))
+    assert list(load_table_chunks(str(path), 2)) == [[["월", "판매량"], ["1월", "10"]], [["2월", ""], ["3월", "30"]]]
+
+
+def test_peek_chunks():
+    first, chunks = peek_chunks(iter([[["a"]], [["b"]]]))
+    assert first == [["a"]]
+    assert list(chunks) == [[["a"]], [["b"]]]
+    assert peek_chunks(iter([]))[0] is None
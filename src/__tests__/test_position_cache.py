@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the per-structure-generation cell position cache
+"""
+
+from src.utils.position_cache import PositionCache, plan_cell_order
+
+
+def test_positions_are_dropped_when_structure_changes():
+    cache = PositionCache()
+    gen1 = ("id:1", 0, 0)
+    cache.record(gen1, ("label", "성명", 1, "right"), [5, 0, 0])
+    assert cache.get(gen1, ("label", "성명", 1, "right")) == (5, 0, 0)
+
+    gen2 = ("id:1", 1, 0)
+    assert cache.get(gen2, ("label", "성명", 1, "right")) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_text_addresses_are_dropped_when_text_changes():
+    cache = PositionCache()
+    key = ("id:1", 0, 0)
+    cache.sync_text(("id:1", 3, 0))
+    cache.record(key, ("label", "성명", 1, "right"), [5, 0, 0])
+    cache.record(key, ("path", ("성명", "<down>"), "right"), [6, 0, 0])
+    cache.record(key, ("cell", 0, 1, 1), [7, 0, 0])
+
+    cache.sync_text(("id:1", 3, 0))
+    assert cache.get(key, ("label", "성명", 1, "right")) == (5, 0, 0)
+
+    # same structure, new text generation: label/path lookups are stale, cells are not
+    cache.sync_text(("id:1", 4, 0))
+    assert cache.get(key, ("label", "성명", 1, "right")) is None
+    assert cache.get(key, ("path", ("성명", "<down>"), "right")) is None
+    assert cache.get(key, ("cell", 0, 1, 1)) == (7, 0, 0)
+
+
+def test_nearest_cell_only_looks_up_or_left():
+    cache = PositionCache()
+    key = ("id:1", 0, 0)
+    cache.record(key, ("cell", 0, 0, 2), [10, 0, 0])
+    cache.record(key, ("cell", 0, 3, 2), [13, 0, 0])
+    cache.record(key, ("cell", 0, 5, 1), [20, 0, 0])
+    cache.record(key, ("cell", 0, 7, 2), [30, 0, 0])   # below the target
+    cache.record(key, ("cell", 1, 5, 2), [40, 0, 0])   # other table
+
+    assert cache.nearest_cell(key, 0, 5, 2) == (5, 1, (20, 0, 0))
+    assert cache.nearest_cell(key, 0, 4, 2) == (3, 2, (13, 0, 0))
+    assert cache.nearest_cell(key, 2, 0, 0) is None
+
+
+def test_lru_limit():
+    cache = PositionCache(maxsize=2)
+    key = ("id:1", 0, 0)
+    for i in range(3):
+        cache.record(key, ("cell", 0, i, 0), [i, 0, 0])
+    assert cache.get(key, ("cell", 0, 0, 0)) is None
+    assert cache.get(key, ("cell", 0, 2, 0)) == (2, 0, 0)
+
+
+def test_known_cells_lists_one_table():
+    cache = PositionCache()
+    key = ("id:1", 0, 0)
+    cache.record(key, ("cell", 0, 1, 2), [10, 0, 0])
+    cache.record(key, ("cell", 1, 0, 0), [20, 0, 0])
+    cache.record(key, ("label", "이름", 1, "right"), [30, 0, 0])
+    assert cache.known_cells(key, 0) == [(1, 2)]
+    assert cache.known_cells(("id:1", 1, 0), 0) == []
+
+
+def test_plan_cell_order_prefers_cheaper_walk():
+    # one column: visited top to bottom, each step continues from the cell above
+    order, moves = plan_cell_order([(9, 3), (1, 3), (5, 3), (2, 3)])
+    assert order == [(1, 3), (2, 3), (5, 3), (9, 3)]
+    assert moves == 16
+
+    # scattered cells: starting from the leftmost column lets later rows branch off it
+    order, moves = plan_cell_order([(2, 2), (4, 4), (5, 1), (5, 5)])
+    assert order == [(5, 1), (2, 2), (4, 4), (5, 5)]
+    assert moves == 18
+
+    # known positions are reached with a single jump
+    _, cold = plan_cell_order([(8, 8)])
+    _, warm = plan_cell_order([(8, 8)], known=[(8, 8)])
+    assert (cold, warm) == (17, 1)
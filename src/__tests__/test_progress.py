@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for progress reporting and cooperative cancellation
+"""
+
+import threading
+
+import pytest
+
+from src.utils.progress import (
+    OperationCancelled,
+    ProgressTracker,
+    cancel_requested,
+    check_cancelled,
+    report_progress,
+    use_tracker,
+)
+
+
+def test_reports_are_throttled_but_last_step_is_sent():
+    """Intermediate steps inside min_interval are dropped, the final one is not."""
+    sent = []
+    tracker = ProgressTracker(report=lambda done, total, msg: sent.append(done), min_interval=60)
+    with use_tracker(tracker):
+        for i in range(1, 11):
+            report_progress(i, 10)
+
+    assert sent == [1, 10]
+    assert tracker.done == 10
+
+
+def test_cancel_from_another_thread_stops_between_steps():
+    """A cancel flag set by the event loop is seen at the next step boundary."""
+    tracker = ProgressTracker()
+    filled = []
+
+    def fill_rows():
+        with use_tracker(tracker):
+            for row in range(100):
+                check_cancelled()
+                filled.append(row)
+                if row == 4:
+                    threading.Thread(target=tracker.cancel).start()
+                    threading.Event().wait(0.05)
+
+    with pytest.raises(OperationCancelled):
+        fill_rows()
+    assert filled == [0, 1, 2, 3, 4]
+
+
+def test_cancelled_is_not_swallowed_by_generic_handlers():
+    """Tool code catches Exception broadly; cancellation must still propagate."""
+    tracker = ProgressTracker()
+    tracker.cancel()
+
+    with pytest.raises(OperationCancelled):
+        with use_tracker(tracker):
+            try:
+                check_cancelled()
+            except Exception:
+                pass
+
+
+def test_calls_without_tracker_are_noops():
+    """Controller code can report progress outside of a tool call."""
+    report_progress(1, 2)
+    check_cancelled()
+    assert not cancel_requested()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the multi-replace planner
+"""
+
+import pytest
+
+from src.utils.replace_planner import apply_simultaneous, count_matches, plan_replacements
+
+
+def run_steps(text, steps):
+    """Replays the plan the way sequential AllReplace calls would."""
+    for find, replace in steps:
+        text = text.replace(find, replace)
+    return text
+
+
+def test_absent_keys_are_skipped():
+    plan = plan_replacements({"성명": "홍길동", "주소": "서울"}, "성명: ____")
+    assert plan["steps"] == [("성명", "홍길동")]
+    assert plan["skipped"] == ["주소"]
+    assert plan["counts"] == {"성명": 1}
+
+
+def test_containing_key_runs_first():
+    mapping = {"성명": "이름", "성명란": "서명란"}
+    text = "성명란에 성명을 적으세요"
+    plan = plan_replacements(mapping, text)
+    assert [find for find, _ in plan["steps"]] == ["성명란", "성명"]
+    assert run_steps(text, plan["steps"]) == apply_simultaneous(text, mapping)[0]
+
+
+def test_replacement_containing_another_key_runs_after_it():
+    mapping = {"a": "b", "b": "c"}
+    plan = plan_replacements(mapping, "ab")
+    assert not plan["uses_sentinels"]
+    assert run_steps("ab", plan["steps"]) == "bc"
+
+
+def test_cycle_is_resolved_with_sentinels():
+    mapping = {"갑": "을", "을": "갑"}
+    text = "갑은 을에게, 을은 갑에게"
+    plan = plan_replacements(mapping, text)
+    assert plan["uses_sentinels"]
+    assert len(plan["steps"]) == 4
+    assert run_steps(text, plan["steps"]) == "을은 갑에게, 갑은 을에게"
+    assert plan["counts"] == {"갑": 2, "을": 2}
+
+
+def test_count_matches_prefers_leftmost_longest():
+    assert count_matches("abcab", ["ab", "abc", "b"]) == {"ab": 1, "abc": 1, "b": 0}
+
+
+def test_overlapping_keys_run_leftmost_first():
+    mapping = {"bc": "Y", "ab": "X"}
+    text = "abc bc"
+    plan = plan_replacements(mapping, text)
+    assert [find for find, _ in plan["steps"]] == ["ab", "bc"]
+    assert run_steps(text, plan["steps"]) == apply_simultaneous(text, mapping)[0] == "Xc Y"
+    assert plan["counts"] == {"bc": 1, "ab": 1}
+
+
+def test_unresolvable_overlap_is_rejected():
+    with pytest.raises(ValueError):
+        plan_replacements({"ab": "X", "ba": "Y"}, "aba bab")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the bounded LRU result cache
+"""
+
+from src.utils.result_cache import LRUResultCache, ToolResultCache
+
+
+def test_get_and_put():
+    """Stored results are returned for the same key."""
+    cache = LRUResultCache(maxsize=4)
+    found, value = cache.get(("hwp_fill_cells", "retry-1", "id:1"))
+    assert not found and value is None
+
+    cache.put(("hwp_fill_cells", "retry-1", "id:1"), "총 3개 성공")
+    assert cache.get(("hwp_fill_cells", "retry-1", "id:1")) == (True, "총 3개 성공")
+    # Same key on another document is a different entry
+    assert cache.get(("hwp_fill_cells", "retry-1", "id:2")) == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted():
+    """The cache stays bounded and evicts the least recently used key."""
+    cache = LRUResultCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_tool_cache_counts_hits_and_misses():
+    """Lookups are counted so the effect on agent loops can be measured."""
+    cache = ToolResultCache(maxsize=8)
+    key = ("hwp_get_text", "()", ("id:1", 0, 0), cache.change_counter, None)
+    assert cache.lookup(key) == (False, None)
+    cache.put(key, "본문")
+    assert cache.lookup(key) == (True, "본문")
+    assert cache.lookup(key) == (True, "본문")
+
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.667
+
+
+def test_tool_cache_invalidate_advances_change_counter():
+    """A mutating tool drops every entry and changes future keys."""
+    cache = ToolResultCache()
+    cache.put("a", 1)
+    before = cache.change_counter
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.change_counter == before + 1
+    assert cache.stats()["invalidations"] == 1
+
+    cache.reset_stats()
+    assert cache.stats()["invalidations"] == 0
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for series generation
+"""
+
+import pytest
+
+from src.utils.series import (
+    cf_html, circled, ganada, generate_series, korean_ordinal, rows_to_html_table, to_html_table,
+)
+
+
+def test_number_series_and_formats():
+    assert generate_series("number", 1, 1, 5) == ["1", "2", "3", "4", "5"]
+    assert generate_series("number", 10, -5, 3, "03d") == ["010", "005", "000"]
+    assert generate_series("number", "1,000", 500, 2, ",") == ["1,000", "1,500"]
+    assert generate_series("number", 0.5, 0.25, 2, "{}점") == ["0.5점", "0.75점"]
+    assert len(generate_series("number", 1, 1, 1000)) == 1000
+    assert generate_series("number", 0, 0.1, 5) == ["0.0", "0.1", "0.2", "0.3", "0.4"]
+    assert generate_series("number", "1.05", "0.1", 3) == ["1.05", "1.15", "1.25"]
+
+
+def test_date_series_clamps_month_end_without_drift():
+    assert generate_series("date", "2024-01-31", "1m", 3) == ["2024-01-31", "2024-02-29", "2024-03-31"]
+    assert generate_series("date", "2024.12.30", 1, 3, "%m/%d") == ["12/30", "12/31", "01/01"]
+    assert generate_series("date", "2023-02-28", "1y", 2) == ["2023-02-28", "2024-02-28"]
+    with pytest.raises(ValueError):
+        generate_series("date", "2024-01-01", "1q", 2)
+
+
+def test_korean_labels():
+    assert [ganada(n) for n in (1, 2, 14, 15)] == ["가", "나", "하", "거"]
+    assert [korean_ordinal(n) for n in (1, 2, 10, 11, 12, 20, 21, 99, 100)] == [
+        "첫째", "둘째", "열째", "열한째", "열두째", "스무째", "스물한째", "아흔아홉째", "100번째",
+    ]
+    assert [circled(n) for n in (1, 20, 21, 50, 51)] == ["①", "⑳", "㉑", "㊿", "(51)"]
+    assert generate_series("ganada", 3, 1, 2) == ["다", "라"]
+
+
+def test_list_and_template():
+    assert generate_series("list", 2, 1, 4, values=["월", "화", "수"]) == ["화", "수", "월", "화"]
+    assert generate_series("template", 1, 1, 2, "=A{n}*B{n}") == ["=A1*B1", "=A2*B2"]
+    with pytest.raises(ValueError):
+        generate_series("list", 1, 1, 2)
+    with pytest.raises(ValueError):
+        generate_series("fibonacci", 1, 1, 2)
+
+
+def test_html_clipboard_offsets():
+    fragment = to_html_table(["a<b", "2"], "column")
+    assert fragment == "<table><tr><td>a&lt;b</td></tr><tr><td>2</td></tr></table>"
+    assert to_html_table(["1", "2"], "row") == "<table><tr><td>1</td><td>2</td></tr></table>"
+
+    data = cf_html("<table><tr><td>가</td></tr></table>")
+    header = dict(line.split(":", 1) for line in data.decode("utf-8").split("\r\n")[1:5])
+    start, end = int(header["StartFragment"]), int(header["EndFragment"])
+    assert data[start:end].decode("utf-8") == "<table><tr><td>가</td></tr></table>"
+    assert int(header["EndHTML"]) == len(data)
+
+
+def test_rows_to_html_table_pads_clips_and_bolds_header():
+    fragment = rows_to_html_table([["이름", "점수"], ["a&b"], ["x", "1", "extra"]], 2, bold_first=True)
+    assert fragment == (
+        "<table><tr><td><b>이름</b></td><td><b>점수</b></td></tr>"
+        "<tr><td>a&amp;b</td><td></td></tr>"
+        "<tr><td>x</td><td>1</td></tr></table>"
+    )
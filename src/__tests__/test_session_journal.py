@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the session journal
+"""
+
+import os
+
+from src.utils.session_journal import SessionJournal
+
+
+def test_journal_round_trip(tmp_path):
+    """Documents, current tab and cursor position survive save/load."""
+    journal = SessionJournal(journal_dir=str(tmp_path))
+    journal.record_documents([{"index": 0, "path": "a.hwp", "autosave": False}], 0)
+    journal.record_position((0, 12, 3))
+    assert journal.save()
+    assert os.path.exists(journal.journal_path)
+
+    restored = SessionJournal(journal_dir=str(tmp_path))
+    assert restored.load()
+    assert restored.documents == [{"index": 0, "path": "a.hwp", "autosave": False}]
+    assert restored.current_index == 0
+    assert restored.last_pos == [0, 12, 3]
+
+
+def test_restorable_documents_skip_missing_files(tmp_path):
+    """Only documents that still exist on disk are restored."""
+    existing = tmp_path / "exists.hwp"
+    existing.write_bytes(b"hwp")
+    journal = SessionJournal(journal_dir=str(tmp_path))
+    journal.record_documents([
+        {"index": 0, "path": str(existing), "autosave": False},
+        {"index": 1, "path": str(tmp_path / "gone.hwp"), "autosave": False},
+    ], 1)
+
+    assert [doc["index"] for doc in journal.restorable_documents()] == [0]
+
+
+def test_autosave_paths_and_checkpoint_interval(tmp_path):
+    """Autosave files live in the journal directory; checkpoints are throttled."""
+    journal = SessionJournal(journal_dir=str(tmp_path), autosave_interval=60)
+    path = journal.autosave_path(2)
+    assert journal.is_autosave_path(path)
+    assert not journal.is_autosave_path(str(tmp_path / "user.hwp"))
+
+    assert journal.checkpoint_due(now=1000)
+    journal.mark_checkpoint(now=1000)
+    assert not journal.checkpoint_due(now=1030)
+    assert journal.checkpoint_due(now=1061)
+
+
+def test_autosave_copy_paths_are_stable_per_document(tmp_path):
+    """Each document keeps one autosave copy that is overwritten at every checkpoint."""
+    journal = SessionJournal(journal_dir=str(tmp_path))
+    named = journal.autosave_path(0, str(tmp_path / "report.hwp"))
+    assert named == journal.autosave_path(3, str(tmp_path / "report.hwp"))
+    assert named != journal.autosave_path(0, str(tmp_path / "other" / "report.hwp"))
+    assert os.path.basename(named).startswith("report_") and named.endswith(".hml")
+
+    untitled = journal.autosave_path(1, doc_id=7)
+    assert untitled == journal.autosave_path(2, doc_id=7)
+    assert untitled != journal.autosave_path(1, doc_id=8)
+    assert journal.is_autosave_path(named) and journal.is_autosave_path(untitled)
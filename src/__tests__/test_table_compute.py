@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for table computation helpers
+"""
+
+import pytest
+
+from src.utils.table_compute import (
+    column_style, compute_table, filter_rows, format_number, group_by,
+    number_style, parse_number, sort_rows, totals_row,
+)
+
+
+SALES = [
+    ["지점", "분기", "매출"],
+    ["서울", "1분기", "1,200원"],
+    ["부산", "2분기", "300원"],
+    ["서울", "10분기", ""],
+    ["대구", "2분기", "2,500원"],
+]
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1,234원", 1234),
+    ("₩5,000", 5000),
+    ("(1,200)", -1200),
+    ("△300", -300),
+    ("-3.25", -3.25),
+    ("12.5%", 12.5),
+    ("3만", 30000),
+    ("5만원", 50000),
+    ("1억 2천만", 120000000),
+    ("1,234천원", 1234000),
+])
+def test_parse_korean_numbers(text, expected):
+    assert parse_number(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["", "abc", "2024-01-01", "제3조", "(100", "1.2.3"])
+def test_parse_rejects_non_numbers(text):
+    assert parse_number(text) is None
+
+
+def test_format_keeps_column_style():
+    assert format_number(3750, column_style(["1,000원", "250원"])) == "3,750원"
+    assert format_number(-1234.5, number_style("(1.0)")) == "(1234.5)"
+    assert format_number(-300, number_style("△1")) == "△300"
+    assert format_number(2468000, column_style(["1,234천원"])) == "2,468천원"
+
+
+def test_sort_numeric_descending_keeps_empty_last():
+    result = sort_rows(SALES, 2, descending=True)
+    assert [row[0] for row in result] == ["지점", "대구", "서울", "부산", "서울"]
+    assert result[-1][2] == ""
+
+
+def test_sort_text_uses_natural_order():
+    result = sort_rows(SALES, 1)
+    assert [row[1] for row in result[1:]] == ["1분기", "2분기", "2분기", "10분기"]
+    # 같은 값은 원래 순서 유지
+    assert [row[0] for row in result[2:4]] == ["부산", "대구"]
+
+
+def test_filter_compares_numbers_and_text():
+    assert [row[0] for row in filter_rows(SALES, 2, ">=", "1,000")[1:]] == ["서울", "대구"]
+    assert len(filter_rows(SALES, 0, "==", "서울")) == 3
+    assert len(filter_rows(SALES, 2, "empty")) == 2
+    with pytest.raises(ValueError):
+        filter_rows(SALES, 2, "~=", "1")
+
+
+def test_group_by_and_totals():
+    assert group_by(SALES, 0, 2) == [["서울", "1,200원"], ["부산", "300원"], ["대구", "2,500원"]]
+    assert group_by(SALES, 1) == [["1분기", "1"], ["2분기", "2"], ["10분기", "1"]]
+
+    totals = totals_row(SALES)
+    assert totals == {"row": ["합계", "", "4,000원"], "row_index": 5, "appended": True}
+    again = totals_row(SALES + [totals["row"]])
+    assert again["appended"] is False and again["row_index"] == 5
+
+
+def test_compute_table_operations():
+    filtered = compute_table(SALES, "filter", column=0, op="!=", value="서울")
+    assert filtered["result"] == {"kept": 2, "removed": 2}
+    assert len(filtered["matrix"]) == len(SALES)
+    assert filtered["matrix"][-1] == ["", "", ""]
+
+    average = compute_table(SALES, "aggregate", column=2, func="avg")
+    assert average["matrix"] is None
+    assert average["result"]["text"] == "1,333.33원"
+
+    totals = compute_table(SALES, "totals", func="max", label="최대")
+    assert totals["matrix"][-1] == ["최대", "", "2,500원"]
+
+    with pytest.raises(ValueError):
+        compute_table(SALES, "pivot")
+    with pytest.raises(ValueError):
+        compute_table(SALES, "sort", column=5)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the merge-aware table grid
+"""
+
+import pytest
+
+from src.utils.table_grid import TableGrid
+
+
+MERGED_HTML = """
+<html><body><table>
+<tr><td rowspan="2"><p>구분</p></td><td colspan="2"><p>금액</p></td></tr>
+<tr><td>상반기</td><td>하반기</td></tr>
+<tr><td>A&nbsp;팀</td><td><p>1,000</p><p>원</p></td><td>2,000</td></tr>
+</table></body></html>
+"""
+
+
+def test_from_html_places_merged_cells():
+    grid = TableGrid.from_html(MERGED_HTML)
+    assert (grid.rows, grid.cols) == (3, 3)
+    assert grid.has_merges()
+    assert grid.anchor(1, 0) == (0, 0)
+    assert grid.anchor(0, 2) == (0, 1)
+    assert grid.text(1, 1) == "상반기"
+    assert grid.text(2, 0) == "A 팀"
+    assert grid.text(2, 1) == "1,000\n원"
+    assert grid.cell_order() == [(0, 0), (0, 1), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+    assert grid.to_matrix()[1] == ["", "상반기", "하반기"]
+    assert grid.to_matrix(fill_merged=True)[1][0] == "구분"
+
+
+def test_nested_table_text_stays_in_outer_cell():
+    html = "<table><tr><td>바깥<table><tr><td>안1</td><td>안2</td></tr></table></td><td>B</td></tr></table>"
+    grid = TableGrid.from_html(html)
+    assert (grid.rows, grid.cols) == (1, 2)
+    assert grid.text(0, 0) == "바깥안1안2"
+    assert grid.text(0, 1) == "B"
+
+
+def test_from_html_without_table_raises():
+    with pytest.raises(ValueError):
+        TableGrid.from_html("<p>표 없음</p>")
+
+
+def test_from_texts_requires_full_rows():
+    grid = TableGrid.from_texts(["a", "b", "c", "d"], 2)
+    assert grid.to_matrix() == [["a", "b"], ["c", "d"]]
+    assert not grid.has_merges()
+    with pytest.raises(ValueError):
+        TableGrid.from_texts(["a", "b", "c"], 2)
+
+
+def test_diff_reports_only_changed_cells():
+    grid = TableGrid.from_html(MERGED_HTML)
+    diff = grid.diff([[None, "상반기", "3분기"], ["B 팀", " 1,000\n원 ", "2,000", "x"]], start_row=1)
+    assert diff["changed"] == [(1, 2, "3분기"), (2, 0, "B 팀")]
+    assert diff["unchanged"] == 3
+    assert diff["merged"] == []
+    assert diff["out_of_range"] == [(2, 3)]
+    assert grid.diff([["덮어쓰기"]], start_row=1)["merged"] == [(1, 0)]
+
+
+def test_diff_normalises_both_sides():
+    grid = TableGrid.from_texts(["A  B", "x\n\ny"], 2)
+    diff = grid.diff([["A  B", "x\n\ny"]])
+    assert diff["changed"] == []
+    assert diff["unchanged"] == 2
+    assert grid.diff([["A B", " x\ny "]])["unchanged"] == 2
+
+
+@pytest.mark.parametrize("row, col, direction, expected", [
+    (0, 0, "right", (0, 1)),
+    (1, 0, "right", (1, 1)),
+    (0, 2, "down", (1, 2)),
+    (0, 0, "down", (2, 0)),
+    (1, 1, "up", (0, 1)),
+    (1, 1, "left", (1, 0)),
+    (0, 0, "up", None),
+    (2, 2, "right", None),
+])
+def test_step_skips_merged_cells(row, col, direction, expected):
+    grid = TableGrid.from_html(MERGED_HTML)
+    assert grid.step(row, col, direction) == expected
+
+
+def test_step_rejects_unknown_direction():
+    with pytest.raises(ValueError):
+        TableGrid.from_html(MERGED_HTML).step(0, 0, "diagonal")
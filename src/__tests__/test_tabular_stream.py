@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for chunked CSV/TSV reading
+"""
+
+import pytest
+
+from src.utils.tabular_stream import (
+    is_tabular_text, iter_chunks, iter_rows, looks_like_path, read_chunks, sniff_delimiter,
+)
+
+
+def test_is_tabular_text():
+    assert is_tabular_text("이름,점수\n홍길동,90\n")
+    assert is_tabular_text("이름\t점수")
+    assert not is_tabular_text('[["이름", "점수"]]')
+    assert not is_tabular_text("1,2,3")  # 한 줄 쉼표 목록은 기존처럼 한 열로 채움
+    assert not is_tabular_text("")
+
+
+def test_sniff_delimiter():
+    assert sniff_delimiter("a\tb\nc\td\n") == "\t"
+    assert sniff_delimiter("a;b;c\n1;2;3\n") == ";"
+    assert sniff_delimiter("single") == ","
+
+
+def test_iter_rows_from_text_handles_quotes_and_blank_lines():
+    text = '이름,메모\n홍길동,"1,000원\n(현금)"\n\n김철수,\n'
+    assert list(iter_rows(text)) == [["이름", "메모"], ["홍길동", "1,000원\n(현금)"], ["김철수", ""]]
+
+
+def test_iter_chunks_bounds_rows():
+    chunks = list(iter_chunks(([str(i)] for i in range(5)), 2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    with pytest.raises(ValueError):
+        list(iter_chunks([], 0))
+
+
+def test_read_chunks_from_files(tmp_path):
+    tsv = tmp_path / "data.tsv"
+    tsv.write_text("a\tb\n" + "".join(f"{i}\t{i * 2}\n" for i in range(250)), encoding="utf-8")
+    assert looks_like_path(str(tsv))
+    chunks = read_chunks(str(tsv), 100)
+    first = next(chunks)
+    assert first[:2] == [["a", "b"], ["0", "0"]]
+    assert [len(chunk) for chunk in chunks] == [100, 51]
+
+    legacy = tmp_path / "legacy.csv"
+    legacy.write_bytes("구분,금액\n식비,1000\n".encode("cp949"))
+    assert list(iter_rows(str(legacy))) == [["구분", "금액"], ["식비", "1000"]]
+
+
+def test_sniffing_sample_does_not_split_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.utils.tabular_stream.SNIFF_BYTES", 7)
+    path = tmp_path / "data.txt"
+    path.write_text("name;score\nalpha;1\nbeta;2\n", encoding="utf-8")
+    assert list(iter_rows(str(path))) == [["name", "score"], ["alpha", "1"], ["beta", "2"]]
+
+
+def test_missing_file_is_not_a_path(tmp_path):
+    assert not looks_like_path(str(tmp_path / "missing.csv"))
+    assert not looks_like_path(str(tmp_path / "notes.md"))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the paragraph-granular text model
+"""
+
+from src.utils.text_model import ParagraphTextModel
+
+
+def _loaded_model():
+    model = ParagraphTextModel()
+    model.load([
+        (0, 0, "제목\r\n"),
+        (0, 1, "첫 번째 "),
+        (0, 1, "문단\r\n"),
+        (3, 0, "셀 A1\r\n"),
+        (0, 2, "마지막 문단"),
+    ], synced_key=("id:1", 0, 0))
+    return model
+
+
+def test_load_joins_chunks_in_document_order():
+    """Chunks of one paragraph are merged; order follows the scan."""
+    model = _loaded_model()
+    assert model.valid
+    assert len(model) == 4
+    assert model.text() == "제목\r\n첫 번째 문단\r\n셀 A1\r\n마지막 문단"
+
+
+def test_text_edit_marks_only_that_paragraph():
+    """Typing inside one paragraph dirties exactly that paragraph."""
+    model = _loaded_model()
+    model.split(0, 1, 0)
+    assert model.dirty_keys() == [(0, 1)]
+
+    model.set_paragraph(0, 1, "고친 문단\r\n")
+    assert model.dirty_keys() == []
+    assert model.text() == "제목\r\n고친 문단\r\n셀 A1\r\n마지막 문단"
+
+
+def test_paragraph_break_shifts_following_paragraphs():
+    """A new paragraph renumbers the rest of its list, not other lists."""
+    model = _loaded_model()
+    model.mark_dirty(0, 2)
+    model.split(0, 1, 1)
+
+    keys = [key for key, _ in model.paragraphs()]
+    assert keys == [(0, 0), (0, 1), (0, 2), (3, 0), (0, 3)]
+    assert model.dirty_keys() == [(0, 1), (0, 2), (0, 3)]
+
+    model.set_paragraph(0, 1, "첫 번째")
+    model.set_paragraph(0, 2, "문단")
+    model.set_paragraph(0, 3, "마지막 문단")
+    assert model.text() == "제목\r\n첫 번째\r\n문단\r\n셀 A1\r\n마지막 문단"
+
+
+def test_unknown_paragraph_invalidates():
+    """Edits the model cannot place force a full rescan."""
+    model = _loaded_model()
+    model.split(9, 0, 0)
+    assert not model.valid
+    assert model.synced_key is None
+    assert model.text() == ""
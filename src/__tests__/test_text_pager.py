@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for paginated text slicing
+"""
+
+import pytest
+
+from src.utils.text_pager import assign_pages, select_pages, slice_text
+
+PARAGRAPHS = [
+    ((0, 0), "제목"),
+    ((0, 1), "본문 1"),
+    ((5, 0), "표 안"),
+    ((0, 2), "본문 2"),
+    ((0, 3), "끝"),
+]
+
+
+def test_assign_pages_uses_page_start_paragraphs():
+    """Paragraphs belong to the page they start on; table cells follow their anchor."""
+    keys = [key for key, _ in PARAGRAPHS]
+    pages = assign_pages(keys, [(1, (0, 0)), (2, (0, 2)), (3, (9, 9))])
+    assert pages == [1, 1, 1, 2, 2]
+
+
+def test_select_pages_is_inclusive():
+    pages = [1, 1, 2, 2, 3]
+    assert [k for k, _ in select_pages(PARAGRAPHS, pages, 2, 2)] == [(5, 0), (0, 2)]
+    assert len(select_pages(PARAGRAPHS, pages, page_from=3)) == 1
+    assert len(select_pages(PARAGRAPHS, pages)) == 5
+
+
+def test_slice_by_characters_reports_next_offset():
+    """Clients can walk the document with next_offset until it is None."""
+    full = "\r\n".join(t for _, t in PARAGRAPHS)
+    collected = ""
+    offset = 0
+    while offset is not None:
+        part = slice_text(PARAGRAPHS, offset, 7)
+        assert part["total"] == len(full)
+        collected += part["text"]
+        offset = part["next_offset"]
+    assert collected == full
+
+
+def test_slice_by_paragraphs():
+    part = slice_text(PARAGRAPHS, 1, 2, unit="paragraphs", separator="\n")
+    assert part["text"] == "본문 1\n표 안"
+    assert part["returned"] == 2
+    assert part["next_offset"] == 3
+
+    last = slice_text(PARAGRAPHS, 3, 10, unit="paragraphs")
+    assert last["returned"] == 2 and last["next_offset"] is None
+
+
+def test_slice_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        slice_text(PARAGRAPHS, unit="pages")
+    with pytest.raises(ValueError):
+        slice_text(PARAGRAPHS, offset=-1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the COM watchdog (fault injection with a simulated slow backend)
+"""
+
+import threading
+import time
+
+import pytest
+from src.utils.watchdog import ComWatchdog, ComTimeoutError
+
+
+class SlowHwpBackend:
+    """Simulated HWP backend whose AllReplace hangs until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def all_replace(self, find, replace):
+        self.calls.append(("AllReplace", find, replace))
+        self.release.wait(5)
+        return True
+
+    def insert_text(self, text):
+        self.calls.append(("InsertText", text))
+        return True
+
+
+def test_fast_call_returns_result():
+    """Calls that finish within the deadline return their result."""
+    watchdog = ComWatchdog(deadlines={"default": 1.0})
+    backend = SlowHwpBackend()
+
+    assert watchdog.call("InsertText", backend.insert_text, "hello") is True
+    assert backend.calls == [("InsertText", "hello")]
+
+
+def test_exceptions_propagate():
+    """Errors raised by the COM call reach the caller unchanged."""
+    watchdog = ComWatchdog()
+
+    def broken():
+        raise RuntimeError("COM failure")
+
+    with pytest.raises(RuntimeError) as e:
+        watchdog.call("default", broken)
+    assert "COM failure" in str(e.value)
+
+
+def test_deadline_cancels_and_recovers():
+    """A hanging call is cancelled, diagnosed and recovery is triggered."""
+    incidents = []
+    watchdog = ComWatchdog(deadlines={"AllReplace": 0.2}, on_timeout=incidents.append)
+    backend = SlowHwpBackend()
+
+    started = time.monotonic()
+    with pytest.raises(ComTimeoutError) as e:
+        watchdog.call("AllReplace", backend.all_replace, "a", "b")
+    assert time.monotonic() - started < 2
+
+    assert e.value.action == "AllReplace"
+    assert "제한 시간" in str(e.value)
+    assert len(incidents) == 1
+    assert incidents[0]["function"] == "all_replace"
+    assert any("all_replace" in line for line in incidents[0]["stack"])
+    assert watchdog.status()["incidents"][0]["action"] == "AllReplace"
+
+    # The next call runs on a fresh worker even though the old one is still stuck
+    assert watchdog.call("InsertText", backend.insert_text, "after") is True
+    backend.release.set()
+
+
+def test_per_action_deadlines():
+    """Unknown actions fall back to the default deadline."""
+    watchdog = ComWatchdog(deadlines={"default": 5, "AllReplace": 7})
+    assert watchdog.deadline_for("AllReplace") == 7
+    assert watchdog.deadline_for("Unknown") == 5
+
+    watchdog.set_deadline("FileSaveAs_S", 3)
+    assert watchdog.deadline_for("FileSaveAs_S") == 3
+
+
+def test_nested_calls_run_inline():
+    """Calls made from inside the worker thread do not deadlock."""
+    watchdog = ComWatchdog(deadlines={"default": 1.0})
+
+    def outer():
+        return watchdog.call("default", lambda: threading.current_thread().name)
+
+    assert watchdog.call("default", outer) == "hwp-com-worker"
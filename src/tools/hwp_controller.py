@@ -5,25 +5,116 @@ win32com을 이용하여 한글 프로그램을 자동화합니다.
 
 import os
 import logging
+import functools
 import win32com.client
 import win32gui
 import win32con
 import time
 import pythoncom
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+try:
+    from src.utils.progress import check_cancelled, report_progress
+    from src.utils.edit_generation import EditGenerationTracker
+    from src.utils.text_model import (
+        ParagraphTextModel, SCAN_RANGE_DOCUMENT, SCAN_RANGE_PARAGRAPH, SCAN_OPTION, SCAN_END_STATES, MOVE_SCAN_POS
+    )
+    from src.utils.text_pager import assign_pages
+    from src.utils.control_index import ControlIndex, assign_tables
+    from src.utils.aho_corasick import AhoCorasick
+    from src.utils.replace_planner import plan_replacements
+    from src.utils.find_session import make_snippet
+    from src.utils.cursor_context import CursorContextCache, build_context, index_to_cell
+    from src.utils.position_cache import TEXT_ADDRESS_KINDS, PositionCache, plan_cell_order
+    from src.utils.form_profiles import fingerprint_tables, profile_key, verify_entry
+    from src.utils.series import cf_html, rows_to_html_table, to_html_table
+    from src.utils.table_grid import TableGrid
+    from src.utils.cell_map import CellAddressMap, parse_cell_reference, table_cell_lists
+    from src.utils.merge_planner import plan_merges, verify_merges
+    from src.utils.path_model import direction_keyword, parse_path, resolve_path
+except ImportError:
+    from utils.progress import check_cancelled, report_progress
+    from utils.edit_generation import EditGenerationTracker
+    from utils.text_model import (
+        ParagraphTextModel, SCAN_RANGE_DOCUMENT, SCAN_RANGE_PARAGRAPH, SCAN_OPTION, SCAN_END_STATES, MOVE_SCAN_POS
+    )
+    from utils.text_pager import assign_pages
+    from utils.control_index import ControlIndex, assign_tables
+    from utils.aho_corasick import AhoCorasick
+    from utils.replace_planner import plan_replacements
+    from utils.find_session import make_snippet
+    from utils.cursor_context import CursorContextCache, build_context, index_to_cell
+    from utils.position_cache import TEXT_ADDRESS_KINDS, PositionCache, plan_cell_order
+    from utils.form_profiles import fingerprint_tables, profile_key, verify_entry
+    from utils.series import cf_html, rows_to_html_table, to_html_table
+    from utils.table_grid import TableGrid
+    from utils.cell_map import CellAddressMap, parse_cell_reference, table_cell_lists
+    from utils.merge_planner import plan_merges, verify_merges
+    from utils.path_model import direction_keyword, parse_path, resolve_path
 
 logger = logging.getLogger("hwp-controller")
 
 
+def mutates_document(method=None, scope: str = "document", structural: Optional[bool] = None):
+    """
+    문서 내용을 바꾸는 컨트롤러 메서드용 데코레이터.
+    가장 바깥 호출이 끝나면 (성공 여부와 관계없이) 활성 문서의 편집 세대를 한 번 올리고
+    문단 텍스트 모델에 변경 범위를 반영합니다.
+
+    Args:
+        scope: 변경 범위
+            - "paragraph": 커서 위치에 텍스트/문단 나눔만 삽입 (해당 문단만 다시 읽음)
+            - "format": 글자/쪽 모양만 변경 (텍스트 모델 유지)
+            - "document": 범위를 알 수 없음 (텍스트 모델 무효화)
+        structural: 표/문단 구조(셀 위치)가 바뀔 수 있는지 여부.
+            None이면 scope가 "document"일 때만 구조 변경으로 보고, 셀 값만 쓰는 메서드는 False로 지정합니다.
+    """
+    is_structural = scope == "document" if structural is None else structural
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            before = self._capture_text_model_state(scope) if self._mutation_depth == 0 else None
+            self._mutation_depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._mutation_depth -= 1
+                if self._mutation_depth == 0:
+                    self.mark_document_changed(structural=is_structural)
+                    self._apply_text_model_change(scope, before)
+        return wrapper
+
+    if method is not None:
+        return decorator(method)
+    return decorator
+
+
 class HwpController:
     """한글 문서를 제어하는 클래스"""
 
-    def __init__(self):
-        """한글 애플리케이션 인스턴스를 초기화합니다."""
+    def __init__(self, edit_generations: Optional[EditGenerationTracker] = None, profile_store=None):
+        """
+        한글 애플리케이션 인스턴스를 초기화합니다.
+
+        Args:
+            edit_generations: 문서별 편집 세대 추적기 (재연결 후에도 유지하려면 외부에서 전달)
+            profile_store: 양식 프로필 저장소 (FormProfileStore, 없으면 프로필을 사용하지 않음)
+        """
         self.hwp = None
         self.visible = True
         self.is_hwp_running = False
         self.current_document_path = None
+        self.edit_generations = edit_generations or EditGenerationTracker()
+        self._mutation_depth = 0
+        self.text_model = ParagraphTextModel()
+        self._page_index = (None, [])
+        self.control_index = ControlIndex()
+        self.cursor_context = CursorContextCache()
+        self.position_cache = PositionCache()
+        self._cell_maps: Tuple[Any, Dict[int, Any]] = (None, {})
+        self.profile_store = profile_store
+        self._autosaved_generations: Dict[str, Tuple[str, int, int]] = {}
 
     def connect(self, visible: bool = True, register_security_module: bool = True) -> bool:
         """
@@ -133,8 +224,10 @@ class HwpController:
             if save:
                 self.hwp.HAction.Run("FileSave")
 
+            document_key = self.get_document_key()
             result = self.hwp.HAction.Run("FileClose")
             self.current_document_path = None
+            self.edit_generations.forget(document_key)
 
             # 메시지 박스 모드 복원
             if suppress_dialog:
@@ -177,6 +270,7 @@ class HwpController:
 
             result = self.hwp.HAction.Run("FileCloseAll")
             self.current_document_path = None
+            self.edit_generations.forget()
 
             # 메시지 박스 모드 복원
             if suppress_dialog:
@@ -267,6 +361,65 @@ class HwpController:
             print(f"문서 목록 조회 실패: {e}")
             return False, []
 
+    def get_document_key(self) -> str:
+        """
+        현재 활성 문서를 식별하는 키를 반환합니다.
+        DocumentID를 우선 사용하고, 없으면 문서 경로나 탭 인덱스를 사용합니다.
+
+        Returns:
+            str: 문서 식별 키
+        """
+        try:
+            if not self.is_hwp_running:
+                return ""
+
+            doc = self.hwp.XHwpDocuments.Active_XHwpDocument
+            try:
+                return f"id:{doc.DocumentID}"
+            except Exception as e:
+                logger.debug(f"DocumentID 조회 실패, 경로 사용: {e}")
+            if doc.Path:
+                return f"path:{os.path.normcase(doc.Path)}"
+        except Exception as e:
+            logger.debug(f"활성 문서 조회 실패: {e}")
+
+        try:
+            return f"index:{self.hwp.CurDocIndex}"
+        except Exception as e:
+            logger.debug(f"CurDocIndex 조회 실패: {e}")
+            return "unknown"
+
+    def mark_document_changed(self, structural: bool = True) -> int:
+        """
+        활성 문서가 변경되었음을 기록합니다.
+        컨트롤러 메서드를 거치지 않고 hwp 객체로 직접 편집한 경우에 호출합니다.
+
+        Args:
+            structural: 표/문단 구조가 바뀌었을 수 있는지 여부 (셀 값만 바꿨다면 False로 셀 위치 캐시 유지)
+
+        Returns:
+            int: 올린 뒤의 편집 세대 (HWP가 실행 중이 아니면 0)
+        """
+        if not self.is_hwp_running:
+            return 0
+        return self.edit_generations.bump(self.get_document_key(), structural=structural)
+
+    def get_edit_generation(self) -> Tuple[str, int, int]:
+        """
+        활성 문서의 편집 세대를 반환합니다. 읽기 결과 캐시의 키로 사용합니다.
+        HWP의 수정 여부 플래그(IsModified)도 확인해 사용자가 직접 편집한 경우를 반영합니다.
+
+        Returns:
+            Tuple[str, int, int]: (문서 키, 편집 세대, 전체 초기화 횟수)
+        """
+        document_key = self.get_document_key()
+        if self.is_hwp_running:
+            try:
+                self.edit_generations.observe_modified(document_key, bool(self.hwp.IsModified))
+            except Exception as e:
+                logger.debug(f"IsModified 조회 실패 (무시): {e}")
+        return self.edit_generations.key(document_key)
+
     def switch_document(self, index: int) -> Tuple[bool, str]:
         """
         특정 인덱스의 문서로 전환합니다.
@@ -305,6 +458,180 @@ class HwpController:
         except Exception as e:
             return False, f"문서 전환 실패: {e}"
 
+    def capture_session(self, journal, full: bool = True) -> bool:
+        """
+        현재 세션 상태를 세션 저널에 기록합니다.
+        커서 위치는 항상 기록하고, full이면 열린 문서 목록을 갱신하고
+        현재 문서가 저장된 적 없거나 저장하지 않은 변경 사항이 있으면 그 사본을 자동 저장 디렉터리에 씁니다.
+        사용자의 탭을 바꾸지 않도록 다른 문서는 내보내지 않고, 그 문서가 현재 문서였을 때 쓴 사본을 기록합니다.
+
+        Args:
+            journal: SessionJournal 인스턴스
+            full (bool): 문서 목록 갱신 및 자동 저장 여부
+
+        Returns:
+            bool: 기록 성공 여부
+        """
+        try:
+            if not self.is_hwp_running:
+                return False
+
+            journal.record_position(self._get_current_position())
+            if not full:
+                return True
+
+            success, documents = self.get_open_documents()
+            if not success:
+                return False
+
+            entries = []
+            current_index = None
+            for doc in documents:
+                path = doc["path"]
+                is_untitled = path == "(새 문서)" or path.startswith("(오류")
+                autosave = is_untitled or journal.is_autosave_path(path)
+
+                copy_path = self._autosave_document(
+                    doc["index"], None if is_untitled else path, journal, doc["is_current"])
+                entry = {"index": doc["index"], "path": copy_path if is_untitled else path, "autosave": autosave}
+                if copy_path and not autosave:
+                    entry["recovery"] = copy_path
+
+                if doc["is_current"]:
+                    current_index = doc["index"]
+                entries.append(entry)
+
+            journal.record_documents(entries, current_index)
+            journal.mark_checkpoint()
+            return journal.save()
+        except Exception as e:
+            logger.warning(f"세션 기록 실패: {e}")
+            return False
+
+    def _autosave_document(self, index: int, source_path: Optional[str], journal, is_current: bool) -> Optional[str]:
+        """
+        index번째 문서의 사본을 HWPML로 자동 저장 디렉터리에 씁니다.
+        SaveAs/Save를 쓰지 않으므로 문서의 경로와 수정 여부는 그대로입니다.
+        새 문서는 내용이 있으면, 저장된 문서는 수정된 경우에만 씁니다.
+        (자동 저장 디렉터리의 사본을 다시 연 문서는 그 파일에 덮어씀)
+        현재 문서만 내보내며, 지난 체크포인트 이후 편집 세대가 그대로이고 사본이 있으면 다시 쓰지 않습니다.
+        현재 문서가 아니면 이전에 쓴 사본이 있을 때 그 경로만 반환합니다.
+
+        Args:
+            index (int): 문서 인덱스
+            source_path (Optional[str]): 문서 파일 경로 (새 문서면 None)
+            journal: SessionJournal 인스턴스
+            is_current (bool): 현재(활성) 문서 여부
+
+        Returns:
+            Optional[str]: 사본 경로 (쓸 필요가 없거나 실패한 경우 None)
+        """
+        try:
+            doc = self.hwp.XHwpDocuments.Item(index)
+            try:
+                modified = bool(doc.Modified)
+            except Exception:
+                modified = True
+
+            if source_path and journal.is_autosave_path(source_path):
+                target = source_path
+            else:
+                try:
+                    doc_id = doc.DocumentID
+                except Exception:
+                    doc_id = None
+                target = journal.autosave_path(index, source_path, doc_id)
+
+            if not modified:
+                if source_path and target != source_path:
+                    # 저장된 상태이므로 이전 사본은 필요 없음
+                    if os.path.exists(target):
+                        os.remove(target)
+                    return None
+                return target if os.path.exists(target) else None
+
+            if not is_current:
+                # 탭을 전환해 내보내지 않음 (그 문서가 현재 문서였을 때 쓴 사본을 사용)
+                return target if os.path.exists(target) else None
+
+            generation = self.get_edit_generation()
+            if self._autosaved_generations.get(target) == generation and os.path.exists(target):
+                return target
+
+            content = self.hwp.GetTextFile("HWPML2X", "")
+            if not content:
+                return None
+            os.makedirs(journal.autosave_dir, exist_ok=True)
+            tmp_path = target + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, target)
+            self._autosaved_generations[target] = generation
+            logger.info(f"문서 사본 자동 저장: [{index}] {target}")
+            return target
+        except Exception as e:
+            logger.warning(f"문서 자동 저장 실패 [{index}]: {e}")
+            return None
+
+    def restore_session(self, journal) -> Tuple[bool, str]:
+        """
+        세션 저널에 기록된 문서, 현재 탭, 커서 위치를 복원합니다.
+        이미 열려 있는 문서는 다시 열지 않습니다.
+
+        Args:
+            journal: SessionJournal 인스턴스
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, "HWP가 실행되지 않았습니다."
+
+            started = time.time()
+            documents = journal.restorable_documents()
+            if not documents:
+                return True, "복원할 문서가 없습니다."
+
+            _, open_docs = self.get_open_documents()
+            open_paths = {os.path.normcase(os.path.abspath(doc["path"]))
+                          for doc in open_docs if doc["path"] and not doc["path"].startswith("(")}
+
+            reopened = 0
+            recovered = []
+            for doc in documents:
+                recovery = doc.get("recovery")
+                if recovery and os.path.exists(recovery):
+                    recovered.append(recovery)
+                if os.path.normcase(os.path.abspath(doc["path"])) in open_paths:
+                    continue
+                if self.open_document(doc["path"]):
+                    reopened += 1
+                else:
+                    logger.warning(f"문서 복원 실패: {doc['path']}")
+
+            # 현재 탭과 커서 위치 복원 (기록된 문서 순서를 기준으로 탭 찾기)
+            if journal.current_index is not None:
+                target_path = next((doc["path"] for doc in journal.documents
+                                    if doc["index"] == journal.current_index), None)
+                _, open_docs = self.get_open_documents()
+                for doc in open_docs:
+                    if target_path and doc["path"] and \
+                            os.path.normcase(doc["path"]) == os.path.normcase(target_path):
+                        self.switch_document(doc["index"])
+                        break
+            if journal.last_pos:
+                self._set_position(journal.last_pos)
+
+            elapsed = time.time() - started
+            message = f"세션 복원 완료: 문서 {reopened}개 다시 열기 ({elapsed:.1f}초)"
+            if recovered:
+                # 원본은 마지막으로 저장된 상태로 열림 - 저장하지 않은 변경 사항은 사본에 있음
+                message += f"\n저장하지 않은 변경 사항 사본: {', '.join(recovered)}"
+            return True, message
+        except Exception as e:
+            return False, f"세션 복원 실패: {e}"
+
     def get_all_hwp_instances(self) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Running Object Table에서 모든 HWP 인스턴스를 찾습니다.
@@ -434,6 +761,38 @@ class HwpController:
         except Exception as e:
             return False, f"창 닫기 실패: {e}"
 
+    @staticmethod
+    def close_modal_dialogs() -> int:
+        """
+        HWP 창이 띄운 모달 대화상자(#32770)를 모두 닫습니다.
+        COM 호출이 대화상자에 막혀 응답하지 않을 때 복구용으로 사용하며,
+        COM 객체를 사용하지 않으므로 어느 스레드에서나 호출할 수 있습니다.
+
+        Returns:
+            int: 닫기 요청을 보낸 대화상자 수
+        """
+        dialogs = []
+
+        def enum_dialogs(hwnd, results):
+            try:
+                if win32gui.GetClassName(hwnd) != "#32770" or not win32gui.IsWindowVisible(hwnd):
+                    return True
+                owner = win32gui.GetWindow(hwnd, win32con.GW_OWNER)
+                if owner and "Hwp" in win32gui.GetClassName(owner):
+                    results.append(hwnd)
+            except Exception as e:
+                logger.debug(f"대화상자 정보 조회 실패 hwnd={hwnd}: {e}")
+            return True
+
+        try:
+            win32gui.EnumWindows(enum_dialogs, dialogs)
+            for hwnd in dialogs:
+                win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
+        except Exception as e:
+            logger.warning(f"HWP 대화상자 닫기 실패: {e}")
+        return len(dialogs)
+
+    @mutates_document
     def open_document(self, file_path: str) -> bool:
         """
         문서를 엽니다.
@@ -456,7 +815,7 @@ class HwpController:
             pset = self.hwp.HParameterSet.HFileOpenSave
             self.hwp.HAction.GetDefault("FileOpen", pset.HSet)
             pset.filename = abs_path
-            pset.Format = "HWP"
+            pset.Format = "HWPML2X" if abs_path.lower().endswith(".hml") else "HWP"
             result = self.hwp.HAction.Execute("FileOpen", pset.HSet)
             print(f"[DEBUG] FileOpen result: {result}")
             if result:
@@ -500,6 +859,7 @@ class HwpController:
             print(f"문서 저장 실패: {e}")
             return False
 
+    @mutates_document(scope="paragraph")
     def insert_text(self, text: str, preserve_linebreaks: bool = True) -> bool:
         """
         현재 커서 위치에 텍스트를 삽입합니다.
@@ -552,6 +912,7 @@ class HwpController:
             logger.debug(f"셀 내부 커서 이동 실패: {e}")
             return False
 
+    @mutates_document(scope="paragraph")
     def _insert_text_direct(self, text: str) -> bool:
         """
         텍스트를 직접 삽입하는 내부 메서드입니다.
@@ -572,6 +933,7 @@ class HwpController:
             print(f"텍스트 직접 삽입 실패: {e}")
             return False
 
+    @mutates_document(scope="format")
     def set_font(self, font_name: str, font_size: int, bold: bool = False, italic: bool = False, 
                 select_previous_text: bool = False) -> bool:
         """
@@ -604,6 +966,7 @@ class HwpController:
             print(f"글꼴 설정 실패: {e}")
             return False
 
+    @mutates_document(scope="format")
     def set_font_style(self, font_name: str = None, font_size: int = None, 
                      bold: bool = False, italic: bool = False, underline: bool = False,
                      select_previous_text: bool = False) -> bool:
@@ -670,6 +1033,58 @@ class HwpController:
             logger.debug(f"GetPos 실패: {e}")
             return None
 
+    def get_cursor_context(self, resolve_table: bool = False) -> Dict[str, Any]:
+        """
+        커서가 표 안에 있는지, 어느 표의 어느 셀에 있는지 구합니다.
+        TableCellBlock/Cancel을 시험 실행하지 않으며, 문서나 커서 위치가 바뀌기 전까지는 저장된 결과를 반환합니다.
+        저장된 결과를 쓸 때도 GetPos와 문서 키 조회(XHwpDocuments.Active_XHwpDocument.DocumentID,
+        실패하면 Path나 CurDocIndex)로 COM 호출 4회 이상이 들며, 새로 구할 때는 본문 밖이면 KeyIndicator,
+        표 번호를 찾으면 ParentCtrl 조회가 더해집니다.
+        (사용자가 탭을 바꿀 수 있으므로 문서 키는 저장해 두지 않고 매번 확인함)
+
+        Args:
+            resolve_table: 표 번호를 모를 때 컨트롤 색인을 만들어서라도 구할지 여부
+
+        Returns:
+            Dict: {"pos", "in_table", "cell" (예: "B3"), "row", "col", "table_index"}
+            (표 번호는 컨트롤 색인이 최신일 때만 채워짐, resolve_table=True면 항상 구함)
+        """
+        pos = self._get_current_position()
+        if not self.is_hwp_running or pos is None:
+            return build_context(None)
+
+        document_key = self.get_document_key()
+        key = (self.edit_generations.key(document_key), tuple(pos))
+        context = self.cursor_context.get(key)
+        if context is not None and (context["table_index"] is not None or not context["in_table"] or not resolve_table):
+            return context
+
+        control_name = None
+        if pos[0] != 0:
+            try:
+                control_name = self.hwp.KeyIndicator()[-1]
+            except Exception as e:
+                logger.debug(f"KeyIndicator 조회 실패 (무시): {e}")
+        context = build_context(pos, control_name)
+
+        if context["in_table"]:
+            index = self.control_index
+            if resolve_table:
+                index = self.get_control_index()
+                self._set_position(pos)
+            if index.synced_key is not None and index.synced_key == self.text_model.synced_key == key[0]:
+                try:
+                    anchor = self.hwp.ParentCtrl.GetAnchorPos(0)
+                    anchor = [anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos")]
+                    context["table_index"] = next(
+                        (t["table_index"] for t in index.tables() if t.get("anchor") == anchor), None
+                    )
+                except Exception as e:
+                    logger.debug(f"ParentCtrl 조회 실패 (무시): {e}")
+
+        self.cursor_context.store(key, context)
+        return context
+
     def _set_position(self, pos):
         """커서 위치를 지정된 위치로 변경합니다."""
         try:
@@ -680,6 +1095,7 @@ class HwpController:
             logger.debug(f"SetPos 실패: {e}")
             return False
 
+    @mutates_document
     def insert_table(self, rows: int, cols: int) -> bool:
         """
         현재 커서 위치에 표를 삽입합니다.
@@ -716,6 +1132,7 @@ class HwpController:
             print(f"표 삽입 실패: {e}")
             return False
 
+    @mutates_document
     def insert_image(self, image_path: str, width: int = 0, height: int = 0) -> bool:
         """
         현재 커서 위치에 이미지를 삽입합니다.
@@ -748,6 +1165,7 @@ class HwpController:
             print(f"이미지 삽입 실패: {e}")
             return False
 
+    @mutates_document
     def undo(self, count: int = 1) -> Tuple[bool, str]:
         """
         실행 취소(Undo)를 수행합니다.
@@ -779,6 +1197,7 @@ class HwpController:
         except Exception as e:
             return False, f"실행 취소 실패: {e}"
 
+    @mutates_document
     def redo(self, count: int = 1) -> Tuple[bool, str]:
         """
         다시 실행(Redo)을 수행합니다.
@@ -840,6 +1259,184 @@ class HwpController:
             print(f"텍스트 찾기 실패: {e}")
             return False
 
+    def find_all(
+        self,
+        text: str,
+        regex: bool = False,
+        max_hits: int = 500,
+        start_pos: Optional[List[int]] = None
+    ) -> Tuple[bool, List[Dict[str, Any]]]:
+        """
+        문서에서 text의 모든 적중 위치를 한 번의 순방향 검색으로 찾습니다.
+        검색 후 커서는 원래 위치로 돌아갑니다.
+
+        Args:
+            text: 찾을 텍스트 (regex가 True이면 정규식)
+            regex: 정규식 검색 여부
+            max_hits: 최대 적중 수
+            start_pos: 검색 시작 위치 (GetPos 형식, 없으면 문서 처음부터)
+
+        Returns:
+            Tuple[bool, List[Dict]]: (성공 여부, 적중 목록)
+            각 적중은 {"pos", "end", "page", "cell", "table_index", "snippet"} 형태
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, []
+
+            paragraphs = self.get_paragraphs()
+            texts = dict(paragraphs)
+            order = {key: i for i, (key, _) in enumerate(paragraphs)}
+            table_anchors = {
+                tuple(table["anchor"]): table["table_index"]
+                for table in self.get_control_index().tables() if table.get("anchor")
+            }
+
+            hits = []
+            seen = set()
+            last_order = None
+            saved_pos = self._get_current_position()
+            try:
+                if start_pos:
+                    self.hwp.SetPos(*start_pos)
+                else:
+                    self.hwp.HAction.Run("MoveDocBegin")
+
+                pset = self.hwp.HParameterSet.HFindReplace
+                self.hwp.HAction.GetDefault("RepeatFind", pset.HSet)
+                pset.FindString = text
+                pset.FindRegExp = 1 if regex else 0
+                pset.IgnoreMessage = 1
+                pset.Direction = 0  # 0: forward
+
+                while len(hits) < max_hits:
+                    check_cancelled()
+                    if not self.hwp.HAction.Execute("RepeatFind", pset.HSet):
+                        break
+                    _, s_list, s_para, s_pos, e_list, e_para, e_pos = self.hwp.GetSelectedPos()
+
+                    # 문서 끝에서 처음으로 되돌아가면 중단
+                    if (s_list, s_para, s_pos) in seen:
+                        break
+                    seen.add((s_list, s_para, s_pos))
+                    if (s_list, s_para) in order:
+                        hit_order = (order[(s_list, s_para)], s_pos)
+                        if last_order is not None and hit_order <= last_order:
+                            break
+                        last_order = hit_order
+
+                    hits.append(self._describe_hit(
+                        [s_list, s_para, s_pos], [e_list, e_para, e_pos], texts, table_anchors
+                    ))
+            finally:
+                self.hwp.HAction.Run("Cancel")
+                self._set_position(saved_pos)
+
+            return True, hits
+        except Exception as e:
+            print(f"전체 찾기 실패: {e}")
+            return False, []
+
+    def find_many(
+        self,
+        labels: List[str],
+        ignore_case: bool = False,
+        max_hits_per_label: int = 100
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        여러 레이블을 문단 텍스트 모델에서 한 번의 Aho–Corasick 순회로 찾습니다.
+        문서 텍스트가 이미 읽혀 있으면 HWP 검색을 실행하지 않습니다.
+
+        Args:
+            labels: 찾을 레이블 목록
+            ignore_case: 영문 대소문자 구분 안 함
+            max_hits_per_label: 레이블별 최대 적중 수
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"found": {레이블: [적중, ...]}, "not_found": [레이블, ...]})
+            각 적중은 {"pos": [리스트 ID, 문단 번호, 문단 안 문자 위치], "table_index", "cell_index", "snippet"}
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+
+            automaton = AhoCorasick(labels, ignore_case)
+            paragraphs = self.get_paragraphs()
+
+            found: Dict[str, List[Dict[str, Any]]] = {}
+            hit_paragraphs = []
+            for i, (key, text) in enumerate(paragraphs):
+                for start, label in automaton.finditer(text):
+                    hits = found.setdefault(label, [])
+                    if len(hits) >= max_hits_per_label:
+                        continue
+                    hits.append({
+                        "pos": [key[0], key[1], start],
+                        "table_index": None,
+                        "cell_index": None,
+                        "snippet": make_snippet(text, start, len(label)),
+                    })
+                    hit_paragraphs.append((i, hits[-1]))
+
+            # 표 안의 적중이 있을 때만 컨트롤 색인으로 표/셀 번호를 붙임
+            if any(hit["pos"][0] != 0 for _, hit in hit_paragraphs):
+                assignments = assign_tables(
+                    [key for key, _ in paragraphs], self.get_control_index().tables()
+                )
+                for i, hit in hit_paragraphs:
+                    hit["table_index"], hit["cell_index"] = assignments[i]
+
+            not_found = [label for label in automaton.patterns if label not in found]
+            return True, {"found": found, "not_found": not_found}
+        except Exception as e:
+            return False, {"error": f"여러 레이블 찾기 실패: {str(e)}"}
+
+    def _describe_hit(self, start, end, texts, table_anchors) -> Dict[str, Any]:
+        """현재 선택된 적중의 쪽, 셀, 표 번호와 문맥을 구합니다."""
+        hit = {"pos": start, "end": end, "page": None, "cell": None, "table_index": None}
+        try:
+            indicator = self.hwp.KeyIndicator()
+            hit["page"] = indicator[3]
+            if start[0] != 0 and indicator[-1]:
+                hit["cell"] = str(indicator[-1]).strip("()")
+        except Exception as e:
+            logger.debug(f"KeyIndicator 조회 실패 (무시): {e}")
+
+        if start[0] != 0:
+            try:
+                anchor = self.hwp.ParentCtrl.GetAnchorPos(0)
+                hit["table_index"] = table_anchors.get(
+                    (anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos"))
+                )
+            except Exception as e:
+                logger.debug(f"ParentCtrl 조회 실패 (무시): {e}")
+
+        length = end[2] - start[2] if end[:2] == start[:2] else 0
+        hit["snippet"] = make_snippet(texts.get((start[0], start[1]), ""), start[2], length)
+        return hit
+
+    def select_range(self, start: List[int], end: List[int]) -> bool:
+        """
+        start부터 end까지 선택합니다. (같은 리스트 안의 범위)
+
+        Args:
+            start: 시작 위치 (GetPos 형식)
+            end: 끝 위치 (GetPos 형식)
+
+        Returns:
+            bool: 선택 성공 여부 (start와 end가 다른 리스트(셀 등)에 있으면 선택하지 않고 False)
+        """
+        try:
+            if not self.is_hwp_running or start[0] != end[0]:
+                return False
+            if not self.hwp.SetPos(*start):
+                return False
+            return bool(self.hwp.SelectText(start[1], start[2], end[1], end[2]))
+        except Exception as e:
+            logger.debug(f"범위 선택 실패: {e}")
+            return False
+
+    @mutates_document
     def replace_text(self, find_text: str, replace_text: str, replace_all: bool = True) -> bool:
         """
         문서에서 텍스트를 찾아 바꿉니다.
@@ -874,9 +1471,47 @@ class HwpController:
             print(f"텍스트 바꾸기 실패: {e}")
             return False
 
+    @mutates_document
+    def replace_many(self, mapping: Dict[str, str]) -> Tuple[bool, Dict[str, Any]]:
+        """
+        여러 항목을 찾아 바꿉니다.
+        문서 텍스트를 미리 검사해 문서에 없는 항목은 AllReplace를 실행하지 않고,
+        겹치거나 서로 의존하는 항목은 동시에 바꾼 것과 같은 결과가 되도록 순서를 정합니다.
+
+        Args:
+            mapping: {찾을 문자열: 바꿀 문자열}
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"counts": 항목별 바꾼 횟수, "skipped": 문서에 없는 항목,
+            "steps": 실행한 AllReplace 수, "uses_sentinels": 임시 문자열 사용 여부})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+
+            plan = plan_replacements(mapping, self.get_text())
+            steps = plan["steps"]
+            for i, (find_text, replace_text) in enumerate(steps):
+                check_cancelled()
+                if not self.replace_text(find_text, replace_text):
+                    return False, {"error": f"'{find_text}' 바꾸기 실패", "completed_steps": i}
+                report_progress(i + 1, len(steps), "replacements")
+
+            return True, {
+                "counts": plan["counts"],
+                "skipped": plan["skipped"],
+                "steps": len(steps),
+                "uses_sentinels": plan["uses_sentinels"],
+            }
+        except ValueError as e:
+            return False, {"error": str(e)}
+        except Exception as e:
+            return False, {"error": f"여러 항목 바꾸기 실패: {str(e)}"}
+
     def get_text(self) -> str:
         """
         현재 문서의 전체 텍스트를 가져옵니다.
+        처음에는 문서 전체를 문단 단위로 스캔하고, 이후에는 편집된 문단만 다시 읽습니다.
         
         Returns:
             str: 문서 텍스트
@@ -884,12 +1519,190 @@ class HwpController:
         try:
             if not self.is_hwp_running:
                 return ""
+
+            try:
+                return self._get_text_incremental()
+            except Exception as e:
+                logger.debug(f"문단 스캔 실패, 전체 내보내기로 대체: {e}")
+                self.text_model.invalidate()
             
             return self.hwp.GetTextFile("TEXT", "")
         except Exception as e:
             print(f"텍스트 가져오기 실패: {e}")
             return ""
 
+    def _get_text_incremental(self) -> str:
+        """문단 텍스트 모델을 최신 상태로 맞춘 뒤 전체 텍스트를 반환합니다."""
+        generation_key = self.get_edit_generation()
+        model = self.text_model
+
+        if not model.valid or model.synced_key != generation_key:
+            self._populate_text_model(generation_key)
+        elif model.dirty_keys():
+            self._refresh_dirty_paragraphs()
+
+        return model.text()
+
+    def _scan_text(self, scan_range: int) -> List[Tuple[int, int, str]]:
+        """
+        InitScan/GetText로 텍스트를 읽어 (리스트 ID, 문단 번호, 텍스트) 조각 목록을 반환합니다.
+        스캔 범위의 시작 위치는 현재 커서 기준입니다. (커서가 이동하므로 호출 측에서 복원)
+        """
+        chunks = []
+        self.hwp.InitScan(SCAN_OPTION, scan_range)
+        try:
+            while True:
+                state, text = self.hwp.GetText()
+                if state in SCAN_END_STATES:
+                    break
+                self.hwp.MovePos(MOVE_SCAN_POS)
+                list_id, para, _ = self.hwp.GetPos()
+                chunks.append((list_id, para, text))
+        finally:
+            self.hwp.ReleaseScan()
+        return chunks
+
+    def _populate_text_model(self, generation_key) -> None:
+        """문서 전체를 스캔해 문단 텍스트 모델을 새로 채웁니다."""
+        saved_pos = self._get_current_position()
+        try:
+            chunks = self._scan_text(SCAN_RANGE_DOCUMENT)
+            self.text_model.load(chunks, generation_key)
+            logger.debug(f"문단 텍스트 모델 구성: {len(self.text_model)}개 문단")
+        finally:
+            self._set_position(saved_pos)
+
+    def _refresh_dirty_paragraphs(self) -> None:
+        """편집으로 표시된 문단만 다시 스캔합니다."""
+        model = self.text_model
+        saved_pos = self._get_current_position()
+        try:
+            for list_id, para in model.dirty_keys():
+                if not self.hwp.SetPos(list_id, para, 0):
+                    model.invalidate()
+                    raise RuntimeError(f"문단 위치로 이동 실패: ({list_id}, {para})")
+                chunks = self._scan_text(SCAN_RANGE_PARAGRAPH)
+                text = "".join(t for l, p, t in chunks if (l, p) == (list_id, para))
+                model.set_paragraph(list_id, para, text)
+        finally:
+            self._set_position(saved_pos)
+
+    def get_paragraphs(self) -> List[Tuple[Tuple[int, int], str]]:
+        """
+        문서 순서의 문단 목록을 반환합니다. (문단 텍스트 모델을 최신 상태로 맞춘 뒤)
+
+        Returns:
+            List[Tuple[Tuple[int, int], str]]: ((리스트 ID, 문단 번호), 텍스트) 목록
+        """
+        if not self.is_hwp_running:
+            return []
+        self._get_text_incremental()
+        return self.text_model.paragraphs()
+
+    def get_paragraph_pages(self) -> List[int]:
+        """
+        get_paragraphs()와 같은 순서로 각 문단이 시작하는 쪽 번호를 반환합니다.
+        쪽 색인은 문서가 바뀌었을 때(편집 세대가 달라졌을 때)만 다시 만듭니다.
+
+        Returns:
+            List[int]: 문단별 쪽 번호 (1부터)
+        """
+        paragraphs = self.get_paragraphs()
+        generation_key = self.text_model.synced_key
+        cached_key, page_starts = self._page_index
+        if cached_key != generation_key:
+            page_starts = self._build_page_starts()
+            self._page_index = (generation_key, page_starts)
+        return assign_pages([key for key, _ in paragraphs], page_starts)
+
+    def _build_page_starts(self) -> List[Tuple[int, Tuple[int, int]]]:
+        """쪽마다 시작 위치로 이동해 (쪽 번호, 시작 문단 키) 목록을 만듭니다."""
+        page_starts = []
+        saved_pos = self._get_current_position()
+        try:
+            page_count = int(self.hwp.PageCount)
+            self.hwp.MovePos(2)  # moveTopOfFile
+            for page in range(1, page_count + 1):
+                if page > 1:
+                    self.hwp.Run("MovePageDown")
+                    self.hwp.Run("MovePageBegin")
+                list_id, para, _ = self.hwp.GetPos()
+                page_starts.append((page, (list_id, para)))
+        finally:
+            self._set_position(saved_pos)
+        return page_starts
+
+    def iter_text(self, chunk_size: int = 65536):
+        """
+        문서 텍스트를 chunk_size 문자 안팎의 조각으로 나누어 차례로 반환하는 제너레이터.
+        전체 텍스트를 메모리에 모으지 않으며 커서를 움직이지 않습니다.
+
+        Args:
+            chunk_size: 한 번에 반환할 대략적인 문자 수
+
+        Yields:
+            str: 텍스트 조각
+        """
+        if not self.is_hwp_running:
+            return
+
+        buffer = []
+        buffered = 0
+        self.hwp.InitScan(SCAN_OPTION, SCAN_RANGE_DOCUMENT)
+        try:
+            while True:
+                state, text = self.hwp.GetText()
+                if state in SCAN_END_STATES:
+                    break
+                if not text:
+                    continue
+                buffer.append(text)
+                buffered += len(text)
+                if buffered >= chunk_size:
+                    yield "".join(buffer)
+                    buffer = []
+                    buffered = 0
+        finally:
+            self.hwp.ReleaseScan()
+        if buffer:
+            yield "".join(buffer)
+
+    def _capture_text_model_state(self, scope: str):
+        """편집 전 상태 (편집 세대 키, 커서 위치)를 기록합니다. 모델이 비어 있으면 기록하지 않습니다."""
+        if scope == "document" or not self.text_model.valid or not self.is_hwp_running:
+            return None
+        try:
+            generation_key = self.edit_generations.key(self.get_document_key())
+            return generation_key, self._get_current_position()
+        except Exception as e:
+            logger.debug(f"편집 전 상태 기록 실패 (무시): {e}")
+            return None
+
+    def _apply_text_model_change(self, scope: str, before) -> None:
+        """편집 범위를 문단 텍스트 모델에 반영합니다. 범위를 확정할 수 없으면 모델을 무효화합니다."""
+        model = self.text_model
+        if before is None:
+            model.invalidate()
+            return
+
+        generation_key, pos_before = before
+        # 모델이 편집 직전 상태와 맞지 않으면 (다른 경로의 편집이 있었음) 전체를 다시 읽음
+        if model.synced_key != generation_key:
+            model.invalidate()
+            return
+
+        if scope == "paragraph":
+            pos_after = self._get_current_position()
+            if not pos_before or not pos_after or pos_after[0] != pos_before[0]:
+                model.invalidate()
+                return
+            model.split(pos_before[0], pos_before[1], pos_after[1] - pos_before[1])
+            if not model.valid:
+                return
+
+        model.synced_key = self.edit_generations.key(generation_key[0])
+
+    @mutates_document(scope="format")
     def set_page_setup(self, orientation: str = "portrait", margin_left: int = 1000, 
                      margin_right: int = 1000, margin_top: int = 1000, margin_bottom: int = 1000) -> bool:
         """
@@ -919,6 +1732,7 @@ class HwpController:
             print(f"페이지 설정 실패: {e}")
             return False
 
+    @mutates_document(scope="paragraph")
     def insert_paragraph(self) -> bool:
         """
         새 단락을 삽입합니다.
@@ -953,6 +1767,7 @@ class HwpController:
             print(f"전체 선택 실패: {e}")
             return False
 
+    @mutates_document(structural=False)
     def fill_cell_field(self, field_name: str, value: str, n: int = 1) -> bool:
         """
         동일한 이름의 셀필드 중 n번째에만 값을 채웁니다.
@@ -1032,6 +1847,7 @@ class HwpController:
             print(f"텍스트 선택 실패: {e}")
             return False
 
+    @mutates_document(structural=False)
     def fill_cell_next_to_label(
         self,
         label: str,
@@ -1059,6 +1875,61 @@ class HwpController:
             if not self.is_hwp_running:
                 return False, "HWP가 연결되어 있지 않습니다."
 
+            direction_lower = direction.lower()
+            mode_lower = mode.lower()
+            if direction_lower not in ("right", "left", "down", "up"):
+                return False, f"잘못된 방향입니다: {direction}. 'right', 'left', 'down', 'up' 중 하나를 사용하세요."
+            if mode_lower not in ("replace", "prepend", "append"):
+                return False, f"잘못된 mode입니다: {mode}. 'replace', 'prepend', 'append' 중 하나를 사용하세요."
+
+            # 이전에 찾은 셀이면 검색과 이동 없이 SetPos로 바로 이동
+            key = self._structure_key()
+            address = ("label", label, occurrence, direction_lower)
+            if not self._jump_to_cached(key, address):
+                found, message = self._locate_cell_next_to_label(label, direction_lower, occurrence)
+                if not found:
+                    return False, message
+                self._remember_position(key, address)
+
+            # mode에 따라 값 입력
+            self._write_current_cell(value, mode_lower)
+            return True, f"'{label}' 옆 셀에 '{value}' 입력 완료"
+
+        except Exception as e:
+            print(f"셀 채우기 실패: {e}")
+            return False, f"셀 채우기 실패: {str(e)}"
+
+    def _write_current_cell(self, value: str, mode: str) -> None:
+        """
+        커서가 있는 셀에 mode에 따라 값을 입력합니다.
+
+        Args:
+            value: 입력할 값
+            mode: "replace"(기존 내용 삭제 후 입력), "prepend"(앞에 추가), "append"(뒤에 추가)
+        """
+        if mode == "replace":
+            # 셀 전체 내용 선택 후 잘라내기
+            self.hwp.HAction.Run("SelectAll")
+            self.hwp.HAction.Run("EditCut")
+        elif mode == "prepend":
+            # 셀 시작으로 이동 후 입력
+            self.hwp.HAction.Run("MoveSelCellBegin")
+            self.hwp.HAction.Run("Cancel")
+        else:
+            # 셀 끝으로 이동: 전체 선택 후 오른쪽으로 이동하면 끝으로 감
+            self.hwp.HAction.Run("SelectAll")
+            self.hwp.HAction.Run("Cancel")
+            self.hwp.HAction.Run("MoveLineEnd")
+        self._insert_text_direct(value)
+
+    def _locate_cell_next_to_label(self, label: str, direction: str, occurrence: int) -> Tuple[bool, str]:
+        """
+        문서 처음부터 레이블의 occurrence번째 항목을 찾아 direction 방향의 옆 셀로 이동합니다.
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 실패 시 메시지)
+        """
+        try:
             # 1. 문서 처음으로 이동
             self.hwp.HAction.Run("MoveDocBegin")
 
@@ -1088,45 +1959,20 @@ class HwpController:
             self.hwp.HAction.Run("Cancel")
 
             # 4. 지정된 방향으로 옆 셀로 이동
-            direction_lower = direction.lower()
-            if direction_lower == "right":
+            if direction == "right":
                 self.hwp.HAction.Run("TableRightCell")
-            elif direction_lower == "left":
+            elif direction == "left":
                 self.hwp.HAction.Run("TableLeftCell")
-            elif direction_lower == "down":
+            elif direction == "down":
                 self.hwp.HAction.Run("MoveDown")
-            elif direction_lower == "up":
-                self.hwp.HAction.Run("TableUpperCell")
             else:
-                return False, f"잘못된 방향입니다: {direction}. 'right', 'left', 'down', 'up' 중 하나를 사용하세요."
-
-            # 5. mode에 따라 값 입력
-            mode_lower = mode.lower()
-            if mode_lower == "replace":
-                # 셀 전체 내용 선택 후 잘라내기
-                self.hwp.HAction.Run("SelectAll")
-                self.hwp.HAction.Run("EditCut")
-                self._insert_text_direct(value)
-            elif mode_lower == "prepend":
-                # 셀 시작으로 이동 후 입력
-                self.hwp.HAction.Run("MoveSelCellBegin")
-                self.hwp.HAction.Run("Cancel")
-                self._insert_text_direct(value)
-            elif mode_lower == "append":
-                # 셀 끝으로 이동: 전체 선택 후 오른쪽으로 이동하면 끝으로 감
-                self.hwp.HAction.Run("SelectAll")
-                self.hwp.HAction.Run("Cancel")
-                self.hwp.HAction.Run("MoveLineEnd")
-                self._insert_text_direct(value)
-            else:
-                return False, f"잘못된 mode입니다: {mode}. 'replace', 'prepend', 'append' 중 하나를 사용하세요."
-
-            return True, f"'{label}' 옆 셀에 '{value}' 입력 완료"
+                self.hwp.HAction.Run("TableUpperCell")
 
+            return True, ""
         except Exception as e:
-            print(f"셀 채우기 실패: {e}")
-            return False, f"셀 채우기 실패: {str(e)}"
+            return False, f"레이블 찾기 실패: {str(e)}"
 
+    @mutates_document(structural=False)
     def fill_cells_from_dict(
         self,
         label_value_map: Dict[str, str],
@@ -1150,6 +1996,7 @@ class HwpController:
 
         return results
 
+    @mutates_document(structural=False)
     def fill_table_with_data(self, data: List[List[str]], start_row: int = 1, start_col: int = 1, has_header: bool = False) -> bool:
         """
         현재 커서 위치의 표에 데이터를 채웁니다.
@@ -1186,6 +2033,8 @@ class HwpController:
             
             # 데이터 채우기
             for row_idx, row_data in enumerate(data):
+                # 행 단위로 취소 확인 (취소 시 OperationCancelled 전파)
+                check_cancelled()
                 for col_idx, cell_value in enumerate(row_data):
                     # 셀 선택 및 내용 삭제
                     self.hwp.Run("TableSelCell")
@@ -1207,6 +2056,8 @@ class HwpController:
                     if col_idx < len(row_data) - 1:
                         self.hwp.Run("TableRightCell")
                 
+                report_progress(row_idx + 1, len(data), "rows filled")
+
                 # 다음 행으로 이동 (마지막 행이 아닌 경우)
                 if row_idx < len(data) - 1:
                     for _ in range(len(row_data) - 1):
@@ -1224,6 +2075,882 @@ class HwpController:
             print(f"표 데이터 채우기 실패: {e}")
             return False
 
+    def get_control_index(self) -> ControlIndex:
+        """
+        문서의 컨트롤(표, 그림, 필드 등) 색인을 반환합니다.
+        HeadCtrl부터 Next로 한 번 순회해 만들고, 문서가 바뀌기 전까지 재사용합니다.
+
+        Returns:
+            ControlIndex: 컨트롤 색인 (각 항목은 type, ctrl_id, anchor, 표의 경우 rows, cols,
+            first_cell, first_cell_text, table_index 포함)
+        """
+        if not self.is_hwp_running:
+            self.control_index.invalidate()
+            return self.control_index
+
+        # 첫 셀 텍스트는 문단 텍스트 모델에서 가져옴 (셀마다 COM으로 읽지 않음)
+        paragraphs = self.get_paragraphs()
+        generation_key = self.text_model.synced_key
+        if self.control_index.synced_key == generation_key and generation_key is not None:
+            return self.control_index
+
+        records = []
+        saved_pos = self._get_current_position()
+        try:
+            ctrl = self.hwp.HeadCtrl
+            while ctrl is not None:
+                record = {"ctrl_id": ctrl.CtrlID, "description": ""}
+                try:
+                    record["description"] = ctrl.UserDesc
+                except Exception as e:
+                    logger.debug(f"UserDesc 조회 실패 (무시): {e}")
+                try:
+                    anchor = ctrl.GetAnchorPos(0)
+                    record["anchor"] = [anchor.Item("List"), anchor.Item("Para"), anchor.Item("Pos")]
+                except Exception as e:
+                    logger.debug(f"GetAnchorPos 실패 (무시): {e}")
+                    record["anchor"] = None
+                if record["ctrl_id"] == "tbl":
+                    record.update(self._describe_table(ctrl))
+                records.append(record)
+                ctrl = ctrl.Next
+        finally:
+            self._set_position(saved_pos)
+
+        for record in records:
+            first_cell = record.get("first_cell")
+            if first_cell:
+                record["first_cell_text"] = self.text_model.separator.join(
+                    text for (list_id, _), text in paragraphs if list_id == first_cell[0]
+                )
+
+        self.control_index.load(records, generation_key)
+        return self.control_index
+
+    def _describe_table(self, ctrl) -> Dict[str, Any]:
+        """표 컨트롤의 행/열 수와 첫 번째 셀 위치를 구합니다. (커서가 이동하므로 호출 측에서 복원)"""
+        info = {"rows": None, "cols": None, "first_cell": None}
+        try:
+            props = ctrl.Properties
+            info["rows"] = props.Item("Rows")
+            info["cols"] = props.Item("Cols")
+        except Exception as e:
+            logger.debug(f"표 크기 조회 실패 (무시): {e}")
+        try:
+            # 표 컨트롤을 선택한 뒤 첫 번째 셀로 진입
+            self.hwp.SetPosBySet(ctrl.GetAnchorPos(0))
+            self.hwp.FindCtrl()
+            self.hwp.HAction.Run("ShapeObjTableSelCell")
+            self.hwp.HAction.Run("Cancel")
+            info["first_cell"] = list(self.hwp.GetPos())
+        except Exception as e:
+            logger.debug(f"표 첫 셀 위치 조회 실패 (무시): {e}")
+        return info
+
+    def goto_table(self, table_index: int) -> Tuple[bool, str]:
+        """
+        table_index번째 표(0부터)의 첫 번째 셀로 커서를 이동합니다.
+
+        Args:
+            table_index: 표 번호 (문서 순서, 0부터)
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, "HWP가 실행되지 않았습니다."
+            table = self.get_control_index().table(table_index)
+            if not table.get("first_cell"):
+                return False, f"표 {table_index}의 첫 셀 위치를 알 수 없습니다."
+            if not self.hwp.SetPos(*table["first_cell"]):
+                # 위치가 어긋났다면 색인을 다시 만들어 한 번 더 시도
+                self.control_index.invalidate()
+                table = self.get_control_index().table(table_index)
+                if not table.get("first_cell") or not self.hwp.SetPos(*table["first_cell"]):
+                    return False, f"표 {table_index}로 이동하지 못했습니다."
+            return True, f"표 {table_index}로 이동했습니다."
+        except IndexError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"표 이동 실패: {e}"
+
+    def _structure_key(self) -> Tuple[str, int, int]:
+        """셀 위치 캐시 키 (활성 문서의 구조 세대)"""
+        return self.edit_generations.structure_key(self.get_document_key())
+
+    def _jump_to_cached(self, key, address) -> bool:
+        """
+        위치 캐시에 있는 주소로 SetPos 한 번에 이동합니다. (없거나 실패하면 False)
+        레이블/경로 주소는 그 뒤로 문서가 편집되었으면(편집 세대가 바뀌면) 버리고 다시 찾게 합니다.
+        """
+        if address[0] in TEXT_ADDRESS_KINDS:
+            self.position_cache.sync_text(self.get_edit_generation())
+        return self._jump_to(self.position_cache.get(key, address))
+
+    def _jump_to(self, pos) -> bool:
+        """SetPos로 이동하고 HWP가 위치를 받아들였는지 반환합니다."""
+        if not pos:
+            return False
+        try:
+            return bool(self.hwp.SetPos(*pos))
+        except Exception as e:
+            logger.debug(f"SetPos 실패: {e}")
+            return False
+
+    def _remember_position(self, key, address):
+        """현재 커서 위치를 주소의 위치로 기록하고 반환합니다."""
+        pos = self._get_current_position()
+        self.position_cache.record(key, address, pos)
+        return pos
+
+    def _cached_move(self, key, pos, direction: str):
+        """
+        pos에서 direction으로 한 칸 이동합니다. 이전에 같은 이동을 했다면 SetPos로 바로 이동합니다.
+
+        Returns:
+            이동 후 위치
+        """
+        address = ("move", tuple(pos) if pos else None, direction)
+        target = self.position_cache.get(key, address) if pos else None
+        if self._jump_to(target):
+            return target
+        self._move_direction(direction)
+        return self._remember_position(key, address) if pos else self._get_current_position()
+
+    def goto_cell(self, table_index: int, row: int, col: int) -> Tuple[bool, str]:
+        """
+        표의 (row, col) 셀(0부터)로 커서를 이동합니다.
+        방문한 적이 있는 셀이나 셀 주소 맵이 있는 표의 셀은 SetPos 한 번으로 이동하고,
+        병합으로 가려진 위치는 그 위치를 덮는 셀로 이동합니다. 주소 맵을 만들 수 없는 표에서는
+        같은 열 위쪽이나 같은 행 왼쪽의 가장 가까운 방문 셀(없으면 첫 셀)에서 아래/오른쪽으로
+        이동한 뒤 위치를 기록합니다.
+
+        Args:
+            table_index: 표 번호 (문서 순서, 0부터)
+            row: 행 번호 (0부터)
+            col: 열 번호 (0부터)
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        if row < 0 or col < 0:
+            return False, f"잘못된 셀 위치입니다: ({row}, {col})"
+        key = self._structure_key()
+        if self._jump_to_cached(key, ("cell", table_index, row, col)):
+            return True, f"표 {table_index}의 ({row}, {col}) 셀로 이동했습니다."
+
+        cell_map = self.get_cell_address_map(table_index)
+        if cell_map is not None:
+            target = cell_map.resolve(row, col)
+            if target is None:
+                return False, f"({row}, {col}) 셀이 표 {table_index}({cell_map.rows}x{cell_map.cols}) 밖에 있습니다."
+            pos = (target[2], 0, 0)
+            if self._jump_to(pos):
+                self.position_cache.record(key, ("cell", table_index, row, col), pos)
+                return True, f"표 {table_index}의 ({row}, {col}) 셀로 이동했습니다."
+            logger.debug(f"셀 주소 맵 위치로 이동 실패, 상대 이동 사용: {pos}")
+
+        start = self.position_cache.nearest_cell(key, table_index, row, col)
+        if start is not None and self._jump_to(start[2]):
+            start_row, start_col = start[0], start[1]
+        else:
+            success, message = self.goto_table(table_index)
+            if not success:
+                return False, message
+            start_row, start_col = 0, 0
+            self._remember_position(key, ("cell", table_index, 0, 0))
+
+        for c in range(start_col + 1, col + 1):
+            self.hwp.HAction.Run("TableRightCell")
+            self._remember_position(key, ("cell", table_index, start_row, c))
+        for r in range(start_row + 1, row + 1):
+            self.hwp.HAction.Run("TableLowerCell")
+            self._remember_position(key, ("cell", table_index, r, col))
+        return True, f"표 {table_index}의 ({row}, {col}) 셀로 이동했습니다."
+
+    @mutates_document(structural=False)
+    def fill_series(
+        self,
+        values: List[str],
+        axis: str = "column",
+        index: int = 1,
+        offset: int = 1,
+        table_index: Optional[int] = None,
+        bulk: bool = True
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        표의 한 열(또는 한 행)에 값 목록을 채웁니다.
+        대상 셀 범위를 셀 블록으로 선택해 한 번에 붙여넣고, 블록 전체를 한 번에 읽어 확인해 맞지 않으면
+        붙여넣기를 되돌린 뒤 셀마다 입력합니다.
+
+        Args:
+            values: 채울 값 목록
+            axis: "column"(열 방향, 아래로) 또는 "row"(행 방향, 오른쪽으로)
+            index: 채울 열(axis="column") 또는 행(axis="row") 번호 (1부터)
+            offset: 첫 값을 넣을 행(axis="column") 또는 열(axis="row") 번호 (1부터)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+            bulk: 한 번에 붙여넣기 시도 여부 (False면 셀마다 입력)
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"written", "method": "paste" | "per_cell", "table_index"})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            axis = axis.lower()
+            if axis not in ("column", "row"):
+                return False, {"error": f"잘못된 axis입니다: {axis}. 'column' 또는 'row'를 사용하세요."}
+            if index < 1 or offset < 1:
+                return False, {"error": "index와 offset은 1 이상이어야 합니다."}
+            if not values:
+                return True, {"written": 0, "method": None, "table_index": table_index}
+
+            if table_index is None:
+                table_index = self.get_cursor_context(resolve_table=True)["table_index"]
+                if table_index is None:
+                    return False, {"error": "커서가 표 안에 있지 않습니다. table_index를 지정하세요."}
+            table = self.get_control_index().table(table_index)
+            rows, cols = table.get("rows"), table.get("cols")
+
+            if axis == "column":
+                cells = [(offset - 1 + i, index - 1) for i in range(len(values))]
+            else:
+                cells = [(index - 1, offset - 1 + i) for i in range(len(values))]
+            last_row, last_col = cells[-1]
+            if rows and cols and (last_row >= rows or last_col >= cols):
+                return False, {"error": f"채울 범위가 표 크기({rows}x{cols})를 벗어납니다."}
+
+            if bulk and len(values) > 1 and self._paste_series_block(values, axis, table_index, cells, rows, cols):
+                report_progress(len(values), len(values), "cells filled")
+                return True, {"written": len(values), "method": "paste", "table_index": table_index}
+
+            for i, (row, col) in enumerate(cells):
+                check_cancelled()
+                success, message = self.goto_cell(table_index, row, col)
+                if not success:
+                    return False, {"error": message, "written": i}
+                self._replace_cell_text(values[i])
+                report_progress(i + 1, len(cells), "cells filled")
+            return True, {"written": len(values), "method": "per_cell", "table_index": table_index}
+        except IndexError as e:
+            return False, {"error": str(e)}
+        except Exception as e:
+            return False, {"error": f"연속 값 채우기 실패: {str(e)}"}
+
+    def _paste_series_block(self, values, axis, table_index, cells, rows, cols) -> bool:
+        """
+        대상 셀 범위를 셀 블록으로 선택하고 값 목록을 HTML 표로 한 번에 붙여넣습니다.
+
+        Returns:
+            bool: 붙여넣은 결과가 확인되었는지 여부 (실패 시 붙여넣기는 되돌림)
+        """
+        (first_row, first_col), (last_row, last_col) = cells[0], cells[-1]
+        success, _ = self.goto_cell(table_index, first_row, first_col)
+        first = self._get_current_position()
+        if not success or not first:
+            return False
+
+        # 셀 블록 선택 후 확장 모드로 마지막 셀까지 이동 (표 끝까지면 한 번에)
+        block = (last_row - first_row, last_col - first_col,
+                 axis == "column" and bool(rows) and last_row == rows - 1,
+                 axis == "row" and bool(cols) and last_col == cols - 1)
+        self._select_cell_block(*block)
+        pasted = self._paste_html(cf_html(to_html_table(values, axis)))
+        self.hwp.HAction.Run("Cancel")
+        if not pasted:
+            return False
+
+        expected = [[value] for value in values] if axis == "column" else [list(values)]
+        if not self._block_matches(first, block, expected):
+            logger.info("셀 블록 붙여넣기 결과가 달라 셀마다 입력합니다.")
+            self.hwp.HAction.Run("Undo")
+            return False
+        return True
+
+    def _select_cell_block(self, down: int, right: int, to_last_row: bool = False, to_last_col: bool = False) -> None:
+        """
+        커서가 있는 셀부터 아래로 down칸, 오른쪽으로 right칸까지 셀 블록으로 선택합니다.
+        to_last_row/to_last_col이면 한 번에 표의 마지막 행/열까지 확장합니다.
+        """
+        self.hwp.HAction.Run("TableCellBlock")
+        self.hwp.HAction.Run("TableCellBlockExtend")
+        if to_last_row:
+            self.hwp.HAction.Run("TableColEnd")
+        else:
+            for _ in range(down):
+                self.hwp.HAction.Run("TableLowerCell")
+        if to_last_col:
+            self.hwp.HAction.Run("TableRowEnd")
+        else:
+            for _ in range(right):
+                self.hwp.HAction.Run("TableRightCell")
+
+    def _block_matches(self, first, block, expected: List[List[Any]]) -> bool:
+        """
+        붙여넣은 셀 블록을 다시 선택해 블록 HTML 내보내기 한 번으로 읽고, 모든 셀이 expected와 같은지 확인합니다.
+
+        Args:
+            first: 블록 첫 셀의 위치 (GetPos 결과)
+            block: _select_cell_block 인자 (down, right, to_last_row, to_last_col)
+            expected: 행×열 값 (None은 빈 셀)
+        """
+        if not self._jump_to(first):
+            return False
+        self._select_cell_block(*block)
+        try:
+            html = self.hwp.GetTextFile("HTML", "saveblock")
+        finally:
+            self.hwp.HAction.Run("Cancel")
+        try:
+            grid = TableGrid.from_html(html or "")
+        except ValueError:
+            return False
+        if (grid.rows, grid.cols) != (len(expected), max(len(values) for values in expected)):
+            return False
+        diff = grid.diff([["" if value is None else value for value in values] for values in expected])
+        return not (diff["changed"] or diff["merged"] or diff["out_of_range"])
+
+    def _paste_html(self, data: bytes) -> bool:
+        """
+        HTML 클립보드 데이터를 현재 선택(셀 블록)에 붙여넣습니다.
+        붙이기 방식 대화상자는 기본값으로 자동 확인하고, 끝나면 사용자의 클립보드를 형식별로 모두 복원합니다.
+        (데이터로 읽을 수 없는 GDI 핸들 형식 - 비트맵, 메타파일 등 - 은 복원되지 않음)
+        """
+        import win32clipboard
+
+        html_format = win32clipboard.RegisterClipboardFormat("HTML Format")
+        saved = []
+        win32clipboard.OpenClipboard()
+        try:
+            fmt = win32clipboard.EnumClipboardFormats(0)
+            while fmt:
+                try:
+                    saved.append((fmt, win32clipboard.GetClipboardData(fmt)))
+                except Exception as e:
+                    logger.debug(f"클립보드 형식 {fmt}을(를) 읽을 수 없음 (복원하지 않음): {e}")
+                fmt = win32clipboard.EnumClipboardFormats(fmt)
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(html_format, data)
+        finally:
+            win32clipboard.CloseClipboard()
+
+        try:
+            self.hwp.SetMessageBoxMode(0x00010000)
+            return bool(self.hwp.HAction.Run("Paste"))
+        except Exception as e:
+            logger.debug(f"셀 블록 붙여넣기 실패: {e}")
+            return False
+        finally:
+            self.hwp.SetMessageBoxMode(0x00000000)
+            win32clipboard.OpenClipboard()
+            try:
+                win32clipboard.EmptyClipboard()
+                for fmt, value in saved:
+                    try:
+                        win32clipboard.SetClipboardData(fmt, value)
+                    except Exception as e:
+                        logger.debug(f"클립보드 형식 {fmt} 복원 실패 (무시): {e}")
+            finally:
+                win32clipboard.CloseClipboard()
+
+    def _read_cell(self, table_index: int, row: int, col: int) -> Optional[str]:
+        """표의 (row, col) 셀(0부터) 텍스트를 읽습니다. (이동하지 못하면 None)"""
+        success, _ = self.goto_cell(table_index, row, col)
+        if not success:
+            return None
+        return self._read_current_cell()
+
+    def _read_current_cell(self) -> str:
+        """커서가 있는 셀의 텍스트를 읽습니다. (빈 셀은 "(빈 셀)")"""
+        self.hwp.HAction.Run("TableSelCell")
+        text = self._get_cell_text()
+        self.hwp.HAction.Run("Cancel")
+        return text
+
+    def _replace_cell_text(self, value: str) -> None:
+        """커서가 있는 셀의 내용을 지우고 value를 입력합니다. (클립보드를 쓰지 않음)"""
+        self.hwp.HAction.Run("SelectAll")
+        self.hwp.HAction.Run("Delete")
+        self._insert_text_direct(str(value))
+
+    def snapshot_table(self, table_index: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
+        """
+        표 전체를 한 번에 읽어 행×열 격자로 만듭니다.
+        병합이 없는 표는 문단 텍스트 모델에서 바로 만들고(COM 호출 없음), 병합이 있으면
+        표를 셀 블록으로 선택해 HTML로 한 번 내보내 병합 정보와 함께 읽습니다.
+        읽은 격자로 셀 주소 맵도 함께 만들어 둡니다. (get_cell_address_map)
+
+        Args:
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"grid": TableGrid, "table_index", "source": "text_model" | "html"})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            if table_index is None:
+                table_index = self.get_cursor_context(resolve_table=True)["table_index"]
+                if table_index is None:
+                    return False, {"error": "커서가 표 안에 있지 않습니다. table_index를 지정하세요."}
+            index = self.get_control_index()
+            table = index.table(table_index)
+            rows, cols = table.get("rows"), table.get("cols")
+
+            paragraphs = self.get_paragraphs()
+            owners = assign_tables([key for key, _ in paragraphs], index.tables())
+            cells: Dict[int, List[str]] = {}
+            for (_, text), (owner, cell_index) in zip(paragraphs, owners):
+                if owner == table_index:
+                    cells.setdefault(cell_index, []).append(text)
+            cell_lists = table_cell_lists(
+                [(key[0], owner, cell_index) for (key, _), (owner, cell_index) in zip(paragraphs, owners)],
+                table_index
+            )
+            if rows and cols and len(cells) == rows * cols:
+                texts = [self.text_model.separator.join(cells[i]).strip() for i in range(len(cells))]
+                grid = TableGrid.from_texts(texts, cols)
+                self._store_cell_map(table_index, grid, cell_lists)
+                return True, {"grid": grid, "table_index": table_index, "source": "text_model"}
+
+            saved_pos = self._get_current_position()
+            try:
+                success, message = self.goto_table(table_index)
+                if not success:
+                    return False, {"error": message}
+                self.hwp.HAction.Run("TableCellBlock")
+                self.hwp.HAction.Run("TableCellBlockExtend")
+                self.hwp.HAction.Run("TableColEnd")
+                self.hwp.HAction.Run("TableRowEnd")
+                html = self.hwp.GetTextFile("HTML", "saveblock")
+                self.hwp.HAction.Run("Cancel")
+            finally:
+                self._set_position(saved_pos)
+            grid = TableGrid.from_html(html or "")
+            self._store_cell_map(table_index, grid, cell_lists)
+            return True, {"grid": grid, "table_index": table_index, "source": "html"}
+        except (IndexError, ValueError) as e:
+            return False, {"error": str(e)}
+        except Exception as e:
+            return False, {"error": f"표 읽기 실패: {str(e)}"}
+
+    def _store_cell_map(self, table_index: int, grid: TableGrid, cell_lists: List[int]) -> None:
+        """격자와 셀 리스트 ID로 셀 주소 맵을 만들어 현재 구조 세대에 보관합니다. (셀 수가 맞지 않으면 None)"""
+        key = self._structure_key()
+        if self._cell_maps[0] != key:
+            self._cell_maps = (key, {})
+        try:
+            self._cell_maps[1][table_index] = CellAddressMap(grid, cell_lists)
+        except ValueError as e:
+            logger.debug(f"셀 주소 맵을 만들 수 없음 (상대 이동 사용): {e}")
+            self._cell_maps[1][table_index] = None
+
+    def get_cell_address_map(self, table_index: int) -> Optional[CellAddressMap]:
+        """
+        표의 셀 주소 맵을 반환합니다. 구조 세대마다 한 번 snapshot_table로 만들고,
+        셀 값만 바뀌는 편집 사이에는 다시 만들지 않습니다.
+
+        Args:
+            table_index: 표 번호 (문서 순서, 0부터)
+
+        Returns:
+            Optional[CellAddressMap]: 셀 주소 맵 (표를 읽지 못했으면 None)
+        """
+        key = self._structure_key()
+        if self._cell_maps[0] != key or table_index not in self._cell_maps[1]:
+            success, snapshot = self.snapshot_table(table_index)
+            if not success:
+                logger.debug(f"셀 주소 맵 생성 실패: {snapshot.get('error')}")
+                return None
+        return self._cell_maps[1].get(table_index)
+
+    @mutates_document(structural=False)
+    def write_table_matrix(
+        self,
+        table_index: int,
+        matrix: List[List[Any]],
+        grid: TableGrid,
+        start_row: int = 0,
+        start_col: int = 0
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        새 값 배열을 snapshot_table로 읽은 격자와 비교해, 값이 바뀐 셀만 씁니다.
+        방문 순서는 기록된 셀 위치를 고려해 이동 횟수가 적은 쪽(행 순서 또는 열 순서)으로 정합니다.
+        배열이 표보다 길면 모자란 행을 표 끝에 추가합니다.
+
+        Args:
+            table_index: 표 번호 (문서 순서, 0부터)
+            matrix: 새 값 (행 목록, None인 값은 그대로 둠)
+            grid: 같은 표를 읽은 격자
+            start_row: matrix[0][0]이 들어갈 행 (0부터)
+            start_col: matrix[0][0]이 들어갈 열 (0부터)
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"written", "unchanged", "appended_rows", "out_of_range", "merged", "moves"})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            if grid.has_merges():
+                return False, {"error": "병합된 셀이 있는 표에는 아직 계산 결과를 쓸 수 없습니다."}
+
+            appended = max(0, start_row + len(matrix) - grid.rows)
+            if appended:
+                success, message = self.goto_table(table_index)
+                if not success:
+                    return False, {"error": message}
+                self._append_table_rows(appended)
+                texts = [grid.text(r, c) for r in range(grid.rows) for c in range(grid.cols)]
+                grid = TableGrid.from_texts(texts + [""] * (appended * grid.cols), grid.cols)
+
+            diff = grid.diff(matrix, start_row, start_col)
+            values = {(row, col): value for row, col, value in diff["changed"]}
+            known = self.position_cache.known_cells(self._structure_key(), table_index)
+            order, moves = plan_cell_order(values, known)
+            for i, (row, col) in enumerate(order):
+                check_cancelled()
+                success, message = self.goto_cell(table_index, row, col)
+                if not success:
+                    return False, {"error": message, "written": i}
+                self._replace_cell_text(values[(row, col)])
+                report_progress(i + 1, len(order), "cells written")
+            return True, {
+                "written": len(order),
+                "unchanged": diff["unchanged"],
+                "appended_rows": appended,
+                "out_of_range": len(diff["out_of_range"]),
+                "merged": len(diff["merged"]),
+                "moves": moves,
+            }
+        except Exception as e:
+            return False, {"error": f"표 쓰기 실패: {str(e)}"}
+
+    @mutates_document(structural=False)
+    def stream_table_rows(
+        self,
+        chunks: Iterable[List[List[Any]]],
+        table_index: Optional[int] = None,
+        start_row: int = 1,
+        start_col: int = 1,
+        has_header: bool = False,
+        min_rows: int = 0
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        행 청크를 차례로 받아 표에 채웁니다. 청크마다 모자란 행을 표 끝에 추가하고
+        셀 블록으로 선택해 한 번에 붙여넣으므로, 전체 데이터를 메모리에 올리지 않고 긴 CSV도 채울 수 있습니다.
+        붙여넣은 청크 블록을 한 번에 읽어 다른 셀이 있으면 그 청크만 되돌리고 셀마다 입력합니다.
+
+        행을 추가하면 셀 주소 맵을 다시 만들어야 하므로, 처음 셀로 이동한 뒤에는 상대 이동만 사용합니다.
+        (병합이 없는 표 기준)
+
+        Args:
+            chunks: 행 청크 (tabular_stream.read_chunks 결과 등)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+            start_row: 첫 행을 넣을 행 번호 (1부터)
+            start_col: 첫 열을 넣을 열 번호 (1부터)
+            has_header: 첫 행을 굵게 입력할지 여부
+            min_rows: 다 채운 뒤 표가 가져야 할 최소 행 수 (모자라면 빈 행 추가)
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"rows", "chunks", "appended_rows", "clipped", "pasted", "per_cell", "table_index"})
+                clipped는 표의 열 수를 넘어 버린 값 수, pasted/per_cell은 방식별 청크 수
+        """
+        stats = {"rows": 0, "chunks": 0, "appended_rows": 0, "clipped": 0, "pasted": 0, "per_cell": 0}
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            if start_row < 1 or start_col < 1:
+                return False, {"error": "start_row와 start_col은 1 이상이어야 합니다."}
+            table_index = self._table_index_or_current(table_index)
+            stats["table_index"] = table_index
+            table = self.get_control_index().table(table_index)
+            rows, cols = table.get("rows"), table.get("cols")
+            if not rows or not cols:
+                return False, {"error": f"표 {table_index}의 크기를 알 수 없습니다."}
+            row, col = start_row - 1, start_col - 1
+            if row >= rows or col >= cols:
+                return False, {"error": f"시작 셀 ({start_row}, {start_col})이 표 크기({rows}x{cols})를 벗어납니다."}
+
+            success, message = self.goto_cell(table_index, row, col)
+            if not success:
+                return False, {"error": message}
+
+            for chunk in chunks:
+                check_cancelled()
+                needed = row + len(chunk) - rows
+                if needed > 0:
+                    # 커서가 청크 중간 행에 있어도 표 끝에 추가하므로 기존 행(붙여넣는 열 밖의 셀 포함)은 밀리지 않음
+                    self._append_table_rows(needed, stats)
+                    rows += needed
+                if stats["chunks"]:
+                    # 이전 청크의 마지막 행 첫 셀에서 다음 행으로
+                    self.hwp.HAction.Run("TableLowerCell")
+
+                width = min(cols - col, max(len(values) for values in chunk))
+                stats["clipped"] += sum(max(0, len(values) - width) for values in chunk)
+                header = has_header and stats["chunks"] == 0
+                if width < 1:
+                    # 빈 행뿐인 청크: 입력 없이 마지막 행으로만 이동
+                    for _ in range(len(chunk) - 1):
+                        self.hwp.HAction.Run("TableLowerCell")
+                elif self._paste_row_block(chunk, width, header,
+                                           last_row=row + len(chunk) == rows, last_col=col + width == cols):
+                    stats["pasted"] += 1
+                else:
+                    self._write_row_block(chunk, width, header)
+                    stats["per_cell"] += 1
+                stats["chunks"] += 1
+                stats["rows"] += len(chunk)
+                row += len(chunk)
+                report_progress(stats["rows"], None, "rows filled")
+
+            if rows < min_rows:
+                self._append_table_rows(min_rows - rows, stats)
+            return True, stats
+        except (IndexError, ValueError) as e:
+            return False, dict(stats, error=str(e))
+        except Exception as e:
+            return False, dict(stats, error=f"표 채우기 실패: {str(e)}")
+
+    def _append_table_rows(self, count: int, stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        커서가 있는 표의 끝(마지막 행 아래)에 빈 행을 count개 추가합니다.
+        TableAppendRow는 커서가 있는 행 아래에 행을 넣으므로 마지막 행으로 이동한 뒤 추가하고,
+        끝나면 커서를 원래 셀로 되돌립니다. (stats가 있으면 appended_rows에 더함)
+        """
+        saved_pos = self._get_current_position()
+        self.hwp.HAction.Run("TableColEnd")
+        for _ in range(count):
+            self.hwp.HAction.Run("TableAppendRow")
+        self._set_position(saved_pos)
+        if stats is not None:
+            stats["appended_rows"] += count
+        # 행이 늘어 기록해 둔 셀 위치가 달라질 수 있음
+        self.mark_document_changed(structural=True)
+
+    def _paste_row_block(
+        self, chunk: List[List[Any]], width: int, header: bool, last_row: bool, last_col: bool
+    ) -> bool:
+        """
+        커서가 있는 셀부터 청크 크기만큼 셀 블록으로 선택해 한 번에 붙여넣습니다.
+        끝나면 커서는 청크 마지막 행의 첫 셀에 있습니다.
+
+        Returns:
+            bool: 붙여넣은 결과가 확인되었는지 여부 (실패 시 붙여넣기는 되돌리고 커서는 청크 첫 셀)
+        """
+        first = self._get_current_position()
+        if not first:
+            return False
+        block = (len(chunk) - 1, width - 1, last_row, last_col)
+        self._select_cell_block(*block)
+        pasted = self._paste_html(cf_html(rows_to_html_table(chunk, width, bold_first=header)))
+        self.hwp.HAction.Run("Cancel")
+
+        expected = [(list(values) + [""] * width)[:width] for values in chunk]
+        if pasted and self._block_matches(first, block, expected) and self._jump_to(first):
+            for _ in range(len(chunk) - 1):
+                self.hwp.HAction.Run("TableLowerCell")
+            return True
+        if pasted:
+            logger.info("셀 블록 붙여넣기 결과가 달라 셀마다 입력합니다.")
+            self.hwp.HAction.Run("Undo")
+        self._jump_to(first)
+        return False
+
+    def _write_row_block(self, chunk: List[List[Any]], width: int, header: bool) -> None:
+        """커서가 있는 셀부터 청크를 셀마다 입력합니다. 끝나면 커서는 청크 마지막 행의 첫 셀에 있습니다."""
+        for i, values in enumerate(chunk):
+            if i:
+                self.hwp.HAction.Run("TableLowerCell")
+            values = list(values)[:width]
+            for j, value in enumerate(values):
+                if j:
+                    self.hwp.HAction.Run("TableRightCell")
+                if header and i == 0:
+                    self.set_font_style(bold=True)
+                self._replace_cell_text("" if value is None else value)
+                if header and i == 0:
+                    self.set_font_style(bold=False)
+            for _ in range(len(values) - 1):
+                self.hwp.HAction.Run("TableLeftCell")
+
+    def _table_index_or_current(self, table_index: Optional[int]) -> int:
+        """table_index가 없으면 커서가 있는 표의 번호를 구합니다. (표 밖이면 ValueError)"""
+        if table_index is not None:
+            return table_index
+        table_index = self.get_cursor_context(resolve_table=True)["table_index"]
+        if table_index is None:
+            raise ValueError("커서가 표 안에 있지 않습니다. table_index를 지정하세요.")
+        return table_index
+
+    @mutates_document(structural=False)
+    def fill_table_cell(self, row, col, text: str, table_index: Optional[int] = None) -> bool:
+        """
+        표의 셀 하나에 텍스트를 입력합니다. (기존 내용은 지움)
+        셀 주소 맵으로 SetPos 한 번에 이동하므로 셀 위치와 관계없이 COM 호출 수가 일정합니다.
+
+        Args:
+            row: 행 번호 (1부터) 또는 "B3" 같은 셀 주소 (이때 col은 None)
+            col: 열 번호 (1부터)
+            text: 입력할 텍스트
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            if not self.is_hwp_running:
+                return False
+            r, c = parse_cell_reference(row, col)
+            table_index = self._table_index_or_current(table_index)
+            success, message = self.goto_cell(table_index, r, c)
+            if not success:
+                logger.warning(message)
+                return False
+            self._replace_cell_text(text)
+            return True
+        except Exception as e:
+            logger.error(f"셀 텍스트 입력 실패: {e}")
+            return False
+
+    def get_table_cell_text(self, row, col=None, table_index: Optional[int] = None) -> str:
+        """
+        표의 셀 하나의 텍스트를 가져옵니다.
+        문단 텍스트 모델이 최신이면 COM 호출 없이 모델에서 읽고, 아니면 셀로 바로 이동해 읽은 뒤
+        커서를 원래 위치로 되돌립니다.
+
+        Args:
+            row: 행 번호 (1부터) 또는 "B3" 같은 셀 주소 (이때 col은 None)
+            col: 열 번호 (1부터)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+
+        Returns:
+            str: 셀 텍스트 (빈 셀은 "(빈 셀)")
+
+        Raises:
+            ValueError: 잘못된 셀 주소이거나 표 밖의 셀인 경우
+            RuntimeError: HWP에 연결되어 있지 않거나 셀로 이동하지 못한 경우
+        """
+        if not self.is_hwp_running:
+            raise RuntimeError("HWP가 연결되어 있지 않습니다.")
+        r, c = parse_cell_reference(row, col)
+        table_index = self._table_index_or_current(table_index)
+
+        model = self.text_model
+        cell_map = self.get_cell_address_map(table_index)
+        if cell_map is not None:
+            target = cell_map.resolve(r, c)
+            if target is None:
+                raise ValueError(f"({r + 1}, {c + 1}) 셀이 표 {table_index}({cell_map.rows}x{cell_map.cols}) 밖에 있습니다.")
+            if model.valid and not model.dirty_keys() and model.synced_key == self.get_edit_generation():
+                text = self._cell_texts().get(target[2], "").strip()
+                return text if text else "(빈 셀)"
+
+        # 읽기만 하므로 셀로 이동했던 커서는 원래 위치로 되돌림
+        saved_pos = self._get_current_position()
+        try:
+            text = self._read_cell(table_index, r, c)
+        finally:
+            self._set_position(saved_pos)
+        if text is None:
+            raise RuntimeError(f"표 {table_index}의 ({r + 1}, {c + 1}) 셀로 이동하지 못했습니다.")
+        return text
+
+    def merge_table_cells(
+        self,
+        start_row,
+        start_col,
+        end_row,
+        end_col,
+        table_index: Optional[int] = None
+    ) -> bool:
+        """
+        표의 사각형 범위를 셀 블록으로 선택해 하나로 병합합니다. (merge_cells_batch 참고)
+
+        Args:
+            start_row: 시작 행 번호 (1부터) 또는 "A1" 같은 시작 셀 주소 (이때 start_col은 None)
+            start_col: 시작 열 번호 (1부터)
+            end_row: 끝 행 번호 (1부터) 또는 "B3" 같은 끝 셀 주소 (이때 end_col은 None)
+            end_col: 끝 열 번호 (1부터)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            r1, c1 = parse_cell_reference(start_row, start_col)
+            r2, c2 = parse_cell_reference(end_row, end_col)
+        except ValueError as e:
+            logger.error(f"셀 병합 실패: {e}")
+            return False
+        success, result = self.merge_cells_batch([[r1 + 1, c1 + 1, r2 + 1, c2 + 1]], table_index)
+        if not success:
+            logger.error(f"셀 병합 실패: {result.get('error') or result.get('errors')}")
+        return success
+
+    @mutates_document
+    def merge_cells_batch(self, ranges: List[Any], table_index: Optional[int] = None) -> Tuple[bool, Dict[str, Any]]:
+        """
+        여러 범위를 한 번에 병합합니다.
+        표를 한 번 읽어 모든 범위를 먼저 검사하고(하나라도 잘못되면 아무것도 병합하지 않음),
+        아래/오른쪽 범위부터 셀 주소로 바로 이동해 셀 블록을 선택하고 병합한 뒤,
+        표를 다시 읽어 병합 결과를 확인합니다.
+
+        Args:
+            ranges: 병합 범위 목록 ("A1:B3", [시작 행, 시작 열, 끝 행, 끝 열] (1부터), {"start", "end"})
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"merged", "skipped", "errors", "mismatched", "table_index"})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            table_index = self._table_index_or_current(table_index)
+            success, snapshot = self.snapshot_table(table_index)
+            if not success:
+                return False, {"error": snapshot.get("error")}
+
+            plan = plan_merges(snapshot["grid"], ranges)
+            result = {"merged": [], "skipped": plan["skipped"], "errors": plan["errors"],
+                      "mismatched": [], "table_index": table_index}
+            if plan["errors"]:
+                return False, result
+            if not plan["steps"]:
+                return True, result
+
+            # 기준 셀(왼쪽 위)은 뒤쪽 범위의 병합으로 바뀌지 않으므로, 병합 전에 만든 주소 맵을 끝까지 사용
+            for i, step in enumerate(plan["steps"]):
+                check_cancelled()
+                top, left = step["range"][0], step["range"][1]
+                success, message = self.goto_cell(table_index, top, left)
+                if not success:
+                    result["error"] = message
+                    return False, result
+                self.hwp.HAction.Run("TableCellBlock")
+                self.hwp.HAction.Run("TableCellBlockExtend")
+                for _ in range(step["right_moves"]):
+                    self.hwp.HAction.Run("TableRightCell")
+                for _ in range(step["down_moves"]):
+                    self.hwp.HAction.Run("TableLowerCell")
+                self.hwp.HAction.Run("TableMergeCell")
+                self.hwp.HAction.Run("Cancel")
+                result["merged"].append(step["address"])
+                report_progress(i + 1, len(plan["steps"]), "ranges merged")
+
+            self.mark_document_changed(structural=True)
+            success, snapshot = self.snapshot_table(table_index)
+            if not success:
+                result["error"] = f"병합 후 표를 다시 읽지 못했습니다: {snapshot.get('error')}"
+                return False, result
+            result["mismatched"] = verify_merges(snapshot["grid"], [step["range"] for step in plan["steps"]])
+            return not result["mismatched"], result
+        except ValueError as e:
+            return False, {"error": str(e)}
+        except Exception as e:
+            return False, {"error": f"셀 병합 실패: {str(e)}"}
+
     def _move_direction(self, direction: str) -> bool:
         """
         지정된 방향으로 셀 이동.
@@ -1246,6 +2973,79 @@ class HwpController:
             return True
         return False
 
+    def _get_selection_text(self) -> Optional[str]:
+        """
+        선택된 블록의 텍스트만 GetTextFile("UNICODE", "saveblock")으로 가져옵니다.
+        클립보드를 쓰지 않으므로 사용자의 클립보드를 덮어쓰거나 시스템 전역 잠금을 잡지 않습니다.
+
+        Returns:
+            Optional[str]: 블록 텍스트 (이 방식으로 읽지 못하면 None)
+        """
+        try:
+            text = self.hwp.GetTextFile("UNICODE", "saveblock")
+        except Exception as e:
+            logger.debug(f"블록 텍스트 내보내기 실패: {e}")
+            return None
+        return text.lstrip("\ufeff") if isinstance(text, str) else None
+
+    def _get_cell_text(self) -> str:
+        """
+        현재 선택된 셀의 텍스트를 가져옵니다. 블록 내보내기를 우선 사용하고,
+        지원하지 않는 HWP 버전에서만 클립보드 방식으로 돌아갑니다.
+        (내부 헬퍼 함수 - 셀이 이미 선택된 상태에서 호출)
+        """
+        self.hwp.HAction.Run("SelectAll")
+        text = self._get_selection_text()
+        self.hwp.HAction.Run("Cancel")
+        if text is None:
+            return self._get_cell_text_by_clipboard()
+        text = text.strip()
+        return text if text else "(빈 셀)"
+
+    def measure_cell_read_latency(self, samples: int = 5) -> Tuple[bool, Dict[str, Any]]:
+        """
+        현재 셀을 블록 내보내기와 클립보드 방식으로 각각 samples번 읽어 평균 시간을 비교합니다.
+        (클립보드 방식 측정 중에는 사용자의 클립보드 내용이 바뀝니다)
+
+        Args:
+            samples: 방식별 반복 횟수
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"samples", "saveblock_ms", "clipboard_ms", "speedup", "same_text"})
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            samples = max(1, int(samples))
+
+            def timed(read):
+                texts = []
+                started = time.perf_counter()
+                for _ in range(samples):
+                    self.hwp.HAction.Run("TableSelCell")
+                    texts.append(read())
+                    self.hwp.HAction.Run("Cancel")
+                return (time.perf_counter() - started) * 1000 / samples, texts[-1]
+
+            # 블록 내보내기를 지원하지 않으면 두 방식 모두 클립보드를 쓰게 되므로 비교하지 않음
+            self.hwp.HAction.Run("TableSelCell")
+            self.hwp.HAction.Run("SelectAll")
+            supported = self._get_selection_text() is not None
+            self.hwp.HAction.Run("Cancel")
+            if not supported:
+                return False, {"error": "이 HWP 버전은 블록 내보내기(saveblock)를 지원하지 않습니다."}
+            saveblock_ms, saveblock_text = timed(self._get_cell_text)
+            clipboard_ms, clipboard_text = timed(self._get_cell_text_by_clipboard)
+            return True, {
+                "samples": samples,
+                "saveblock_ms": round(saveblock_ms, 2),
+                "clipboard_ms": round(clipboard_ms, 2),
+                "speedup": round(clipboard_ms / saveblock_ms, 2) if saveblock_ms else None,
+                "same_text": saveblock_text == clipboard_text,
+            }
+        except Exception as e:
+            return False, {"error": f"셀 읽기 시간 측정 실패: {str(e)}"}
+
     def _get_cell_text_by_clipboard(self) -> str:
         """
         현재 선택된 셀의 텍스트를 클립보드를 통해 가져옵니다.
@@ -1291,7 +3091,7 @@ class HwpController:
 
             # 이동 후 셀 선택하고 내용 가져오기
             self.hwp.HAction.Run("TableSelCell")
-            text = self._get_cell_text_by_clipboard()
+            text = self._get_cell_text()
 
             return True, direction, text
         except Exception as e:
@@ -1322,40 +3122,26 @@ class HwpController:
                 return False, {"error": "HWP가 연결되어 있지 않습니다."}
 
             result = {}
+            key = self._structure_key()
 
             # 현재 셀 내용 가져오기
             self.hwp.HAction.Run("TableSelCell")
-            result["center"] = self._get_cell_text_by_clipboard()
+            result["center"] = self._get_cell_text()
             self.hwp.HAction.Run("Cancel")
+            center = self._get_current_position()
 
-            # 각 방향으로 탐색
-            directions = [
-                ("up", "TableUpperCell"),
-                ("down", "TableLowerCell"),
-                ("left", "TableLeftCell"),
-                ("right", "TableRightCell")
-            ]
-
-            for dir_name, action in directions:
-                # 현재 위치로 돌아오기 위해 반대 방향 저장
-                opposite = {
-                    "up": "TableLowerCell",
-                    "down": "TableUpperCell",
-                    "left": "TableRightCell",
-                    "right": "TableLeftCell"
-                }
-
+            # 각 방향으로 탐색 (지나간 이동은 위치 캐시에 기록되어 다음 호출에서는 SetPos로 이동)
+            for dir_name in ("up", "down", "left", "right"):
+                pos = center
                 for d in range(1, depth + 1):
-                    # 이동
-                    self.hwp.HAction.Run(action)
+                    pos = self._cached_move(key, pos, dir_name)
                     self.hwp.HAction.Run("TableSelCell")
-                    cell_text = self._get_cell_text_by_clipboard()
+                    cell_text = self._get_cell_text()
                     result[f"{dir_name}_{d}"] = cell_text
                     self.hwp.HAction.Run("Cancel")
 
-                # 원래 위치로 복귀
-                for _ in range(depth):
-                    self.hwp.HAction.Run(opposite[dir_name])
+                # 원래 위치로 한 번에 복귀
+                self._set_position(center)
 
             return True, result
         except Exception as e:
@@ -1392,13 +3178,13 @@ class HwpController:
 
             # 찾은 후 셀 선택하고 내용 가져오기
             self.hwp.HAction.Run("TableSelCell")
-            cell_text = self._get_cell_text_by_clipboard()
+            cell_text = self._get_cell_text()
 
             return True, cell_text
         except Exception as e:
             return False, f"찾기 실패: {str(e)}"
 
-    def _find_labels_recursive(self, path: List[str], depth: int = 0) -> Tuple[bool, int]:
+    def _find_labels_recursive(self, path: List[str], depth: int = 0, trace: Optional[list] = None) -> Tuple[bool, int]:
         """
         경로의 레이블들을 순차적으로 찾는 재귀 함수.
         방향 키워드(<left>, <right>, <up>, <down>)도 지원합니다.
@@ -1406,6 +3192,7 @@ class HwpController:
         Args:
             path: 찾을 레이블 경로 (예: ["대표자", "<down>", "<right>"])
             depth: 현재 깊이 (인덱스)
+            trace: 주어지면 찾은 레이블마다 (레이블, 찾은 위치)를 추가
 
         Returns:
             Tuple[bool, int]: (성공 여부, 찾은 depth)
@@ -1423,9 +3210,13 @@ class HwpController:
                 # 현재 셀 위치 확정 후 이동
                 self.hwp.HAction.Run("TableSelCell")
                 self.hwp.HAction.Run("Cancel")
-                self._move_direction(direction)
+                moved = self._step_with_model(direction)
+                if moved is None:
+                    moved = self._move_direction(direction)
+                if not moved:
+                    return False, depth  # 이동할 셀이 없음
                 # 재귀: 다음 항목 처리
-                return self._find_labels_recursive(path, depth + 1)
+                return self._find_labels_recursive(path, depth + 1, trace)
             else:
                 return False, depth  # 잘못된 방향 키워드
 
@@ -1441,9 +3232,13 @@ class HwpController:
         if not result:
             return False, depth
 
+        if trace is not None:
+            trace.append((item, self._get_current_position()))
+
         # 재귀: 다음 항목 처리
-        return self._find_labels_recursive(path, depth + 1)
+        return self._find_labels_recursive(path, depth + 1, trace)
 
+    @mutates_document(structural=False)
     def fill_cell_by_path(
         self,
         path: List[str],
@@ -1478,56 +3273,16 @@ class HwpController:
             if not path or len(path) == 0:
                 return False, "경로가 비어있습니다."
 
-            # 1. 문서 처음으로 이동
-            self.hwp.HAction.Run("MoveDocBegin")
+            mode_lower = mode.lower()
+            if mode_lower not in ("replace", "prepend", "append"):
+                return False, f"잘못된 mode입니다: {mode}. 'replace', 'prepend', 'append' 중 하나를 사용하세요."
 
-            # 2. 재귀적으로 경로의 모든 레이블 찾기
-            found, found_depth = self._find_labels_recursive(path)
+            found, message = self._resolve_path(path, direction)
             if not found:
-                if found_depth == 0:
-                    return False, f"첫 번째 레이블 '{path[0]}'을(를) 찾을 수 없습니다."
-                else:
-                    found_path = " > ".join(path[:found_depth])
-                    missing_label = path[found_depth]
-                    return False, f"'{found_path}' 이후에 '{missing_label}'을(를) 찾을 수 없습니다."
-
-            # 3. 현재 셀 선택 후 해제 - 커서 위치 확정
-            self.hwp.HAction.Run("TableSelCell")
-            self.hwp.HAction.Run("Cancel")
+                return False, message
 
-            # 4. 마지막 항목이 방향 키워드가 아닌 경우에만 direction으로 추가 이동
-            last_item = path[-1] if path else ""
-            is_last_direction = last_item.startswith("<") and last_item.endswith(">")
-
-            if not is_last_direction:
-                direction_lower = direction.lower()
-                if direction_lower == "right":
-                    self.hwp.HAction.Run("TableRightCell")
-                elif direction_lower == "left":
-                    self.hwp.HAction.Run("TableLeftCell")
-                elif direction_lower == "down":
-                    self.hwp.HAction.Run("TableLowerCell")
-                elif direction_lower == "up":
-                    self.hwp.HAction.Run("TableUpperCell")
-
-            # 5. mode에 따라 값 입력
-            mode_lower = mode.lower()
-            if mode_lower == "replace":
-                self.hwp.HAction.Run("SelectAll")
-                self.hwp.HAction.Run("EditCut")
-                self._insert_text_direct(value)
-            elif mode_lower == "prepend":
-                self.hwp.HAction.Run("MoveSelCellBegin")
-                self.hwp.HAction.Run("Cancel")
-                self._insert_text_direct(value)
-            elif mode_lower == "append":
-                # 셀 끝으로 이동: 전체 선택 후 오른쪽으로 이동하면 끝으로 감
-                self.hwp.HAction.Run("SelectAll")
-                self.hwp.HAction.Run("Cancel")
-                self.hwp.HAction.Run("MoveLineEnd")
-                self._insert_text_direct(value)
-            else:
-                return False, f"잘못된 mode입니다: {mode}. 'replace', 'prepend', 'append' 중 하나를 사용하세요."
+            # mode에 따라 값 입력
+            self._write_current_cell(value, mode_lower)
 
             path_str = " > ".join(path)
             return True, f"'{path_str}' 경로의 셀에 '{value}' 입력 완료"
@@ -1535,36 +3290,318 @@ class HwpController:
         except Exception as e:
             return False, f"셀 채우기 실패: {str(e)}"
 
+    def _resolve_path(self, path: List[str], direction: str) -> Tuple[bool, str]:
+        """
+        경로가 가리키는 셀로 커서를 이동합니다.
+        이전에 같은 경로로 찾은 셀이면 검색과 이동 없이 SetPos로 바로 이동하고,
+        처음 찾은 경로는 대상 셀과 마지막 레이블을 찾은 위치를 위치 캐시에 기록합니다.
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 실패 시 메시지)
+        """
+        key = self._structure_key()
+        address = ("path", tuple(path), direction.lower())
+        if self._jump_to_cached(key, address):
+            return True, ""
+
+        # 1. 문서 처음으로 이동
+        self.hwp.HAction.Run("MoveDocBegin")
+
+        # 2. 재귀적으로 경로의 모든 레이블 찾기
+        trace = []
+        found, found_depth = self._find_labels_recursive(path, trace=trace)
+        if not found:
+            if found_depth == 0:
+                return False, f"첫 번째 레이블 '{path[0]}'을(를) 찾을 수 없습니다."
+            found_path = " > ".join(path[:found_depth])
+            missing_label = path[found_depth]
+            if direction_keyword(missing_label) is not None:
+                return False, f"'{found_path}'에서 {missing_label}(으)로 이동할 셀이 없습니다."
+            return False, f"'{found_path}' 이후에 '{missing_label}'을(를) 찾을 수 없습니다."
+
+        # 3. 현재 셀 선택 후 해제 - 커서 위치 확정
+        self.hwp.HAction.Run("TableSelCell")
+        self.hwp.HAction.Run("Cancel")
+
+        # 4. 마지막 항목이 방향 키워드가 아닌 경우에만 direction으로 추가 이동
+        last_item = path[-1] if path else ""
+        is_last_direction = last_item.startswith("<") and last_item.endswith(">")
+
+        if not is_last_direction:
+            direction_lower = direction.lower()
+            moved = self._step_with_model(direction_lower)
+            if moved is None:
+                moved = self._move_direction(direction_lower)
+            if not moved:
+                return False, f"'{' > '.join(path)}'에서 <{direction_lower}>(으)로 이동할 셀이 없습니다."
+
+        self._remember_position(key, address)
+        if trace:
+            self.position_cache.record(key, ("path_label",) + address[1:], trace[-1][1])
+        return True, ""
+
+    def _step_with_model(self, direction: str) -> Optional[bool]:
+        """
+        커서가 있는 셀에서 direction으로 한 칸 이동합니다. 현재 구조 세대의 셀 주소 맵이 있으면
+        병합 셀을 반영한 격자에서 이동할 셀을 구해 SetPos로 들어갑니다.
+
+        Returns:
+            Optional[bool]: 이동하면 True, 격자에서 이동할 셀이 없으면(표 밖) False,
+                현재 셀의 주소 맵이 없으면 None (이때만 상대 이동을 사용)
+        """
+        key, maps = self._cell_maps
+        if key != self._structure_key():
+            return None
+        pos = self._get_current_position()
+        if not pos:
+            return None
+        for cell_map in maps.values():
+            cell = cell_map.cell_of(pos[0]) if cell_map is not None else None
+            if cell is None:
+                continue
+            target = cell_map.grid.step(cell[0], cell[1], direction)
+            if target is None:
+                return False
+            return self._jump_to((cell_map.resolve(*target)[2], 0, 0))
+        return None
+
+    def _path_context(self):
+        """
+        경로 해석에 쓰는 문단 텍스트 모델과 표 조회 함수를 만듭니다.
+
+        Returns:
+            (문서 순서의 문단 목록, 셀 리스트 ID → 표 번호 함수, 표 번호 → CellAddressMap 함수)
+        """
+        paragraphs = self.get_paragraphs()
+        owners = assign_tables([key for key, _ in paragraphs], self.get_control_index().tables())
+        table_of: Dict[int, int] = {}
+        for ((list_id, _), _), (owner, _) in zip(paragraphs, owners):
+            if owner is not None:
+                table_of.setdefault(list_id, owner)
+
+        maps: Dict[int, Optional[CellAddressMap]] = {}
+
+        def map_of(table_index):
+            if table_index not in maps:
+                maps[table_index] = self.get_cell_address_map(table_index)
+            return maps[table_index]
+
+        return paragraphs, table_of.get, map_of
+
+    def resolve_paths(self, paths: List[List[str]], direction: str = "right") -> List[Dict[str, Any]]:
+        """
+        여러 경로가 가리키는 셀을 문단 텍스트 모델과 셀 주소 맵에서 찾습니다.
+        커서를 움직이거나 문서를 검색하지 않으므로 입력 전에 모든 경로를 한 번에 확인할 수 있습니다.
+
+        Args:
+            paths: 경로 목록 (예: [["대표자", "<down>"], ["연락처"]])
+            direction: 마지막 항목이 레이블일 때 이동할 방향
+
+        Returns:
+            List[Dict]: 경로마다 path_model.resolve_path 결과
+        """
+        paragraphs, table_of, map_of = self._path_context()
+        return [resolve_path(path, direction.lower(), paragraphs, table_of, map_of) for path in paths]
+
+    def preview_paths(
+        self,
+        path_value_map: Dict[str, str],
+        direction: str = "right",
+        use_profile: bool = True
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        fill_cells_by_path_batch가 각 경로에 입력할 셀과 그 셀의 현재 내용을 문서를 바꾸지 않고 확인합니다.
+        실제 입력과 같은 순서로 대상을 정합니다. (확인된 양식 프로필 항목 먼저, 나머지는 표 격자에서 해석)
+
+        Args:
+            path_value_map: 경로(문자열)와 값의 매핑
+            direction: 이동 방향 ("right", "down", "left", "up")
+            use_profile: 양식 프로필 사용 여부
+
+        Returns:
+            Tuple[bool, Dict]: (성공 여부, {"previews": [...]})
+                각 항목은 {"path", "value", "ok"}와, 찾으면 {"table_index", "cell", "row", "col", "current",
+                "labels", "source"} (row/col은 1부터, source는 "profile" 또는 "model"), 못 찾으면 {"error"}.
+                같은 셀을 가리키는 경로가 여럿이면 "duplicate_of"가 붙습니다.
+        """
+        try:
+            if not self.is_hwp_running:
+                return False, {"error": "HWP가 연결되어 있지 않습니다."}
+            direction_lower = direction.lower()
+            _, profile, verified = self._verified_profile(use_profile)
+            paragraphs, table_of, map_of = self._path_context()
+            cell_texts = self._cell_texts()
+
+            previews, targets = [], {}
+            for path_str, value in path_value_map.items():
+                path = parse_path(path_str)
+                result = None
+                entry_key = profile_key(path, direction_lower)
+                if entry_key in verified:
+                    list_id = profile[entry_key]["pos"][0]
+                    table_index = table_of(list_id)
+                    cell_map = map_of(table_index) if table_index is not None else None
+                    found = cell_map.cell_of(list_id) if cell_map is not None else None
+                    if found:
+                        result = {"ok": True, "table_index": table_index, "row": found[0], "col": found[1],
+                                  "list_id": list_id, "labels": [], "source": "profile"}
+                if result is None:
+                    result = dict(resolve_path(path, direction_lower, paragraphs, table_of, map_of), source="model")
+
+                preview = {"path": path_str, "value": value, "ok": result["ok"]}
+                if not result["ok"]:
+                    preview["error"] = result["error"]
+                    previews.append(preview)
+                    continue
+                preview.update(
+                    table_index=result["table_index"],
+                    cell=index_to_cell(result["row"], result["col"]),
+                    row=result["row"] + 1,
+                    col=result["col"] + 1,
+                    current=cell_texts.get(result["list_id"], "").strip(),
+                    labels=result["labels"],
+                    source=result["source"],
+                )
+                if result["list_id"] in targets:
+                    preview["duplicate_of"] = targets[result["list_id"]]
+                else:
+                    targets[result["list_id"]] = path_str
+                previews.append(preview)
+            return True, {"previews": previews}
+        except Exception as e:
+            return False, {"error": f"경로 미리보기 실패: {str(e)}"}
+
+    def _verified_profile(self, use_profile: bool = True):
+        """
+        활성 문서의 양식 프로필을 읽고, 현재 문서에서도 맞는 항목을 고릅니다.
+
+        Returns:
+            (양식 지문 또는 None, 프로필 {항목 키: 항목}, 확인된 항목 키 집합)
+        """
+        if not use_profile or self.profile_store is None or not self.is_hwp_running:
+            return None, {}, set()
+        try:
+            fingerprint = self.get_form_fingerprint()
+            if not fingerprint:
+                return None, {}, set()
+            profile = self.profile_store.load(fingerprint)
+            cell_texts = self._cell_texts() if profile else {}
+            return fingerprint, profile, {key for key, entry in profile.items() if verify_entry(entry, cell_texts)}
+        except Exception as e:
+            logger.debug(f"양식 프로필 확인 실패 (무시): {e}")
+            return None, {}, set()
+
+    def get_form_fingerprint(self) -> Optional[str]:
+        """
+        활성 문서의 표 구조 지문을 구합니다. (같은 양식이면 같은 지문)
+
+        Returns:
+            Optional[str]: 지문 (표가 없으면 None)
+        """
+        if not self.is_hwp_running:
+            return None
+        tables = self.get_control_index().tables()
+        keys = [key for key, _ in self.get_paragraphs()]
+        cells: Dict[int, set] = {}
+        for table_index, cell_index in assign_tables(keys, tables):
+            if table_index is not None:
+                cells.setdefault(table_index, set()).add(cell_index)
+        return fingerprint_tables(tables, {index: len(found) for index, found in cells.items()})
+
+    def _cell_texts(self) -> Dict[int, str]:
+        """텍스트 모델에서 본문 밖 리스트(셀 등)별 텍스트를 모읍니다."""
+        texts: Dict[int, List[str]] = {}
+        for (list_id, _), text in self.get_paragraphs():
+            if list_id != 0:
+                texts.setdefault(list_id, []).append(text)
+        return {list_id: self.text_model.separator.join(parts) for list_id, parts in texts.items()}
+
+    @mutates_document(structural=False)
     def fill_cells_by_path_batch(
         self,
         path_value_map: Dict[str, str],
         direction: str = "right",
-        mode: str = "replace"
+        mode: str = "replace",
+        use_profile: bool = True
     ) -> Dict[str, Tuple[bool, str]]:
         """
         여러 경로에 대해 값을 일괄 입력합니다.
 
+        양식 프로필 저장소가 있으면 표 구조 지문이 같은 문서에서 찾았던 셀 위치로 바로 이동합니다.
+        저장된 위치는 입력 전에 확인(레이블 셀에 레이블이 그대로 있는지)하고,
+        맞지 않는 경로는 평소처럼 찾아서 입력한 뒤 프로필을 갱신합니다.
+
         Args:
             path_value_map: 경로(문자열)와 값의 매핑
                 - 경로는 " > " 또는 "/"로 구분 (예: "대표자 > 총 인원" 또는 "대표자/총 인원")
             direction: 이동 방향 ("right", "down", "left", "up")
             mode: 입력 모드 ("replace", "prepend", "append")
+            use_profile: 양식 프로필 사용 여부
 
         Returns:
             Dict[str, Tuple[bool, str]]: 각 경로에 대한 (성공 여부, 결과 메시지)
         """
         results = {}
 
+        # 입력하면 텍스트 모델을 다시 읽어야 하므로 프로필 항목은 입력 전에 한 번에 확인
+        fingerprint, profile, verified = self._verified_profile(use_profile)
+
+        direction_lower = direction.lower()
+        mode_lower = mode.lower()
+        valid_mode = mode_lower in ("replace", "prepend", "append")
+        paths = {path_str: parse_path(path_str) for path_str in path_value_map}
+
+        # 프로필에 없는 경로는 입력 전에 텍스트 모델과 표 격자에서 한 번에 해석
+        # (입력할 때마다 텍스트 모델을 다시 읽거나 문서를 검색하지 않음, 해석하지 못한 경로는 기존 방식으로 찾음)
+        resolved = {}
+        if valid_mode and self.is_hwp_running:
+            pending = [path_str for path_str, path in paths.items()
+                       if profile_key(path, direction_lower) not in verified]
+            try:
+                for path_str, result in zip(pending, self.resolve_paths([paths[p] for p in pending], direction_lower)):
+                    if result["ok"]:
+                        resolved[path_str] = result
+            except Exception as e:
+                logger.debug(f"경로 해석 실패 (검색으로 찾음): {e}")
+
+        learned = {}
         for path_str, value in path_value_map.items():
-            # 경로 문자열을 리스트로 변환
-            if " > " in path_str:
-                path = [p.strip() for p in path_str.split(" > ")]
-            elif "/" in path_str:
-                path = [p.strip() for p in path_str.split("/")]
+            path = paths[path_str]
+
+            entry_key = profile_key(path, direction_lower)
+            if entry_key in verified and valid_mode and self._jump_to(profile[entry_key]["pos"]):
+                self._write_current_cell(value, mode_lower)
+                results[path_str] = (True, f"'{' > '.join(path)}' 경로의 셀에 '{value}' 입력 완료 (양식 프로필)")
+                continue
+
+            target = resolved.get(path_str)
+            if target and self._jump_to((target["list_id"], 0, 0)):
+                self._write_current_cell(value, mode_lower)
+                key = self._structure_key()
+                address = ("path", tuple(path), direction_lower)
+                self.position_cache.record(key, address, (target["list_id"], 0, 0))
+                if target["label_pos"]:
+                    self.position_cache.record(key, ("path_label",) + address[1:], target["label_pos"])
+                success, message = True, f"'{' > '.join(path)}' 경로의 셀에 '{value}' 입력 완료"
             else:
-                path = [path_str]
-
-            success, message = self.fill_cell_by_path(path, value, direction, mode)
+                success, message = self.fill_cell_by_path(path, value, direction, mode)
             results[path_str] = (success, message)
 
+            # 새로 찾은 경로는 프로필에 기록 (대상 셀 위치와 마지막 레이블을 찾은 셀)
+            if success and fingerprint:
+                key = self._structure_key()
+                target = self.position_cache.get(key, ("path", tuple(path), direction_lower))
+                label_pos = self.position_cache.get(key, ("path_label", tuple(path), direction_lower))
+                labels = [item for item in path if direction_keyword(item) is None]
+                if target and label_pos and labels:
+                    learned[entry_key] = {
+                        "path": path,
+                        "direction": direction_lower,
+                        "pos": list(target),
+                        "label": labels[-1],
+                        "label_list": label_pos[0],
+                    }
+
+        if learned:
+            self.profile_store.update(fingerprint, learned)
         return results
\ No newline at end of file
@@ -57,7 +57,7 @@ class HwpTableTools:
             logger.error(f"Error inserting table: {str(e)}", exc_info=True)
             return f"Error: {str(e)}"
 
-    def set_cell_text(self, row: int, col: int, text: str) -> str:
+    def set_cell_text(self, row: int, col: int, text: str, table_index: Optional[int] = None) -> str:
         """
         표의 특정 셀에 텍스트를 입력합니다.
         
@@ -65,6 +65,7 @@ class HwpTableTools:
             row: 셀의 행 번호 (1부터 시작)
             col: 셀의 열 번호 (1부터 시작)
             text: 입력할 텍스트
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
             
         Returns:
             str: 결과 메시지
@@ -74,7 +75,7 @@ class HwpTableTools:
                 return "Error: HWP Controller is not set"
             
             # fill_table_cell 메서드를 사용하여 셀에 텍스트 입력
-            if self.hwp_controller.fill_table_cell(row, col, text):
+            if self.hwp_controller.fill_table_cell(row, col, text, table_index):
                 logger.info(f"셀 텍스트 설정 완료: ({row}, {col})")
                 return f"셀({row}, {col})에 텍스트 입력 완료"
             else:
@@ -83,7 +84,7 @@ class HwpTableTools:
             logger.error(f"셀 텍스트 설정 중 오류: {str(e)}", exc_info=True)
             return f"Error: {str(e)}"
 
-    def merge_cells(self, start_row: int, start_col: int, end_row: int, end_col: int) -> str:
+    def merge_cells(self, start_row: int, start_col: int, end_row: int, end_col: int, table_index: Optional[int] = None) -> str:
         """
         표의 특정 범위의 셀을 병합합니다.
         
@@ -92,6 +93,7 @@ class HwpTableTools:
             start_col: 시작 열 번호 (1부터 시작)
             end_row: 종료 행 번호 (1부터 시작)
             end_col: 종료 열 번호 (1부터 시작)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
             
         Returns:
             str: 결과 메시지
@@ -101,7 +103,7 @@ class HwpTableTools:
                 return "Error: HWP Controller is not set"
             
             # merge_table_cells 메서드를 사용하여 셀 병합
-            if self.hwp_controller.merge_table_cells(start_row, start_col, end_row, end_col):
+            if self.hwp_controller.merge_table_cells(start_row, start_col, end_row, end_col, table_index):
                 logger.info(f"셀 병합 완료: ({start_row},{start_col}) - ({end_row},{end_col})")
                 return f"셀 병합 완료 ({start_row},{start_col}) - ({end_row},{end_col})"
             else:
@@ -110,13 +112,14 @@ class HwpTableTools:
             logger.error(f"셀 병합 중 오류: {str(e)}", exc_info=True)
             return f"Error: {str(e)}"
 
-    def get_cell_text(self, row: int, col: int) -> str:
+    def get_cell_text(self, row: int, col: int, table_index: Optional[int] = None) -> str:
         """
         표의 특정 셀의 텍스트를 가져옵니다.
         
         Args:
             row: 셀의 행 번호 (1부터 시작)
             col: 셀의 열 번호 (1부터 시작)
+            table_index: 표 번호 (문서 순서, 0부터). 없으면 커서가 있는 표
             
         Returns:
             str: 셀의 텍스트 내용
@@ -126,7 +129,7 @@ class HwpTableTools:
                 return "Error: HWP Controller is not set"
             
             # get_table_cell_text 메서드를 사용하여 셀 텍스트 가져오기
-            text = self.hwp_controller.get_table_cell_text(row, col)
+            text = self.hwp_controller.get_table_cell_text(row, col, table_index)
             logger.info(f"셀 텍스트 가져오기 완료: ({row}, {col})")
             return text
         except Exception as e:
@@ -0,0 +1,77 @@
+"""
+Aho–Corasick 다중 패턴 검색 모듈
+여러 검색어(레이블)를 텍스트 한 번 순회로 모두 찾습니다.
+"""
+
+from collections import deque
+from typing import Dict, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """여러 패턴을 동시에 찾는 오토마톤"""
+
+    def __init__(self, patterns: List[str], ignore_case: bool = False):
+        """
+        Args:
+            patterns: 찾을 문자열 목록 (빈 문자열은 무시)
+            ignore_case: 영문 대소문자 구분 안 함
+        """
+        self.ignore_case = ignore_case
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            self._add(self._normalize(pattern), pattern_id)
+        self._build()
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _add(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = nxt
+        self._output[state].append(pattern_id)
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        text에서 모든 패턴의 모든 적중을 찾습니다. (겹치는 적중 포함)
+
+        Yields:
+            Tuple[int, str]: (시작 위치, 패턴)
+        """
+        state = 0
+        for i, ch in enumerate(self._normalize(text)):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for pattern_id in self._output[state]:
+                pattern = self.patterns[pattern_id]
+                yield i - len(pattern) + 1, pattern
+
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """패턴별 시작 위치 목록을 반환합니다. (적중이 없는 패턴은 포함하지 않음)"""
+        found: Dict[str, List[int]] = {}
+        for start, pattern in self.finditer(text):
+            found.setdefault(pattern, []).append(start)
+        return found
@@ -0,0 +1,81 @@
+"""
+일괄 작업 체크포인트 모듈
+시간 제한으로 중단된 일괄 작업을 이어서 실행할 수 있도록
+다음 작업 위치와 문서 체크포인트를 담은 이어하기 토큰을 만들고 검증합니다.
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+TOKEN_VERSION = 1
+
+
+def operations_digest(operations: List[Dict[str, Any]]) -> str:
+    """작업 목록의 요약 해시 (이어하기 시 같은 작업 목록인지 확인하는 데 사용)"""
+    payload = json.dumps(operations, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_continuation_token(
+    next_index: int,
+    total: int,
+    digest: str,
+    document: str = "",
+    pos: Optional[List[int]] = None
+) -> str:
+    """
+    이어하기 토큰을 만듭니다.
+
+    Args:
+        next_index: 다음에 실행할 작업의 인덱스 (0부터 시작)
+        total: 전체 작업 수
+        digest: operations_digest() 결과
+        document: 중단 시점의 문서 식별 키
+        pos: 중단 시점의 커서 위치 (GetPos 결과)
+
+    Returns:
+        str: URL에 안전한 base64 토큰
+    """
+    payload = {
+        "v": TOKEN_VERSION,
+        "next": next_index,
+        "total": total,
+        "digest": digest,
+        "document": document,
+        "pos": list(pos) if pos else None,
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_continuation_token(token: str, operations: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    이어하기 토큰을 해석하고 검증합니다.
+
+    Args:
+        token: encode_continuation_token()으로 만든 토큰
+        operations: 이어서 실행할 작업 목록 (주어지면 토큰과 같은 목록인지 확인)
+
+    Returns:
+        Dict[str, Any]: {"next", "total", "digest", "document", "pos"}
+
+    Raises:
+        ValueError: 토큰이 손상되었거나 작업 목록이 다른 경우
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Invalid continuation token: {str(e)}")
+
+    if not isinstance(payload, dict) or payload.get("v") != TOKEN_VERSION:
+        raise ValueError("Unsupported continuation token version")
+
+    if operations is not None:
+        if payload.get("digest") != operations_digest(operations):
+            raise ValueError("Continuation token does not match the given operations")
+        if not 0 <= payload.get("next", -1) <= len(operations):
+            raise ValueError("Continuation token points outside the operations list")
+
+    return payload
@@ -0,0 +1,123 @@
+"""
+셀 주소 맵 모듈
+표 격자(TableGrid)의 기준 셀 순서와 문단 텍스트 모델의 셀 리스트 ID를 짝지어
+(행, 열) 또는 "A1" 주소에서 셀 리스트 ID를 바로 찾습니다. 리스트 ID를 알면
+SetPos(리스트 ID, 0, 0) 한 번으로 셀에 들어갈 수 있으므로, 표 안의 어느 셀이든
+상대 이동(TableRightCell, TableLowerCell) 없이 바로 읽고 쓸 수 있습니다.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from src.utils.cursor_context import cell_to_index, index_to_cell
+    from src.utils.table_grid import TableGrid
+except ImportError:
+    from utils.cursor_context import cell_to_index, index_to_cell
+    from utils.table_grid import TableGrid
+
+ROW_COL_PATTERN = re.compile(r"^\s*\(?\s*(\d+)\s*,\s*(\d+)\s*\)?\s*$")
+
+
+def parse_cell_reference(reference: Any, col: Optional[int] = None) -> Tuple[int, int]:
+    """
+    셀 참조를 (행, 열) 번호(0부터)로 바꿉니다.
+
+    Args:
+        reference: "B3" 같은 셀 주소, "3,2" 또는 [3, 2] 같은 (행, 열) (1부터), 또는 행 번호 (1부터)
+        col: reference가 행 번호일 때의 열 번호 (1부터)
+
+    Returns:
+        Tuple[int, int]: (행, 열) (0부터)
+
+    Raises:
+        ValueError: 형식이 맞지 않거나 번호가 1보다 작은 경우
+    """
+    if isinstance(reference, (list, tuple)):
+        if len(reference) != 2:
+            raise ValueError(f"Cell reference must be [row, col]: {reference!r}")
+        reference, col = reference
+    elif isinstance(reference, str) and col is None:
+        match = ROW_COL_PATTERN.match(reference)
+        if not match:
+            return cell_to_index(reference)
+        reference, col = match.group(1), match.group(2)
+    if col is None:
+        raise ValueError(f"Column is required for row reference {reference!r}")
+    row, col = int(reference), int(col)
+    if row < 1 or col < 1:
+        raise ValueError(f"Row and column start at 1: ({row}, {col})")
+    return row - 1, col - 1
+
+
+class CellAddressMap:
+    """표 하나의 (행, 열) → 셀 리스트 ID 맵 (병합된 셀은 가려진 위치도 기준 셀로 연결)"""
+
+    def __init__(self, grid: TableGrid, cell_lists: Sequence[int]):
+        """
+        Args:
+            grid: 표 격자
+            cell_lists: 기준 셀의 읽는 순서대로의 셀 리스트 ID
+
+        Raises:
+            ValueError: 셀 수가 격자의 기준 셀 수와 다른 경우
+        """
+        order = grid.cell_order()
+        if len(order) != len(cell_lists):
+            raise ValueError(f"Table has {len(order)} cells but {len(cell_lists)} cell lists were found")
+        self.grid = grid
+        self._lists: Dict[Tuple[int, int], int] = dict(zip(order, cell_lists))
+        self._cells: Dict[int, Tuple[int, int]] = {list_id: cell for cell, list_id in self._lists.items()}
+
+    @property
+    def rows(self) -> int:
+        return self.grid.rows
+
+    @property
+    def cols(self) -> int:
+        return self.grid.cols
+
+    def resolve(self, row: int, col: int) -> Optional[Tuple[int, int, int]]:
+        """
+        (행, 열)을 덮는 셀을 찾습니다.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: (기준 셀 행, 기준 셀 열, 셀 리스트 ID), 표 밖이면 None
+        """
+        anchor = self.grid.anchor(row, col)
+        if anchor is None:
+            return None
+        return anchor[0], anchor[1], self._lists[anchor]
+
+    def cell_of(self, list_id: int) -> Optional[Tuple[int, int]]:
+        """셀 리스트 ID의 (행, 열) (표의 셀이 아니면 None)"""
+        return self._cells.get(list_id)
+
+    def address(self, row: int, col: int) -> str:
+        """(행, 열)의 "A1" 형식 주소"""
+        return index_to_cell(row, col)
+
+    def span(self, row: int, col: int) -> Tuple[int, int]:
+        """(행, 열)을 덮는 셀의 (rowspan, colspan) (표 밖이면 (0, 0))"""
+        return self.grid.span(row, col)
+
+    def __len__(self) -> int:
+        return len(self._lists)
+
+
+def table_cell_lists(cell_indexes: Sequence[Tuple[int, Optional[int], Optional[int]]], table_index: int) -> List[int]:
+    """
+    문단마다의 (리스트 ID, 표 번호, 셀 순번) 목록에서 한 표의 셀 리스트 ID를 읽는 순서대로 모읍니다.
+
+    Args:
+        cell_indexes: 문서 순서의 (리스트 ID, 표 번호, 셀 순번) (assign_tables 결과와 문단 키를 합친 것)
+        table_index: 표 번호
+
+    Returns:
+        List[int]: 셀 순번 순서의 셀 리스트 ID
+    """
+    lists: Dict[int, int] = {}
+    for list_id, owner, cell_index in cell_indexes:
+        if owner == table_index and cell_index not in lists:
+            lists[cell_index] = list_id
+    return [lists[i] for i in sorted(lists)]
@@ -0,0 +1,144 @@
+"""
+문서 컨트롤 색인 모듈
+HeadCtrl/Next로 한 번 순회한 컨트롤(표, 그림, 필드 등) 정보를 보관하여
+표 도구가 커서 위치에 의존하지 않고 SetPos로 바로 원하는 표로 이동할 수 있게 합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# CtrlID → 컨트롤 종류
+CONTROL_TYPES = {
+    "tbl": "table",
+    "gso": "shape",
+    "eqed": "equation",
+    "head": "header",
+    "foot": "footer",
+    "fn": "footnote",
+    "en": "endnote",
+    "atno": "auto_number",
+    "pgnp": "page_number",
+    "bokm": "bookmark",
+    "secd": "section",
+    "cold": "column",
+}
+
+
+def control_type(ctrl_id: str, description: str = "") -> str:
+    """
+    CtrlID와 UserDesc로 컨트롤 종류를 구합니다.
+
+    Args:
+        ctrl_id: 컨트롤 ID (예: "tbl", "gso", "%clk")
+        description: 컨트롤 설명 (UserDesc, 예: "그림")
+
+    Returns:
+        str: "table", "picture", "field", "shape" 등 (모르는 ID는 "other")
+    """
+    ctrl_id = (ctrl_id or "").strip()
+    if ctrl_id == "gso" and description and "그림" in description:
+        return "picture"
+    if ctrl_id.startswith("%"):
+        return "field"
+    return CONTROL_TYPES.get(ctrl_id, "other")
+
+
+class ControlIndex:
+    """문서 순서의 컨트롤 목록과 표 번호"""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self.synced_key: Optional[Any] = None
+
+    def load(self, records: List[Dict[str, Any]], synced_key: Any = None) -> None:
+        """
+        순회 결과로 색인을 채웁니다.
+
+        Args:
+            records: 문서 순서의 컨트롤 정보 ({"ctrl_id", "description", "anchor", ...})
+            synced_key: 순회 시점의 편집 세대 키
+        """
+        self.entries = []
+        table_count = 0
+        for i, record in enumerate(records):
+            entry = dict(record)
+            entry["index"] = i
+            entry["type"] = control_type(entry.get("ctrl_id", ""), entry.get("description", ""))
+            if entry["type"] == "table":
+                entry["table_index"] = table_count
+                table_count += 1
+            self.entries.append(entry)
+        self.synced_key = synced_key
+
+    def invalidate(self) -> None:
+        """색인을 버립니다."""
+        self.entries = []
+        self.synced_key = None
+
+    def by_type(self, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """종류별 컨트롤 목록 (kind가 None이면 전체)"""
+        if kind is None:
+            return list(self.entries)
+        return [entry for entry in self.entries if entry["type"] == kind]
+
+    def tables(self) -> List[Dict[str, Any]]:
+        """표 목록"""
+        return self.by_type("table")
+
+    def table(self, table_index: int) -> Dict[str, Any]:
+        """
+        table_index번째 표 (0부터)
+
+        Raises:
+            IndexError: 해당 번호의 표가 없는 경우
+        """
+        tables = self.tables()
+        if not 0 <= table_index < len(tables):
+            raise IndexError(f"Table index {table_index} out of range (document has {len(tables)} tables)")
+        return tables[table_index]
+
+    def summary(self) -> Dict[str, int]:
+        """종류별 컨트롤 수"""
+        counts: Dict[str, int] = {}
+        for entry in self.entries:
+            counts[entry["type"]] = counts.get(entry["type"], 0) + 1
+        return counts
+
+
+def assign_tables(
+    keys: List[Tuple[int, int]],
+    tables: List[Dict[str, Any]]
+) -> List[Tuple[Optional[int], Optional[int]]]:
+    """
+    문서 순서의 문단 키마다 속한 표 번호와 표 안의 셀 순번을 구합니다.
+    스캔 순서에서 표의 셀 문단은 첫 셀부터 이어서 나오고, 표를 둔 리스트로 돌아오면 표가 끝납니다.
+
+    Args:
+        keys: 문서 순서의 (리스트 ID, 문단 번호) 목록
+        tables: ControlIndex.tables() 결과 (first_cell, anchor, table_index 필요)
+
+    Returns:
+        List[Tuple[Optional[int], Optional[int]]]: keys와 같은 순서의 (표 번호, 셀 순번).
+        표 밖의 문단은 (None, None). 셀 순번은 표 안에서 읽는 순서(0부터)입니다.
+    """
+    starts = {}
+    for table in tables:
+        first_cell = table.get("first_cell")
+        anchor = table.get("anchor")
+        if first_cell and anchor:
+            starts[(first_cell[0], first_cell[1])] = (table["table_index"], anchor[0])
+
+    result = []
+    stack = []  # (표 번호, 표를 둔 리스트 ID, {셀 리스트 ID: 셀 순번})
+    for key in keys:
+        while stack and key[0] == stack[-1][1]:
+            stack.pop()
+        if key in starts:
+            table_index, anchor_list = starts[key]
+            stack.append((table_index, anchor_list, {}))
+        if not stack:
+            result.append((None, None))
+            continue
+        table_index, _, cells = stack[-1]
+        cell_index = cells.setdefault(key[0], len(cells))
+        result.append((table_index, cell_index))
+    return result
@@ -0,0 +1,117 @@
+"""
+커서 위치 정보 모듈
+커서가 표 안에 있는지, 어느 셀에 있는지를 TableCellBlock/Cancel 시험 실행 없이
+GetPos와 KeyIndicator 결과로 판단하고, 커서가 움직이기 전까지 재사용합니다.
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+# KeyIndicator의 컨트롤 이름에 나타나는 셀 주소 (예: "(A1)", "B12")
+CELL_ADDRESS_PATTERN = re.compile(r"^\(?\s*([A-Za-z]+)(\d+)\s*\)?$")
+
+
+def parse_cell_address(text: Any) -> Optional[str]:
+    """
+    KeyIndicator의 컨트롤 이름에서 셀 주소를 추출합니다.
+
+    Args:
+        text: KeyIndicator()의 마지막 값 (예: "(A1)")
+
+    Returns:
+        Optional[str]: 대문자 셀 주소 (예: "A1"), 셀 주소가 아니면 None
+    """
+    if not text:
+        return None
+    match = CELL_ADDRESS_PATTERN.match(str(text).strip())
+    if not match or int(match.group(2)) < 1:
+        return None
+    return f"{match.group(1).upper()}{int(match.group(2))}"
+
+
+def cell_to_index(address: str) -> Tuple[int, int]:
+    """
+    셀 주소를 (행, 열) 번호로 바꿉니다. (0부터, "A1" → (0, 0), "AA3" → (2, 26))
+
+    Raises:
+        ValueError: 셀 주소 형식이 아닌 경우
+    """
+    normalized = parse_cell_address(address)
+    if normalized is None:
+        raise ValueError(f"Invalid cell address: {address!r}")
+    match = CELL_ADDRESS_PATTERN.match(normalized)
+    col = 0
+    for ch in match.group(1):
+        col = col * 26 + (ord(ch) - ord("A") + 1)
+    return int(match.group(2)) - 1, col - 1
+
+
+def index_to_cell(row: int, col: int) -> str:
+    """
+    (행, 열) 번호(0부터)를 셀 주소로 바꿉니다. ((0, 0) → "A1", (2, 26) → "AA3")
+
+    Raises:
+        ValueError: 음수 번호인 경우
+    """
+    if row < 0 or col < 0:
+        raise ValueError(f"Invalid cell index: ({row}, {col})")
+    letters = ""
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return f"{letters}{row + 1}"
+
+
+def build_context(pos: Any, control_name: Any = None, table_index: Optional[int] = None) -> Dict[str, Any]:
+    """
+    커서 위치 정보를 만듭니다.
+    본문(리스트 ID 0)이 아니고 컨트롤 이름이 셀 주소이면 표 안으로 판단합니다.
+
+    Args:
+        pos: GetPos() 결과 (리스트 ID, 문단 번호, 글자 위치)
+        control_name: KeyIndicator()의 컨트롤 이름
+        table_index: 커서가 들어 있는 표 번호 (알 수 있는 경우)
+
+    Returns:
+        Dict: {"pos", "in_table", "cell", "row", "col", "table_index"}
+    """
+    pos = list(pos) if pos else None
+    cell = parse_cell_address(control_name) if pos and pos[0] != 0 else None
+    row, col = cell_to_index(cell) if cell else (None, None)
+    return {
+        "pos": pos,
+        "in_table": cell is not None,
+        "cell": cell,
+        "row": row,
+        "col": col,
+        "table_index": table_index if cell else None,
+    }
+
+
+class CursorContextCache:
+    """마지막으로 구한 커서 위치 정보 (문서, 편집 세대, 커서 위치가 같을 때만 재사용)"""
+
+    def __init__(self):
+        self._key: Optional[Tuple] = None
+        self._context: Optional[Dict[str, Any]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """key가 저장된 키와 같으면 위치 정보의 사본을, 아니면 None을 반환합니다."""
+        if self._context is not None and key == self._key:
+            self.hits += 1
+            return dict(self._context)
+        self.misses += 1
+        return None
+
+    def store(self, key: Tuple, context: Dict[str, Any]) -> None:
+        """위치 정보를 저장합니다."""
+        self._key = key
+        self._context = dict(context)
+
+    def invalidate(self) -> None:
+        """저장된 위치 정보를 버립니다."""
+        self._key = None
+        self._context = None
@@ -0,0 +1,101 @@
+"""
+문서 편집 세대(generation) 추적 모듈
+문서가 변경될 때마다 문서별 카운터를 올려, 읽기 결과 캐시가 (문서, 세대)를 키로
+시간 제한 없이 정확하게 무효화될 수 있게 합니다.
+표/문단 구조가 바뀐 변경은 구조 세대로 따로 세어, 셀 위치 캐시처럼 텍스트 변경에는
+영향을 받지 않는 캐시가 구조 세대를 키로 쓸 수 있게 합니다.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class EditGenerationTracker:
+    """문서별 편집 세대 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._structures: Dict[str, int] = {}
+        self._modified: Dict[str, bool] = {}
+        self._epoch = 0
+
+    def generation(self, document: str) -> int:
+        """문서의 현재 세대를 반환합니다. (처음 보는 문서는 0)"""
+        with self._lock:
+            return self._generations.get(document, 0)
+
+    def key(self, document: str) -> Tuple[str, int, int]:
+        """캐시 키로 사용할 (문서, 세대, 전체 초기화 횟수)를 반환합니다."""
+        with self._lock:
+            return document, self._generations.get(document, 0), self._epoch
+
+    def structure_key(self, document: str) -> Tuple[str, int, int]:
+        """위치 캐시 키로 사용할 (문서, 구조 세대, 전체 초기화 횟수)를 반환합니다."""
+        with self._lock:
+            return document, self._structures.get(document, 0), self._epoch
+
+    def bump(self, document: str, structural: bool = True) -> int:
+        """
+        문서가 변경되었음을 기록합니다.
+
+        Args:
+            document: 문서 식별 키
+            structural: 표/문단 구조가 바뀌었을 수 있는지 여부 (False면 셀 안의 텍스트만 바뀐 경우)
+
+        Returns:
+            int: 올린 뒤의 세대
+        """
+        with self._lock:
+            generation = self._generations.get(document, 0) + 1
+            self._generations[document] = generation
+            if structural:
+                self._structures[document] = self._structures.get(document, 0) + 1
+            # 이미 반영한 변경이므로 이후 IsModified 전환으로 다시 올리지 않음
+            if document in self._modified:
+                self._modified[document] = True
+            return generation
+
+    def observe_modified(self, document: str, modified: bool) -> bool:
+        """
+        HWP의 수정 여부 플래그를 관찰합니다.
+        저장 후 다시 수정됨(False → True)으로 바뀌었다면 이 서버가 모르는 편집(사용자 입력 등)이
+        있었을 수 있으므로 세대를 올립니다.
+
+        Args:
+            document: 문서 식별 키
+            modified: 현재 수정 여부 플래그
+
+        Returns:
+            bool: 세대를 올렸는지 여부
+        """
+        with self._lock:
+            previous = self._modified.get(document)
+            self._modified[document] = bool(modified)
+            if previous is False and modified:
+                # 어떤 편집인지 알 수 없으므로 구조 세대도 올림
+                self._generations[document] = self._generations.get(document, 0) + 1
+                self._structures[document] = self._structures.get(document, 0) + 1
+                return True
+            return False
+
+    def forget(self, document: Optional[str] = None) -> None:
+        """
+        닫힌 문서의 기록을 지웁니다. document가 None이면 모든 문서를 지웁니다.
+        지운 뒤에도 이전 캐시 키와 겹치지 않도록 전체 초기화 횟수를 올립니다.
+        """
+        with self._lock:
+            if document is None:
+                self._generations.clear()
+                self._structures.clear()
+                self._modified.clear()
+            else:
+                self._generations.pop(document, None)
+                self._structures.pop(document, None)
+                self._modified.pop(document, None)
+            self._epoch += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """문서별 세대의 복사본을 반환합니다."""
+        with self._lock:
+            return dict(self._generations)
@@ -0,0 +1,100 @@
+"""
+찾기 세션 모듈
+한 번의 전체 찾기 결과(적중 위치 목록)를 세션으로 보관하여,
+다음 찾기가 문서 처음부터 다시 검색하지 않고 마지막 적중 다음부터 이어지게 합니다.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+def make_snippet(text: str, start: int, length: int, width: int = 30) -> str:
+    """
+    적중 위치 앞뒤 width 글자를 포함한 문맥 문자열을 만듭니다.
+
+    Args:
+        text: 적중한 문단의 텍스트
+        start: 문단 안에서 적중 시작 위치
+        length: 적중 길이
+        width: 앞뒤로 포함할 글자 수
+
+    Returns:
+        str: 문맥 문자열 (잘린 쪽에는 "…" 표시)
+    """
+    if not text:
+        return ""
+    start = max(0, min(start, len(text)))
+    left = max(0, start - width)
+    right = min(len(text), start + length + width)
+    prefix = "…" if left > 0 else ""
+    suffix = "…" if right < len(text) else ""
+    return prefix + text[left:right] + suffix
+
+
+class FindSession:
+    """하나의 검색어에 대한 적중 목록과 진행 위치"""
+
+    def __init__(self, session_id: str, query: str, regex: bool, hits: List[Dict[str, Any]], synced_key: Any = None):
+        self.session_id = session_id
+        self.query = query
+        self.regex = regex
+        self.hits = hits
+        self.synced_key = synced_key
+        self.next_hit = 0
+        self.last_hit: Optional[Dict[str, Any]] = None
+
+    def advance(self) -> Optional[Dict[str, Any]]:
+        """다음 적중을 반환하고 진행 위치를 옮깁니다. 더 없으면 None."""
+        if self.next_hit >= len(self.hits):
+            return None
+        hit = self.hits[self.next_hit]
+        self.next_hit += 1
+        self.last_hit = hit
+        return hit
+
+    def rebase(self, hits: List[Dict[str, Any]], synced_key: Any = None) -> None:
+        """문서가 바뀐 뒤 마지막 적중 이후부터 다시 찾은 결과로 교체합니다."""
+        self.hits = hits
+        self.synced_key = synced_key
+        self.next_hit = 0
+
+    @property
+    def remaining(self) -> int:
+        """아직 반환하지 않은 적중 수"""
+        return max(0, len(self.hits) - self.next_hit)
+
+
+class FindSessionStore:
+    """크기 제한이 있는 찾기 세션 저장소 (가장 오래 사용하지 않은 세션부터 제거)"""
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._sessions: "OrderedDict[str, FindSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, query: str, regex: bool, hits: List[Dict[str, Any]], synced_key: Any = None) -> FindSession:
+        """새 세션을 만듭니다."""
+        session = FindSession(uuid.uuid4().hex[:12], query, regex, hits, synced_key)
+        with self._lock:
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.maxsize:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id: str) -> Optional[FindSession]:
+        """세션을 찾습니다. 없거나 만료되었으면 None."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def close(self, session_id: str) -> bool:
+        """세션을 닫습니다."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
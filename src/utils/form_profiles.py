@@ -0,0 +1,130 @@
+"""
+양식 프로필 모듈
+같은 양식(표 구조가 같은 문서)을 반복해서 채울 때, 한 번 찾은 경로의 셀 위치를
+표 구조 지문(fingerprint)별로 디스크에 저장해 다음 문서에서는 검색 없이 바로 입력할 수 있게 합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("hwp-form-profiles")
+
+# 프로필 디렉터리를 지정하는 환경 변수
+PROFILE_DIR_ENV = "HWP_MCP_PROFILE_DIR"
+
+
+def fingerprint_tables(tables: List[Dict[str, Any]], cell_counts: Dict[int, int]) -> Optional[str]:
+    """
+    표 구조의 지문을 구합니다.
+    표마다 행/열 수, 실제 셀 수(병합이 있으면 행×열과 다름), 첫 셀 텍스트(보통 레이블)를 사용하며,
+    값이 들어가는 셀의 내용은 포함하지 않으므로 같은 양식이면 채운 정도와 관계없이 같은 지문이 됩니다.
+
+    Args:
+        tables: ControlIndex.tables() 결과
+        cell_counts: {표 번호: 셀 수}
+
+    Returns:
+        Optional[str]: 지문 (표가 없으면 None)
+    """
+    if not tables:
+        return None
+    shape = [
+        [
+            table.get("rows"),
+            table.get("cols"),
+            cell_counts.get(table.get("table_index"), 0),
+            "".join((table.get("first_cell_text") or "").split()),
+        ]
+        for table in tables
+    ]
+    raw = json.dumps(shape, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+
+
+def profile_key(path: List[str], direction: str) -> str:
+    """경로와 마지막 이동 방향으로 프로필 항목 키를 만듭니다."""
+    return " > ".join(path) + "|" + direction.lower()
+
+
+def verify_entry(entry: Dict[str, Any], cell_texts: Dict[int, str]) -> bool:
+    """
+    저장된 항목이 현재 문서에서도 맞는지 확인합니다.
+    대상 셀이 있고, 레이블을 찾았던 셀에 아직 그 레이블이 있어야 합니다.
+
+    Args:
+        entry: 프로필 항목 ({"pos", "label", "label_list"})
+        cell_texts: 현재 문서의 {셀 리스트 ID: 셀 텍스트}
+    """
+    try:
+        pos = entry["pos"]
+        label_text = cell_texts.get(entry["label_list"])
+        return pos[0] in cell_texts and label_text is not None and entry["label"] in label_text
+    except (KeyError, TypeError, IndexError):
+        return False
+
+
+class FormProfileStore:
+    """양식 지문별 프로필을 JSON 파일로 보관하는 저장소"""
+
+    def __init__(self, profile_dir: Optional[str] = None):
+        """
+        Args:
+            profile_dir: 프로필 디렉터리 (기본값: HWP_MCP_PROFILE_DIR 환경 변수, 없으면 ~/.hwp-mcp/profiles)
+        """
+        self.profile_dir = (
+            profile_dir
+            or os.environ.get(PROFILE_DIR_ENV)
+            or os.path.join(os.path.expanduser("~"), ".hwp-mcp", "profiles")
+        )
+        self._profiles: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def profile_path(self, fingerprint: str) -> str:
+        """지문의 프로필 파일 경로"""
+        return os.path.join(self.profile_dir, f"{fingerprint}.json")
+
+    def load(self, fingerprint: str) -> Dict[str, Dict[str, Any]]:
+        """
+        지문의 프로필 항목을 읽습니다. (한 번 읽은 프로필은 메모리에 보관)
+
+        Returns:
+            Dict[str, Dict]: {항목 키: {"path", "direction", "pos", "label", "label_list"}}, 없으면 빈 딕셔너리
+        """
+        if fingerprint not in self._profiles:
+            entries = {}
+            try:
+                with open(self.profile_path(fingerprint), "r", encoding="utf-8") as f:
+                    entries = json.load(f).get("entries", {})
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"양식 프로필 읽기 실패 (무시): {e}")
+            self._profiles[fingerprint] = entries
+        return self._profiles[fingerprint]
+
+    def update(self, fingerprint: str, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        항목을 추가/갱신하고 파일에 기록합니다. (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        profile = self.load(fingerprint)
+        profile.update(entries)
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = self.profile_path(fingerprint)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"fingerprint": fingerprint, "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"), "entries": profile},
+                    f, ensure_ascii=False, indent=2
+                )
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.warning(f"양식 프로필 저장 실패: {e}")
+            return False
@@ -0,0 +1,102 @@
+"""
+HWPX 파일 처리 모듈
+HWPX(zip + XML) 문서의 본문 텍스트(<hp:t>)를 HWP를 거치지 않고 직접 바꿉니다.
+"""
+
+import os
+import re
+import tempfile
+import zipfile
+from typing import Dict, Optional
+from xml.sax.saxutils import escape, unescape
+
+try:
+    from src.utils.aho_corasick import AhoCorasick
+    from src.utils.replace_planner import apply_simultaneous
+except ImportError:
+    from utils.aho_corasick import AhoCorasick
+    from utils.replace_planner import apply_simultaneous
+
+# 본문 구역 XML (Contents/section0.xml, section1.xml, ...)
+SECTION_PATTERN = re.compile(r"^Contents/section\d+\.xml$")
+# 텍스트 요소 <hp:t>...</hp:t> (속성이나 다른 접두사도 허용, 빈 요소 제외)
+TEXT_PATTERN = re.compile(r"(<(\w+:)?t(?:\s[^>]*)?>)(.*?)(</\2?t>)", re.DOTALL)
+# unescape()가 기본으로 처리하지 않는 엔티티
+XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}
+
+
+def replace_in_xml(xml: str, mapping: Dict[str, str], counts: Dict[str, int]) -> str:
+    """
+    XML의 텍스트 요소마다 모든 항목을 한 번에 바꿉니다.
+    텍스트 안에 다른 요소(탭, 줄바꿈 등)가 섞인 경우 요소 사이의 텍스트만 바꿉니다.
+
+    Args:
+        xml: 구역 XML 문자열
+        mapping: {찾을 문자열: 바꿀 문자열}
+        counts: 항목별 횟수를 누적할 딕셔너리
+
+    Returns:
+        str: 바꾼 XML
+    """
+    automaton = AhoCorasick(list(mapping))
+
+    def replace_text_node(match):
+        inner = match.group(3)
+        # 요소 안의 하위 태그는 그대로 두고 태그 사이 텍스트만 바꿈
+        pieces = re.split(r"(<[^>]+>)", inner)
+        for i, piece in enumerate(pieces):
+            if not piece or piece.startswith("<"):
+                continue
+            original = unescape(piece, XML_ENTITIES)
+            replaced, piece_counts = apply_simultaneous(original, mapping, automaton)
+            if replaced != original:
+                pieces[i] = escape(replaced)
+                for key, count in piece_counts.items():
+                    # 같은 값으로 바꾸는 항목은 바뀐 것이 없으므로 세지 않음
+                    if mapping[key] != key:
+                        counts[key] = counts.get(key, 0) + count
+        return match.group(1) + "".join(pieces) + match.group(4)
+
+    return TEXT_PATTERN.sub(replace_text_node, xml)
+
+
+def replace_in_hwpx(path: str, mapping: Dict[str, str], output_path: Optional[str] = None) -> Dict[str, int]:
+    """
+    HWPX 파일의 본문 텍스트를 한 번에 바꿉니다. 구역 XML을 각각 한 번만 읽고 씁니다.
+
+    Args:
+        path: HWPX 파일 경로
+        mapping: {찾을 문자열: 바꿀 문자열}
+        output_path: 저장 경로 (없으면 원본 파일을 바꿈)
+
+    Returns:
+        Dict[str, int]: 항목별로 실제로 바꾼 횟수 (같은 값으로 바꾸는 항목은 0)
+
+    Raises:
+        ValueError: HWPX(zip) 파일이 아닌 경우
+    """
+    if not zipfile.is_zipfile(path):
+        raise ValueError(f"Not an HWPX file: {path}")
+
+    mapping = {key: "" if value is None else str(value) for key, value in mapping.items() if key}
+    counts = {key: 0 for key in mapping}
+    target = os.path.abspath(output_path or path)
+    fd, temp_path = tempfile.mkstemp(suffix=".hwpx", dir=os.path.dirname(target))
+    os.close(fd)
+
+    try:
+        with zipfile.ZipFile(path, "r") as src, zipfile.ZipFile(temp_path, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info.filename)
+                if SECTION_PATTERN.match(info.filename):
+                    xml = data.decode("utf-8")
+                    data = replace_in_xml(xml, mapping, counts).encode("utf-8")
+                # mimetype 등 원래 압축 방식 유지
+                dst.writestr(info, data, compress_type=info.compress_type)
+        os.replace(temp_path, target)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return counts
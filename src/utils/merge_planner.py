@@ -0,0 +1,171 @@
+"""
+셀 병합 계획 모듈
+여러 병합 범위를 표 격자(TableGrid)에 대해 미리 검사하고(표 밖, 서로 겹침, 기존 병합 셀을 일부만 포함),
+뒤쪽 범위부터 병합하도록 순서를 정해 앞쪽 범위의 기준 셀이 병합으로 밀리지 않게 합니다.
+범위마다 셀 블록을 넓힐 이동 횟수는 기존 병합 셀을 고려해 계산하고, 병합 후에는 다시 읽은
+격자와 비교해 결과를 확인합니다.
+"""
+
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    from src.utils.cell_map import parse_cell_reference
+    from src.utils.cursor_context import index_to_cell
+    from src.utils.table_grid import TableGrid
+except ImportError:
+    from utils.cell_map import parse_cell_reference
+    from utils.cursor_context import index_to_cell
+    from utils.table_grid import TableGrid
+
+# (위 행, 왼쪽 열, 아래 행, 오른쪽 열), 0부터
+CellRange = Tuple[int, int, int, int]
+
+RANGE_PATTERN = re.compile(r"^\s*([A-Za-z]+\d+)\s*:\s*([A-Za-z]+\d+)\s*$")
+
+
+def parse_range(spec: Any) -> CellRange:
+    """
+    병합 범위를 (위, 왼쪽, 아래, 오른쪽) 번호(0부터)로 바꿉니다. 모서리 순서는 상관없습니다.
+
+    Args:
+        spec: "A1:B3", [시작 행, 시작 열, 끝 행, 끝 열] (1부터), 또는 {"start": "A1", "end": "B3"}
+            ({"start": [1, 1], "end": [3, 2]}도 가능)
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    if isinstance(spec, str):
+        match = RANGE_PATTERN.match(spec)
+        if not match:
+            raise ValueError(f"Invalid range: {spec!r} (use e.g. 'A1:B3')")
+        first, second = parse_cell_reference(match.group(1)), parse_cell_reference(match.group(2))
+    elif isinstance(spec, dict):
+        if "start" not in spec or "end" not in spec:
+            raise ValueError(f"Range needs 'start' and 'end': {spec!r}")
+        first, second = parse_cell_reference(spec["start"]), parse_cell_reference(spec["end"])
+    elif isinstance(spec, (list, tuple)) and len(spec) == 4:
+        first, second = parse_cell_reference(spec[0], spec[1]), parse_cell_reference(spec[2], spec[3])
+    else:
+        raise ValueError(f"Invalid range: {spec!r}")
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[0], second[0]), max(first[1], second[1]))
+
+
+def range_address(cell_range: CellRange) -> str:
+    """범위의 "A1:B3" 형식 주소"""
+    top, left, bottom, right = cell_range
+    return f"{index_to_cell(top, left)}:{index_to_cell(bottom, right)}"
+
+
+def _overlaps(a: CellRange, b: CellRange) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _cell_range(cell: Dict[str, Any]) -> CellRange:
+    return (cell["row"], cell["col"], cell["row"] + cell["rowspan"] - 1, cell["col"] + cell["colspan"] - 1)
+
+
+def selection_moves(grid: TableGrid, cell_range: CellRange) -> Tuple[int, int]:
+    """
+    범위의 왼쪽 위 셀에서 셀 블록을 넓힐 때의 (오른쪽 이동 수, 아래 이동 수).
+    병합 셀은 한 번의 이동으로 건너뛰므로, 위 행을 따라 지나는 셀 수와 오른쪽 열을 따라 지나는 셀 수로 셉니다.
+    """
+    top, left, bottom, right = cell_range
+    across = {grid.anchor(top, c) for c in range(left, right + 1)}
+    down = {grid.anchor(r, right) for r in range(top, bottom + 1)}
+    return len(across) - 1, len(down) - 1
+
+
+def merge_grid(grid: TableGrid, cell_range: CellRange) -> TableGrid:
+    """범위를 병합한 격자를 새로 만듭니다. (범위 안 셀의 텍스트는 읽는 순서대로 줄바꿈으로 이음)"""
+    top, left, bottom, right = cell_range
+    inside = [cell for cell in grid.cells if _overlaps(_cell_range(cell), cell_range)]
+    merged = {
+        "row": top, "col": left,
+        "rowspan": bottom - top + 1, "colspan": right - left + 1,
+        "text": "\n".join(cell["text"] for cell in inside if cell["text"]),
+    }
+    cells = [cell for cell in grid.cells if cell not in inside] + [merged]
+    cells.sort(key=lambda cell: (cell["row"], cell["col"]))
+    return TableGrid(cells, grid.rows, grid.cols)
+
+
+def plan_merges(grid: TableGrid, ranges: Sequence[Any]) -> Dict[str, Any]:
+    """
+    병합 범위 목록을 검사하고 실행 순서를 정합니다.
+
+    Args:
+        grid: 병합 전 표 격자
+        ranges: 병합 범위 목록 (parse_range 형식)
+
+    Returns:
+        Dict: {
+            "steps": [{"range", "address", "right_moves", "down_moves"}, ...] 실행 순서 (아래/오른쪽 범위부터),
+            "skipped": [{"address", "reason"}, ...] 한 칸이거나 이미 병합된 범위,
+            "errors": [{"range", "error"}, ...] 잘못된 범위 (하나라도 있으면 아무것도 병합하지 않아야 함),
+            "grid": 모든 병합을 적용한 예상 격자,
+        }
+    """
+    parsed, skipped, errors = [], [], []
+    for spec in ranges:
+        try:
+            cell_range = parse_range(spec)
+        except ValueError as e:
+            errors.append({"range": spec, "error": str(e)})
+            continue
+        address = range_address(cell_range)
+        top, left, bottom, right = cell_range
+        if bottom >= grid.rows or right >= grid.cols:
+            errors.append({"range": address, "error": f"outside the {grid.rows}x{grid.cols} table"})
+            continue
+        if (top, left) == (bottom, right):
+            skipped.append({"address": address, "reason": "single cell"})
+            continue
+        if grid.anchor(top, left) == (top, left) and grid.span(top, left) == (bottom - top + 1, right - left + 1):
+            skipped.append({"address": address, "reason": "already merged"})
+            continue
+        partial = [
+            range_address(_cell_range(cell)) for cell in grid.cells
+            if (cell["rowspan"] > 1 or cell["colspan"] > 1)
+            and _overlaps(_cell_range(cell), cell_range)
+            and not (top <= cell["row"] and left <= cell["col"]
+                     and _cell_range(cell)[2] <= bottom and _cell_range(cell)[3] <= right)
+        ]
+        if partial:
+            errors.append({"range": address, "error": f"cuts through merged cell {', '.join(partial)}"})
+            continue
+        parsed.append(cell_range)
+
+    for i, a in enumerate(parsed):
+        for b in parsed[i + 1:]:
+            if _overlaps(a, b):
+                errors.append({"range": range_address(a), "error": f"overlaps {range_address(b)}"})
+
+    steps = []
+    planned = grid
+    # 뒤쪽(아래, 오른쪽) 범위부터 병합: 병합으로 없어지는 셀은 항상 아직 남은 범위의 기준 셀보다 뒤에 있음
+    for cell_range in sorted(set(parsed), reverse=True):
+        right_moves, down_moves = selection_moves(planned, cell_range)
+        steps.append({
+            "range": cell_range,
+            "address": range_address(cell_range),
+            "right_moves": right_moves,
+            "down_moves": down_moves,
+        })
+        planned = merge_grid(planned, cell_range)
+    return {"steps": steps, "skipped": skipped, "errors": errors, "grid": planned}
+
+
+def verify_merges(grid: TableGrid, ranges: Sequence[CellRange]) -> List[str]:
+    """
+    다시 읽은 격자에서 각 범위가 하나의 셀로 병합되었는지 확인합니다.
+
+    Returns:
+        List[str]: 병합 결과가 다른 범위의 주소 목록
+    """
+    mismatched = []
+    for top, left, bottom, right in ranges:
+        if grid.anchor(top, left) != (top, left) or grid.span(top, left) != (bottom - top + 1, right - left + 1):
+            mismatched.append(range_address((top, left, bottom, right)))
+    return mismatched
@@ -0,0 +1,138 @@
+"""
+경로 해석 모듈
+hwp_fill_cells의 경로("대표자 > <down> > <right>")를 문서를 건드리지 않고 문단 텍스트 모델과
+병합 셀을 반영한 표 격자(CellAddressMap) 위에서 해석합니다.
+레이블은 문서 순서로 앞에서부터 찾고(RepeatFind와 같은 순서), 방향 키워드는 격자에서 한 칸씩
+이동하므로 병합 셀 주변에서도 결과가 항상 같습니다.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+DIRECTIONS = ("left", "right", "up", "down")
+
+
+def parse_path(path_str: str) -> List[str]:
+    """경로 문자열을 항목 목록으로 나눕니다. (" > " 또는 "/"로 구분)"""
+    if " > " in path_str:
+        return [p.strip() for p in path_str.split(" > ")]
+    if "/" in path_str:
+        return [p.strip() for p in path_str.split("/")]
+    return [path_str]
+
+
+def direction_keyword(item: str) -> Optional[str]:
+    """
+    경로 항목이 방향 키워드이면 방향을 반환합니다.
+
+    Returns:
+        Optional[str]: "left", "right", "up", "down", 꺾쇠로 감쌌지만 모르는 방향이면 "", 레이블이면 None
+    """
+    if item.startswith("<") and item.endswith(">"):
+        direction = item[1:-1].lower()
+        return direction if direction in DIRECTIONS else ""
+    return None
+
+
+def resolve_path(
+    path: Sequence[str],
+    direction: str,
+    paragraphs: Sequence[Tuple[Tuple[int, int], str]],
+    table_of: Callable[[int], Optional[int]],
+    map_of: Callable[[int], Any]
+) -> Dict[str, Any]:
+    """
+    경로가 가리키는 셀을 찾습니다.
+
+    Args:
+        path: 경로 항목 (레이블과 방향 키워드)
+        direction: 마지막 항목이 레이블일 때 한 칸 더 이동할 방향
+        paragraphs: 문서 순서의 ((리스트 ID, 문단 번호), 텍스트)
+        table_of: 셀 리스트 ID → 표 번호 (표의 셀이 아니면 None)
+        map_of: 표 번호 → CellAddressMap (만들 수 없으면 None)
+
+    Returns:
+        Dict: 찾으면 {"ok": True, "table_index", "row", "col", "list_id", "labels", "label_pos"},
+            못 찾으면 {"ok": False, "error", "depth"}.
+            row/col은 대상 셀(병합 셀이면 왼쪽 위)의 번호(0부터), labels는 찾은 레이블마다
+            {"label", "table_index", "row", "col"}, label_pos는 마지막 레이블을 찾은 위치입니다.
+    """
+    first_index: Dict[int, int] = {}
+    for i, ((list_id, _), _) in enumerate(paragraphs):
+        first_index.setdefault(list_id, i)
+
+    index, offset = 0, 0
+    cell = None  # (표 번호, 논리 행, 논리 열, 주소 맵)
+    labels, label_pos = [], None
+
+    def failure(depth, message):
+        return {"ok": False, "error": message, "depth": depth}
+
+    def locate(list_id):
+        table_index = table_of(list_id)
+        cell_map = map_of(table_index) if table_index is not None else None
+        found = cell_map.cell_of(list_id) if cell_map is not None else None
+        return (table_index, found[0], found[1], cell_map) if found else None
+
+    def move(depth, step):
+        if cell is None:
+            return None, failure(depth, f"표 밖에서는 <{step}>으로 이동할 수 없습니다.")
+        table_index, row, col, cell_map = cell
+        target = cell_map.grid.step(row, col, step)
+        if target is None:
+            return None, failure(depth, f"{cell_map.address(row, col)} 셀에서 <{step}>으로 이동할 셀이 없습니다.")
+        return (table_index, target[0], target[1], cell_map), None
+
+    for depth, item in enumerate(path):
+        step = direction_keyword(item)
+        if step == "":
+            return failure(depth, f"잘못된 방향 키워드입니다: {item}")
+        if step:
+            cell, error = move(depth, step)
+            if error:
+                return error
+            # 이동한 셀의 처음부터 다음 레이블을 찾음
+            list_id = cell[3].resolve(cell[1], cell[2])[2]
+            index, offset = first_index.get(list_id, len(paragraphs)), 0
+            continue
+
+        found = None
+        for i in range(index, len(paragraphs)):
+            position = paragraphs[i][1].find(item, offset if i == index else 0)
+            if position >= 0:
+                found = (i, position)
+                break
+        if found is None:
+            if depth == 0:
+                return failure(depth, f"첫 번째 레이블 '{item}'을(를) 찾을 수 없습니다.")
+            return failure(depth, f"'{' > '.join(path[:depth])}' 이후에 '{item}'을(를) 찾을 수 없습니다.")
+
+        index, offset = found[0], found[1] + len(item)
+        (list_id, para), _ = paragraphs[index]
+        label_pos = (list_id, para, found[1])
+        located = locate(list_id)
+        if located is not None:
+            table_index, row, col, cell_map = located
+            cell = located
+            labels.append({"label": item, "table_index": table_index, "row": row, "col": col})
+        else:
+            cell = None
+            labels.append({"label": item, "table_index": None, "row": None, "col": None})
+
+    if path and direction_keyword(path[-1]) is None:
+        cell, error = move(len(path), direction.lower())
+        if error:
+            return error
+    if cell is None:
+        return failure(len(path), "경로가 표의 셀을 가리키지 않습니다.")
+
+    table_index, row, col, cell_map = cell
+    anchor_row, anchor_col, list_id = cell_map.resolve(row, col)
+    return {
+        "ok": True,
+        "table_index": table_index,
+        "row": anchor_row,
+        "col": anchor_col,
+        "list_id": list_id,
+        "labels": labels,
+        "label_pos": label_pos,
+    }
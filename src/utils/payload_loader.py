@@ -0,0 +1,191 @@
+"""
+파일 참조 입력 모듈
+표 데이터, 문서 내용, 일괄 작업 목록처럼 큰 입력을 MCP 메시지에 담지 않고 로컬 파일 경로로 받아
+서버가 직접 읽습니다. JSON과 텍스트(Markdown)는 메모리 맵으로 읽어 한 번만 파싱하고,
+CSV/TSV와 Arrow/Parquet(pyarrow가 설치된 경우) 표 데이터는 행 청크로 나눠 읽습니다.
+"""
+
+import itertools
+import json
+import mmap
+import os
+from typing import Any, Iterator, List, Optional
+
+try:
+    from src.utils.tabular_stream import DEFAULT_CHUNK_ROWS, detect_encoding, iter_chunks, iter_file_rows
+except ImportError:
+    from utils.tabular_stream import DEFAULT_CHUNK_ROWS, detect_encoding, iter_chunks, iter_file_rows
+
+# 확장자별 형식
+PAYLOAD_FORMATS = {
+    ".json": "json",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".txt": "text",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+TABLE_FORMATS = ("json", "csv", "tsv", "markdown", "parquet", "arrow")
+
+
+def resolve_payload_path(path: str) -> str:
+    """
+    파일 참조를 절대 경로로 바꿉니다. ("~"와 따옴표 허용)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    resolved = os.path.abspath(os.path.expanduser(str(path).strip().strip('"')))
+    if not os.path.isfile(resolved):
+        raise FileNotFoundError(f"Payload file not found: {path}")
+    return resolved
+
+
+def payload_format(path: str, fmt: Optional[str] = None) -> str:
+    """
+    파일 형식을 정합니다. (fmt가 없으면 확장자로 판단)
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    fmt = (fmt or PAYLOAD_FORMATS.get(os.path.splitext(path)[1].lower(), "")).lower()
+    if fmt not in set(PAYLOAD_FORMATS.values()):
+        raise ValueError(f"Unsupported payload format for {path!r} (use one of {sorted(set(PAYLOAD_FORMATS.values()))})")
+    return fmt
+
+
+def _decode_mapped(path: str) -> str:
+    """파일을 메모리 맵으로 열어 문자열로 디코딩합니다. (읽기 버퍼를 따로 만들지 않음)"""
+    encoding = detect_encoding(path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return str(view, encoding)
+
+
+def load_text(path: str) -> str:
+    """텍스트/Markdown 파일을 읽습니다. (UTF-8 또는 CP949, 줄바꿈은 \\n으로 통일)"""
+    text = _decode_mapped(resolve_payload_path(path))
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def load_json(path: str) -> Any:
+    """JSON 파일을 메모리 맵으로 읽어 한 번 파싱합니다."""
+    return json.loads(_decode_mapped(resolve_payload_path(path)) or "null")
+
+
+def load_operations(path: str) -> List[dict]:
+    """
+    일괄 작업 목록 파일을 읽습니다. JSON 배열 또는 {"operations": [...]} 형식입니다.
+
+    Raises:
+        ValueError: 작업 목록 형식이 아닌 경우
+    """
+    data = load_json(path)
+    if isinstance(data, dict):
+        data = data.get("operations")
+    if not isinstance(data, list) or not all(isinstance(op, dict) for op in data):
+        raise ValueError(f"{path!r} must contain a list of operations")
+    return data
+
+
+def _cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def markdown_table_rows(text: str) -> Iterator[List[str]]:
+    """Markdown 표(| 가 | 나 |)의 행을 읽습니다. 구분선(|---|:---:|)과 표 밖의 줄은 건너뜁니다."""
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line.startswith("|"):
+            continue
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        if all(cell and set(cell) <= set("-: ") for cell in cells):
+            continue
+        yield cells
+
+
+def _arrow_chunks(path: str, fmt: str, chunk_rows: int) -> Iterator[List[List[str]]]:
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError(f"Reading {fmt} files requires pyarrow (pip install pyarrow)")
+
+    if fmt == "parquet":
+        parquet = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        names = parquet.schema_arrow.names
+        batches = parquet.iter_batches(batch_size=chunk_rows)
+    else:
+        reader = pyarrow.ipc.open_file(pyarrow.memory_map(path, "r"))
+        names = reader.schema.names
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+
+    def rows():
+        yield list(names)
+        for batch in batches:
+            columns = [column.to_pylist() for column in batch.columns]
+            for values in zip(*columns):
+                yield [_cell(value) for value in values]
+
+    return iter_chunks(rows(), chunk_rows)
+
+
+def load_table_chunks(
+    path: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    fmt: Optional[str] = None
+) -> Iterator[List[List[str]]]:
+    """
+    표 데이터 파일을 행 청크로 읽습니다.
+    CSV/TSV와 Arrow/Parquet은 청크 단위로 읽고, JSON(2차원 배열)과 Markdown 표는 한 번 파싱한 뒤 나눕니다.
+    Arrow/Parquet은 첫 행이 열 이름입니다.
+
+    Args:
+        path: 파일 경로
+        chunk_rows: 청크당 행 수
+        fmt: 형식 ("json", "csv", "tsv", "markdown", "parquet", "arrow"), 없으면 확장자로 판단
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        ValueError: 표 데이터로 읽을 수 없는 형식
+    """
+    path = resolve_payload_path(path)
+    fmt = payload_format(path, fmt)
+    if fmt not in TABLE_FORMATS:
+        if fmt != "text":
+            raise ValueError(f"{fmt} files cannot be read as table data")
+        fmt = "csv"
+
+    if fmt in ("csv", "tsv"):
+        return iter_chunks(iter_file_rows(path, "\t" if fmt == "tsv" else None), chunk_rows)
+    if fmt in ("parquet", "arrow"):
+        return _arrow_chunks(path, fmt, chunk_rows)
+    if fmt == "markdown":
+        return iter_chunks(markdown_table_rows(load_text(path)), chunk_rows)
+
+    data = load_json(path)
+    if not isinstance(data, list):
+        raise ValueError(f"{path!r} must contain a 2D array")
+    rows = ([_cell(v) for v in row] if isinstance(row, list) else [_cell(row)] for row in data)
+    return iter_chunks(rows, chunk_rows)
+
+
+def peek_chunks(chunks: Iterator[List[List[str]]]):
+    """
+    첫 청크를 미리 읽습니다.
+
+    Returns:
+        (첫 청크 또는 None, 첫 청크를 포함한 청크 이터레이터)
+    """
+    first = next(chunks, None)
+    return first, (itertools.chain([first], chunks) if first is not None else iter(()))
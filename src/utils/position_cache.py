@@ -0,0 +1,177 @@
+"""
+셀 위치 캐시 모듈
+컨트롤러가 방문한 셀의 절대 위치(GetPos 결과)를 문서 구조 세대별로 기억해,
+같은 셀을 다시 찾을 때 상대 이동(TableRightCell, MoveDown 등)을 반복하지 않고
+SetPos 한 번으로 이동할 수 있게 합니다.
+
+주소(address)는 해시 가능한 값이면 무엇이든 됩니다.
+    ("cell", 표 번호, 행, 열)          표의 셀 (0부터)
+    ("label", 레이블, 순번, 방향)       레이블 옆 셀
+    ("path", (경로...), 방향)           경로로 찾은 셀
+    ("move", (시작 위치), 방향)         한 칸 이동 결과
+레이블과 경로 주소는 문서 텍스트로 찾은 위치이므로, 구조가 같아도 텍스트 세대가 바뀌면 버립니다. (sync_text)
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# 문서 텍스트(레이블 검색)로 찾은 주소 종류
+TEXT_ADDRESS_KINDS = ("label", "path", "path_label")
+
+
+class PositionCache:
+    """구조 세대 하나에 대한 주소 → 절대 위치 캐시"""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize: 보관할 최대 위치 수 (초과 시 가장 오래 사용하지 않은 위치부터 제거)
+        """
+        self.maxsize = maxsize
+        self.synced_key: Optional[Any] = None
+        self.synced_text_key: Optional[Any] = None
+        self._positions: "OrderedDict[Hashable, Tuple[int, int, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _sync(self, key: Any) -> None:
+        # 구조 세대가 바뀌면 이전 위치는 모두 버림
+        if key != self.synced_key:
+            self._positions.clear()
+            self.synced_key = key
+
+    def get(self, key: Any, address: Hashable) -> Optional[Tuple[int, int, int]]:
+        """
+        주소의 위치를 찾습니다.
+
+        Args:
+            key: 현재 구조 세대 키 (EditGenerationTracker.structure_key)
+            address: 셀 주소
+
+        Returns:
+            Optional[Tuple[int, int, int]]: (리스트 ID, 문단 번호, 글자 위치), 없으면 None
+        """
+        self._sync(key)
+        pos = self._positions.get(address)
+        if pos is None:
+            self.misses += 1
+            return None
+        self._positions.move_to_end(address)
+        self.hits += 1
+        return pos
+
+    def sync_text(self, text_key: Any) -> None:
+        """
+        텍스트 세대가 바뀌었으면 텍스트로 찾은 주소(TEXT_ADDRESS_KINDS)를 버립니다.
+        셀 값을 바꾸거나 문단을 넣으면 구조 세대는 그대로여도 레이블이 다른 곳에서 찾아질 수 있습니다.
+
+        Args:
+            text_key: 현재 텍스트 세대 키 (HwpController.get_edit_generation)
+        """
+        if text_key == self.synced_text_key:
+            return
+        stale = [address for address in self._positions
+                 if isinstance(address, tuple) and address and address[0] in TEXT_ADDRESS_KINDS]
+        for address in stale:
+            del self._positions[address]
+        self.synced_text_key = text_key
+
+    def record(self, key: Any, address: Hashable, pos: Any) -> None:
+        """방문한 주소의 위치를 기록합니다. (pos가 없으면 무시)"""
+        if not pos:
+            return
+        self._sync(key)
+        self._positions[address] = tuple(pos)
+        self._positions.move_to_end(address)
+        while len(self._positions) > self.maxsize:
+            self._positions.popitem(last=False)
+
+    def nearest_cell(self, key: Any, table_index: int, row: int, col: int) -> Optional[Tuple[int, int, Tuple[int, int, int]]]:
+        """
+        같은 표에서 목표 셀과 같은 열의 위쪽, 또는 같은 행의 왼쪽에 있는 가장 가까운 기록된 셀.
+        그 셀에서 아래/오른쪽으로만 이동하면 목표 셀에 닿습니다.
+
+        Returns:
+            Optional[Tuple[int, int, Tuple]]: (행, 열, 위치), 없으면 None
+        """
+        self._sync(key)
+        best = None
+        for address, pos in self._positions.items():
+            if len(address) != 4 or address[0] != "cell" or address[1] != table_index:
+                continue
+            r, c = address[2], address[3]
+            if (c == col and r <= row) or (r == row and c <= col):
+                distance = (row - r) + (col - c)
+                if best is None or distance < best[0]:
+                    best = (distance, r, c, pos)
+        return best[1:] if best else None
+
+    def invalidate(self) -> None:
+        """모든 위치를 버립니다."""
+        self._positions.clear()
+        self.synced_key = None
+        self.synced_text_key = None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def known_cells(self, key: Any, table_index: int) -> List[Tuple[int, int]]:
+        """같은 표에서 위치가 기록된 셀 (행, 열) 목록"""
+        self._sync(key)
+        return [
+            (address[2], address[3]) for address in self._positions
+            if len(address) == 4 and address[0] == "cell" and address[1] == table_index
+        ]
+
+
+def _simulate_visits(order: Sequence[Tuple[int, int]], known: Iterable[Tuple[int, int]]) -> int:
+    """
+    HwpController.goto_cell의 이동 규칙대로 order 순서로 셀을 방문할 때의 COM 이동 횟수를 셉니다.
+    기록된 셀은 SetPos 한 번, 처음 가는 셀은 같은 열 위쪽이나 같은 행 왼쪽의 가장 가까운 기록 셀
+    (없으면 표 첫 셀)에서 오른쪽/아래로 한 칸씩 이동하며, 지나간 셀은 모두 기록됩니다.
+    """
+    visited = set(known)
+    moves = 0
+    for row, col in order:
+        if (row, col) in visited:
+            moves += 1
+            continue
+        candidates = [(row - r, r, col) for r in range(row) if (r, col) in visited]
+        candidates += [(col - c, row, c) for c in range(col) if (row, c) in visited]
+        if candidates:
+            distance, start_row, start_col = min(candidates)
+            moves += 1 + distance
+        else:
+            start_row, start_col = 0, 0
+            moves += 1 + row + col
+            visited.add((0, 0))
+        for c in range(start_col + 1, col + 1):
+            visited.add((start_row, c))
+        for r in range(start_row + 1, row + 1):
+            visited.add((r, col))
+    return moves
+
+
+def plan_cell_order(
+    cells: Iterable[Tuple[int, int]],
+    known: Iterable[Tuple[int, int]] = ()
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    여러 셀을 방문할 순서를 정합니다. 행 순서와 열 순서로 방문할 때의 이동 횟수를 비교해
+    적은 쪽을 고릅니다. (같으면 행 순서)
+
+    Args:
+        cells: 방문할 (행, 열) 목록 (0부터)
+        known: 이미 위치가 기록된 셀 (행, 열) 목록
+
+    Returns:
+        Tuple[List[Tuple[int, int]], int]: (방문 순서, 예상 이동 횟수)
+    """
+    known = list(known)
+    row_major = sorted(set(cells))
+    column_major = sorted(row_major, key=lambda cell: (cell[1], cell[0]))
+    row_moves = _simulate_visits(row_major, known)
+    column_moves = _simulate_visits(column_major, known)
+    if column_moves < row_moves:
+        return column_major, column_moves
+    return row_major, row_moves
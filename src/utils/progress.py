@@ -0,0 +1,109 @@
+"""
+진행 상황 보고 및 협조적 취소 모듈
+오래 걸리는 작업이 COM 호출 사이사이에 진행 상황을 알리고 취소 요청을 확인할 수 있게 합니다.
+작업 스레드마다 현재 작업의 ProgressTracker를 스레드 로컬로 보관합니다.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+logger = logging.getLogger("hwp-progress")
+
+
+class OperationCancelled(BaseException):
+    """
+    클라이언트가 작업을 취소했을 때 발생하는 예외.
+    도구와 컨트롤러의 `except Exception` 처리에 삼켜지지 않도록 BaseException을 상속합니다.
+    """
+
+
+class ProgressTracker:
+    """작업 한 건의 진행 상황 보고와 취소 플래그"""
+
+    def __init__(
+        self,
+        report: Optional[Callable[[float, Optional[float], Optional[str]], None]] = None,
+        min_interval: float = 0.2
+    ):
+        """
+        Args:
+            report: 진행 상황을 전달할 콜백 (done, total, message)
+            min_interval: 보고 최소 간격(초). 마지막 단계는 항상 보고합니다.
+        """
+        self._report = report
+        self._cancelled = threading.Event()
+        self.min_interval = min_interval
+        self._last_report = None
+        self.done = 0
+        self.total = None
+
+    def cancel(self) -> None:
+        """취소를 요청합니다."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소가 요청되었는지 여부"""
+        return self._cancelled.is_set()
+
+    def check_cancelled(self) -> None:
+        """취소가 요청되었으면 OperationCancelled를 발생시킵니다."""
+        if self._cancelled.is_set():
+            raise OperationCancelled("작업이 취소되었습니다.")
+
+    def report(self, done: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        """진행 상황을 보고합니다. (min_interval보다 자주 호출되면 건너뜀)"""
+        self.done = done
+        self.total = total
+        if self._report is None:
+            return
+
+        now = time.monotonic()
+        finished = total is not None and done >= total
+        if not finished and self._last_report is not None and now - self._last_report < self.min_interval:
+            return
+        self._last_report = now
+
+        try:
+            self._report(done, total, message)
+        except Exception as e:
+            logger.debug(f"진행 상황 보고 실패 (무시): {e}")
+
+
+# 보고 대상이 없는 호출에서 사용하는 기본 추적기
+_NULL_TRACKER = ProgressTracker()
+_local = threading.local()
+
+
+def current_tracker() -> ProgressTracker:
+    """현재 스레드에서 실행 중인 작업의 추적기를 반환합니다."""
+    return getattr(_local, "tracker", None) or _NULL_TRACKER
+
+
+@contextmanager
+def use_tracker(tracker: ProgressTracker):
+    """with 블록 동안 현재 스레드의 추적기를 tracker로 지정합니다."""
+    previous = getattr(_local, "tracker", None)
+    _local.tracker = tracker
+    try:
+        yield tracker
+    finally:
+        _local.tracker = previous
+
+
+def report_progress(done: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+    """현재 작업의 진행 상황을 보고합니다."""
+    current_tracker().report(done, total, message)
+
+
+def check_cancelled() -> None:
+    """현재 작업이 취소되었으면 OperationCancelled를 발생시킵니다."""
+    current_tracker().check_cancelled()
+
+
+def cancel_requested() -> bool:
+    """현재 작업에 취소가 요청되었는지 여부"""
+    return current_tracker().cancelled
@@ -0,0 +1,191 @@
+"""
+여러 찾아 바꾸기 계획 모듈
+찾을 문자열 여러 개를 한 번에 바꿀 때, 문서에 없는 항목은 건너뛰고
+순서대로 AllReplace를 실행해도 "동시에 바꾼 결과"와 같아지도록 실행 순서를 정합니다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from src.utils.aho_corasick import AhoCorasick
+except ImportError:
+    from utils.aho_corasick import AhoCorasick
+
+# 순환 의존을 풀 때 쓰는 임시 치환 문자열의 구분자와 숫자 (유니코드 사용자 정의 영역)
+SENTINEL_OPEN = "\ue000"
+SENTINEL_CLOSE = "\ue001"
+SENTINEL_DIGIT_BASE = 0xE010
+
+
+def find_matches(text: str, keys: List[str], automaton: Optional[AhoCorasick] = None) -> List[Tuple[int, str]]:
+    """
+    동시에 바꿀 때 실제로 바뀌는 적중 위치를 구합니다.
+    왼쪽부터, 같은 위치에서는 긴 문자열을 우선하며 겹치는 적중은 버립니다.
+
+    Args:
+        text: 검색할 텍스트
+        keys: 찾을 문자열 목록
+        automaton: 여러 텍스트에 반복 사용할 때 미리 만든 keys의 오토마톤
+
+    Returns:
+        List[Tuple[int, str]]: (시작 위치, 찾을 문자열) 목록
+    """
+    automaton = automaton or AhoCorasick(keys)
+    candidates = sorted(automaton.finditer(text), key=lambda m: (m[0], -len(m[1])))
+    selected = []
+    end = 0
+    for start, key in candidates:
+        if start >= end:
+            selected.append((start, key))
+            end = start + len(key)
+    return selected
+
+
+def count_matches(text: str, keys: List[str]) -> Dict[str, int]:
+    """찾을 문자열별로 동시에 바꿀 때 바뀌는 횟수"""
+    counts = {key: 0 for key in keys if key}
+    for _, key in find_matches(text, list(counts)):
+        counts[key] += 1
+    return counts
+
+
+def apply_simultaneous(
+    text: str,
+    mapping: Dict[str, str],
+    automaton: Optional[AhoCorasick] = None
+) -> Tuple[str, Dict[str, int]]:
+    """
+    모든 항목을 한 번에 바꾼 결과와 항목별 횟수를 반환합니다. (바꾼 결과는 다시 검색하지 않음)
+    """
+    counts = {key: 0 for key in mapping if key}
+    parts = []
+    last = 0
+    for start, key in find_matches(text, list(counts), automaton):
+        parts.append(text[last:start])
+        parts.append(mapping[key])
+        counts[key] += 1
+        last = start + len(key)
+    parts.append(text[last:])
+    return "".join(parts), counts
+
+
+def _sentinel(n: int) -> str:
+    digits = []
+    while True:
+        digits.append(chr(SENTINEL_DIGIT_BASE + n % 16))
+        n //= 16
+        if not n:
+            break
+    return SENTINEL_OPEN + "".join(reversed(digits)) + SENTINEL_CLOSE
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """a의 끝부분이 b의 앞부분과 겹치는지 여부 ("ab"와 "bc")"""
+    return any(a.endswith(b[:n]) for n in range(1, min(len(a), len(b))))
+
+
+def _order(keys: List[str], before: Dict[str, set]) -> Tuple[List[str], set]:
+    """
+    before 관계를 지키는 실행 순서 (같은 단계에서는 긴 항목, 입력 순서 우선).
+
+    Returns:
+        (순서, 순환 의존 때문에 순서를 정하지 못한 항목)
+    """
+    order: List[str] = []
+    remaining = set(keys)
+    while remaining:
+        ready = [key for key in remaining if not (before[key] & remaining)]
+        if not ready:
+            break
+        ready.sort(key=lambda k: (-len(k), keys.index(k)))
+        order.extend(ready)
+        remaining.difference_update(ready)
+    return order, remaining
+
+
+def _run_steps(text: str, steps: List[Tuple[str, str]]) -> Tuple[str, List[int]]:
+    """
+    AllReplace를 차례로 실행한 결과를 흉내 냅니다. (단계마다 왼쪽부터 겹치지 않게 모두 바꿈)
+
+    Returns:
+        (결과 텍스트, 단계별 바꾼 횟수)
+    """
+    counts = []
+    for find, replace in steps:
+        counts.append(text.count(find))
+        text = text.replace(find, replace)
+    return text, counts
+
+
+def plan_replacements(mapping: Dict[str, str], text: str) -> Dict[str, object]:
+    """
+    문서 텍스트를 미리 검사해 AllReplace 실행 계획을 세웁니다.
+
+    - 문서에 없는 항목은 건너뜁니다.
+    - 다른 항목을 포함하는 긴 항목을 먼저 바꿉니다. ("성명란"을 "성명"보다 먼저)
+    - 끝부분이 다른 항목의 앞부분과 겹치는 항목을 먼저 바꿉니다. ("abc"에서 "ab"를 "bc"보다 먼저)
+    - 바꾼 값에 다른 항목이 들어 있으면 그 항목을 먼저 바꿉니다.
+    - 순환 의존(A→B, B→A)이 있으면 모든 항목을 임시 문자열로 바꾼 뒤 최종 값으로 바꿉니다.
+    - 세운 계획은 문서 텍스트에서 실행해 보고, 동시에 바꾼 결과와 다르면 ValueError를 냅니다.
+
+    Args:
+        mapping: {찾을 문자열: 바꿀 문자열}
+        text: 문서 텍스트
+
+    Returns:
+        Dict: {
+            "steps": [(찾을 문자열, 바꿀 문자열), ...] 실행 순서,
+            "counts": {찾을 문자열: 바뀔 횟수} (문서에 있는 항목, 계획대로 실행할 때의 횟수),
+            "skipped": [문서에 없는 항목],
+            "uses_sentinels": 임시 문자열 사용 여부,
+        }
+
+    Raises:
+        ValueError: 서로 겹치는 항목(예: "ab"와 "ba") 때문에 AllReplace 순서로는 동시에 바꾼 결과를 만들 수 없는 경우
+    """
+    mapping = {key: "" if value is None else str(value) for key, value in mapping.items() if key}
+    counts = count_matches(text, list(mapping))
+    present = [key for key in mapping if counts.get(key)]
+    skipped = [key for key in mapping if not counts.get(key)]
+
+    # 항목 a보다 먼저 실행해야 하는 항목들 (찾는 위치가 겹치는 관계와, 바꾼 값에 의한 관계)
+    match_before: Dict[str, set] = {key: set() for key in present}
+    before: Dict[str, set] = {key: set() for key in present}
+    for a in present:
+        for b in present:
+            if a == b:
+                continue
+            if a in b:
+                match_before[a].add(b)    # b가 a를 포함 → b 먼저
+            elif _overlaps(b, a):
+                match_before[a].add(b)    # b의 끝이 a의 앞과 겹침 → 왼쪽에서 먼저 찾히는 b 먼저
+            if b in mapping[a]:
+                before[a].add(b)          # a의 결과에 b가 들어감 → b 먼저
+        before[a] |= match_before[a]
+
+    order, remaining = _order(present, before)
+    steps = [(key, mapping[key]) for key in order]
+
+    uses_sentinels = bool(remaining)
+    if uses_sentinels:
+        reserved = "".join(present) + "".join(mapping[k] for k in present) + text
+        if SENTINEL_OPEN in reserved or SENTINEL_CLOSE in reserved:
+            raise ValueError("Replacement cycle cannot be resolved: text already contains reserved characters")
+        # 임시 문자열에는 항목이 들어 있지 않으므로 찾는 위치의 관계만 지키면 됨
+        ordered, cyclic = _order(present, match_before)
+        ordered += sorted(cyclic, key=lambda k: (-len(k), present.index(k)))
+        sentinels = {key: _sentinel(i) for i, key in enumerate(ordered)}
+        steps = [(key, sentinels[key]) for key in ordered]
+        steps += [(sentinels[key], mapping[key]) for key in ordered]
+
+    result, step_counts = _run_steps(text, steps)
+    if result != apply_simultaneous(text, mapping)[0]:
+        raise ValueError(
+            "Overlapping keys cannot be replaced in sequence without changing the result: "
+            + ", ".join(repr(key) for key in present if match_before[key])
+            + " (replace them in separate calls)"
+        )
+    actual = dict(zip((find for find, _ in steps), step_counts))
+    counts = {key: actual[key] for key in present}
+
+    return {"steps": steps, "counts": counts, "skipped": skipped, "uses_sentinels": uses_sentinels}
@@ -0,0 +1,106 @@
+"""
+도구 결과 캐시 모듈
+재시도된 요청이 같은 결과를 즉시 받을 수 있도록 완료된 결과를 크기 제한이 있는 LRU에 보관합니다.
+읽기 전용 도구의 결과도 다음 변경 전까지 같은 방식으로 보관합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+
+class LRUResultCache:
+    """크기 제한이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Args:
+            maxsize: 보관할 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        캐시된 값을 찾습니다.
+
+        Returns:
+            Tuple[bool, Any]: (찾았는지 여부, 값)
+        """
+        with self._lock:
+            if key not in self._items:
+                return False, None
+            self._items.move_to_end(key)
+            return True, self._items[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """값을 저장합니다."""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+
+class ToolResultCache(LRUResultCache):
+    """
+    읽기 전용 도구 결과 캐시.
+    변경 도구가 실행될 때마다 올라가는 변경 카운터와 적중/실패 통계를 함께 관리합니다.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__(maxsize)
+        self.change_counter = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """get()과 같지만 적중/실패 횟수를 기록합니다."""
+        found, value = self.get(key)
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return found, value
+
+    def invalidate(self) -> None:
+        """변경 카운터를 올리고 모든 항목을 제거합니다."""
+        with self._lock:
+            self.change_counter += 1
+            self.invalidations += 1
+            self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패 통계를 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "change_counter": self.change_counter,
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+            }
+
+    def reset_stats(self) -> None:
+        """적중/실패 통계를 0으로 되돌립니다."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
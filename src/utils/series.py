@@ -0,0 +1,237 @@
+"""
+연속 값(series) 생성 모듈
+표의 행/열에 채울 숫자, 날짜, 한글 순서 표시(가나다, 첫째/둘째, ①②③), 사용자 목록 등의
+값 목록을 Python에서 한 번에 만들고, 셀 블록에 한 번에 붙여넣을 수 있는 형식으로 바꿉니다.
+"""
+
+import calendar
+import datetime
+import decimal
+import html
+import re
+from typing import Any, List, Optional, Sequence
+
+GENERATORS = ("number", "date", "ganada", "korean_ordinal", "circled", "list", "template")
+
+# 가나다 순서의 첫소리 (ㄱ ㄴ ㄷ ㄹ ㅁ ㅂ ㅅ ㅇ ㅈ ㅊ ㅋ ㅌ ㅍ ㅎ)와 14개마다 바꾸는 모음 (ㅏ ㅓ ㅗ ㅜ ㅡ ㅣ)
+GANADA_INITIALS = (0, 2, 3, 5, 6, 7, 9, 11, 12, 14, 15, 16, 17, 18)
+GANADA_VOWELS = (0, 4, 8, 13, 18, 20)
+
+ORDINAL_UNITS = ("", "첫", "둘", "셋", "넷", "다섯", "여섯", "일곱", "여덟", "아홉")
+ORDINAL_COMPOUND_UNITS = ("", "한", "두", "셋", "넷", "다섯", "여섯", "일곱", "여덟", "아홉")
+ORDINAL_TENS = ("", "열", "스물", "서른", "마흔", "쉰", "예순", "일흔", "여든", "아흔")
+
+DATE_STEP_PATTERN = re.compile(r"^\s*(-?\d+)\s*([dwmy]?)\s*$", re.IGNORECASE)
+
+
+def ganada(n: int) -> str:
+    """n번째(1부터) 가나다 순서 표시 (가, 나, ..., 하, 거, 너, ...)"""
+    if n < 1:
+        raise ValueError(f"ganada index must be >= 1: {n}")
+    index = n - 1
+    initial = GANADA_INITIALS[index % len(GANADA_INITIALS)]
+    vowel = GANADA_VOWELS[(index // len(GANADA_INITIALS)) % len(GANADA_VOWELS)]
+    return chr(0xAC00 + (initial * 21 + vowel) * 28)
+
+
+def korean_ordinal(n: int) -> str:
+    """n번째(1부터) 고유어 서수 (첫째, 둘째, ..., 열한째, 스무째, ...). 100 이상은 "100번째" """
+    if n < 1:
+        raise ValueError(f"ordinal must be >= 1: {n}")
+    if n >= 100:
+        return f"{n}번째"
+    tens, units = divmod(n, 10)
+    if tens == 0:
+        return ORDINAL_UNITS[units] + "째"
+    if units == 0:
+        return ("스무" if tens == 2 else ORDINAL_TENS[tens]) + "째"
+    return ORDINAL_TENS[tens] + ORDINAL_COMPOUND_UNITS[units] + "째"
+
+
+def circled(n: int) -> str:
+    """원 숫자 (①~㊿), 범위를 넘으면 "(n)" """
+    if 1 <= n <= 20:
+        return chr(0x2460 + n - 1)
+    if 21 <= n <= 35:
+        return chr(0x3251 + n - 21)
+    if 36 <= n <= 50:
+        return chr(0x32B1 + n - 36)
+    return f"({n})"
+
+
+def _parse_number(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).replace(",", "").strip()
+    return float(text) if any(ch in text for ch in ".eE") else int(text)
+
+
+def _decimal_places(value: Any) -> int:
+    """숫자 표기의 소수 자릿수 ("0.25" → 2, "1e-3" → 3, 정수는 0)"""
+    try:
+        exponent = decimal.Decimal(str(value).replace(",", "").strip()).as_tuple().exponent
+    except decimal.InvalidOperation:
+        return 0
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def _format_value(value: Any, fmt: Optional[str]) -> str:
+    if not fmt:
+        return str(value)
+    if "{" in fmt:
+        return fmt.format(value)
+    return format(value, fmt)
+
+
+def _parse_date(value: Any) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    text = re.sub(r"[./]", "-", str(value).strip())
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """months개월 뒤의 날짜 (말일을 넘으면 그 달의 말일)"""
+    month_index = date.year * 12 + date.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(date.day, calendar.monthrange(year, month + 1)[1])
+    return datetime.date(year, month + 1, day)
+
+
+def _date_series(start: Any, step: Any, count: int, fmt: Optional[str]) -> List[str]:
+    first = _parse_date(start)
+    match = DATE_STEP_PATTERN.match(str(step))
+    if not match:
+        raise ValueError(f"Invalid date step: {step!r} (use e.g. 1, '7d', '1w', '1m', '1y')")
+    amount, unit = int(match.group(1)), (match.group(2) or "d").lower()
+    fmt = fmt or "%Y-%m-%d"
+
+    values = []
+    for i in range(count):
+        if unit == "d":
+            date = first + datetime.timedelta(days=amount * i)
+        elif unit == "w":
+            date = first + datetime.timedelta(weeks=amount * i)
+        elif unit == "m":
+            # 매번 시작일에서 계산해 말일 보정이 누적되지 않도록 함 (1/31 → 2/29 → 3/31)
+            date = add_months(first, amount * i)
+        else:
+            date = add_months(first, 12 * amount * i)
+        values.append(date.strftime(fmt))
+    return values
+
+
+def generate_series(
+    generator: str = "number",
+    start: Any = 1,
+    step: Any = 1,
+    count: int = 10,
+    fmt: Optional[str] = None,
+    values: Optional[Sequence[Any]] = None
+) -> List[str]:
+    """
+    표에 채울 값 목록을 만듭니다.
+
+    Args:
+        generator: 생성 방식
+            - "number": start부터 step씩 증가하는 수 (fmt: 형식 지정자 "03d", ",.1f" 또는 "{}번")
+            - "date": start 날짜(YYYY-MM-DD)부터 step 간격 (정수=일, "1w", "1m", "1y"), fmt는 strftime 형식
+            - "ganada": 가, 나, 다, ... (start번째부터)
+            - "korean_ordinal": 첫째, 둘째, 셋째, ...
+            - "circled": ①, ②, ③, ...
+            - "list": values를 start번째부터 step씩 건너뛰며 반복
+            - "template": fmt의 {n}에 start부터 step씩 증가하는 수를 넣은 문자열 (예: "제{n}조", "=A{n}*B{n}")
+        start: 시작 값
+        step: 증가 폭
+        count: 값 개수
+        fmt: 형식
+        values: "list"에서 사용할 사용자 목록
+
+    Returns:
+        List[str]: 값 목록
+
+    Raises:
+        ValueError: 알 수 없는 생성 방식이나 잘못된 인자
+    """
+    if count < 0:
+        raise ValueError(f"count must be >= 0: {count}")
+    generator = (generator or "number").lower()
+
+    if generator == "number":
+        first, delta = _parse_number(start), _parse_number(step)
+        if isinstance(first, float) or isinstance(delta, float):
+            # 부동소수점 오차(0.1 * 3 = 0.30000000000000004)가 셀에 들어가지 않도록 시작/증가 값의 자릿수로 반올림
+            places = max(_decimal_places(start), _decimal_places(step))
+            return [_format_value(round(first + delta * i, places), fmt) for i in range(count)]
+        return [_format_value(first + delta * i, fmt) for i in range(count)]
+    if generator == "date":
+        return _date_series(start, step, count, fmt)
+    if generator == "list":
+        if not values:
+            raise ValueError("generator 'list' requires values")
+        first, delta = int(start) - 1, int(step)
+        return [_format_value(values[(first + delta * i) % len(values)], fmt) for i in range(count)]
+
+    numbers = [int(start) + int(step) * i for i in range(count)]
+    if generator == "ganada":
+        return [ganada(n) for n in numbers]
+    if generator == "korean_ordinal":
+        return [korean_ordinal(n) for n in numbers]
+    if generator == "circled":
+        return [circled(n) for n in numbers]
+    if generator == "template":
+        if not fmt or "{n" not in fmt:
+            raise ValueError("generator 'template' requires a format containing {n}")
+        return [fmt.format(n=n) for n in numbers]
+    raise ValueError(f"Unknown generator: {generator!r} (use one of {', '.join(GENERATORS)})")
+
+
+def to_html_table(values: Sequence[str], axis: str = "column") -> str:
+    """
+    값 목록을 셀 블록에 붙여넣을 HTML 표로 바꿉니다. (column: 한 열, row: 한 행)
+    """
+    cells = [f"<td>{html.escape(str(value))}</td>" for value in values]
+    if axis == "row":
+        rows = ["<tr>" + "".join(cells) + "</tr>"]
+    else:
+        rows = [f"<tr>{cell}</tr>" for cell in cells]
+    return "<table>" + "".join(rows) + "</table>"
+
+
+def rows_to_html_table(rows: Sequence[Sequence[str]], width: int, bold_first: bool = False) -> str:
+    """
+    행 목록을 셀 블록에 붙여넣을 HTML 표로 바꿉니다. 짧은 행은 빈 셀로 채우고 width열을 넘는 값은 버립니다.
+
+    Args:
+        rows: 행 목록
+        width: 열 수
+        bold_first: 첫 행을 굵게 할지 여부 (머리글)
+    """
+    html_rows = []
+    for i, row in enumerate(rows):
+        values = [html.escape(str(value)) for value in list(row)[:width]]
+        values += [""] * (width - len(values))
+        if bold_first and i == 0:
+            values = [f"<b>{value}</b>" if value else value for value in values]
+        html_rows.append("<tr>" + "".join(f"<td>{value}</td>" for value in values) + "</tr>")
+    return "<table>" + "".join(html_rows) + "</table>"
+
+
+def cf_html(fragment: str) -> bytes:
+    """
+    HTML 조각을 Windows 클립보드 "HTML Format" 데이터(헤더의 바이트 오프셋 포함)로 만듭니다.
+    """
+    header = (
+        "Version:0.9\r\n"
+        "StartHTML:{0:010d}\r\nEndHTML:{1:010d}\r\n"
+        "StartFragment:{2:010d}\r\nEndFragment:{3:010d}\r\n"
+    )
+    prefix = "<html><body><!--StartFragment-->"
+    suffix = "<!--EndFragment--></body></html>"
+    header_length = len(header.format(0, 0, 0, 0).encode("utf-8"))
+    start_fragment = header_length + len(prefix.encode("utf-8"))
+    end_fragment = start_fragment + len(fragment.encode("utf-8"))
+    end_html = end_fragment + len(suffix.encode("utf-8"))
+    return (header.format(header_length, end_html, start_fragment, end_fragment) + prefix + fragment + suffix).encode("utf-8")
@@ -0,0 +1,138 @@
+"""
+HWP 세션 저널 모듈
+열린 문서 경로, 현재 탭, 마지막 커서 위치, 자동 저장 파일을 기록하여
+HWP 연결이 끊어진 뒤 재연결할 때 작업 상태를 복원할 수 있게 합니다.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("hwp-session-journal")
+
+
+class SessionJournal:
+    """열린 문서와 커서 상태를 가볍게 기록하는 세션 저널"""
+
+    def __init__(self, journal_dir: Optional[str] = None, autosave_interval: float = 120.0):
+        """
+        Args:
+            journal_dir: 저널 파일과 자동 저장 파일을 둘 디렉터리 (기본값: 임시 디렉터리/hwp-mcp)
+            autosave_interval: 문서 목록 갱신 및 자동 저장 주기(초)
+        """
+        self.journal_dir = journal_dir or os.path.join(tempfile.gettempdir(), "hwp-mcp")
+        self.autosave_interval = autosave_interval
+        self.documents: List[Dict[str, Any]] = []
+        self.current_index: Optional[int] = None
+        self.last_pos: Optional[List[int]] = None
+        self.last_checkpoint = 0.0
+        self.session_stamp = int(time.time())
+
+    @property
+    def journal_path(self) -> str:
+        """저널 파일 경로"""
+        return os.path.join(self.journal_dir, "session.json")
+
+    @property
+    def autosave_dir(self) -> str:
+        """자동 저장 파일 디렉터리"""
+        return os.path.join(self.journal_dir, "autosave")
+
+    def autosave_path(self, index: int, source_path: Optional[str] = None, doc_id: Optional[Any] = None) -> str:
+        """
+        문서 사본(HWPML)의 자동 저장 경로. 같은 문서는 체크포인트마다 같은 파일에 덮어씁니다.
+
+        Args:
+            index: 문서 인덱스
+            source_path: 저장된 문서의 파일 경로 (새 문서면 None)
+            doc_id: 새 문서를 구분할 문서 ID (없으면 index)
+        """
+        if source_path:
+            stem = os.path.splitext(os.path.basename(source_path))[0]
+            key = zlib.crc32(os.path.normcase(os.path.abspath(source_path)).encode("utf-8"))
+            return os.path.join(self.autosave_dir, f"{stem}_{key:08x}.hml")
+        key = index if doc_id is None else doc_id
+        return os.path.join(self.autosave_dir, f"untitled_{self.session_stamp}_{key}.hml")
+
+    def is_autosave_path(self, path: str) -> bool:
+        """자동 저장 디렉터리 안의 파일인지 여부"""
+        if not path:
+            return False
+        autosave_dir = os.path.normcase(os.path.abspath(self.autosave_dir))
+        return os.path.normcase(os.path.abspath(path)).startswith(autosave_dir + os.sep)
+
+    def record_position(self, pos) -> None:
+        """마지막 커서 위치(GetPos 결과)를 기록합니다."""
+        if pos:
+            self.last_pos = [int(value) for value in pos]
+
+    def record_documents(self, documents: List[Dict[str, Any]], current_index: Optional[int]) -> None:
+        """
+        열린 문서 목록을 기록합니다.
+
+        Args:
+            documents: {"index": int, "path": str, "autosave": bool, "recovery": Optional[str]} 목록
+                (recovery는 저장된 문서의 저장하지 않은 변경 사항 사본)
+            current_index: 현재 활성 문서 인덱스
+        """
+        self.documents = [dict(doc) for doc in documents]
+        self.current_index = current_index
+
+    def checkpoint_due(self, now: Optional[float] = None) -> bool:
+        """문서 목록 갱신/자동 저장 주기가 되었는지 여부"""
+        now = time.monotonic() if now is None else now
+        return now - self.last_checkpoint >= self.autosave_interval
+
+    def mark_checkpoint(self, now: Optional[float] = None) -> None:
+        """체크포인트 시각을 기록합니다."""
+        self.last_checkpoint = time.monotonic() if now is None else now
+
+    def snapshot(self) -> Dict[str, Any]:
+        """저널 내용을 딕셔너리로 반환합니다."""
+        return {
+            "documents": self.documents,
+            "current_index": self.current_index,
+            "last_pos": self.last_pos,
+            "saved_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+    def restorable_documents(self) -> List[Dict[str, Any]]:
+        """다시 열 수 있는(파일이 존재하는) 문서 목록을 반환합니다."""
+        return [doc for doc in self.documents if doc.get("path") and os.path.exists(doc["path"])]
+
+    def save(self) -> bool:
+        """저널을 파일에 기록합니다. (임시 파일에 쓴 뒤 교체)"""
+        try:
+            os.makedirs(self.journal_dir, exist_ok=True)
+            tmp_path = self.journal_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.journal_path)
+            return True
+        except Exception as e:
+            logger.warning(f"세션 저널 저장 실패: {e}")
+            return False
+
+    def load(self) -> bool:
+        """파일에서 저널을 읽습니다."""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.documents = data.get("documents", [])
+            self.current_index = data.get("current_index")
+            self.last_pos = data.get("last_pos")
+            return True
+        except Exception as e:
+            logger.debug(f"세션 저널 읽기 실패: {e}")
+            return False
+
+    def clear(self) -> None:
+        """기록된 세션을 비웁니다."""
+        self.documents = []
+        self.current_index = None
+        self.last_pos = None
+        self.last_checkpoint = 0.0
@@ -0,0 +1,467 @@
+"""
+표 계산 모듈
+한 번에 읽은 표 데이터(행×열 텍스트 배열)를 Python에서 정렬, 필터, 집계, 그룹별 집계하고
+합계 행을 만듭니다. "1,234원", "₩5,000", "(1,200)", "△300", "12.5%", "1억 2천만" 같은
+한국식 숫자 표기를 읽고, 계산 결과는 같은 열의 표기(쉼표, 단위, 소수 자릿수)로 다시 씁니다.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+OPERATIONS = ("sort", "filter", "aggregate", "group_by", "totals")
+AGGREGATES = ("sum", "avg", "min", "max", "count")
+FILTER_OPS = ("==", "!=", ">", ">=", "<", "<=", "contains", "startswith", "endswith", "empty", "not_empty")
+
+# 큰 단위(조, 억, 만)는 구간을 나누고, 작은 단위(천, 백)는 구간 안에서 곱함
+BIG_UNITS = {"조": 10 ** 12, "억": 10 ** 8, "만": 10 ** 4}
+SMALL_UNITS = {"천": 10 ** 3, "백": 10 ** 2}
+
+NUMBER_PATTERN = re.compile(
+    r"^(?P<sign>[-−△▲]?)\s*(?P<open>\()?\s*(?P<prefix>[₩￦$]?)\s*"
+    r"(?P<body>[\d.,\s조억만천백]*\d[\d.,\s조억만천백]*?)\s*"
+    r"(?P<suffix>원|%|개|명|건|회|점|장|권|대|배)?\s*(?P<close>\))?$"
+)
+UNIT_TOKEN_PATTERN = re.compile(r"(\d+(?:\.\d+)?)|([천백])|([조억만])")
+SINGLE_UNIT_PATTERN = re.compile(r"^\d+(?:\.\d+)?([조억만천백])$")
+
+
+def _parse_units(body: str) -> Optional[float]:
+    """"1억2천만", "1234천" 같은 단위 표기를 수로 바꿉니다. (읽을 수 없으면 None)"""
+    total, section, current, consumed = 0.0, 0.0, None, 0
+    for match in UNIT_TOKEN_PATTERN.finditer(body):
+        if match.start() != consumed:
+            return None
+        consumed = match.end()
+        digits, small, big = match.groups()
+        if digits is not None:
+            if current is not None:
+                return None
+            current = float(digits)
+        elif small is not None:
+            section += (1 if current is None else current) * SMALL_UNITS[small]
+            current = None
+        else:
+            section += current or 0
+            total += (section or 1) * BIG_UNITS[big]
+            section, current = 0.0, None
+    if consumed != len(body):
+        return None
+    return total + section + (current or 0)
+
+
+def _match_number(text: Any):
+    if text is None:
+        return None
+    match = NUMBER_PATTERN.match(str(text).strip())
+    if not match or bool(match.group("open")) != bool(match.group("close")):
+        return None
+    return match
+
+
+def parse_number(text: Any) -> Optional[float]:
+    """
+    셀 텍스트를 수로 읽습니다.
+
+    Args:
+        text: 셀 텍스트 (예: "1,234원", "-5", "(1,200)", "△300", "12.5%", "3만", "1억 2천만")
+
+    Returns:
+        Optional[float]: 수 (숫자가 아니면 None). "%"는 그대로의 값(12.5%는 12.5)입니다.
+    """
+    if isinstance(text, bool):
+        return None
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = _match_number(text)
+    if not match:
+        return None
+    body = re.sub(r"[,\s]", "", match.group("body"))
+    if re.fullmatch(r"\d+(?:\.\d+)?", body):
+        value = float(body)
+    else:
+        value = _parse_units(body)
+        if value is None:
+            return None
+    negative = match.group("sign") != "" or match.group("open") is not None
+    return -value if negative else value
+
+
+def number_style(text: Any) -> Optional[Dict[str, Any]]:
+    """
+    숫자 텍스트의 표기 방식을 구합니다.
+
+    Returns:
+        Optional[Dict]: {"comma", "prefix", "suffix", "unit", "decimals", "negative"} (숫자가 아니면 None)
+    """
+    match = _match_number(text)
+    if not match or parse_number(text) is None:
+        return None
+    body = re.sub(r"\s", "", match.group("body"))
+    unit_match = SINGLE_UNIT_PATTERN.match(body.replace(",", ""))
+    digits = body.replace(",", "")
+    decimals = len(digits.split(".", 1)[1].rstrip("조억만천백")) if "." in digits else 0
+    if match.group("open"):
+        negative = "()"
+    elif match.group("sign") in ("△", "▲"):
+        negative = match.group("sign")
+    else:
+        negative = "-"
+    return {
+        "comma": "," in body,
+        "prefix": match.group("prefix"),
+        "suffix": match.group("suffix") or "",
+        "unit": unit_match.group(1) if unit_match else "",
+        "decimals": decimals,
+        "negative": negative,
+    }
+
+
+def column_style(texts: Sequence[Any]) -> Dict[str, Any]:
+    """
+    한 열의 숫자 텍스트들에서 공통 표기 방식을 구합니다.
+    쉼표는 하나라도 쓰면 사용, 소수 자릿수는 가장 긴 것, 단위(천, 만 등)는 모든 값이 같을 때만 사용합니다.
+    """
+    styles = [style for style in (number_style(text) for text in texts) if style]
+    if not styles:
+        return {"comma": False, "prefix": "", "suffix": "", "unit": "", "decimals": 0, "negative": "-"}
+
+    def most_common(field):
+        values = [style[field] for style in styles]
+        return max(set(values), key=values.count)
+
+    units = {style["unit"] for style in styles}
+    negatives = [style["negative"] for style in styles if style["negative"] != "-"]
+    return {
+        "comma": any(style["comma"] for style in styles),
+        "prefix": most_common("prefix"),
+        "suffix": most_common("suffix"),
+        "unit": units.pop() if len(units) == 1 else "",
+        "decimals": max(style["decimals"] for style in styles),
+        "negative": negatives[0] if negatives else "-",
+    }
+
+
+def format_number(value: float, style: Optional[Dict[str, Any]] = None, decimals: Optional[int] = None) -> str:
+    """
+    수를 표기 방식에 맞는 텍스트로 바꿉니다.
+
+    Args:
+        value: 수
+        style: number_style/column_style 결과 (없으면 쉼표 없는 일반 숫자)
+        decimals: 소수 자릿수 (없으면 style의 자릿수)
+    """
+    style = style or {}
+    unit = style.get("unit", "")
+    scale = BIG_UNITS.get(unit) or SMALL_UNITS.get(unit) or 1
+    places = style.get("decimals", 0) if decimals is None else decimals
+    amount = abs(value) / scale
+    body = f"{amount:,.{places}f}" if style.get("comma") else f"{amount:.{places}f}"
+    text = style.get("prefix", "") + body + unit + style.get("suffix", "")
+    if value >= 0 or float(body.replace(",", "")) == 0:
+        return text
+    negative = style.get("negative", "-")
+    return f"({text})" if negative == "()" else negative + text
+
+
+def _natural_key(text: str):
+    # "2월"이 "10월"보다 앞에 오도록 숫자 부분은 수로 비교
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part.lower())
+            for part in re.split(r"(\d+)", text) if part]
+
+
+def _is_empty(text: Any) -> bool:
+    return text is None or str(text).strip() in ("", "(빈 셀)")
+
+
+def _body(matrix: Sequence[Sequence[str]], header_rows: int) -> List[List[str]]:
+    return [list(row) for row in matrix[header_rows:]]
+
+
+def _cell(row: Sequence[str], column: int) -> str:
+    return row[column] if column < len(row) else ""
+
+
+def _check_column(matrix: Sequence[Sequence[str]], column: int) -> None:
+    width = max((len(row) for row in matrix), default=0)
+    if not 0 <= column < width:
+        raise ValueError(f"column {column + 1} is out of range (table has {width} columns)")
+
+
+def is_numeric_column(values: Sequence[Any]) -> bool:
+    """빈 값을 뺀 모든 값이 수로 읽히는지 여부 (값이 하나도 없으면 False)"""
+    present = [value for value in values if not _is_empty(value)]
+    return bool(present) and all(parse_number(value) is not None for value in present)
+
+
+def column_values(matrix: Sequence[Sequence[str]], column: int, header_rows: int = 1) -> List[str]:
+    """머리글 행을 뺀 한 열의 값 목록"""
+    return [_cell(row, column) for row in matrix[header_rows:]]
+
+
+def sort_rows(
+    matrix: Sequence[Sequence[str]],
+    column: int,
+    descending: bool = False,
+    header_rows: int = 1,
+    numeric: Optional[bool] = None
+) -> List[List[str]]:
+    """
+    머리글 행을 두고 본문 행을 한 열 기준으로 정렬합니다. (같은 값은 원래 순서 유지, 빈 값은 맨 뒤)
+
+    Args:
+        matrix: 행×열 텍스트 배열
+        column: 기준 열 (0부터)
+        descending: 내림차순 여부
+        header_rows: 정렬하지 않을 머리글 행 수
+        numeric: 수로 비교할지 여부 (없으면 열의 모든 값이 수일 때 수로 비교, 아니면 자연 순서)
+
+    Returns:
+        List[List[str]]: 정렬된 새 배열
+    """
+    _check_column(matrix, column)
+    body = _body(matrix, header_rows)
+    if numeric is None:
+        numeric = is_numeric_column(_cell(row, column) for row in body)
+
+    present = [row for row in body if not _is_empty(_cell(row, column))]
+    empty = [row for row in body if _is_empty(_cell(row, column))]
+    if numeric:
+        def key(row):
+            value = parse_number(_cell(row, column))
+            return (0, value, "") if value is not None else (1, 0, _cell(row, column))
+    else:
+        def key(row):
+            return _natural_key(_cell(row, column).strip())
+    present.sort(key=key, reverse=descending)
+    return [list(row) for row in matrix[:header_rows]] + present + empty
+
+
+def _matcher(op: str, value: Any) -> Callable[[str], bool]:
+    op = (op or "==").lower()
+    if op not in FILTER_OPS:
+        raise ValueError(f"Unknown filter op: {op!r} (use one of {', '.join(FILTER_OPS)})")
+    if op == "empty":
+        return _is_empty
+    if op == "not_empty":
+        return lambda text: not _is_empty(text)
+    target = "" if value is None else str(value).strip()
+    if op == "contains":
+        return lambda text: target in str(text)
+    if op == "startswith":
+        return lambda text: str(text).strip().startswith(target)
+    if op == "endswith":
+        return lambda text: str(text).strip().endswith(target)
+
+    target_number = parse_number(value)
+    compare = {
+        "==": lambda a, b: a == b, "!=": lambda a, b: a != b,
+        ">": lambda a, b: a > b, ">=": lambda a, b: a >= b,
+        "<": lambda a, b: a < b, "<=": lambda a, b: a <= b,
+    }[op]
+
+    def match(text):
+        number = parse_number(text)
+        if target_number is not None and number is not None:
+            return compare(number, target_number)
+        if op in ("==", "!="):
+            return compare(str(text).strip(), target)
+        # 크기 비교는 수끼리만 (수가 아닌 값은 조건을 만족하지 않음)
+        return False
+    return match
+
+
+def filter_rows(
+    matrix: Sequence[Sequence[str]],
+    column: int,
+    op: str = "==",
+    value: Any = None,
+    header_rows: int = 1
+) -> List[List[str]]:
+    """
+    조건을 만족하는 본문 행만 남깁니다.
+
+    Args:
+        matrix: 행×열 텍스트 배열
+        column: 조건을 볼 열 (0부터)
+        op: "==", "!=", ">", ">=", "<", "<=" (둘 다 수이면 수로 비교), "contains", "startswith",
+            "endswith", "empty", "not_empty"
+        value: 비교할 값
+        header_rows: 항상 남길 머리글 행 수
+
+    Returns:
+        List[List[str]]: 머리글 행 + 남은 행
+    """
+    _check_column(matrix, column)
+    match = _matcher(op, value)
+    kept = [row for row in _body(matrix, header_rows) if match(_cell(row, column))]
+    return [list(row) for row in matrix[:header_rows]] + kept
+
+
+def aggregate_values(values: Sequence[Any], func: str = "sum") -> Optional[float]:
+    """
+    값 목록을 집계합니다. 수로 읽히지 않는 값은 건너뜁니다.
+
+    Args:
+        values: 셀 텍스트 목록
+        func: "sum", "avg", "min", "max", "count"(빈 값이 아닌 셀 수)
+
+    Returns:
+        Optional[float]: 집계 값 (수가 하나도 없으면 sum/count는 0, 나머지는 None)
+    """
+    func = (func or "sum").lower()
+    if func not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate: {func!r} (use one of {', '.join(AGGREGATES)})")
+    if func == "count":
+        return float(sum(1 for value in values if not _is_empty(value)))
+    numbers = [number for number in (parse_number(value) for value in values) if number is not None]
+    if func == "sum":
+        return float(sum(numbers))
+    if not numbers:
+        return None
+    if func == "avg":
+        return sum(numbers) / len(numbers)
+    return min(numbers) if func == "min" else max(numbers)
+
+
+def format_aggregate(value: Optional[float], func: str, values: Sequence[Any], decimals: Optional[int] = None) -> str:
+    """
+    집계 값을 열의 표기 방식으로 바꿉니다. count는 일반 정수, avg는 열의 자릿수로
+    나타낼 수 없으면 소수 둘째 자리까지 씁니다.
+    """
+    if value is None:
+        return ""
+    if func == "count":
+        return str(int(value))
+    style = column_style(values)
+    if decimals is None and func == "avg":
+        scale = BIG_UNITS.get(style["unit"]) or SMALL_UNITS.get(style["unit"]) or 1
+        scaled = value / scale
+        if abs(scaled - round(scaled, style["decimals"])) > 1e-9:
+            decimals = max(style["decimals"], 2)
+    return format_number(value, style, decimals)
+
+
+def group_by(
+    matrix: Sequence[Sequence[str]],
+    key_column: int,
+    value_column: Optional[int] = None,
+    func: str = "sum",
+    header_rows: int = 1,
+    decimals: Optional[int] = None
+) -> List[List[str]]:
+    """
+    한 열의 값별로 다른 열을 집계합니다. (그룹은 처음 나온 순서)
+
+    Args:
+        matrix: 행×열 텍스트 배열
+        key_column: 묶을 기준 열 (0부터)
+        value_column: 집계할 열 (없으면 그룹별 행 수)
+        func: 집계 방식
+        header_rows: 머리글 행 수
+        decimals: 소수 자릿수
+
+    Returns:
+        List[List[str]]: [[그룹 값, 집계 텍스트], ...]
+    """
+    _check_column(matrix, key_column)
+    if value_column is None:
+        func, value_column = "count", key_column
+    _check_column(matrix, value_column)
+    groups: Dict[str, List[str]] = {}
+    for row in _body(matrix, header_rows):
+        groups.setdefault(_cell(row, key_column).strip(), []).append(_cell(row, value_column))
+    all_values = column_values(matrix, value_column, header_rows)
+    return [
+        [key, format_aggregate(aggregate_values(values, func), func, all_values, decimals)]
+        for key, values in groups.items()
+    ]
+
+
+def totals_row(
+    matrix: Sequence[Sequence[str]],
+    columns: Optional[Sequence[int]] = None,
+    func: str = "sum",
+    label: str = "합계",
+    label_column: int = 0,
+    header_rows: int = 1,
+    decimals: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    합계(또는 평균 등) 행을 만듭니다. 마지막 행의 레이블 열이 이미 label이면 그 행은
+    계산에서 빼고 그 자리를 바꾸므로, 다시 실행해도 합계 행이 늘어나지 않습니다.
+
+    Args:
+        matrix: 행×열 텍스트 배열
+        columns: 집계할 열 목록 (0부터, 없으면 레이블 열을 뺀 숫자 열 전부)
+        func: 집계 방식
+        label: 레이블 열에 넣을 텍스트
+        label_column: 레이블 열 (0부터)
+        header_rows: 머리글 행 수
+        decimals: 소수 자릿수
+
+    Returns:
+        Dict: {"row": 새 행, "row_index": 행 번호(0부터), "appended": 새로 추가하는 행인지 여부}
+    """
+    width = max((len(row) for row in matrix), default=0)
+    rows = [list(row) + [""] * (width - len(row)) for row in matrix]
+    existing = len(rows) > header_rows and rows[-1][label_column].strip() == label
+    body_end = len(rows) - 1 if existing else len(rows)
+    data = rows[:body_end]
+
+    if columns is None:
+        columns = [
+            c for c in range(width)
+            if c != label_column and is_numeric_column(column_values(data, c, header_rows))
+        ]
+    new_row = [""] * width
+    new_row[label_column] = label
+    for c in columns:
+        _check_column(rows, c)
+        values = column_values(data, c, header_rows)
+        new_row[c] = format_aggregate(aggregate_values(values, func), func, values, decimals)
+    return {"row": new_row, "row_index": body_end, "appended": not existing}
+
+
+def compute_table(matrix: Sequence[Sequence[str]], operation: str, **options) -> Dict[str, Any]:
+    """
+    표 데이터에 연산을 적용합니다.
+
+    Args:
+        matrix: 행×열 텍스트 배열
+        operation: "sort", "filter", "aggregate", "group_by", "totals"
+        **options: 연산별 인자 (column, descending, op, value, func, key_column, value_column,
+            columns, label, label_column, header_rows, decimals)
+
+    Returns:
+        Dict: {"matrix": 표에 다시 쓸 새 배열 (표를 바꾸지 않는 연산은 None), "result": 연산 결과}
+            filter는 남은 행을 위로 모으고 나머지 행은 비웁니다.
+    """
+    operation = (operation or "").lower()
+    header_rows = options.get("header_rows", 1)
+    width = max((len(row) for row in matrix), default=0)
+
+    if operation == "sort":
+        sorted_matrix = sort_rows(matrix, options["column"], options.get("descending", False), header_rows)
+        return {"matrix": sorted_matrix, "result": {"rows": len(sorted_matrix) - header_rows}}
+    if operation == "filter":
+        kept = filter_rows(matrix, options["column"], options.get("op", "=="), options.get("value"), header_rows)
+        blank = [[""] * width for _ in range(len(matrix) - len(kept))]
+        return {"matrix": kept + blank, "result": {"kept": len(kept) - header_rows, "removed": len(blank)}}
+    if operation == "aggregate":
+        column, func = options["column"], options.get("func", "sum")
+        _check_column(matrix, column)
+        values = column_values(matrix, column, header_rows)
+        value = aggregate_values(values, func)
+        return {"matrix": None, "result": {
+            "value": value, "text": format_aggregate(value, func, values, options.get("decimals"))
+        }}
+    if operation == "group_by":
+        groups = group_by(matrix, options["key_column"], options.get("value_column"),
+                          options.get("func", "sum"), header_rows, options.get("decimals"))
+        return {"matrix": None, "result": {"groups": groups}}
+    if operation == "totals":
+        totals = totals_row(matrix, options.get("columns"), options.get("func", "sum"), options.get("label", "합계"),
+                            options.get("label_column", 0), header_rows, options.get("decimals"))
+        new_matrix = [list(row) + [""] * (width - len(row)) for row in matrix[:totals["row_index"]]]
+        return {"matrix": new_matrix + [totals["row"]], "result": totals}
+    raise ValueError(f"Unknown operation: {operation!r} (use one of {', '.join(OPERATIONS)})")
@@ -0,0 +1,249 @@
+"""
+표 격자 모듈
+표를 한 번에 읽은 결과(블록 HTML 내보내기)를 병합 셀을 반영한 행×열 격자로 바꿔,
+셀 값을 (행, 열)로 다루고 바뀐 셀만 골라 쓸 수 있게 합니다.
+"""
+
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class _TableHTMLParser(HTMLParser):
+    """가장 바깥 표의 행/셀과 병합 정보를 모으는 파서 (중첩 표의 텍스트는 바깥 셀 텍스트에 포함)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[Dict]] = []
+        self._depth = 0
+        self._cell: Optional[Dict] = None
+        self._parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        tag = tag.lower()
+        if tag == "table":
+            self._depth += 1
+            return
+        if self._depth != 1:
+            if tag in ("p", "br") and self._cell is not None:
+                self._parts.append("\n")
+            return
+        if tag == "tr":
+            self.rows.append([])
+        elif tag in ("td", "th"):
+            if not self.rows:
+                self.rows.append([])
+            attrs = dict(attrs)
+            self._cell = {
+                "rowspan": max(1, _to_int(attrs.get("rowspan"))),
+                "colspan": max(1, _to_int(attrs.get("colspan"))),
+            }
+            self._parts = []
+        elif tag in ("p", "br") and self._cell is not None:
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag):
+        tag = tag.lower()
+        if tag == "table":
+            self._depth -= 1
+        elif self._depth == 1 and tag in ("td", "th") and self._cell is not None:
+            self._cell["text"] = _clean_text("".join(self._parts))
+            self.rows[-1].append(self._cell)
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._parts.append(data)
+
+
+def _to_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 1
+
+
+def _clean_text(text: str) -> str:
+    lines = [" ".join(line.split()) for line in text.replace("\xa0", " ").split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+class TableGrid:
+    """
+    병합 셀을 반영한 표 격자.
+    각 셀은 왼쪽 위(기준) 위치와 rowspan/colspan을 가지며, 병합으로 가려진 위치는 기준 셀을 가리킵니다.
+    """
+
+    def __init__(self, cells: List[Dict], rows: int, cols: int):
+        """
+        Args:
+            cells: 기준 셀 목록 ({"row", "col", "rowspan", "colspan", "text"}, 읽는 순서)
+            rows: 행 수
+            cols: 열 수
+        """
+        self.cells = cells
+        self.rows = rows
+        self.cols = cols
+        self._owner: Dict[Tuple[int, int], Dict] = {}
+        for cell in cells:
+            for r in range(cell["row"], cell["row"] + cell["rowspan"]):
+                for c in range(cell["col"], cell["col"] + cell["colspan"]):
+                    self._owner[(r, c)] = cell
+
+    @classmethod
+    def from_html(cls, html: str) -> "TableGrid":
+        """
+        블록 HTML 내보내기 결과에서 가장 바깥 표를 읽습니다.
+
+        Raises:
+            ValueError: 표가 없는 경우
+        """
+        parser = _TableHTMLParser()
+        parser.feed(html)
+        parser.close()
+        rows = [row for row in parser.rows if row]
+        if not rows:
+            raise ValueError("No table found in HTML")
+
+        occupied = set()
+        cells = []
+        for r, row in enumerate(rows):
+            c = 0
+            for cell in row:
+                while (r, c) in occupied:
+                    c += 1
+                placed = dict(cell, row=r, col=c)
+                cells.append(placed)
+                for dr in range(placed["rowspan"]):
+                    for dc in range(placed["colspan"]):
+                        occupied.add((r + dr, c + dc))
+                c += placed["colspan"]
+        n_rows = max(r for r, _ in occupied) + 1
+        n_cols = max(c for _, c in occupied) + 1
+        return cls(cells, n_rows, n_cols)
+
+    @classmethod
+    def from_texts(cls, texts: Sequence[str], cols: int) -> "TableGrid":
+        """
+        병합이 없는 표의 셀 텍스트(읽는 순서)로 격자를 만듭니다.
+
+        Raises:
+            ValueError: 셀 수가 열 수의 배수가 아닌 경우 (병합이 있는 표)
+        """
+        if cols < 1 or len(texts) % cols:
+            raise ValueError(f"{len(texts)} cells do not fill {cols} columns (merged cells?)")
+        cells = [
+            {"row": i // cols, "col": i % cols, "rowspan": 1, "colspan": 1, "text": text}
+            for i, text in enumerate(texts)
+        ]
+        return cls(cells, len(texts) // cols, cols)
+
+    def anchor(self, row: int, col: int) -> Optional[Tuple[int, int]]:
+        """(row, col)을 덮는 기준 셀의 위치 (격자 밖이면 None)"""
+        cell = self._owner.get((row, col))
+        return (cell["row"], cell["col"]) if cell else None
+
+    def is_anchor(self, row: int, col: int) -> bool:
+        """(row, col)이 병합으로 가려지지 않은 기준 셀인지 여부"""
+        return self.anchor(row, col) == (row, col)
+
+    def span(self, row: int, col: int) -> Tuple[int, int]:
+        """(row, col)을 덮는 셀의 (rowspan, colspan) (격자 밖이면 (0, 0))"""
+        cell = self._owner.get((row, col))
+        return (cell["rowspan"], cell["colspan"]) if cell else (0, 0)
+
+    def step(self, row: int, col: int, direction: str) -> Optional[Tuple[int, int]]:
+        """
+        (row, col)에서 direction으로 한 칸 이동한 위치.
+        병합 셀은 한 칸으로 보고 건너뛰며, 이동 방향과 수직인 좌표는 유지합니다.
+        (예: 두 행을 병합한 셀의 위 행에서 오른쪽으로 가면 같은 위 행의 다음 셀)
+
+        Args:
+            row: 행 (0부터)
+            col: 열 (0부터)
+            direction: "left", "right", "up", "down"
+
+        Returns:
+            Optional[Tuple[int, int]]: 이동한 위치 (표 밖으로 나가면 None)
+
+        Raises:
+            ValueError: 알 수 없는 방향
+        """
+        cell = self._owner.get((row, col))
+        if cell is None:
+            return None
+        if direction == "right":
+            target = (row, cell["col"] + cell["colspan"])
+        elif direction == "left":
+            target = (row, cell["col"] - 1)
+        elif direction == "down":
+            target = (cell["row"] + cell["rowspan"], col)
+        elif direction == "up":
+            target = (cell["row"] - 1, col)
+        else:
+            raise ValueError(f"Unknown direction: {direction!r}")
+        return target if target in self._owner else None
+
+    def has_merges(self) -> bool:
+        """병합된 셀이 있는지 여부"""
+        return any(cell["rowspan"] > 1 or cell["colspan"] > 1 for cell in self.cells)
+
+    def text(self, row: int, col: int) -> str:
+        """(row, col) 셀의 텍스트 (병합으로 가려진 위치는 기준 셀의 텍스트)"""
+        cell = self._owner.get((row, col))
+        return cell["text"] if cell else ""
+
+    def to_matrix(self, fill_merged: bool = False) -> List[List[str]]:
+        """
+        행×열 텍스트 배열.
+
+        Args:
+            fill_merged: 병합으로 가려진 위치에 기준 셀 텍스트를 채울지 여부 (False면 빈 문자열)
+        """
+        return [
+            [
+                self.text(r, c) if fill_merged or self.is_anchor(r, c) else ""
+                for c in range(self.cols)
+            ]
+            for r in range(self.rows)
+        ]
+
+    def diff(self, matrix: Sequence[Sequence], start_row: int = 0, start_col: int = 0) -> Dict[str, List]:
+        """
+        새 값 배열과 비교해 바꿔야 할 셀을 구합니다.
+        양쪽 텍스트를 같은 방식(연속 공백과 빈 줄 정리)으로 정리한 뒤 비교하므로,
+        HTML에서 읽은 격자와 셀 텍스트로 만든 격자가 같은 결과를 냅니다.
+
+        Args:
+            matrix: 새 값 (행 목록, None인 값은 건너뜀)
+            start_row: matrix[0][0]이 들어갈 행 (0부터)
+            start_col: matrix[0][0]이 들어갈 열 (0부터)
+
+        Returns:
+            Dict: {
+                "changed": [(행, 열, 새 값), ...],
+                "unchanged": 같은 값이라 건너뛴 셀 수,
+                "merged": [(행, 열), ...] 병합으로 가려진 위치라 쓸 수 없는 셀,
+                "out_of_range": [(행, 열), ...] 표 밖의 셀,
+            }
+        """
+        changed, merged, out_of_range = [], [], []
+        unchanged = 0
+        for i, values in enumerate(matrix):
+            for j, value in enumerate(values):
+                if value is None:
+                    continue
+                r, c = start_row + i, start_col + j
+                anchor = self.anchor(r, c)
+                if anchor is None:
+                    out_of_range.append((r, c))
+                elif anchor != (r, c):
+                    merged.append((r, c))
+                elif _clean_text(str(value)) == _clean_text(self.text(r, c)):
+                    unchanged += 1
+                else:
+                    changed.append((r, c, str(value)))
+        return {"changed": changed, "unchanged": unchanged, "merged": merged, "out_of_range": out_of_range}
+
+    def cell_order(self) -> List[Tuple[int, int]]:
+        """기준 셀의 읽는 순서 (HWP의 TableRightCell 이동 순서와 같음)"""
+        return [(cell["row"], cell["col"]) for cell in self.cells]
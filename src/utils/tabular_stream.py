@@ -0,0 +1,135 @@
+"""
+CSV/TSV 스트림 읽기 모듈
+CSV/TSV 텍스트나 파일을 한 번에 리스트로 만들지 않고 일정한 행 수의 청크로 나눠 읽습니다.
+표 채우기는 청크마다 표를 늘리고 한 번에 붙여넣으므로, 행 수와 관계없이 메모리에는
+한 청크만 올라갑니다.
+"""
+
+import codecs
+import csv
+import io
+import itertools
+import os
+from typing import Iterable, Iterator, List, Optional
+
+DEFAULT_CHUNK_ROWS = 200
+
+# 확장자별 구분자 (None이면 내용으로 판단)
+TABULAR_EXTENSIONS = {".csv": ",", ".tsv": "\t", ".tab": "\t", ".txt": None}
+
+SNIFF_DELIMITERS = ",\t;|"
+SNIFF_BYTES = 64 * 1024
+
+
+def looks_like_path(value: str) -> bool:
+    """값이 읽을 수 있는 CSV/TSV 파일 경로인지 여부"""
+    if not isinstance(value, str) or "\n" in value or len(value) > 1024:
+        return False
+    path = os.path.expanduser(value.strip().strip('"'))
+    return os.path.splitext(path)[1].lower() in TABULAR_EXTENSIONS and os.path.isfile(path)
+
+
+def is_tabular_text(text: str) -> bool:
+    """
+    문자열이 CSV/TSV 텍스트인지 여부.
+    JSON/파이썬 리스트 표기와, 한 줄짜리 쉼표 목록(기존처럼 한 열로 채움)은 제외합니다.
+    """
+    if not isinstance(text, str):
+        return False
+    stripped = text.strip()
+    if not stripped or stripped[0] in "[{(":
+        return False
+    return "\n" in stripped or "\t" in stripped
+
+
+def sniff_delimiter(sample: str) -> str:
+    """첫 부분으로 구분자를 추정합니다. (첫 줄에 탭이 있으면 TSV, 알 수 없으면 쉼표)"""
+    first_line = sample.split("\n", 1)[0]
+    if "\t" in first_line:
+        return "\t"
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def detect_encoding(path: str) -> str:
+    """파일 앞부분이 UTF-8로 읽히면 "utf-8-sig", 아니면 한글 윈도우 기본 인코딩 "cp949"."""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+    try:
+        # 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        codecs.getincrementaldecoder("utf-8-sig")().decode(head, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _read_rows(stream, delimiter: Optional[str]) -> Iterator[List[str]]:
+    if delimiter is None:
+        # 줄 중간에서 끊기지 않게 표본을 줄 끝까지 읽음
+        sample = stream.read(SNIFF_BYTES)
+        sample += stream.readline()
+        delimiter = sniff_delimiter(sample)
+        stream = itertools.chain(io.StringIO(sample), stream) if sample else stream
+    for row in csv.reader(stream, delimiter=delimiter):
+        # 빈 줄(마지막 줄바꿈 등)은 건너뜀
+        if row and any(cell != "" for cell in row):
+            yield row
+
+
+def iter_rows(source: str, delimiter: Optional[str] = None) -> Iterator[List[str]]:
+    """
+    CSV/TSV 파일 또는 텍스트를 한 행씩 읽습니다.
+
+    Args:
+        source: 파일 경로 또는 CSV/TSV 텍스트
+        delimiter: 구분자 (없으면 파일 확장자나 내용으로 추정)
+
+    Yields:
+        List[str]: 행의 셀 값 목록
+    """
+    if looks_like_path(source):
+        yield from iter_file_rows(os.path.expanduser(source.strip().strip('"')), delimiter)
+    else:
+        yield from _read_rows(io.StringIO(source), delimiter)
+
+
+def iter_file_rows(path: str, delimiter: Optional[str] = None) -> Iterator[List[str]]:
+    """
+    CSV/TSV 파일을 한 행씩 읽습니다. (확장자와 관계없이 파일로 읽음)
+
+    Args:
+        path: 파일 경로
+        delimiter: 구분자 (없으면 확장자나 내용으로 추정)
+    """
+    if delimiter is None:
+        delimiter = TABULAR_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    with open(path, "r", encoding=detect_encoding(path), newline="") as f:
+        yield from _read_rows(f, delimiter)
+
+
+def iter_chunks(rows: Iterable[List[str]], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[List[List[str]]]:
+    """
+    행을 chunk_rows개씩 묶습니다.
+
+    Raises:
+        ValueError: chunk_rows가 1보다 작은 경우
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be at least 1: {chunk_rows}")
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_chunks(
+    source: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    delimiter: Optional[str] = None
+) -> Iterator[List[List[str]]]:
+    """CSV/TSV 파일 또는 텍스트를 chunk_rows행씩 읽습니다. (iter_rows + iter_chunks)"""
+    return iter_chunks(iter_rows(source, delimiter), chunk_rows)
@@ -0,0 +1,156 @@
+"""
+문단 단위 텍스트 모델 모듈
+문서 텍스트를 (리스트 ID, 문단 번호) 키로 보관하여, 편집 후에는 바뀐 문단만 다시 읽을 수 있게 합니다.
+HWP 스캔 API(InitScan/GetText/ReleaseScan)로 읽은 조각을 받아 구성하며, COM 호출은 하지 않습니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+ParagraphKey = Tuple[int, int]
+
+# InitScan 범위 플래그 (시작 | 끝)
+SCAN_RANGE_DOCUMENT = 0x0077   # scanSposDocument | scanEposDocument
+SCAN_RANGE_PARAGRAPH = 0x0033  # scanSposParagraph | scanEposParagraph
+# InitScan 옵션 (maskNormal: 본문과 표 등 하위 리스트의 텍스트)
+SCAN_OPTION = 0x00
+# GetText 상태 코드 중 스캔 종료를 뜻하는 값 (텍스트 없음, 리스트 끝, 초기화 안 됨, 변환 실패)
+SCAN_END_STATES = (0, 1, 101, 102)
+# MovePos: 스캔 위치로 캐럿 이동
+MOVE_SCAN_POS = 201
+
+
+class ParagraphTextModel:
+    """문서 순서대로 정렬된 문단 텍스트와 다시 읽어야 할(dirty) 문단 집합"""
+
+    def __init__(self, separator: str = "\r\n"):
+        """
+        Args:
+            separator: 전체 텍스트를 만들 때 문단 사이에 넣을 문자열 (GetTextFile("TEXT")와 같은 줄바꿈)
+        """
+        self.separator = separator
+        self.synced_key: Optional[Any] = None
+        self._order: List[ParagraphKey] = []
+        self._texts: Dict[ParagraphKey, str] = {}
+        self._dirty: Set[ParagraphKey] = set()
+        self._valid = False
+        self._joined: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        """모델이 채워져 있고 무효화되지 않았는지 여부"""
+        return self._valid
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def invalidate(self) -> None:
+        """모델 전체를 버립니다. 다음 읽기에서 문서 전체를 다시 스캔합니다."""
+        self._order = []
+        self._texts = {}
+        self._dirty = set()
+        self._valid = False
+        self._joined = None
+        self.synced_key = None
+
+    def load(self, chunks: Iterable[Tuple[int, int, str]], synced_key: Any = None) -> None:
+        """
+        스캔 결과로 모델을 채웁니다.
+
+        Args:
+            chunks: 문서 순서의 (리스트 ID, 문단 번호, 텍스트 조각). 같은 문단의 조각은 이어 붙입니다.
+            synced_key: 스캔 시점의 편집 세대 키
+        """
+        self.invalidate()
+        for list_id, para, text in chunks:
+            key = (list_id, para)
+            if key not in self._texts:
+                self._order.append(key)
+                self._texts[key] = ""
+            self._texts[key] += text or ""
+        for key in self._order:
+            self._texts[key] = _strip_paragraph_end(self._texts[key])
+        self._valid = True
+        self.synced_key = synced_key
+
+    def has_paragraph(self, list_id: int, para: int) -> bool:
+        """해당 문단이 모델에 있는지 여부"""
+        return (list_id, para) in self._texts
+
+    def mark_dirty(self, list_id: int, para: int) -> None:
+        """문단을 다시 읽어야 한다고 표시합니다. 모르는 문단이면 모델을 무효화합니다."""
+        if (list_id, para) not in self._texts:
+            self.invalidate()
+            return
+        self._dirty.add((list_id, para))
+
+    def split(self, list_id: int, para: int, count: int = 0) -> None:
+        """
+        문단 para에서 편집이 일어나 count개의 문단이 그 뒤에 새로 생겼음을 반영합니다.
+        같은 리스트의 뒤쪽 문단 번호를 count만큼 밀고, para부터 새 문단까지 dirty로 표시합니다.
+
+        Args:
+            list_id: 편집한 리스트 ID
+            para: 편집을 시작한 문단 번호
+            count: 새로 생긴 문단 수 (텍스트만 바뀌었으면 0)
+        """
+        if not self._valid or (list_id, para) not in self._texts or count < 0:
+            self.invalidate()
+            return
+
+        if count:
+            order = []
+            texts = {}
+            for key in self._order:
+                if key[0] == list_id and key[1] > para:
+                    new_key = (list_id, key[1] + count)
+                else:
+                    new_key = key
+                order.append(new_key)
+                texts[new_key] = self._texts[key]
+                if key == (list_id, para):
+                    for offset in range(1, count + 1):
+                        order.append((list_id, para + offset))
+                        texts[(list_id, para + offset)] = ""
+            self._dirty = {
+                (k[0], k[1] + count) if k[0] == list_id and k[1] > para else k
+                for k in self._dirty
+            }
+            self._order = order
+            self._texts = texts
+
+        for offset in range(count + 1):
+            self._dirty.add((list_id, para + offset))
+        self._joined = None
+
+    def dirty_keys(self) -> List[ParagraphKey]:
+        """다시 읽어야 할 문단 키를 문서 순서로 반환합니다."""
+        if not self._dirty:
+            return []
+        return [key for key in self._order if key in self._dirty]
+
+    def set_paragraph(self, list_id: int, para: int, text: str) -> None:
+        """다시 읽은 문단 텍스트를 반영하고 dirty 표시를 지웁니다."""
+        key = (list_id, para)
+        if key not in self._texts:
+            self.invalidate()
+            return
+        text = _strip_paragraph_end(text or "")
+        if self._texts[key] != text:
+            self._texts[key] = text
+            self._joined = None
+        self._dirty.discard(key)
+
+    def paragraphs(self) -> List[Tuple[ParagraphKey, str]]:
+        """문서 순서의 (키, 텍스트) 목록을 반환합니다."""
+        return [(key, self._texts[key]) for key in self._order]
+
+    def text(self) -> str:
+        """전체 텍스트를 반환합니다. 문단이 바뀌지 않았으면 이전에 합친 결과를 재사용합니다."""
+        if self._joined is None:
+            self._joined = self.separator.join(self._texts[key] for key in self._order)
+        return self._joined
+
+
+def _strip_paragraph_end(text: str) -> str:
+    """문단 끝의 줄바꿈 문자를 제거합니다."""
+    return text.rstrip("\r\n")
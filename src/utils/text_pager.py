@@ -0,0 +1,98 @@
+"""
+텍스트 페이지 나누기 모듈
+문단 텍스트 목록을 문자/문단 단위 offset·limit 또는 쪽 범위로 잘라,
+큰 문서를 한 번의 응답에 모두 담지 않고 나누어 전달할 수 있게 합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+ParagraphKey = Tuple[int, int]
+
+UNITS = ("chars", "paragraphs")
+
+
+def assign_pages(keys: List[ParagraphKey], page_starts: List[Tuple[int, ParagraphKey]]) -> List[int]:
+    """
+    각 문단이 시작하는 쪽 번호를 구합니다.
+
+    Args:
+        keys: 문서 순서의 문단 키 목록
+        page_starts: (쪽 번호, 그 쪽이 시작하는 문단 키) 목록
+
+    Returns:
+        List[int]: keys와 같은 순서의 쪽 번호 (첫 쪽 시작 전 문단은 1쪽)
+    """
+    index_of = {key: i for i, key in enumerate(keys)}
+    boundaries = sorted((index_of[key], page) for page, key in page_starts if key in index_of)
+
+    pages = []
+    page = 1
+    b = 0
+    for i in range(len(keys)):
+        while b < len(boundaries) and boundaries[b][0] <= i:
+            page = max(page, boundaries[b][1])
+            b += 1
+        pages.append(page)
+    return pages
+
+
+def select_pages(
+    paragraphs: List[Tuple[ParagraphKey, str]],
+    pages: List[int],
+    page_from: Optional[int] = None,
+    page_to: Optional[int] = None
+) -> List[Tuple[ParagraphKey, str]]:
+    """page_from~page_to 쪽에서 시작하는 문단만 골라냅니다. (양 끝 포함, None이면 제한 없음)"""
+    low = page_from if page_from is not None else 1
+    high = page_to if page_to is not None else max(pages, default=1)
+    return [item for item, page in zip(paragraphs, pages) if low <= page <= high]
+
+
+def slice_text(
+    paragraphs: List[Tuple[ParagraphKey, str]],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    unit: str = "chars",
+    separator: str = "\r\n"
+) -> Dict[str, Any]:
+    """
+    문단 목록에서 요청한 구간의 텍스트를 잘라냅니다.
+
+    Args:
+        paragraphs: 문서 순서의 (키, 텍스트) 목록
+        offset: 시작 위치 (unit 단위, 0부터)
+        limit: 최대 길이 (unit 단위, None이면 끝까지)
+        unit: "chars" (문자) 또는 "paragraphs" (문단)
+        separator: 문단 사이 구분 문자열
+
+    Returns:
+        Dict[str, Any]: text, unit, offset, returned, total, next_offset (끝이면 None)
+
+    Raises:
+        ValueError: 지원하지 않는 단위이거나 offset/limit이 음수인 경우
+    """
+    if unit not in UNITS:
+        raise ValueError(f"Unsupported unit '{unit}'. Use one of: {', '.join(UNITS)}")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative")
+
+    if unit == "paragraphs":
+        total = len(paragraphs)
+        end = total if limit is None else min(total, offset + limit)
+        text = separator.join(t for _, t in paragraphs[offset:end])
+        returned = max(0, end - offset)
+    else:
+        full = separator.join(t for _, t in paragraphs)
+        total = len(full)
+        end = total if limit is None else min(total, offset + limit)
+        text = full[offset:end]
+        returned = len(text)
+
+    return {
+        "text": text,
+        "unit": unit,
+        "offset": offset,
+        "returned": returned,
+        "total": total,
+        "next_offset": end if end < total else None,
+    }
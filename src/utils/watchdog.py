@@ -0,0 +1,233 @@
+"""
+HWP COM 호출 감시(워치독) 모듈
+모든 COM 호출을 전용 작업 스레드에서 실행하고, 동작 유형별 제한 시간을 넘기면
+진단 정보를 남긴 뒤 호출을 취소하고 복구 콜백을 호출합니다.
+"""
+
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("hwp-watchdog")
+
+# 동작 유형별 기본 제한 시간(초). 등록되지 않은 동작은 "default"를 사용합니다.
+DEFAULT_DEADLINES = {
+    "default": 60.0,
+    "FileOpen": 60.0,
+    "FileSaveAs_S": 60.0,
+    "AllReplace": 120.0,
+    "replace_many": 600.0,
+    "table_fill": 300.0,
+    "create_document": 300.0,
+    "export_text": 300.0,
+    "batch": 600.0,
+}
+
+
+class ComTimeoutError(Exception):
+    """COM 호출이 제한 시간을 초과하여 취소되었을 때 발생하는 예외"""
+
+    def __init__(self, action: str, deadline: float, diagnostics: Dict[str, Any]):
+        self.action = action
+        self.deadline = deadline
+        self.diagnostics = diagnostics
+        super().__init__(
+            f"'{action}' 작업이 제한 시간({deadline:g}초)을 초과하여 취소되었습니다. "
+            f"HWP 인스턴스 복구를 시도했으니 다시 호출하세요."
+        )
+
+
+class _ComJob:
+    """작업 스레드에서 실행될 COM 호출 한 건"""
+
+    def __init__(self, action: str, fn: Callable, args: tuple, kwargs: dict):
+        self.action = action
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+
+
+class _ComWorker(threading.Thread):
+    """COM 호출을 순서대로 실행하는 전용 스레드 (HWP 객체는 이 스레드의 아파트에 묶임)"""
+
+    def __init__(self, initializer: Optional[Callable[[], None]] = None):
+        super().__init__(name="hwp-com-worker", daemon=True)
+        self.jobs = queue.Queue()
+        self.current_job = None
+        self.abandoned = False
+        self._initializer = initializer
+
+    def run(self):
+        if self._initializer:
+            try:
+                self._initializer()
+            except Exception as e:
+                logger.debug(f"작업 스레드 초기화 실패 (무시): {e}")
+
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+
+            self.current_job = job
+            job.started_at = time.monotonic()
+            try:
+                job.result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.error = e
+            finally:
+                self.current_job = None
+                job.done.set()
+
+            # 제한 시간 초과로 버려진 스레드는 걸려 있던 호출이 끝나면 종료
+            if self.abandoned:
+                break
+
+
+class ComWatchdog:
+    """
+    진행 중인 COM 호출을 동작 유형별 제한 시간과 비교하여 감시합니다.
+
+    호출은 한 번에 하나씩 전용 작업 스레드에서 실행됩니다. 제한 시간이 지나면
+    작업 스레드의 스택 등 진단 정보를 기록하고, 걸린 스레드를 버린 뒤
+    on_timeout 콜백으로 복구를 요청하고 ComTimeoutError를 발생시킵니다.
+    다음 호출은 새 작업 스레드에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        deadlines: Optional[Dict[str, float]] = None,
+        on_timeout: Optional[Callable[[Dict[str, Any]], None]] = None,
+        initializer: Optional[Callable[[], None]] = None,
+        max_incidents: int = 20
+    ):
+        """
+        Args:
+            deadlines: 동작 유형별 제한 시간(초). DEFAULT_DEADLINES를 덮어씁니다.
+            on_timeout: 제한 시간 초과 시 진단 정보와 함께 호출되는 복구 콜백
+            initializer: 새 작업 스레드 시작 시 호출 (예: pythoncom.CoInitialize)
+            max_incidents: 보관할 최근 초과 기록 수
+        """
+        self.deadlines = dict(DEFAULT_DEADLINES)
+        if deadlines:
+            self.deadlines.update(deadlines)
+        self.on_timeout = on_timeout
+        self._initializer = initializer
+        self._lock = threading.Lock()
+        self._worker = None
+        self.incidents = deque(maxlen=max_incidents)
+
+    def deadline_for(self, action: str) -> float:
+        """동작 유형의 제한 시간(초)을 반환합니다."""
+        return float(self.deadlines.get(action, self.deadlines.get("default", 60.0)))
+
+    def set_deadline(self, action: str, seconds: float) -> None:
+        """동작 유형의 제한 시간(초)을 설정합니다."""
+        self.deadlines[action] = float(seconds)
+
+    def in_worker_thread(self) -> bool:
+        """현재 스레드가 COM 작업 스레드인지 여부"""
+        return isinstance(threading.current_thread(), _ComWorker)
+
+    def call(self, action: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        fn(*args, **kwargs)를 작업 스레드에서 실행하고 결과를 반환합니다.
+
+        Args:
+            action: 제한 시간을 고르는 동작 유형 (예: "AllReplace")
+            fn: 실행할 함수
+
+        Returns:
+            Any: fn의 반환값
+
+        Raises:
+            ComTimeoutError: 제한 시간을 초과한 경우
+        """
+        # 작업 스레드 안에서의 중첩 호출은 그대로 실행 (바깥 호출의 제한 시간 적용)
+        if self.in_worker_thread():
+            return fn(*args, **kwargs)
+
+        deadline = self.deadline_for(action)
+        with self._lock:
+            worker = self._ensure_worker()
+            job = _ComJob(action, fn, args, kwargs)
+            worker.jobs.put(job)
+
+            if not job.done.wait(deadline):
+                diagnostics = self._collect_diagnostics(worker, job, deadline)
+                self._abandon(worker)
+                self.incidents.append(diagnostics)
+                logger.error(
+                    f"COM 호출 제한 시간 초과: {action} ({diagnostics['elapsed']:.1f}초 > {deadline:g}초)\n"
+                    + "".join(diagnostics["stack"])
+                )
+                if self.on_timeout:
+                    try:
+                        self.on_timeout(diagnostics)
+                    except Exception as e:
+                        logger.error(f"HWP 복구 콜백 실패: {e}", exc_info=True)
+                raise ComTimeoutError(action, deadline, diagnostics)
+
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def in_flight(self) -> List[Dict[str, Any]]:
+        """현재 실행 중인 COM 호출 정보를 반환합니다."""
+        worker = self._worker
+        job = worker.current_job if worker else None
+        if job is None or job.started_at is None:
+            return []
+        return [{
+            "action": job.action,
+            "elapsed": round(time.monotonic() - job.started_at, 3),
+            "deadline": self.deadline_for(job.action),
+        }]
+
+    def status(self) -> Dict[str, Any]:
+        """제한 시간 설정, 진행 중인 호출, 최근 초과 기록을 반환합니다."""
+        return {
+            "deadlines": dict(self.deadlines),
+            "in_flight": self.in_flight(),
+            "incidents": [
+                {key: value for key, value in incident.items() if key != "stack"}
+                for incident in self.incidents
+            ],
+        }
+
+    def _ensure_worker(self) -> _ComWorker:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = _ComWorker(self._initializer)
+            self._worker.start()
+        return self._worker
+
+    def _abandon(self, worker: _ComWorker) -> None:
+        """걸린 작업 스레드를 버립니다. 다음 호출은 새 스레드에서 실행됩니다."""
+        worker.abandoned = True
+        worker.jobs.put(None)
+        if self._worker is worker:
+            self._worker = None
+
+    def _collect_diagnostics(self, worker: _ComWorker, job: _ComJob, deadline: float) -> Dict[str, Any]:
+        frame = sys._current_frames().get(worker.ident)
+        stack = traceback.format_stack(frame) if frame is not None else []
+        return {
+            "action": job.action,
+            "function": getattr(job.fn, "__name__", repr(job.fn)),
+            "deadline": deadline,
+            "elapsed": time.monotonic() - job.submitted_at,
+            "started": job.started_at is not None,
+            "arguments": repr(job.kwargs or job.args)[:200],
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "stack": stack,
+        }